@@ -7,20 +7,27 @@ various messaging backends.
 Key Components:
     ACPHandler: Manages sending and receiving structured ACP messages.
     A2AClient: Client for interacting with A2A-compatible agents.
+    A2AConnectionPool: Pooled keep-alive HTTP connections shared by A2A clients.
     AILFASA2AServer: Base class for exposing AILF agents as A2A-compatible servers.
+    AdmissionController: Concurrency limits and load shedding for A2A servers.
     AGUIClient: Client for interacting with AG-UI-compatible agents.
     AILFAsAGUIServer: Base class for exposing AILF agents as AG-UI-compatible servers.
 """
 
 from .handler import ACPHandler
-from .a2a_client import A2AClient, A2AClientError, A2AHTTPError, A2AJSONError
+from .a2a_client import A2AClient, A2AClientError, A2AConnectionPool, A2AHTTPError, A2AJSONError
 from .a2a_server import (
     AILFASA2AServer,
     A2AAgentExecutor,
     A2ARequestContext,
     A2AServerError,
+    HistoryCompaction,
+    MessageArchive,
     TaskStore,
 )
+from .a2a_admission import A2AOverloadedError, AdmissionController
+from .a2a_idempotency import IdempotencyCache, RedisIdempotencyCache
+from .a2a_task_store import RedisTaskStore, SQLiteMessageArchive, SQLiteTaskStore
 from .ag_ui_client import AGUIClient, AGUIClientError, AGUIHTTPError, AGUIJSONError
 from .ag_ui_server import AGUIRequestContext, AGUIExecutor, AILFAsAGUIServer, AGUIServerError
 from .ag_ui_executor import SimpleAGUIExecutor
@@ -32,6 +39,7 @@ __all__ = [
     "ACPHandler",
     "A2AClient",
     "A2AClientError", 
+    "A2AConnectionPool",
     "A2AHTTPError",
     "A2AJSONError",
     "AILFASA2AServer",
@@ -39,6 +47,15 @@ __all__ = [
     "A2ARequestContext",
     "A2AServerError",
     "TaskStore",
+    "SQLiteTaskStore",
+    "RedisTaskStore",
+    "AdmissionController",
+    "A2AOverloadedError",
+    "IdempotencyCache",
+    "RedisIdempotencyCache",
+    "HistoryCompaction",
+    "MessageArchive",
+    "SQLiteMessageArchive",
     # AG-UI components
     "AGUIClient",
     "AGUIClientError",
@@ -0,0 +1,351 @@
+"""Admission control for A2A servers.
+
+An :class:`AdmissionController` bounds how many agent executions run at once,
+overall and per tenant. Requests over the limit wait in a bounded FIFO queue
+for a free slot. When the queue is full, or a tenant has too many requests
+waiting, the request is rejected immediately with :class:`A2AOverloadedError`,
+which the server turns into a 503 (or 429 for a tenant over its own limit)
+with a ``Retry-After`` hint.
+
+A full queue is not the only sign of overload: a queue that never drains
+means every request waits, even if it is short. The controller sheds load
+like CoDel does for packets. It watches how long each request waited when
+it leaves the queue. Once waits have stayed above `target_queue_delay` for
+`queue_delay_interval` seconds, it rejects waiting requests at an increasing
+rate until waits drop below the target again. Requests also give up after
+`max_queue_delay` seconds.
+
+Example:
+    >>> admission = AdmissionController(max_concurrency=32, max_concurrency_per_tenant=8)
+    >>> server = AILFASA2AServer(agent_description, executor, admission=admission)
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Deque, Dict, Optional
+
+if TYPE_CHECKING:
+    from ailf.core.monitoring import MetricsExporter
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest execution time in the moving average behind Retry-After hints
+_SERVICE_TIME_SMOOTHING = 0.2
+
+
+class A2AOverloadedError(Exception):
+    """Raised when a request is not admitted.
+
+    Attributes:
+        status_code: HTTP status for the rejection, 429 when the tenant is over its
+            own limit and 503 when the server is overloaded.
+        retry_after: Seconds the client should wait before retrying.
+        reason: One of "queue_full", "tenant_limit", "shed" or "timeout".
+    """
+
+    def __init__(self, message: str, status_code: int, retry_after: int, reason: str):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+@dataclass
+class AdmissionStats:
+    """Counters of an admission controller.
+
+    Attributes:
+        admitted: Requests given a slot
+        queued: Admitted requests that waited in the queue first
+        rejected_queue_full: Requests rejected because the queue was full
+        rejected_tenant_limit: Requests rejected because their tenant had too many waiting
+        shed: Waiting requests rejected because waits stayed above the target
+        timed_out: Waiting requests rejected after waiting `max_queue_delay`
+    """
+    admitted: int = 0
+    queued: int = 0
+    rejected_queue_full: int = 0
+    rejected_tenant_limit: int = 0
+    shed: int = 0
+    timed_out: int = 0
+
+
+class AdmissionTicket:
+    """A slot held by an admitted request, released with :meth:`AdmissionController.release`.
+
+    Attributes:
+        tenant: The tenant the slot counts against.
+        queue_delay: Seconds the request waited for the slot.
+    """
+
+    __slots__ = ("tenant", "queue_delay", "admitted_at", "released")
+
+    def __init__(self, tenant: str, queue_delay: float):
+        self.tenant = tenant
+        self.queue_delay = queue_delay
+        self.admitted_at = time.monotonic()
+        self.released = False
+
+
+class _Waiter:
+    """A request waiting in the queue."""
+
+    __slots__ = ("tenant", "future", "enqueued", "timer")
+
+    def __init__(self, tenant: str, future: asyncio.Future):
+        self.tenant = tenant
+        self.future = future
+        self.enqueued = time.monotonic()
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class AdmissionController:
+    """Concurrency limits with a bounded wait queue and delay-based load shedding."""
+
+    def __init__(self,
+                 max_concurrency: int = 64,
+                 max_concurrency_per_tenant: Optional[int] = None,
+                 max_queue_size: int = 256,
+                 max_queued_per_tenant: Optional[int] = None,
+                 target_queue_delay: float = 0.1,
+                 queue_delay_interval: float = 1.0,
+                 max_queue_delay: float = 30.0):
+        """Initialize the controller.
+
+        Args:
+            max_concurrency: Maximum number of requests holding a slot at once.
+            max_concurrency_per_tenant: Maximum number of slots one tenant can hold.
+                None limits tenants only by `max_concurrency`.
+            max_queue_size: Maximum number of requests waiting for a slot.
+            max_queued_per_tenant: Maximum number of waiting requests of one tenant.
+                None limits tenants only by `max_queue_size`.
+            target_queue_delay: Wait in seconds that requests should stay under.
+            queue_delay_interval: Seconds waits must stay above the target before
+                requests are shed. It should be about the time a typical request takes.
+            max_queue_delay: Seconds after which a waiting request is rejected.
+        """
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_tenant = max_concurrency_per_tenant
+        self.max_queue_size = max_queue_size
+        self.max_queued_per_tenant = max_queued_per_tenant
+        self.target_queue_delay = target_queue_delay
+        self.queue_delay_interval = queue_delay_interval
+        self.max_queue_delay = max_queue_delay
+        self.stats = AdmissionStats()
+        self._active = 0
+        self._tenant_active: Dict[str, int] = {}
+        self._tenant_queued: Dict[str, int] = {}
+        self._queue: Deque[_Waiter] = deque()
+        self._service_time: Optional[float] = None
+        self._queue_delay = 0.0
+        # CoDel state
+        self._first_above: Optional[float] = None
+        self._dropping = False
+        self._drop_count = 0
+        self._drop_next = 0.0
+
+    @property
+    def active(self) -> int:
+        """Number of slots held."""
+        return self._active
+
+    def _has_slot(self, tenant: str) -> bool:
+        if self._active >= self.max_concurrency:
+            return False
+        limit = self.max_concurrency_per_tenant
+        return limit is None or self._tenant_active.get(tenant, 0) < limit
+
+    def retry_after(self) -> int:
+        """Estimate the seconds until a new request would get a slot.
+
+        Returns:
+            The time to drain the queue at the average execution time, at least 1.
+        """
+        service_time = self._service_time if self._service_time is not None else 1.0
+        return max(1, math.ceil(service_time * (len(self._queue) + 1) / self.max_concurrency))
+
+    def _reject(self, reason: str, tenant: str) -> A2AOverloadedError:
+        if reason == "tenant_limit":
+            self.stats.rejected_tenant_limit += 1
+            return A2AOverloadedError(f"Too many requests for tenant {tenant or 'default'}", 429,
+                                      self.retry_after(), reason)
+        if reason == "queue_full":
+            self.stats.rejected_queue_full += 1
+        elif reason == "shed":
+            self.stats.shed += 1
+        else:
+            self.stats.timed_out += 1
+        return A2AOverloadedError("Server overloaded", 503, self.retry_after(), reason)
+
+    def _admit(self, tenant: str, queue_delay: float) -> AdmissionTicket:
+        self._active += 1
+        self._tenant_active[tenant] = self._tenant_active.get(tenant, 0) + 1
+        self.stats.admitted += 1
+        self._queue_delay = queue_delay
+        return AdmissionTicket(tenant, queue_delay)
+
+    async def acquire(self, tenant: Optional[str] = None) -> AdmissionTicket:
+        """Wait for a slot.
+
+        Args:
+            tenant: The tenant the request belongs to. None for the default tenant.
+
+        Returns:
+            The ticket to release when the request is done.
+
+        Raises:
+            A2AOverloadedError: If the request is rejected.
+        """
+        tenant = tenant or ""
+        if self._has_slot(tenant):
+            return self._admit(tenant, 0.0)
+        if len(self._queue) >= self.max_queue_size:
+            raise self._reject("queue_full", tenant)
+        queued = self._tenant_queued.get(tenant, 0)
+        if self.max_queued_per_tenant is not None and queued >= self.max_queued_per_tenant:
+            raise self._reject("tenant_limit", tenant)
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(tenant, loop.create_future())
+        waiter.timer = loop.call_later(self.max_queue_delay, self._expire, waiter)
+        self._queue.append(waiter)
+        self._tenant_queued[tenant] = queued + 1
+        try:
+            return await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+                # Admitted just before being cancelled
+                self.release(waiter.future.result())
+            else:
+                self._remove(waiter)
+            raise
+
+    def _remove(self, waiter: _Waiter) -> bool:
+        try:
+            self._queue.remove(waiter)
+        except ValueError:
+            return False
+        self._dequeued(waiter)
+        return True
+
+    def _dequeued(self, waiter: _Waiter) -> None:
+        if waiter.timer is not None:
+            waiter.timer.cancel()
+        self._tenant_queued[waiter.tenant] -= 1
+        if not self._tenant_queued[waiter.tenant]:
+            del self._tenant_queued[waiter.tenant]
+
+    def _expire(self, waiter: _Waiter) -> None:
+        if self._remove(waiter) and not waiter.future.done():
+            waiter.future.set_exception(self._reject("timeout", waiter.tenant))
+
+    def _should_shed(self, queue_delay: float, now: float) -> bool:
+        """Decide whether to shed a request leaving the queue, as CoDel decides to drop a packet."""
+        if queue_delay < self.target_queue_delay:
+            self._first_above = None
+            self._dropping = False
+            return False
+        if self._first_above is None:
+            self._first_above = now + self.queue_delay_interval
+            return False
+        if now < self._first_above:
+            return False
+        if not self._dropping:
+            self._dropping = True
+            self._drop_count = 1
+        elif now < self._drop_next:
+            return False
+        else:
+            self._drop_count += 1
+        self._drop_next = now + self.queue_delay_interval / math.sqrt(self._drop_count)
+        return True
+
+    def _dispatch(self) -> None:
+        """Give free slots to the oldest waiting requests whose tenant has a slot."""
+        while self._queue and self._active < self.max_concurrency:
+            waiter = next((w for w in self._queue if self._has_slot(w.tenant)), None)
+            if waiter is None:
+                return
+            self._queue.remove(waiter)
+            self._dequeued(waiter)
+            if waiter.future.done():
+                continue
+            now = time.monotonic()
+            queue_delay = now - waiter.enqueued
+            if self._should_shed(queue_delay, now):
+                logger.debug(f"Shedding request of tenant {waiter.tenant or 'default'} after {queue_delay:.3f}s")
+                waiter.future.set_exception(self._reject("shed", waiter.tenant))
+                continue
+            self.stats.queued += 1
+            waiter.future.set_result(self._admit(waiter.tenant, queue_delay))
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Free the slot of an admitted request. Releasing a ticket again does nothing.
+
+        Args:
+            ticket: The ticket returned by :meth:`acquire`.
+        """
+        if ticket.released:
+            return
+        ticket.released = True
+        elapsed = time.monotonic() - ticket.admitted_at
+        if self._service_time is None:
+            self._service_time = elapsed
+        else:
+            self._service_time += _SERVICE_TIME_SMOOTHING * (elapsed - self._service_time)
+        self._active -= 1
+        self._tenant_active[ticket.tenant] -= 1
+        if not self._tenant_active[ticket.tenant]:
+            del self._tenant_active[ticket.tenant]
+        self._dispatch()
+
+    @asynccontextmanager
+    async def admit(self, tenant: Optional[str] = None) -> AsyncIterator[AdmissionTicket]:
+        """Hold a slot for the duration of a ``async with`` block.
+
+        Args:
+            tenant: The tenant the request belongs to.
+
+        Raises:
+            A2AOverloadedError: If the request is rejected.
+        """
+        ticket = await self.acquire(tenant)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission counters and current load.
+
+        Returns:
+            The counters of :class:`AdmissionStats`, with the slots held as "active",
+            the waiting requests as "queue_depth", the wait of the last admitted request
+            as "queue_delay_seconds", and slots held and requests waiting by tenant.
+        """
+        return {
+            "active": self._active,
+            "queue_depth": len(self._queue),
+            "queue_delay_seconds": self._queue_delay,
+            "tenants_active": dict(self._tenant_active),
+            "tenants_queued": dict(self._tenant_queued),
+            **asdict(self.stats),
+        }
+
+    def export(self, exporter: "MetricsExporter", name: str = "a2a_admission") -> None:
+        """Send the current load and counters to an ``ailf.core.monitoring`` exporter.
+
+        Args:
+            exporter: The exporter.
+            name: Name of the metrics.
+        """
+        exporter.export_gauges(name, {
+            "active": self._active,
+            "queue_depth": len(self._queue),
+            "queue_delay_seconds": self._queue_delay,
+        })
+        exporter.export_counters(name, asdict(self.stats))
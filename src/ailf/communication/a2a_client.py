@@ -1,10 +1,21 @@
 """A2A Protocol client implementation for AILF.
 
 This module provides a client for interacting with A2A-compatible agents.
+
+Requests go through long-lived pooled ``httpx.AsyncClient`` instances held by
+an :class:`A2AConnectionPool`, so connections to an agent are kept alive and
+reused instead of paying TCP and TLS setup on every call. Each agent origin
+(scheme, host and port) gets its own client, which makes the connection limits
+per host. Clients that share a pool, such as those created by
+``A2AOrchestrator`` and ``A2ARegistryManager``, share connections to agents
+on the same host.
 """
+import asyncio
 import json
 import logging
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+import threading
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
 from uuid import uuid4
 
 import httpx
@@ -16,6 +27,8 @@ from ailf.schemas.a2a import (
     CancelTaskResponse,
     GetTaskRequest,
     GetTaskResponse,
+    ListMessagesResponse,
+    ListTasksResponse,
     Message,
     MessageSendParams,
     SendMessageRequest,
@@ -30,6 +43,10 @@ from ailf.schemas.a2a import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
 
 class A2AClientError(Exception):
     """Base exception for A2A client errors."""
@@ -48,34 +65,178 @@ class A2AJSONError(A2AClientError):
     pass
 
 
+class _NoLoop:
+    """Key of the HTTP clients created outside of an event loop."""
+
+    def is_closed(self) -> bool:
+        return False
+
+
+_NO_LOOP = _NoLoop()
+
+
+def _running_loop() -> Any:
+    """Get the running event loop, or a placeholder outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return _NO_LOOP
+
+
+class A2AConnectionPool:
+    """Pooled HTTP clients for A2A agents, one per agent origin.
+
+    httpx clients are bound to the event loop that opened their connections,
+    so the pool keeps one set of clients per loop.
+    """
+
+    _default: Optional["A2AConnectionPool"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self,
+                 max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+                 max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                 keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+                 http2: bool = False):
+        """Initialize the connection pool.
+
+        Args:
+            max_connections_per_host: Maximum number of concurrent connections to one agent origin.
+            max_keepalive_connections: Maximum number of idle connections kept open per origin.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Whether to negotiate HTTP/2 with agents that support it. Requires the
+                ``h2`` package (``httpx[http2]``).
+        """
+        self.max_connections_per_host = max_connections_per_host
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+        # Keyed by event loop; the clients keep their loop alive, so the
+        # clients of closed loops are dropped by _discard_closed_loops
+        self._clients: Dict[Any, Dict[Tuple[str, str, Optional[int]], httpx.AsyncClient]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls) -> "A2AConnectionPool":
+        """Get the process-wide connection pool.
+
+        Returns:
+            The shared pool instance.
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the HTTP client of one origin. Override to change how requests are sent."""
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections_per_host,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            http2=self.http2,
+        )
+
+    def get(self, url: str) -> httpx.AsyncClient:
+        """Get the shared HTTP client for an agent URL in the current event loop.
+
+        Args:
+            url: The agent URL. Only its scheme, host and port select the client.
+
+        Returns:
+            The shared HTTP client.
+        """
+        parsed = httpx.URL(url)
+        key = (parsed.scheme, parsed.host, parsed.port)
+        loop = _running_loop()
+        with self._lock:
+            self._discard_closed_loops()
+            clients = self._clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None or client.is_closed:
+                client = clients[key] = self._create_client()
+                logger.debug(f"Created A2A HTTP client for {parsed.scheme}://{parsed.netloc.decode()}")
+        return client
+
+    def _discard_closed_loops(self) -> None:
+        """Drop the HTTP clients of closed event loops (called with the lock held).
+
+        A closed loop cannot run ``aclose``, so their sockets are closed when
+        the clients are collected.
+        """
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            del self._clients[loop]
+
+    async def aclose(self) -> None:
+        """Close the HTTP clients of the current event loop."""
+        with self._lock:
+            clients = list(self._clients.pop(_running_loop(), {}).values())
+        for client in clients:
+            await client.aclose()
+
+
 class A2AClient:
-    """Client for interacting with A2A-compatible agents."""
+    """Client for interacting with A2A-compatible agents.
+
+    The client can be used as an async context manager, which closes its
+    connections on exit when it owns its connection pool.
+    """
 
     def __init__(self, 
                  base_url: str, 
                  headers: Optional[Dict[str, str]] = None, 
-                 timeout: float = 60.0):
+                 timeout: float = 60.0,
+                 connection_pool: Optional[A2AConnectionPool] = None,
+                 max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+                 max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                 http2: bool = False):
         """Initialize the A2A client.
 
         Args:
             base_url: The base URL of the A2A agent.
             headers: Optional headers to include in requests.
             timeout: Timeout for HTTP requests in seconds.
+            connection_pool: Pool to share connections with other clients. If None,
+                the client owns a private pool built from the remaining arguments.
+            max_connections_per_host: Connection limit of a private pool.
+            max_keepalive_connections: Idle connections kept open by a private pool.
+            http2: Whether a private pool negotiates HTTP/2.
         """
         self.base_url = base_url.rstrip("/")
         self.headers = headers or {}
         self.timeout = timeout
+        self._owns_pool = connection_pool is None
+        self.connection_pool = connection_pool or A2AConnectionPool(
+            max_connections_per_host=max_connections_per_host,
+            max_keepalive_connections=max_keepalive_connections,
+            http2=http2,
+        )
+
+    async def __aenter__(self) -> "A2AClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the client's connections if it owns its connection pool."""
+        if self._owns_pool:
+            await self.connection_pool.aclose()
         
     async def _make_request(self, 
                            method: str, 
                            path: str, 
-                           json_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                           json_data: Optional[Dict[str, Any]] = None,
+                           headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Make an HTTP request to the A2A agent.
 
         Args:
             method: HTTP method to use.
             path: Path to request.
             json_data: Optional JSON data to send.
+            headers: Headers to send in addition to the client's headers.
 
         Returns:
             The JSON response from the agent.
@@ -88,22 +249,21 @@ class A2AClient:
         logger.debug(f"Making {method} request to {url}")
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    json=json_data,
-                    timeout=self.timeout
-                )
-                
-                response.raise_for_status()
-                
-                try:
-                    return response.json()
-                except json.JSONDecodeError as e:
-                    raise A2AJSONError(f"Failed to parse JSON response: {e}")
-                
+            response = await self.connection_pool.get(self.base_url).request(
+                method=method,
+                url=url,
+                headers={**self.headers, **headers} if headers else self.headers,
+                json=json_data,
+                timeout=self.timeout
+            )
+            
+            response.raise_for_status()
+            
+            try:
+                return response.json()
+            except json.JSONDecodeError as e:
+                raise A2AJSONError(f"Failed to parse JSON response: {e}")
+            
         except httpx.HTTPStatusError as e:
             error_detail = ""
             try:
@@ -177,19 +337,23 @@ class A2AClient:
         """
         try:
             request = CancelTaskRequest()
-            response = await self._make_request("POST", f"/tasks/{task_id}/cancel", request.model_dump())
+            response = await self._make_request("POST", f"/tasks/{task_id}/cancel", request.model_dump(mode="json"))
             return Task.model_validate(response.get("task"))
         except ValidationError as e:
             raise A2AClientError(f"Failed to parse task: {e}")
             
     async def send_message(self, 
                           task_id: str, 
-                          message: Message) -> Task:
+                          message: Message,
+                          idempotency_key: Optional[str] = None) -> Task:
         """Send a message to a task.
 
         Args:
             task_id: The ID of the task.
             message: The message to send.
+            idempotency_key: Key identifying this request. Sending the message again
+                with the same key returns the first response, on servers that
+                support idempotency keys, instead of executing it twice.
 
         Returns:
             The updated task.
@@ -202,7 +366,8 @@ class A2AClient:
             response = await self._make_request(
                 "POST", 
                 f"/tasks/{task_id}/messages", 
-                request.model_dump(exclude_none=True)
+                request.model_dump(mode="json", exclude_none=True),
+                headers={"Idempotency-Key": idempotency_key} if idempotency_key else None,
             )
             return Task.model_validate(response.get("task"))
         except ValidationError as e:
@@ -210,12 +375,16 @@ class A2AClient:
             
     async def stream_message(self, 
                            task_id: str, 
-                           message: Message) -> AsyncGenerator[TaskDelta, None]:
+                           message: Message,
+                           idempotency_key: Optional[str] = None) -> AsyncGenerator[TaskDelta, None]:
         """Send a message to a task and stream the response.
 
         Args:
             task_id: The ID of the task.
             message: The message to send.
+            idempotency_key: Key identifying this request. Streaming the message again
+                with the same key replays the first response's deltas, on servers that
+                support idempotency keys, instead of executing it twice.
 
         Yields:
             Task deltas as they are received.
@@ -225,40 +394,42 @@ class A2AClient:
         """
         request = SendMessageStreamingRequest(message=message)
         url = f"{self.base_url}/tasks/{task_id}/messages:stream"
+        headers = {**self.headers, "Accept": "text/event-stream"}
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
         
         try:
-            async with httpx.AsyncClient() as client:
-                async with client.stream(
-                    method="POST",
-                    url=url,
-                    headers={**self.headers, "Accept": "text/event-stream"},
-                    json=request.model_dump(exclude_none=True),
-                    timeout=self.timeout
-                ) as response:
-                    response.raise_for_status()
+            async with self.connection_pool.get(self.base_url).stream(
+                method="POST",
+                url=url,
+                headers=headers,
+                json=request.model_dump(mode="json", exclude_none=True),
+                timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                
+                # Parse Server-Sent Events
+                buffer = ""
+                async for chunk in response.aiter_text():
+                    buffer += chunk
                     
-                    # Parse Server-Sent Events
-                    buffer = ""
-                    async for chunk in response.aiter_text():
-                        buffer += chunk
+                    # Process complete events
+                    while "\n\n" in buffer:
+                        event, buffer = buffer.split("\n\n", 1)
+                        lines = event.split("\n")
                         
-                        # Process complete events
-                        while "\n\n" in buffer:
-                            event, buffer = buffer.split("\n\n", 1)
-                            lines = event.split("\n")
-                            
-                            data_line = next((line for line in lines if line.startswith("data: ")), None)
-                            if data_line:
-                                data_json = data_line[6:]  # Remove "data: " prefix
-                                try:
-                                    data = json.loads(data_json)
-                                    task_delta = TaskDelta.model_validate(data.get("task"))
-                                    yield task_delta
-                                    
-                                    if task_delta.done:
-                                        return
-                                except (json.JSONDecodeError, ValidationError) as e:
-                                    logger.error(f"Failed to parse streaming response: {e}")
+                        data_line = next((line for line in lines if line.startswith("data: ")), None)
+                        if data_line:
+                            data_json = data_line[6:]  # Remove "data: " prefix
+                            try:
+                                data = json.loads(data_json)
+                                task_delta = TaskDelta.model_validate(data.get("task"))
+                                yield task_delta
+                                
+                                if task_delta.done:
+                                    return
+                            except (json.JSONDecodeError, ValidationError) as e:
+                                logger.error(f"Failed to parse streaming response: {e}")
         except httpx.HTTPStatusError as e:
             error_detail = ""
             try:
@@ -290,3 +461,52 @@ class A2AClient:
             return [Task.model_validate(task) for task in response.get("tasks", [])]
         except ValidationError as e:
             raise A2AClientError(f"Failed to parse tasks: {e}")
+
+    async def list_tasks_page(self,
+                              limit: int = 10,
+                              cursor: Optional[str] = None,
+                              state: Optional[TaskState] = None) -> ListTasksResponse:
+        """List a page of tasks, most recently updated first.
+
+        Args:
+            limit: Maximum number of tasks to return.
+            cursor: The nextCursor of the previous page, or None for the first page.
+            state: Only list tasks in this state.
+
+        Returns:
+            The page, with the cursor of the next page if there is one.
+
+        Raises:
+            A2AClientError: If the request fails.
+        """
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        if state is not None:
+            params["state"] = TaskState(state).value
+        try:
+            response = await self._make_request("GET", f"/tasks?{urlencode(params)}")
+            return ListTasksResponse.model_validate(response)
+        except ValidationError as e:
+            raise A2AClientError(f"Failed to parse tasks: {e}")
+
+    async def get_messages(self, task_id: str, start: int = 0, limit: int = 100) -> ListMessagesResponse:
+        """Get a range of a task's message history, including messages compacted out of the task.
+
+        Args:
+            task_id: The ID of the task.
+            start: Position of the first message, 0 being the first message of the task.
+            limit: Maximum number of messages to return.
+
+        Returns:
+            The messages, oldest first, and the length of the history.
+
+        Raises:
+            A2AClientError: If the request fails.
+        """
+        params = {"start": start, "limit": limit}
+        try:
+            response = await self._make_request("GET", f"/tasks/{task_id}/messages?{urlencode(params)}")
+            return ListMessagesResponse.model_validate(response)
+        except ValidationError as e:
+            raise A2AClientError(f"Failed to parse messages: {e}")
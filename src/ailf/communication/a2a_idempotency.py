@@ -0,0 +1,333 @@
+"""Idempotency keys for A2A servers.
+
+A client that times out waiting for ``POST /tasks/{id}/messages`` cannot tell
+whether the agent ran, so it retries, and the agent runs again. With an
+:class:`IdempotencyCache`, a client that sends an ``Idempotency-Key`` header
+gets the same response for every request with that key:
+
+* while the first request is executing, duplicates wait for its result, or
+  for a streamed response, receive the deltas sent so far and then follow
+  the live stream;
+* after it succeeded, duplicates get the recorded response, or a replay of
+  the recorded deltas, without running the executor again.
+
+Keys are scoped to the task and endpoint. Reusing a key with a different
+message is rejected with 422. Failed executions are not recorded, so a
+retry runs the executor again.
+
+Recorded results are kept for `ttl` seconds. :class:`IdempotencyCache` keeps
+at most `max_entries` of them in process memory; :class:`RedisIdempotencyCache`
+keeps them in Redis so that server replicas share them.
+
+Example:
+    >>> server = AILFASA2AServer(agent_description, executor, idempotency=IdempotencyCache(ttl=3600))
+"""
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from ailf.messaging.redis_pool import RedisPoolRegistry
+
+
+class IdempotencyError(Exception):
+    """Raised when a request cannot be served for its idempotency key.
+
+    Attributes:
+        status_code: HTTP status for the response, 422 when the key was used for a
+            different request and 409 when the request is running on another server.
+    """
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def request_fingerprint(request: BaseModel) -> str:
+    """Hash a message request, ignoring the message ID and timestamp that a server fills in.
+
+    Args:
+        request: The SendMessageRequest or SendMessageStreamingRequest.
+
+    Returns:
+        A hex digest identifying the request.
+    """
+    data = request.model_dump(mode="json", exclude={"message": {"id", "createdAt"}})
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class IdempotentExecution:
+    """The result of an execution for an idempotency key, recorded as it is produced.
+
+    A response is recorded with :meth:`finish`; a stream with :meth:`add_event`
+    for each event and then :meth:`finish`.
+
+    Attributes:
+        key: The scoped idempotency key.
+        fingerprint: Fingerprint of the request that started the execution.
+        status_code: HTTP status of the response, None while running.
+        body: The response body, for non-streaming responses.
+        events: The events streamed so far.
+        replayed: Whether the result was loaded from the cache.
+    """
+
+    def __init__(self, key: str, fingerprint: str):
+        self.key = key
+        self.fingerprint = fingerprint
+        self.status_code: Optional[int] = None
+        self.body: Optional[Dict[str, Any]] = None
+        self.events: List[Dict[str, Any]] = []
+        self.replayed = False
+        self._changed = asyncio.Event()
+
+    @property
+    def done(self) -> bool:
+        """Whether the execution has finished."""
+        return self.status_code is not None
+
+    def add_event(self, event: Dict[str, Any]) -> None:
+        """Record a streamed event and wake followers."""
+        self.events.append(event)
+        self._changed.set()
+
+    def finish(self, status_code: int = 200, body: Optional[Dict[str, Any]] = None) -> None:
+        """Record the end of the execution and wake waiters.
+
+        Args:
+            status_code: HTTP status of the response.
+            body: The response body, or the error detail for a failure.
+        """
+        self.status_code = status_code
+        self.body = body
+        self._changed.set()
+
+    async def result(self) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Wait for the execution to finish.
+
+        Returns:
+            The status code and body.
+        """
+        while not self.done:
+            self._changed.clear()
+            await self._changed.wait()
+        return self.status_code, self.body
+
+    async def follow(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the recorded events, then the live ones until the execution finishes."""
+        position = 0
+        while True:
+            while position < len(self.events):
+                yield self.events[position]
+                position += 1
+            if self.done:
+                return
+            self._changed.clear()
+            await self._changed.wait()
+
+    def to_record(self) -> Dict[str, Any]:
+        """Serialize a finished execution for the cache."""
+        return {
+            "fingerprint": self.fingerprint,
+            "status_code": self.status_code,
+            "body": self.body,
+            "events": self.events,
+        }
+
+    def replay(self, record: Dict[str, Any]) -> None:
+        """Finish the execution with a result loaded from the cache."""
+        self.fingerprint = record["fingerprint"]
+        self.events = record["events"]
+        self.replayed = True
+        self.finish(record["status_code"], record["body"])
+
+
+class IdempotencyCache:
+    """In-memory cache of results by idempotency key, and the interface of shared caches.
+
+    Executions still running are tracked in this process whatever the cache,
+    so duplicates arriving at the same server attach to them.
+    """
+
+    def __init__(self, ttl: float = 24 * 3600, max_entries: int = 10000):
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Seconds a recorded result is replayed for.
+            max_entries: Maximum number of recorded results; the least recently used
+                are evicted first.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._in_flight: Dict[str, IdempotentExecution] = {}
+
+    async def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the recorded result of a key.
+
+        Args:
+            key: The scoped idempotency key.
+
+        Returns:
+            The record, or None if there is none or it expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def save(self, key: str, record: Dict[str, Any]) -> None:
+        """Record the result of a key for `ttl` seconds.
+
+        Args:
+            key: The scoped idempotency key.
+            record: The serialized execution.
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, record)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def reserve(self, key: str) -> bool:
+        """Claim the execution of a key, so other servers sharing the cache do not run it too.
+
+        Returns:
+            True if this server may execute the request.
+        """
+        return True
+
+    async def unreserve(self, key: str) -> None:
+        """Give up the claim on a key, e.g. after a failed execution."""
+
+    async def begin(self, key: str, fingerprint: str) -> Tuple[IdempotentExecution, bool]:
+        """Start, attach to or replay the execution of a key.
+
+        Args:
+            key: The scoped idempotency key.
+            fingerprint: The :func:`request_fingerprint` of the request.
+
+        Returns:
+            The execution and whether the caller owns it and must run the request,
+            then call :meth:`complete`.
+
+        Raises:
+            IdempotencyError: If the key was used for a different request, or the
+                request is running on another server.
+        """
+        execution = self._in_flight.get(key)
+        if execution is not None:
+            if execution.fingerprint != fingerprint:
+                raise IdempotencyError("Idempotency key was used for a different request", 422)
+            return execution, False
+
+        # Track the key before looking it up, so that duplicates arriving meanwhile attach to it
+        execution = IdempotentExecution(key, fingerprint)
+        self._in_flight[key] = execution
+        try:
+            record = await self.load(key)
+            if record is None and await self.reserve(key):
+                return execution, True
+        except BaseException:
+            del self._in_flight[key]
+            execution.finish(500, {"detail": "Idempotency cache unavailable"})
+            raise
+        del self._in_flight[key]
+        if record is None:
+            error = IdempotencyError("A request with this idempotency key is in progress", 409)
+            execution.finish(error.status_code, {"detail": str(error)})
+            raise error
+        execution.replay(record)
+        if record["fingerprint"] != fingerprint:
+            raise IdempotencyError("Idempotency key was used for a different request", 422)
+        return execution, False
+
+    async def complete(self, execution: IdempotentExecution) -> None:
+        """Stop tracking a finished execution, recording it if it succeeded.
+
+        Args:
+            execution: The execution returned by :meth:`begin`.
+        """
+        self._in_flight.pop(execution.key, None)
+        if execution.status_code is not None and 200 <= execution.status_code < 300:
+            await self.save(execution.key, execution.to_record())
+        else:
+            await self.unreserve(execution.key)
+
+    async def close(self) -> None:
+        """Release the resources of the cache."""
+
+
+class RedisIdempotencyCache(IdempotencyCache):
+    """Idempotency cache in Redis, shared by the replicas of a server.
+
+    A request claims its key with a lock that expires after `lock_timeout`
+    seconds, so a duplicate reaching another replica while the first request
+    runs is answered with 409 instead of executing again.
+    """
+
+    def __init__(self,
+                 redis_url: str = "redis://localhost:6379/0",
+                 key_prefix: str = "a2a",
+                 ttl: float = 24 * 3600,
+                 lock_timeout: float = 300.0,
+                 pool_registry: Optional["RedisPoolRegistry"] = None):
+        """Initialize the cache.
+
+        Args:
+            redis_url: URL of the Redis server.
+            key_prefix: Prefix of every key the cache writes.
+            ttl: Seconds a recorded result is replayed for.
+            lock_timeout: Seconds after which the claim of an unfinished request lapses.
+            pool_registry: Registry providing the shared connection pool. Defaults to the
+                process-wide registry.
+        """
+        from ailf.messaging.redis_pool import RedisPoolRegistry
+
+        super().__init__(ttl)
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self.lock_timeout = lock_timeout
+        self.pool_registry = pool_registry or RedisPoolRegistry.default()
+        self._redis = None
+
+    @property
+    def redis(self) -> Any:
+        """The asyncio Redis client, created on first use."""
+        if self._redis is None:
+            self._redis = self.pool_registry.async_client(url=self.redis_url)
+        return self._redis
+
+    def _result_key(self, key: str) -> str:
+        return f"{self.key_prefix}:idempotency:{key}"
+
+    def _lock_key(self, key: str) -> str:
+        return f"{self.key_prefix}:idempotency:{key}:lock"
+
+    async def load(self, key: str) -> Optional[Dict[str, Any]]:
+        data = await self.redis.get(self._result_key(key))
+        return json.loads(data) if data is not None else None
+
+    async def save(self, key: str, record: Dict[str, Any]) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._result_key(key), json.dumps(record), px=int(self.ttl * 1000))
+            pipe.delete(self._lock_key(key))
+            await pipe.execute()
+
+    async def reserve(self, key: str) -> bool:
+        return bool(await self.redis.set(self._lock_key(key), 1, nx=True, px=int(self.lock_timeout * 1000)))
+
+    async def unreserve(self, key: str) -> None:
+        await self.redis.delete(self._lock_key(key))
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
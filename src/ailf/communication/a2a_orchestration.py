@@ -2,23 +2,39 @@
 
 This module provides utilities for orchestrating multiple A2A-compatible agents,
 enabling complex workflows that involve multiple agents working together.
+
+Routes are indexed by source agent, and the field paths of route conditions
+are compiled once into accessors that read the ``Task`` model directly, so
+choosing the next agent costs the same however many routes there are and
+however long the task's conversation is.
+
+Parallel routes send a task to all of their destination agents at once, so a
+fan-out takes as long as its slowest agent, and merge the answers with a
+:class:`MergeStrategy`.
 """
 import asyncio
 import json
 import logging
+import operator
+import re
+import time
+from contextlib import aclosing, nullcontext
 from datetime import datetime, UTC
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union, Callable, AsyncIterator
+from functools import lru_cache
+from typing import Any, Awaitable, Dict, List, Optional, Set, Tuple, Type, Union, Callable, AsyncIterator
 
 import httpx
 from pydantic import BaseModel, Field, validator
 
-from ailf.communication.a2a_client import A2AClient
+from ailf.communication.a2a_client import A2AClient, A2AConnectionPool
 from ailf.communication.a2a_registry import A2ARegistryManager, RegistryEntry
 from ailf.schemas.a2a import (
     AgentCard,
     Message,
+    MessageDelta,
     MessagePart,
+    MessagePartDelta,
     MessageType,
     Task,
     TaskDelta,
@@ -33,6 +49,105 @@ class OrchestratorError(Exception):
     pass
 
 
+# One step of a field path: a name followed by any number of [index] suffixes
+_PATH_STEP = re.compile(r"^([^\[\]]+)((?:\[-?\d+\])*)$")
+_PATH_INDEX = re.compile(r"\[(-?\d+)\]")
+
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "neq": operator.ne,
+    "contains": lambda value, expected: expected in value,
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "ge": operator.ge,
+    "le": operator.le,
+}
+
+
+def _get_attribute(obj: Any, name: str) -> Any:
+    """Read a model field, or a key of a dictionary."""
+    if isinstance(obj, BaseModel):
+        if name not in type(obj).model_fields:
+            raise KeyError(name)
+        return getattr(obj, name)
+    return obj[name]
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert a model, or a list of them, to the dictionaries ``model_dump`` would give."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, list) and any(isinstance(item, BaseModel) for item in value):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=1024)
+def compile_field_path(field_path: str) -> Callable[[Task], Any]:
+    """Compile a field path into a function reading it from a task.
+    
+    The function walks the task's attributes, so its cost depends on the
+    length of the path and not on the size of the task. Values that are
+    models are returned as dictionaries, as in ``task.model_dump()``.
+    
+    Args:
+        field_path: Path to the field (e.g., "messages[-1].parts[0].content")
+        
+    Returns:
+        A function returning the value at the path, or None if not found.
+    """
+    steps: List[Tuple[str, Tuple[int, ...]]] = []
+    for part in field_path.split("."):
+        match = _PATH_STEP.match(part)
+        if match is None:
+            logger.warning(f"Invalid field path '{field_path}'")
+            return lambda task: None
+        steps.append((match.group(1), tuple(int(index) for index in _PATH_INDEX.findall(match.group(2)))))
+
+    def get_field_value(task: Task) -> Any:
+        value: Any = task
+        try:
+            for name, indexes in steps:
+                value = _get_attribute(value, name)
+                for index in indexes:
+                    value = value[index]
+        except (KeyError, IndexError, TypeError) as e:
+            logger.debug(f"Field path '{field_path}' not found in task: {str(e)}")
+            return None
+        return _to_plain(value)
+
+    return get_field_value
+
+
+def compile_condition(condition: "RouteCondition") -> Callable[[Task], bool]:
+    """Compile a routing condition into a predicate on tasks.
+    
+    Args:
+        condition: The condition to compile.
+        
+    Returns:
+        A function returning True if a task meets the condition.
+    """
+    compare = _OPERATORS.get(condition.operator)
+    if compare is None:
+        logger.warning(f"Unknown operator: {condition.operator}")
+        return lambda task: False
+    get_field_value = compile_field_path(condition.field)
+    expected = condition.value
+    is_equality = condition.operator in ("eq", "neq")
+
+    def predicate(task: Task) -> bool:
+        value = get_field_value(task)
+        if value is None and not is_equality:
+            return False
+        try:
+            return bool(compare(value, expected))
+        except TypeError:
+            return False
+
+    return predicate
+
+
 class RouteType(str, Enum):
     """Types of routes between agents."""
     SEQUENTIAL = "sequential"  # Route from one agent to the next in sequence
@@ -41,6 +156,21 @@ class RouteType(str, Enum):
     DYNAMIC = "dynamic"  # Route determined at runtime
 
 
+class CompletionPolicy(str, Enum):
+    """When a parallel request to a group of agents is complete."""
+    ALL = "all"  # Wait for every agent; any failure fails the request
+    FIRST_K = "first_k"  # Stop at the first k successes
+    QUORUM = "quorum"  # Stop at a majority of successes, or k if given
+    FIRST_SUCCESS = "first_success"  # Stop at the first success and cancel the other tasks
+
+
+class MergeStrategy(str, Enum):
+    """How the answers of a parallel route are merged into one message."""
+    CONCATENATE = "concatenate"  # One part per agent, in completion order
+    VOTE = "vote"  # The answer given by the most agents
+    REDUCER = "reducer"  # A registered reducer function
+
+
 class RouteCondition(BaseModel):
     """A condition for conditional routing."""
     field: str = Field(..., description="The field to check in the task/message")
@@ -65,6 +195,26 @@ class AgentRoute(BaseModel):
         None,
         description="Name of the router function for dynamic routing"
     )
+    completion_policy: CompletionPolicy = Field(
+        default=CompletionPolicy.ALL,
+        description="When a parallel route has enough answers"
+    )
+    min_successes: Optional[int] = Field(
+        None,
+        description="Answers needed by the first_k policy, and by quorum instead of a majority"
+    )
+    timeout: Optional[float] = Field(
+        None,
+        description="Seconds to wait for each destination agent of a parallel route"
+    )
+    merge_strategy: MergeStrategy = Field(
+        default=MergeStrategy.CONCATENATE,
+        description="How the answers of a parallel route are merged"
+    )
+    reducer: Optional[str] = Field(
+        None,
+        description="Name of the reducer function for the reducer merge strategy"
+    )
     
     @validator("conditions")
     def validate_conditional_route(cls, v, values):
@@ -86,6 +236,17 @@ class AgentRoute(BaseModel):
         if values.get("type") in (RouteType.SEQUENTIAL, RouteType.PARALLEL) and not v:
             raise ValueError(f"{values.get('type')} routes must have destination agents")
         return v
+    
+    @validator("reducer", always=True)
+    def validate_reducer(cls, v, values):
+        """Validate that the reducer merge strategy names a reducer function."""
+        if values.get("merge_strategy") == MergeStrategy.REDUCER and not v:
+            raise ValueError("The reducer merge strategy requires a reducer function")
+        return v
+
+
+# A route with its conditions compiled into predicates
+_IndexedRoute = Tuple[AgentRoute, List[Tuple[RouteCondition, Callable[[Task], bool]]]]
 
 
 class TaskHandler(BaseModel):
@@ -100,6 +261,113 @@ class TaskHandler(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Task metadata")
 
 
+class ParallelResult(BaseModel):
+    """The outcome of a request to one agent of a parallel group."""
+    agent_id: str = Field(..., description="ID of the agent")
+    task_id: Optional[str] = Field(None, description="ID of the task, None if its creation failed")
+    task: Optional[Task] = Field(None, description="The task returned by the agent")
+    error: Optional[str] = Field(None, description="Why the request failed or timed out")
+    elapsed: float = Field(0.0, description="Seconds the request took")
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the agent returned a task."""
+        return self.error is None
+
+
+def _answer(task: Task) -> Optional[str]:
+    """Get the text of the last assistant message of a task."""
+    for message in reversed(task.messages):
+        if message.role == "assistant":
+            return "\n".join(str(part.content) for part in message.parts if part.type == MessageType.TEXT)
+    return None
+
+
+def merge_concatenate(results: List[ParallelResult]) -> Message:
+    """Merge the answers of a parallel route into one message with a part per agent.
+    
+    Args:
+        results: The successful results, in completion order.
+        
+    Returns:
+        An assistant message whose parts are tagged with the agent that gave them.
+    """
+    return Message(
+        role="assistant",
+        parts=[
+            MessagePart(type="text", content=_answer(result.task) or "",
+                        metadata={"agent_id": result.agent_id, "task_id": result.task_id})
+            for result in results
+        ]
+    )
+
+
+def merge_vote(results: List[ParallelResult]) -> Message:
+    """Merge the answers of a parallel route by majority vote.
+    
+    Answers are compared after stripping whitespace. Ties go to the answer
+    that arrived first.
+    
+    Args:
+        results: The successful results, in completion order.
+        
+    Returns:
+        An assistant message with the winning answer, and the votes in its metadata.
+    """
+    votes: Dict[str, List[str]] = {}
+    for result in results:
+        answer = _answer(result.task)
+        if answer is not None:
+            votes.setdefault(answer.strip(), []).append(result.agent_id)
+    if not votes:
+        raise OrchestratorError("No agent of the parallel route answered")
+    winner = max(votes, key=lambda answer: len(votes[answer]))
+    return Message(
+        role="assistant",
+        parts=[MessagePart(type="text", content=winner)],
+        metadata={"votes": {"agents": votes[winner], "count": len(votes[winner]), "total": len(results)}}
+    )
+
+
+# Decides where streamed text can be cut: returns the length of the buffered
+# text that forms complete chunks, 0 to wait for more
+ChunkSplitter = Callable[[str], int]
+
+_SENTENCE_END = re.compile(r"[.!?]+\s+")
+
+
+def split_lines(text: str) -> int:
+    """Cut streamed text after the last complete line."""
+    return text.rfind("\n") + 1
+
+
+def split_paragraphs(text: str) -> int:
+    """Cut streamed text after the last blank line."""
+    end = text.rfind("\n\n")
+    return end + 2 if end >= 0 else 0
+
+
+def split_sentences(text: str) -> int:
+    """Cut streamed text after the last sentence followed by whitespace."""
+    end = 0
+    for match in _SENTENCE_END.finditer(text):
+        end = match.end()
+    return end
+
+
+def _delta_text(delta: TaskDelta) -> str:
+    """Get the text an agent streamed in a delta."""
+    return "".join(
+        str(part.content)
+        for message in delta.messages if message.role != "user"
+        for part in message.parts if part.type in (None, MessageType.TEXT) and part.content is not None
+    )
+
+
+# A request to one agent of a parallel group: agent ID, task ID and the call to make
+_ParallelCall = Tuple[str, Optional[str], Callable[[], Awaitable[Task]]]
+
+
 class OrchestrationConfig(BaseModel):
     """Configuration for agent orchestration."""
     routes: List[AgentRoute] = Field(..., description="Routes between agents")
@@ -127,19 +395,46 @@ class A2AOrchestrator:
     def __init__(
         self,
         config: OrchestrationConfig,
-        registry_manager: Optional[A2ARegistryManager] = None
+        registry_manager: Optional[A2ARegistryManager] = None,
+        connection_pool: Optional[A2AConnectionPool] = None
     ):
         """Initialize the orchestrator.
         
         Args:
             config: Configuration for the orchestration.
             registry_manager: Optional registry manager for agent discovery.
+            connection_pool: Connection pool shared by the agent clients. If None,
+                uses the process-wide pool.
         """
         self.config = config
         self.registry_manager = registry_manager
+        self.connection_pool = connection_pool or A2AConnectionPool.default()
         self.clients: Dict[str, A2AClient] = {}
         self.task_handlers: Dict[str, TaskHandler] = {}
         self.dynamic_routers: Dict[str, Callable] = {}
+        self.reducers: Dict[str, Callable] = {}
+        self._route_index: Dict[str, List[_IndexedRoute]] = {}
+        self._indexed_routes: Optional[Tuple[int, int]] = None
+        self.reload_routes()
+
+    def reload_routes(self) -> None:
+        """Rebuild the route index and compiled conditions from the configuration.
+        
+        Routes added to or removed from ``config.routes`` are picked up
+        automatically; call this after changing a route in place.
+        """
+        index: Dict[str, List[_IndexedRoute]] = {}
+        for route in self.config.routes:
+            conditions = [(condition, compile_condition(condition)) for condition in route.conditions or []]
+            index.setdefault(route.source_agent, []).append((route, conditions))
+        self._route_index = index
+        self._indexed_routes = (id(self.config.routes), len(self.config.routes))
+
+    def _routes_from(self, agent_id: str) -> List[_IndexedRoute]:
+        """Get the indexed routes from an agent, with their compiled conditions."""
+        if self._indexed_routes != (id(self.config.routes), len(self.config.routes)):
+            self.reload_routes()
+        return self._route_index.get(agent_id, [])
     
     def register_dynamic_router(self, name: str, router_func: Callable) -> None:
         """Register a dynamic router function.
@@ -151,6 +446,18 @@ class A2AOrchestrator:
         """
         self.dynamic_routers[name] = router_func
     
+    def register_reducer(self, name: str, reducer_func: Callable) -> None:
+        """Register a reducer function for parallel routes.
+        
+        Args:
+            name: Name of the reducer, used in ``AgentRoute.reducer``.
+            reducer_func: The function merging the answers of a parallel route.
+                It receives the list of successful ``ParallelResult`` objects in
+                completion order, and returns a Message or the text of one. It
+                may be a coroutine function.
+        """
+        self.reducers[name] = reducer_func
+    
     async def setup_client(self, agent_id: str) -> A2AClient:
         """Set up an A2A client for an agent.
         
@@ -171,7 +478,7 @@ class A2AOrchestrator:
         if self.registry_manager:
             try:
                 agent = await self.registry_manager.get_agent(agent_id)
-                self.clients[agent_id] = A2AClient(base_url=agent.url)
+                self.clients[agent_id] = A2AClient(base_url=agent.url, connection_pool=self.connection_pool)
                 return self.clients[agent_id]
             except Exception as e:
                 raise OrchestratorError(f"Failed to create client for agent {agent_id}: {str(e)}")
@@ -232,7 +539,10 @@ class A2AOrchestrator:
         if response.state == TaskState.COMPLETED:
             # Check for routes from the current agent
             next_agent = await self._find_next_agent(handler.current_agent, response)
-            if next_agent:
+            if isinstance(next_agent, AgentRoute):
+                # Fan the task out to the destinations of a parallel route
+                response = await self._route_parallel(response, handler.current_agent, next_agent)
+            elif next_agent:
                 # Route the task to the next agent
                 response = await self._route_task(response, handler.current_agent, next_agent)
         
@@ -267,7 +577,7 @@ class A2AOrchestrator:
         
         # Stream the message to the current agent
         final_delta = None
-        async for delta in client.send_message_streaming(task_id, message):
+        async for delta in client.stream_message(task_id, message):
             # Keep track of the final delta to check for completion
             if delta.done:
                 final_delta = delta
@@ -280,7 +590,25 @@ class A2AOrchestrator:
             if task.state == TaskState.COMPLETED:
                 # Check for routes from the current agent
                 next_agent = await self._find_next_agent(handler.current_agent, task)
-                if next_agent:
+                if isinstance(next_agent, AgentRoute):
+                    # Fan the task out to the destinations of a parallel route
+                    merged_task = await self._route_parallel(task, handler.current_agent, next_agent)
+                    yield TaskDelta(
+                        id=task_id,
+                        messages=[MessageDelta(
+                            id=merged_task.messages[-1].id,
+                            role="assistant",
+                            parts=[MessagePartDelta(type=part.type, content=part.content, metadata=part.metadata)
+                                   for part in merged_task.messages[-1].parts]
+                        )],
+                        metadata={
+                            "orchestrator": {
+                                "routed_to": next_agent.destination_agents,
+                                "timestamp": datetime.now(UTC).isoformat()
+                            }
+                        }
+                    )
+                elif next_agent:
                     # Route the task to the next agent
                     routed_task = await self._route_task(task, handler.current_agent, next_agent)
                     # Yield a delta indicating the routing
@@ -320,7 +648,28 @@ class A2AOrchestrator:
         # Get the task from the current agent
         return await client.get_task(task_id)
     
-    async def _find_next_agent(self, current_agent_id: str, task: Task) -> Optional[str]:
+    async def cancel_task(self, task_id: str) -> Task:
+        """Cancel a task at its current agent.
+        
+        Args:
+            task_id: ID of the task.
+            
+        Returns:
+            The canceled task.
+            
+        Raises:
+            OrchestratorError: If the task is not found.
+        """
+        if task_id not in self.task_handlers:
+            raise OrchestratorError(f"Task {task_id} not found in orchestrator")
+        
+        handler = self.task_handlers[task_id]
+        client = await self.setup_client(handler.current_agent)
+        task = await client.cancel_task(task_id)
+        handler.status = task.state
+        return task
+    
+    async def _find_next_agent(self, current_agent_id: str, task: Task) -> Optional[Union[str, AgentRoute]]:
         """Find the next agent to route a task to.
         
         Args:
@@ -328,33 +677,29 @@ class A2AOrchestrator:
             task: The task to route.
             
         Returns:
-            ID of the next agent, or None if there is no next agent.
+            ID of the next agent, the parallel route whose destinations the task
+            goes to, or None if there is no next agent.
         """
         # Find routes from the current agent
-        routes = [r for r in self.config.routes if r.source_agent == current_agent_id]
+        routes = self._routes_from(current_agent_id)
         if not routes:
             return None
         
         # Process each route based on its type
-        for route in routes:
+        for route, conditions in routes:
             if route.type == RouteType.SEQUENTIAL:
                 # Simply route to the first destination agent
                 return route.destination_agents[0]
             
             elif route.type == RouteType.CONDITIONAL:
                 # Check conditions to determine destination
-                for condition in route.conditions:
-                    if self._evaluate_condition(condition, task):
+                for condition, predicate in conditions:
+                    if predicate(task):
                         return condition.route_to
             
             elif route.type == RouteType.PARALLEL:
-                # In this simple implementation, we just route to the first parallel agent
-                # A more sophisticated implementation would clone the task to all destinations
-                logger.warning(
-                    "Parallel routing is using only the first destination. "
-                    "Full parallel routing requires task cloning."
-                )
-                return route.destination_agents[0]
+                # The task is cloned to every destination agent
+                return route
             
             elif route.type == RouteType.DYNAMIC:
                 # Use the dynamic router function
@@ -382,28 +727,7 @@ class A2AOrchestrator:
         Returns:
             True if the condition is met, False otherwise.
         """
-        # Parse the field path (e.g., "messages[-1].parts[0].content")
-        value = self._get_field_value(task, condition.field)
-        
-        # Evaluate based on operator
-        op = condition.operator
-        if op == "eq":
-            return value == condition.value
-        elif op == "neq":
-            return value != condition.value
-        elif op == "contains":
-            return condition.value in value if value is not None else False
-        elif op == "gt":
-            return value > condition.value if value is not None else False
-        elif op == "lt":
-            return value < condition.value if value is not None else False
-        elif op == "ge":
-            return value >= condition.value if value is not None else False
-        elif op == "le":
-            return value <= condition.value if value is not None else False
-        else:
-            logger.warning(f"Unknown operator: {op}")
-            return False
+        return compile_condition(condition)(task)
     
     def _get_field_value(self, task: Task, field_path: str) -> Any:
         """Get a value from a task using a field path.
@@ -415,59 +739,17 @@ class A2AOrchestrator:
         Returns:
             The value at the specified path, or None if not found.
         """
-        parts = field_path.split(".")
-        value = task.model_dump()
-        
-        try:
-            for part in parts:
-                # Handle array indexing
-                if "[" in part and part.endswith("]"):
-                    name, index_str = part.split("[", 1)
-                    index_str = index_str[:-1]  # Remove the closing bracket
-                    
-                    # Handle negative indexing (-1 for last element)
-                    if index_str.startswith("-"):
-                        index = int(index_str)
-                        value = value[name][index]
-                    else:
-                        value = value[name][int(index_str)]
-                else:
-                    value = value[part]
-            return value
-        except (KeyError, IndexError, TypeError) as e:
-            logger.debug(f"Field path '{field_path}' not found in task: {str(e)}")
-            return None
+        return compile_field_path(field_path)(task)
     
-    async def _route_task(self, task: Task, from_agent: str, to_agent: str) -> Task:
-        """Route a task from one agent to another.
-        
-        Args:
-            task: The task to route.
-            from_agent: ID of the source agent.
-            to_agent: ID of the destination agent.
-            
-        Returns:
-            The task after routing to the new agent.
-            
-        Raises:
-            OrchestratorError: If routing fails or maximum depth is reached.
-        """
-        # Get the task handler
-        handler = self.task_handlers[task.id]
-        
-        # Check routing depth
+    def _check_routing_depth(self, handler: TaskHandler) -> None:
+        """Raise an OrchestratorError if a task was routed too many times."""
         if len(handler.history) >= self.config.max_routing_depth:
             raise OrchestratorError(
-                f"Maximum routing depth ({self.config.max_routing_depth}) reached for task {task.id}"
+                f"Maximum routing depth ({self.config.max_routing_depth}) reached for task {handler.task_id}"
             )
-        
-        # Get clients for both agents
-        from_client = await self.setup_client(from_agent)
-        to_client = await self.setup_client(to_agent)
-        
-        # Create a new task on the destination agent
-        new_task = await to_client.create_task()
-        
+    
+    def _handoff_message(self, task: Task, from_agent: str, handler: TaskHandler) -> Message:
+        """Build the message passing a task's history to the next agent."""
         # Add routing metadata
         routing_metadata = {
             "routed_from": from_agent,
@@ -492,12 +774,42 @@ class A2AOrchestrator:
             f"{chr(10).join(messages_content)}"
         )
         
-        # Send the combined message to the new agent
-        message = Message(
+        return Message(
             role="user",
             parts=[MessagePart(type="text", content=combined_content)],
             metadata={"routing": routing_metadata}
         )
+    
+    async def _route_task(self, task: Task, from_agent: str, to_agent: str) -> Task:
+        """Route a task from one agent to another.
+        
+        Args:
+            task: The task to route.
+            from_agent: ID of the source agent.
+            to_agent: ID of the destination agent.
+            
+        Returns:
+            The task after routing to the new agent.
+            
+        Raises:
+            OrchestratorError: If routing fails or maximum depth is reached.
+        """
+        # Get the task handler
+        handler = self.task_handlers[task.id]
+        
+        # Check routing depth
+        self._check_routing_depth(handler)
+        
+        # Get clients for both agents
+        from_client = await self.setup_client(from_agent)
+        to_client = await self.setup_client(to_agent)
+        
+        # Create a new task on the destination agent
+        new_task = await to_client.create_task()
+        
+        # Send the combined message to the new agent
+        message = self._handoff_message(task, from_agent, handler)
+        routing_metadata = message.metadata["routing"]
         new_task = await to_client.send_message(new_task.id, message)
         
         # Update the task handler
@@ -527,6 +839,108 @@ class A2AOrchestrator:
         self.task_handlers[new_task.id] = new_handler
         
         return new_task
+    
+    async def _clone_task(self, task_id: str, from_agent: str, to_agent: str) -> Task:
+        """Create a task on an agent to continue a task, with a handler of its own."""
+        handler = self.task_handlers[task_id]
+        client = await self.setup_client(to_agent)
+        clone = await client.create_task()
+        self.task_handlers[clone.id] = TaskHandler(
+            task_id=clone.id,
+            current_agent=to_agent,
+            history=handler.history + [to_agent],
+            status=clone.state,
+            metadata={"original_task_id": task_id, "routed_from": from_agent}
+        )
+        return clone
+    
+    async def _merge(self, route: AgentRoute, results: List[ParallelResult]) -> Message:
+        """Merge the answers of a parallel route with the route's merge strategy."""
+        if route.merge_strategy == MergeStrategy.VOTE:
+            return merge_vote(results)
+        if route.merge_strategy == MergeStrategy.REDUCER:
+            reducer_func = self.reducers.get(route.reducer)
+            if not reducer_func:
+                raise OrchestratorError(f"Reducer '{route.reducer}' not registered")
+            merged = reducer_func(results)
+            if asyncio.iscoroutine(merged):
+                merged = await merged
+            if isinstance(merged, Message):
+                return merged
+            return Message(role="assistant", parts=[MessagePart(type="text", content=merged)])
+        return merge_concatenate(results)
+    
+    async def _route_parallel(self, task: Task, from_agent: str, route: AgentRoute) -> Task:
+        """Route a task to every destination of a parallel route at once and merge the answers.
+        
+        The task's history is sent to a new task on each destination agent.
+        The route's completion policy decides how many answers are needed;
+        agents that fail or exceed the route's timeout count as failures, and
+        agents still working when the policy is satisfied are not waited for.
+        The answers are then merged into one assistant message.
+        
+        Args:
+            task: The task to route.
+            from_agent: ID of the source agent.
+            route: The parallel route.
+            
+        Returns:
+            The task with the merged message appended, and the result of each
+            agent in ``metadata["parallel"]``.
+            
+        Raises:
+            OrchestratorError: If the maximum depth is reached or too many agents failed.
+        """
+        handler = self.task_handlers[task.id]
+        self._check_routing_depth(handler)
+        
+        group = ParallelTaskGroup(self, timeout=route.timeout)
+        destinations = route.destination_agents
+        required = group._required(route.completion_policy, route.min_successes, len(destinations))
+        
+        # Create the clones first, so that the ones left running can be canceled
+        clones = await group._gather([
+            (agent_id, None, lambda agent_id=agent_id: self._clone_task(task.id, from_agent, agent_id))
+            for agent_id in destinations
+        ])
+        results = [result for result in clones if not result.succeeded]
+        if len(destinations) - len(results) < required:
+            await group._cancel_remote([clone.task_id for clone in clones if clone.succeeded])
+            group._check(results, "clone task")
+        
+        message = self._handoff_message(task, from_agent, handler)
+        calls = [
+            (clone.agent_id, clone.task_id,
+             lambda clone=clone: self.send_message(clone.task_id, message))
+            for clone in clones if clone.succeeded
+        ]
+        cancel_rest = route.completion_policy == CompletionPolicy.FIRST_SUCCESS
+        async with aclosing(group._complete(calls, required, cancel_rest)) as completed:
+            async for result in completed:
+                results.append(result)
+        
+        succeeded = [result for result in results if result.succeeded]
+        merged = await self._merge(route, succeeded)
+        merged.metadata = {**(merged.metadata or {}), "merge_strategy": route.merge_strategy.value}
+        
+        handler.history.extend(result.agent_id for result in succeeded)
+        handler.metadata["routing_history"] = handler.metadata.get("routing_history", []) + [{
+            "from": from_agent,
+            "to": result.agent_id,
+            "timestamp": datetime.now(UTC).isoformat(),
+            "original_task_id": task.id,
+            "new_task_id": result.task_id
+        } for result in results if result.task_id]
+        
+        return task.model_copy(update={
+            "state": TaskState.COMPLETED,
+            "messages": task.messages + [merged],
+            "updatedAt": datetime.now(UTC),
+            "metadata": {**(task.metadata or {}), "parallel": {
+                "route_from": from_agent,
+                "results": [result.model_dump(exclude={"task"}) for result in results],
+            }},
+        })
 
 
 class ParallelTaskGroup:
@@ -534,17 +948,142 @@ class ParallelTaskGroup:
     
     This class manages a set of tasks that are executed on multiple agents in parallel,
     and provides methods to interact with all of them as a group.
+    
+    Requests to the agents run concurrently, at most `max_concurrency` at a time,
+    and each is given up after its agent's timeout. Messages can be sent with a
+    :class:`CompletionPolicy`, and :meth:`iter_message_to_all` yields the answers
+    as they arrive so that later steps can start on the first ones.
+    
+    Example:
+        >>> group = ParallelTaskGroup(orchestrator, max_concurrency=8, timeout=30)
+        >>> await group.create_tasks(["search", "wiki", "news"])
+        >>> async for result in group.iter_message_to_all(message, CompletionPolicy.QUORUM):
+        ...     print(result.agent_id, result.succeeded)
     """
     
-    def __init__(self, orchestrator: A2AOrchestrator):
+    def __init__(
+        self,
+        orchestrator: A2AOrchestrator,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        agent_timeouts: Optional[Dict[str, float]] = None
+    ):
         """Initialize the parallel task group.
         
         Args:
             orchestrator: The orchestrator to use for task management.
+            max_concurrency: Maximum number of requests to agents in flight at once.
+                None sends to every agent at once.
+            timeout: Seconds to wait for an agent to answer a request. None waits
+                indefinitely.
+            agent_timeouts: Timeouts overriding `timeout` for specific agent IDs.
         """
         self.orchestrator = orchestrator
         self.tasks: Dict[str, Task] = {}  # task_id -> task
         self.agent_tasks: Dict[str, List[str]] = {}  # agent_id -> list of task_ids
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.agent_timeouts = agent_timeouts or {}
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    
+    async def _call(self, agent_id: str, task_id: Optional[str],
+                    operation: Callable[[], Awaitable[Task]]) -> ParallelResult:
+        """Make a request to an agent within the concurrency limit and its timeout."""
+        timeout = self.agent_timeouts.get(agent_id, self.timeout)
+        async with self._semaphore or nullcontext():
+            start = time.monotonic()
+            try:
+                task = await asyncio.wait_for(operation(), timeout)
+            except asyncio.TimeoutError:
+                error = f"Timed out after {timeout}s"
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            else:
+                return ParallelResult(agent_id=agent_id, task_id=task_id or task.id, task=task,
+                                      elapsed=time.monotonic() - start)
+        logger.warning(f"Request to agent {agent_id} failed: {error}")
+        return ParallelResult(agent_id=agent_id, task_id=task_id, error=error,
+                              elapsed=time.monotonic() - start)
+    
+    async def _gather(self, calls: List[_ParallelCall]) -> List[ParallelResult]:
+        """Make requests concurrently and return their results in order."""
+        return list(await asyncio.gather(*(self._call(*call) for call in calls)))
+    
+    @staticmethod
+    def _check(results: List[ParallelResult], action: str) -> None:
+        """Raise an OrchestratorError naming the agents whose request failed."""
+        failures = [f"{result.agent_id} ({result.error})" for result in results if not result.succeeded]
+        if failures:
+            raise OrchestratorError(f"Failed to {action} on agents: {', '.join(failures)}")
+    
+    async def _complete(self, calls: List[_ParallelCall], required: int,
+                        cancel_rest: bool = False) -> AsyncIterator[ParallelResult]:
+        """Make requests concurrently, yielding results in completion order until enough succeeded.
+        
+        Requests still running when `required` requests have succeeded, or when
+        iteration stops, are abandoned; with `cancel_rest` their tasks are also
+        canceled at the agents.
+        
+        Raises:
+            OrchestratorError: If too many requests failed for `required` to succeed.
+        """
+        if required > len(calls):
+            raise OrchestratorError(f"{required} successes required but only {len(calls)} agents in the group")
+        
+        pending = {asyncio.create_task(self._call(*call)): index for index, call in enumerate(calls)}
+        succeeded = failed = 0
+        try:
+            while pending and succeeded < required:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in sorted(done, key=pending.get):
+                    del pending[future]
+                    result = future.result()
+                    if result.succeeded:
+                        succeeded += 1
+                    else:
+                        failed += 1
+                    yield result
+                    if succeeded >= required:
+                        break
+                    if len(calls) - failed < required:
+                        raise OrchestratorError(
+                            f"{failed} of {len(calls)} agents failed, {required} successes required"
+                        )
+        finally:
+            unfinished = [future for future in pending if not future.done()]
+            for future in unfinished:
+                future.cancel()
+            if unfinished:
+                await asyncio.gather(*unfinished, return_exceptions=True)
+                if cancel_rest:
+                    await self._cancel_remote([calls[pending[future]][1] for future in unfinished])
+    
+    async def _cancel_remote(self, task_ids: List[Optional[str]]) -> None:
+        """Cancel tasks at their agents, logging failures."""
+        results = await asyncio.gather(
+            *(self.orchestrator.cancel_task(task_id) for task_id in task_ids if task_id),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to cancel task: {str(result)}")
+    
+    @staticmethod
+    def _required(policy: CompletionPolicy, k: Optional[int], total: int) -> int:
+        """Number of successes a completion policy needs."""
+        if policy == CompletionPolicy.ALL:
+            return total
+        if policy == CompletionPolicy.FIRST_SUCCESS:
+            return 1
+        if policy == CompletionPolicy.QUORUM:
+            if k is None:
+                return total // 2 + 1
+            if k < 1:
+                raise OrchestratorError("The quorum policy requires k >= 1")
+            return k
+        if k is None or k < 1:
+            raise OrchestratorError("The first_k policy requires k >= 1")
+        return k
     
     async def create_tasks(self, agent_ids: List[str]) -> List[Task]:
         """Create tasks on multiple agents in parallel.
@@ -553,30 +1092,89 @@ class ParallelTaskGroup:
             agent_ids: List of agent IDs to create tasks on.
             
         Returns:
-            List of created tasks.
+            List of created tasks, in the order of `agent_ids`.
+            
+        Raises:
+            OrchestratorError: If a task could not be created. The tasks created on
+                the other agents are still added to the group.
+        """
+        results = await self._gather([
+            (agent_id, None, lambda agent_id=agent_id: self.orchestrator.create_task(agent_id))
+            for agent_id in agent_ids
+        ])
+        for result in results:
+            if result.succeeded:
+                self.tasks[result.task_id] = result.task
+                self.agent_tasks.setdefault(result.agent_id, []).append(result.task_id)
+        self._check(results, "create tasks")
+        return [result.task for result in results]
+    
+    def _message_calls(self, message: Message, agent_ids: Optional[List[str]] = None) -> List[_ParallelCall]:
+        return [
+            (agent_id, task_id, lambda task_id=task_id: self.orchestrator.send_message(task_id, message))
+            for agent_id, task_ids in self.agent_tasks.items()
+            if agent_ids is None or agent_id in agent_ids
+            for task_id in task_ids
+        ]
+    
+    async def iter_message_to_all(
+        self,
+        message: Message,
+        policy: CompletionPolicy = CompletionPolicy.ALL,
+        k: Optional[int] = None
+    ) -> AsyncIterator[ParallelResult]:
+        """Send a message to all tasks in the group, yielding results as they arrive.
+        
+        Failed and timed out requests are yielded too. Iteration ends once the
+        policy is satisfied; requests still running are then abandoned, and with
+        ``CompletionPolicy.FIRST_SUCCESS`` their tasks are canceled. To stop
+        earlier, iterate within ``contextlib.aclosing`` so that the remaining
+        requests are abandoned when the loop exits.
+        
+        Args:
+            message: The message to send.
+            policy: When the request is complete.
+            k: Number of successes for ``FIRST_K``, and for ``QUORUM`` instead of a majority.
+            
+        Yields:
+            The result of each agent, in completion order.
+            
+        Raises:
+            OrchestratorError: If too many agents failed for the policy to be satisfied.
         """
-        tasks = []
-        for agent_id in agent_ids:
-            task = await self.orchestrator.create_task(agent_id)
-            self.tasks[task.id] = task
-            self.agent_tasks.setdefault(agent_id, []).append(task.id)
-            tasks.append(task)
-        return tasks
-    
-    async def send_message_to_all(self, message: Message) -> Dict[str, Task]:
+        calls = self._message_calls(message)
+        required = self._required(policy, k, len(calls))
+        cancel_rest = policy == CompletionPolicy.FIRST_SUCCESS
+        async with aclosing(self._complete(calls, required, cancel_rest)) as results:
+            async for result in results:
+                if result.succeeded:
+                    self.tasks[result.task_id] = result.task
+                yield result
+    
+    async def send_message_to_all(
+        self,
+        message: Message,
+        policy: CompletionPolicy = CompletionPolicy.ALL,
+        k: Optional[int] = None
+    ) -> Dict[str, Task]:
         """Send a message to all tasks in the group.
         
         Args:
             message: The message to send.
+            policy: When the request is complete. By default every agent must answer.
+            k: Number of successes for ``FIRST_K``, and for ``QUORUM`` instead of a majority.
             
         Returns:
-            A dictionary mapping task IDs to updated tasks.
+            A dictionary mapping task IDs to updated tasks, for the agents that
+            answered before the policy was satisfied, in completion order.
+            
+        Raises:
+            OrchestratorError: If too many agents failed for the policy to be satisfied.
         """
         results = {}
-        for task_id in self.tasks:
-            task = await self.orchestrator.send_message(task_id, message)
-            results[task_id] = task
-            self.tasks[task_id] = task
+        async for result in self.iter_message_to_all(message, policy, k):
+            if result.succeeded:
+                results[result.task_id] = result.task
         return results
     
     async def send_message_to_agent(self, agent_id: str, message: Message) -> List[Task]:
@@ -588,41 +1186,51 @@ class ParallelTaskGroup:
             
         Returns:
             List of updated tasks.
+            
+        Raises:
+            OrchestratorError: If a task failed to process the message.
         """
         if agent_id not in self.agent_tasks:
             return []
         
-        results = []
-        for task_id in self.agent_tasks[agent_id]:
-            task = await self.orchestrator.send_message(task_id, message)
-            self.tasks[task_id] = task
-            results.append(task)
-        return results
+        results = await self._gather(self._message_calls(message, [agent_id]))
+        self._check(results, "send message")
+        for result in results:
+            self.tasks[result.task_id] = result.task
+        return [result.task for result in results]
     
     async def collect_results(self) -> Dict[str, Dict[str, Any]]:
         """Collect results from all tasks.
         
         Returns:
             A dictionary mapping agent IDs to their response data.
+            
+        Raises:
+            OrchestratorError: If a task could not be fetched.
         """
-        results = {}
-        for agent_id, task_ids in self.agent_tasks.items():
-            agent_results = []
-            for task_id in task_ids:
-                task = await self.orchestrator.get_task(task_id)
-                # Extract the assistant messages
-                messages = [msg for msg in task.messages if msg.role == "assistant"]
-                if messages:
-                    # Get the content of the last assistant message
-                    last_message = messages[-1]
-                    content = [part.content for part in last_message.parts if part.type == "text"]
-                    agent_results.append({
-                        "task_id": task_id,
-                        "content": content,
-                        "state": task.state,
-                        "timestamp": last_message.createdAt.isoformat() if hasattr(last_message, "createdAt") else None
-                    })
-            results[agent_id] = agent_results
+        calls = [
+            (agent_id, task_id, lambda task_id=task_id: self.orchestrator.get_task(task_id))
+            for agent_id, task_ids in self.agent_tasks.items()
+            for task_id in task_ids
+        ]
+        fetched = await self._gather(calls)
+        self._check(fetched, "collect results")
+        
+        results = {agent_id: [] for agent_id in self.agent_tasks}
+        for result in fetched:
+            task = result.task
+            # Extract the assistant messages
+            messages = [msg for msg in task.messages if msg.role == "assistant"]
+            if messages:
+                # Get the content of the last assistant message
+                last_message = messages[-1]
+                content = [part.content for part in last_message.parts if part.type == "text"]
+                results[result.agent_id].append({
+                    "task_id": result.task_id,
+                    "content": content,
+                    "state": task.state,
+                    "timestamp": last_message.createdAt.isoformat() if hasattr(last_message, "createdAt") else None
+                })
         return results
 
 
@@ -631,17 +1239,41 @@ class SequentialTaskChain:
     
     This class manages a task that is passed from one agent to another in sequence,
     maintaining the context and conversation history.
+    
+    By default each agent gets the task when the previous one completed it.
+    In pipelined mode, the agents stream their answers and each agent starts
+    on the first chunks of the previous agent's answer, so the chain takes
+    about as long as its slowest agent instead of the sum of all of them.
+    Chunks are cut by a :data:`ChunkSplitter`, at line ends by default; chunks
+    arriving while an agent is busy are sent to it together.
+    
+    Example:
+        >>> chain = SequentialTaskChain(orchestrator, ["draft", "translate"], pipelined=True,
+        ...                             splitter=split_sentences)
+        >>> await chain.start_chain()
+        >>> async for delta in chain.stream_message(message):
+        ...     print(delta)
     """
     
-    def __init__(self, orchestrator: A2AOrchestrator, agent_sequence: List[str]):
+    def __init__(
+        self,
+        orchestrator: A2AOrchestrator,
+        agent_sequence: List[str],
+        pipelined: bool = False,
+        splitter: ChunkSplitter = split_lines
+    ):
         """Initialize the sequential task chain.
         
         Args:
             orchestrator: The orchestrator to use for task management.
             agent_sequence: List of agent IDs to process the task in sequence.
+            pipelined: Whether agents start on the streamed output of the previous agent.
+            splitter: Where streamed output is cut into chunks in pipelined mode.
         """
         self.orchestrator = orchestrator
         self.agent_sequence = agent_sequence
+        self.pipelined = pipelined
+        self.splitter = splitter
         self.current_index = 0
         self.task_id = None
         self.tasks: List[Task] = []
@@ -666,7 +1298,8 @@ class SequentialTaskChain:
         """Send a message to the current agent in the chain.
         
         If the current agent completes the task, it will be automatically
-        forwarded to the next agent in the sequence.
+        forwarded to the next agent in the sequence. In pipelined mode the
+        message goes through the rest of the chain at once.
         
         Args:
             message: The message to send.
@@ -677,6 +1310,11 @@ class SequentialTaskChain:
         if not self.task_id:
             raise OrchestratorError("Chain not started. Call start_chain first.")
         
+        if self.pipelined:
+            async for _ in self.stream_message(message):
+                pass
+            return self.tasks[-1]
+        
         # Send message to current agent
         task = await self.orchestrator.send_message(self.task_id, message)
         self.tasks.append(task)
@@ -687,6 +1325,135 @@ class SequentialTaskChain:
         
         return task
     
+    async def stream_message(self, message: Message) -> AsyncIterator[TaskDelta]:
+        """Send a message through the rest of the chain with pipelined streaming.
+        
+        Every remaining agent gets a task of its own. The current agent
+        streams its answer to the message; each chunk of it is sent to the
+        next agent as soon as it is complete, and so on down the chain.
+        
+        Args:
+            message: The message to send.
+            
+        Yields:
+            The deltas streamed by the last agent, then a final delta with
+            ``done`` set.
+            
+        Raises:
+            OrchestratorError: If the chain is not started or an agent fails.
+        """
+        if not self.task_id:
+            raise OrchestratorError("Chain not started. Call start_chain first.")
+        
+        agents = self.agent_sequence[self.current_index:]
+        task_ids = [self.task_id]
+        for from_agent, to_agent in zip(agents, agents[1:]):
+            clone = await self.orchestrator._clone_task(task_ids[-1], from_agent, to_agent)
+            task_ids.append(clone.id)
+        
+        # Chunks waiting for each agent; None ends an agent's input
+        inputs: List[asyncio.Queue] = [asyncio.Queue() for _ in agents]
+        output: asyncio.Queue = asyncio.Queue()
+        inputs[0].put_nowait(message)
+        inputs[0].put_nowait(None)
+        stages = [
+            asyncio.create_task(self._run_stage(index, agents, task_ids, inputs, output))
+            for index in range(len(agents))
+        ]
+        try:
+            finished = 0
+            while finished < len(stages):
+                item = await output.get()
+                if item is None:
+                    finished += 1
+                elif isinstance(item, Exception):
+                    raise OrchestratorError(f"Pipelined chain failed: {str(item)}") from item
+                else:
+                    yield item
+        finally:
+            for stage in stages:
+                stage.cancel()
+            await asyncio.gather(*stages, return_exceptions=True)
+        
+        tasks = await asyncio.gather(*(self.orchestrator.get_task(task_id) for task_id in task_ids))
+        self.tasks.extend(tasks)
+        self.current_index += len(agents) - 1
+        self.task_id = task_ids[-1]
+        yield TaskDelta(id=self.task_id, state=tasks[-1].state, done=True,
+                        metadata={"pipeline": {"agents": agents, "task_ids": task_ids}})
+    
+    async def _run_stage(self, index: int, agents: List[str], task_ids: List[str],
+                         inputs: List[asyncio.Queue], output: asyncio.Queue) -> None:
+        """Send an agent its chunks as they arrive and pass its streamed answer on.
+        
+        The last agent's deltas go to `output`; the other agents' answers are
+        cut into chunks for the next agent. Reports completion with None, and
+        failure with the exception, on `output`.
+        """
+        last = index == len(agents) - 1
+        buffer = ""
+        chunks_sent = 0
+        
+        def forward(text: str) -> None:
+            nonlocal chunks_sent
+            chunks_sent += 1
+            inputs[index + 1].put_nowait(Message(
+                role="user",
+                parts=[MessagePart(type="text", content=text)],
+                metadata={"pipeline": {
+                    "from_agent": agents[index],
+                    "original_task_id": task_ids[index],
+                    "chunk": chunks_sent,
+                }}
+            ))
+        
+        def take(text: str) -> None:
+            nonlocal buffer
+            buffer += text
+            cut = self.splitter(buffer)
+            if cut:
+                forward(buffer[:cut])
+                buffer = buffer[cut:]
+        
+        try:
+            while True:
+                message = await inputs[index].get()
+                if message is None:
+                    break
+                # Send the chunks that arrived meanwhile along with this one
+                closed = False
+                while not inputs[index].empty():
+                    extra = inputs[index].get_nowait()
+                    if extra is None:
+                        closed = True
+                        break
+                    message.parts[0].content += extra.parts[0].content
+                
+                streamed = False
+                async for delta in self.orchestrator.send_message_streaming(task_ids[index], message):
+                    if last:
+                        output.put_nowait(delta.model_copy(update={"done": False}))
+                        continue
+                    text = _delta_text(delta)
+                    if text:
+                        streamed = True
+                        take(text)
+                
+                if not last and not streamed:
+                    # The agent answered without streaming text
+                    take(_answer(await self.orchestrator.get_task(task_ids[index])) or "")
+                if closed:
+                    break
+            
+            if not last:
+                if buffer:
+                    forward(buffer)
+                inputs[index + 1].put_nowait(None)
+            output.put_nowait(None)
+        except Exception as e:
+            logger.error(f"Pipeline stage {agents[index]} failed: {str(e)}")
+            output.put_nowait(e)
+    
     async def _advance_to_next_agent(self, task: Task) -> Task:
         """Advance to the next agent in the sequence.
         
@@ -2,12 +2,22 @@
 
 This module provides support for A2A push notifications, allowing servers to notify clients
 about task state changes and other events.
+
+Notifications are delivered in the background by a :class:`PushDeliveryQueue`, so
+sending one never waits on the receiving webhook. The queue is bounded, sends over
+pooled keep-alive connections, limits concurrent requests per endpoint, and retries
+failed deliveries with exponential backoff. Events of one task are delivered in order;
+while a receiver is slow, successive ``task_delta`` events of a task that are still
+waiting are coalesced into one.
 """
 import asyncio
 import datetime
 import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+import random
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
 
 
 class DateTimeEncoder(json.JSONEncoder):
@@ -22,10 +32,14 @@ class DateTimeEncoder(json.JSONEncoder):
 import httpx
 from pydantic import BaseModel, Field
 
+from ailf.communication.a2a_client import A2AConnectionPool
 from ailf.schemas.a2a import Task, TaskDelta, TaskState
 
 logger = logging.getLogger(__name__)
 
+# Status codes worth retrying; other client errors will not succeed on a second attempt
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
 
 class PushNotificationConfig(BaseModel):
     """Configuration for push notifications."""
@@ -45,12 +59,296 @@ class PushNotificationEvent(BaseModel):
     timestamp: str = Field(..., description="ISO 8601 timestamp of when the event occurred")
 
 
+@dataclass
+class DeliveryStats:
+    """Counters of a push delivery queue.
+
+    Attributes:
+        queued: Notifications accepted into the queue
+        delivered: Notifications the receiver acknowledged
+        failed: Notifications given up on after the last retry or a non-retryable error
+        retried: Delivery attempts that were retried
+        dropped: Notifications rejected because the queue was full
+        coalesced: Task deltas merged into a delta that was still waiting
+    """
+    queued: int = 0
+    delivered: int = 0
+    failed: int = 0
+    retried: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+
+
+def _merge_deltas(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine two dumped TaskDelta objects into one equivalent delta."""
+    merged = dict(older)
+    if newer.get("state") is not None:
+        merged["state"] = newer["state"]
+    if merged.get("id") is None and newer.get("id") is not None:
+        merged["id"] = newer["id"]
+    merged["messages"] = list(older.get("messages", [])) + list(newer.get("messages", []))
+    if newer.get("metadata"):
+        merged["metadata"] = {**(older.get("metadata") or {}), **newer["metadata"]}
+    merged["done"] = bool(older.get("done")) or bool(newer.get("done"))
+    return merged
+
+
+class _Delivery:
+    """A queued notification and its delivery attempts."""
+
+    __slots__ = ("config", "event", "body", "started")
+
+    def __init__(self, config: PushNotificationConfig, event: PushNotificationEvent):
+        self.config = config
+        self.event = event
+        self.body: Optional[bytes] = None
+        self.started = False
+
+    def encode(self) -> bytes:
+        """Serialize the event once, on the first attempt."""
+        if self.body is None:
+            self.body = json.dumps(self.event.model_dump(), cls=DateTimeEncoder).encode("utf-8")
+        return self.body
+
+
+class PushDeliveryQueue:
+    """Bounded background queue that delivers push notifications to webhooks.
+
+    Each endpoint URL has its own queue and at most `max_concurrency_per_endpoint`
+    requests in flight, so a slow receiver does not hold up the others.
+    """
+
+    def __init__(self,
+                 max_queue_size: int = 1000,
+                 max_concurrency_per_endpoint: int = 4,
+                 max_retries: int = 3,
+                 backoff_base: float = 0.5,
+                 backoff_max: float = 30.0,
+                 timeout: float = 10.0,
+                 connection_pool: Optional[A2AConnectionPool] = None):
+        """Initialize the delivery queue.
+
+        Args:
+            max_queue_size: Maximum number of notifications waiting or in flight. Notifications
+                sent while the queue is full are dropped.
+            max_concurrency_per_endpoint: Maximum number of concurrent requests to one endpoint.
+            max_retries: Retries of a failed delivery before giving up.
+            backoff_base: Delay in seconds before the first retry; doubled on each further retry.
+            backoff_max: Maximum delay in seconds between retries.
+            timeout: Timeout for each webhook request in seconds.
+            connection_pool: Pool of keep-alive HTTP connections. If None, uses the
+                process-wide pool shared with A2A clients.
+        """
+        if max_concurrency_per_endpoint < 1:
+            raise ValueError("max_concurrency_per_endpoint must be at least 1")
+        self.max_queue_size = max_queue_size
+        self.max_concurrency_per_endpoint = max_concurrency_per_endpoint
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.connection_pool = connection_pool or A2AConnectionPool.default()
+        self.stats = DeliveryStats()
+        self._queues: Dict[str, Deque[_Delivery]] = {}
+        # Last waiting delivery of each (endpoint, task), the candidate for coalescing
+        self._last_waiting: Dict[Tuple[str, str], _Delivery] = {}
+        self._tasks_in_flight: Set[Tuple[str, str]] = set()
+        self._workers: Dict[str, Set[asyncio.Task]] = {}
+        self._size = 0
+        self._idle: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def enqueue(self, config: PushNotificationConfig, event: PushNotificationEvent) -> bool:
+        """Queue a notification for delivery without waiting for it.
+
+        Must be called from a running event loop.
+
+        Args:
+            config: The endpoint to deliver to.
+            event: The notification.
+
+        Returns:
+            True if the notification was queued or coalesced, False if the queue is full.
+        """
+        key = (config.url, event.task_id)
+        if event.event_type == "task_delta":
+            waiting = self._last_waiting.get(key)
+            if waiting is not None and waiting.event.event_type == "task_delta" and not waiting.started:
+                waiting.event = waiting.event.model_copy(update={
+                    "data": {"delta": _merge_deltas(waiting.event.data["delta"], event.data["delta"])},
+                    "timestamp": event.timestamp,
+                })
+                self.stats.coalesced += 1
+                return True
+
+        if self._size >= self.max_queue_size:
+            self.stats.dropped += 1
+            logger.warning(f"Push notification queue full, dropping {event.event_type} for task {event.task_id}")
+            return False
+
+        delivery = _Delivery(config, event)
+        self._queues.setdefault(config.url, deque()).append(delivery)
+        self._last_waiting[key] = delivery
+        self._size += 1
+        self.stats.queued += 1
+        self._idle_event().clear()
+
+        workers = self._workers.setdefault(config.url, set())
+        if len(workers) < self.max_concurrency_per_endpoint:
+            worker = asyncio.create_task(self._work(config.url))
+            workers.add(worker)
+        return True
+
+    def _idle_event(self) -> asyncio.Event:
+        if self._idle is None:
+            self._idle = asyncio.Event()
+            self._idle.set()
+        return self._idle
+
+    def _next(self, url: str) -> Optional[_Delivery]:
+        """Take the oldest delivery of an endpoint whose task has nothing in flight."""
+        queue = self._queues.get(url)
+        if not queue:
+            return None
+        for index, delivery in enumerate(queue):
+            key = (url, delivery.event.task_id)
+            if key not in self._tasks_in_flight:
+                del queue[index]
+                delivery.started = True
+                self._tasks_in_flight.add(key)
+                if self._last_waiting.get(key) is delivery:
+                    del self._last_waiting[key]
+                return delivery
+        return None
+
+    async def _work(self, url: str) -> None:
+        try:
+            while True:
+                delivery = self._next(url)
+                if delivery is None:
+                    if not self._queues.get(url):
+                        self._queues.pop(url, None)
+                    return
+                key = (url, delivery.event.task_id)
+                try:
+                    await self._deliver(delivery)
+                finally:
+                    self._tasks_in_flight.discard(key)
+                    self._size -= 1
+                    if self._size == 0:
+                        self._idle_event().set()
+        finally:
+            # Leave the worker set before returning, not in a done callback: an
+            # enqueue between the two would see the slot taken and start nobody.
+            workers = self._workers.get(url)
+            if workers is not None:
+                workers.discard(asyncio.current_task())
+                if not workers:
+                    del self._workers[url]
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _deliver(self, delivery: _Delivery) -> bool:
+        """Send a notification, retrying with backoff. Returns True once delivered."""
+        config, event = delivery.config, delivery.event
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {config.token}"
+        }
+        if config.headers:
+            headers.update(config.headers)
+
+        for attempt in range(self.max_retries + 1):
+            retryable = True
+            try:
+                response = await self.connection_pool.get(config.url).post(
+                    config.url,
+                    content=delivery.encode(),
+                    headers=headers,
+                    timeout=self.timeout
+                )
+                response.raise_for_status()
+                self.stats.delivered += 1
+                logger.info(f"Push notification sent for task {event.task_id}: {event.event_type}")
+                return True
+            except httpx.HTTPStatusError as e:
+                retryable = e.response.status_code in RETRYABLE_STATUS_CODES
+                error = e
+            except httpx.RequestError as e:
+                error = e
+            except Exception as e:
+                retryable = False
+                error = e
+
+            if not retryable or attempt == self.max_retries:
+                break
+            self.stats.retried += 1
+            delay = self._backoff(attempt)
+            logger.debug(f"Retrying push notification for task {event.task_id} in {delay:.2f}s: {error}")
+            await asyncio.sleep(delay)
+
+        self.stats.failed += 1
+        logger.error(f"Failed to send push notification for task {event.task_id}: {str(error)}")
+        return False
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued notification has been delivered or given up on.
+
+        Args:
+            timeout: Maximum number of seconds to wait. None waits indefinitely.
+
+        Returns:
+            True if the queue is empty, False if the timeout expired first.
+        """
+        try:
+            await asyncio.wait_for(self._idle_event().wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def aclose(self, timeout: Optional[float] = 5.0) -> None:
+        """Deliver what is queued, then stop the workers.
+
+        Args:
+            timeout: Seconds to wait for queued notifications before discarding them.
+        """
+        await self.flush(timeout)
+        workers = [worker for endpoint_workers in self._workers.values() for worker in endpoint_workers]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        self._queues.clear()
+        self._last_waiting.clear()
+        self._tasks_in_flight.clear()
+        self._size = 0
+        self._idle_event().set()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get delivery counters and the current queue size.
+
+        Returns:
+            The counters of :class:`DeliveryStats`, with the queue size as "size".
+        """
+        return {"size": self._size, **asdict(self.stats)}
+
+
 class PushNotificationManager:
     """Manager for sending push notifications to clients."""
     
-    def __init__(self):
-        """Initialize a new push notification manager."""
+    def __init__(self, delivery_queue: Optional[PushDeliveryQueue] = None):
+        """Initialize a new push notification manager.
+        
+        Args:
+            delivery_queue: Queue that delivers the notifications in the background.
+                If None, a queue with default settings is created.
+        """
         self.task_configs: Dict[str, PushNotificationConfig] = {}
+        self.delivery_queue = delivery_queue if delivery_queue is not None else PushDeliveryQueue()
         
     def register_task(self, task_id: str, config: PushNotificationConfig) -> None:
         """Register a task for push notifications.
@@ -76,7 +374,10 @@ class PushNotificationManager:
         event_type: str, 
         data: Dict[str, Any]
     ) -> bool:
-        """Send a notification for a task.
+        """Queue a notification for a task.
+        
+        The notification is delivered in the background; this method does not
+        wait for the receiving endpoint.
         
         Args:
             task_id: The ID of the task.
@@ -84,7 +385,7 @@ class PushNotificationManager:
             data: The event data.
             
         Returns:
-            True if the notification was sent, False otherwise.
+            True if the notification was queued, False otherwise.
         """
         if task_id not in self.task_configs:
             logger.warning(f"No push notification config for task {task_id}")
@@ -100,35 +401,22 @@ class PushNotificationManager:
             timestamp=datetime.datetime.now(datetime.UTC).isoformat(),
         )
         
-        # Send the notification
-        try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Content-Type": "application/json", 
-                    "Authorization": f"Bearer {config.token}"
-                }
-                
-                if config.headers:
-                    headers.update(config.headers)
-                    
-                # Convert to JSON-safe dictionary first with custom encoder
-                notification_dict = json.loads(
-                    json.dumps(notification.model_dump(), cls=DateTimeEncoder)
-                )
-                
-                response = await client.post(
-                    config.url, 
-                    json=notification_dict,
-                    headers=headers
-                )
-                
-                response.raise_for_status()
-                logger.info(f"Push notification sent for task {task_id}: {event_type}")
-                return True
-                
-        except Exception as e:
-            logger.error(f"Failed to send push notification for task {task_id}: {str(e)}")
-            return False
+        return self.delivery_queue.enqueue(config, notification)
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued notification has been delivered or given up on.
+        
+        Args:
+            timeout: Maximum number of seconds to wait. None waits indefinitely.
+            
+        Returns:
+            True if the queue is empty, False if the timeout expired first.
+        """
+        return await self.delivery_queue.flush(timeout)
+
+    async def aclose(self) -> None:
+        """Deliver queued notifications and stop the delivery workers."""
+        await self.delivery_queue.aclose()
             
     async def notify_task_update(self, task: Task) -> bool:
         """Send a task update notification.
@@ -137,7 +425,7 @@ class PushNotificationManager:
             task: The updated task.
             
         Returns:
-            True if the notification was sent, False otherwise.
+            True if the notification was queued, False otherwise.
         """
         return await self.send_notification(
             task.id,
@@ -153,7 +441,7 @@ class PushNotificationManager:
             delta: The task delta.
             
         Returns:
-            True if the notification was sent, False otherwise.
+            True if the notification was queued, False otherwise.
         """
         return await self.send_notification(
             task_id,
@@ -169,7 +457,7 @@ class PushNotificationManager:
             new_state: The new state of the task.
             
         Returns:
-            True if the notification was sent, False otherwise.
+            True if the notification was queued, False otherwise.
         """
         return await self.send_notification(
             task_id,
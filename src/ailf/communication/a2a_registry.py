@@ -7,13 +7,16 @@ import json
 import logging
 import os
 from datetime import datetime, UTC
-from typing import Dict, List, Optional, Union, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Union, Any
 
 import httpx
 from pydantic import BaseModel, Field
 
 from ailf.schemas.a2a import AgentCard
 
+if TYPE_CHECKING:
+    from ailf.communication.a2a_client import A2AClient, A2AConnectionPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -311,14 +314,17 @@ class A2ARegistryClient:
 class A2ARegistryManager:
     """Manager for discovering and interacting with A2A agents."""
     
-    def __init__(self, registry_url: Optional[str] = None):
+    def __init__(self, registry_url: Optional[str] = None, connection_pool: Optional["A2AConnectionPool"] = None):
         """Initialize the registry manager.
         
         Args:
             registry_url: URL of the remote registry service. If None, uses local registry.
+            connection_pool: Connection pool shared by the clients of discovered agents.
+                If None, uses the process-wide pool.
         """
         self.local_registry = A2ARegistry()
         self.remote_client = A2ARegistryClient(registry_url) if registry_url else None
+        self.connection_pool = connection_pool
         
     async def discover_agent(self, agent_id: str) -> Optional[RegistryEntry]:
         """Discover an agent by ID from local or remote registry.
@@ -384,13 +390,14 @@ class A2ARegistryManager:
             agent_id: The ID of the agent to get a client for.
             
         Returns:
-            An A2AClient configured for the agent, or None if agent not found.
+            An A2AClient configured for the agent, sharing pooled connections
+            with other clients of the same agent host, or None if agent not found.
         """
         # Local import to avoid circular dependency
-        from ailf.communication.a2a_client import A2AClient
+        from ailf.communication.a2a_client import A2AClient, A2AConnectionPool
         
         agent = await self.discover_agent(agent_id)
         if not agent:
             return None
             
-        return A2AClient(base_url=agent.url)
+        return A2AClient(base_url=agent.url, connection_pool=self.connection_pool or A2AConnectionPool.default())
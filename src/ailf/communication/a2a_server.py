@@ -3,10 +3,14 @@
 This module provides base classes and utilities for creating A2A-compatible
 FastAPI servers that integrate with AILF agents.
 """
+import base64
+import bisect
 import json
 import logging
-from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Type, Union
+import time
+from contextlib import aclosing, asynccontextmanager
+from datetime import UTC, datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import asyncio
 from fastapi import FastAPI, HTTPException, Request, Response, Depends
@@ -14,8 +18,17 @@ from fastapi.responses import JSONResponse, StreamingResponse
 from sse_starlette.sse import EventSourceResponse
 from pydantic import BaseModel, ValidationError
 
+from ailf.communication.a2a_admission import A2AOverloadedError, AdmissionController, AdmissionTicket
+from ailf.communication.a2a_idempotency import (
+    IdempotencyCache,
+    IdempotencyError,
+    IdempotentExecution,
+    request_fingerprint,
+)
 from ailf.schemas.a2a import (
     AgentCard,
+    ListMessagesResponse,
+    ListTasksResponse,
     Message,
     MessagePart,
     SendMessageRequest,
@@ -35,22 +48,234 @@ class A2AServerError(Exception):
     pass
 
 
+class MessageArchive:
+    """In-memory storage for messages compacted out of tasks, and the interface of archives.
+
+    Each task's archived messages form a log indexed from 0, the position of
+    the task's first message. Subclasses can keep the log elsewhere, e.g.
+    ``SQLiteMessageArchive`` in ``ailf.communication.a2a_task_store``.
+    """
+
+    def __init__(self):
+        """Initialize an empty archive."""
+        self.messages: Dict[str, List[Message]] = {}
+
+    async def write(self, task_id: str, start: int, messages: List[Message]) -> None:
+        """Store messages from position `start`, discarding any stored at or after it.
+        
+        Args:
+            task_id: The ID of the task.
+            start: Position of the first message.
+            messages: The messages to store.
+        """
+        log = self.messages.setdefault(task_id, [])
+        del log[start:]
+        log.extend(messages)
+
+    async def read(self, task_id: str, start: int, end: int) -> List[Message]:
+        """Read the messages at positions `start` to `end` (exclusive).
+        
+        Args:
+            task_id: The ID of the task.
+            start: Position of the first message.
+            end: Position after the last message.
+            
+        Returns:
+            The stored messages in the range.
+        """
+        return self.messages.get(task_id, [])[start:end]
+
+    async def delete(self, task_id: str) -> None:
+        """Delete the archived messages of a task."""
+        self.messages.pop(task_id, None)
+
+    async def close(self) -> None:
+        """Release the resources of the archive."""
+
+
+class HistoryCompaction:
+    """Policy bounding the messages kept inline in tasks.
+    
+    When a task is stored with more than `keep_last` messages, the older ones
+    move out of ``Task.messages`` into the task's message history, and
+    ``Task.archivedMessageCount`` counts them. The stored task, and every
+    response that includes it, then holds at most `keep_last` messages however
+    long the conversation gets. Clients fetch the rest with
+    :meth:`TaskStore.get_messages`.
+    
+    A `summarizer` can fold the messages that leave the window into
+    ``Task.historySummary``. It is called with the previous summary (or None)
+    and the messages leaving, so each message is summarized once.
+    """
+
+    def __init__(self,
+                 keep_last: int = 50,
+                 summarizer: Optional[Callable[[Optional[str], List[Message]], Awaitable[str]]] = None,
+                 archive: Optional[MessageArchive] = None):
+        """Initialize the policy.
+        
+        Args:
+            keep_last: Number of most recent messages kept inline.
+            summarizer: Coroutine function returning the new summary from the previous
+                summary and the messages being compacted.
+            archive: Where the in-memory :class:`TaskStore` keeps compacted messages.
+                Defaults to process memory. Persistent task stores keep them in
+                their own message storage and ignore it.
+        """
+        if keep_last < 1:
+            raise ValueError("keep_last must be at least 1")
+        self.keep_last = keep_last
+        self.summarizer = summarizer
+        self.archive = archive if archive is not None else MessageArchive()
+
+    async def compact(self, task: Task) -> List[Message]:
+        """Move the messages of a task beyond the last `keep_last` out of it.
+        
+        Args:
+            task: The task, changed in place.
+            
+        Returns:
+            The messages moved out, oldest first. They are the messages at positions
+            ``task.archivedMessageCount - len(result)`` onwards of the history.
+        """
+        overflow = task.messages[:-self.keep_last]
+        if not overflow:
+            return []
+        if self.summarizer is not None:
+            task.historySummary = await self.summarizer(task.historySummary, overflow)
+        task.messages = task.messages[-self.keep_last:]
+        task.archivedMessageCount += len(overflow)
+        return overflow
+
+
 class TaskStore:
-    """Simple in-memory storage for A2A tasks."""
+    """In-memory storage for A2A tasks, and the interface of persistent task stores.
+
+    Tasks are indexed by state and by ``updatedAt``. :meth:`list_tasks_page`
+    returns the most recently updated tasks first and continues from an opaque
+    cursor, so a page costs the same however deep it is. With a `ttl`, tasks not
+    updated for `ttl` seconds expire. ``SQLiteTaskStore`` and ``RedisTaskStore``
+    in ``ailf.communication.a2a_task_store`` implement the same methods with
+    storage that survives restarts and can be shared by server replicas.
+
+    With a :class:`HistoryCompaction` policy, tasks are stored with only their
+    most recent messages, so the cost of storing and returning a task does not
+    grow with its conversation.
+    """
     
-    def __init__(self):
-        """Initialize an empty task store."""
+    def __init__(self, ttl: Optional[float] = None, compaction: Optional[HistoryCompaction] = None):
+        """Initialize an empty task store.
+        
+        Args:
+            ttl: Seconds after its last update at which a task expires. None keeps tasks forever.
+            compaction: Policy moving older messages out of stored tasks. None keeps every
+                message inline.
+        """
+        self.ttl = ttl
+        self.compaction = compaction
         self.tasks: Dict[str, Task] = {}
+        # Sorted (updatedAt in microseconds, task ID) keys, overall and per state
+        self._index: List[Tuple[int, str]] = []
+        self._state_index: Dict[TaskState, List[Tuple[int, str]]] = {}
+        self._keys: Dict[str, Tuple[Tuple[int, str], TaskState]] = {}
+
+    @staticmethod
+    def sort_key(task: Task) -> Tuple[int, str]:
+        """Get the (updatedAt in microseconds, task ID) key that orders tasks in pages."""
+        return int(task.updatedAt.timestamp() * 1_000_000), task.id
+
+    @staticmethod
+    def encode_cursor(key: Tuple[int, str]) -> str:
+        """Encode the sort key of the last task of a page as a cursor."""
+        return base64.urlsafe_b64encode(f"{key[0]}:{key[1]}".encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[int, str]:
+        """Decode a cursor into the sort key of the last task of the previous page.
         
-    async def create_task(self) -> Task:
+        Raises:
+            A2AServerError: If the cursor is malformed.
+        """
+        try:
+            updated, task_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split(":", 1)
+            return int(updated), task_id
+        except (ValueError, UnicodeError) as e:
+            raise A2AServerError(f"Invalid cursor: {cursor}") from e
+
+    def _expired(self, task: Task, now: Optional[float] = None) -> bool:
+        if self.ttl is None:
+            return False
+        return task.updatedAt.timestamp() + self.ttl <= (now if now is not None else time.time())
+
+    def _index_add(self, task: Task) -> None:
+        key = self.sort_key(task)
+        bisect.insort(self._index, key)
+        bisect.insort(self._state_index.setdefault(task.state, []), key)
+        self._keys[task.id] = (key, task.state)
+
+    def _index_remove(self, task_id: str) -> None:
+        key, state = self._keys.pop(task_id)
+        for index in (self._index, self._state_index[state]):
+            position = bisect.bisect_left(index, key)
+            if position < len(index) and index[position] == key:
+                del index[position]
+
+    def _store(self, task: Task) -> None:
+        if task.id in self._keys:
+            self._index_remove(task.id)
+        self.tasks[task.id] = task
+        self._index_add(task)
+
+    async def _compact(self, task: Task) -> List[Message]:
+        """Apply the compaction policy to a task about to be stored.
+        
+        Returns:
+            The messages moved out of the task, which the store must keep in the
+            task's message history.
+        """
+        if self.compaction is None:
+            return []
+        return await self.compaction.compact(task)
+
+    async def _archive(self, task: Task, overflow: List[Message]) -> None:
+        """Write messages moved out of a task to the archive of the compaction policy."""
+        if overflow:
+            await self.compaction.archive.write(task.id, task.archivedMessageCount - len(overflow), overflow)
+        
+    async def create_task(self, task: Optional[Task] = None) -> Task:
         """Create a new task.
         
+        Args:
+            task: The task to store. If None, an empty task is created.
+        
         Returns:
             The created task.
+            
+        Raises:
+            A2AServerError: If a task with the same ID exists.
         """
-        task = Task(state=TaskState.CREATED)
-        self.tasks[task.id] = task
+        task = task or Task(state=TaskState.CREATED)
+        if task.id in self.tasks:
+            raise A2AServerError(f"Task {task.id} already exists")
+        await self._archive(task, await self._compact(task))
+        self._store(task)
         return task
+
+    async def add_tasks(self, tasks: Iterable[Task]) -> int:
+        """Store many existing tasks, e.g. when migrating between stores.
+        
+        Args:
+            tasks: The tasks to store. Tasks with the ID of a stored task replace it.
+            
+        Returns:
+            The number of tasks stored.
+        """
+        count = 0
+        for task in tasks:
+            await self._archive(task, await self._compact(task))
+            self._store(task)
+            count += 1
+        return count
         
     async def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID.
@@ -61,10 +286,18 @@ class TaskStore:
         Returns:
             The task if found, None otherwise.
         """
-        return self.tasks.get(task_id)
+        task = self.tasks.get(task_id)
+        if task is not None and self._expired(task):
+            await self.delete_task(task_id)
+            return None
+        return task
         
     async def update_task(self, task: Task) -> Task:
-        """Update a task.
+        """Update a task and set its updatedAt to now.
+        
+        Persistent stores treat messages as append-only: messages beyond those
+        already stored are appended, and earlier ones are not rewritten. With a
+        compaction policy, the task is compacted in place.
         
         Args:
             task: The task to update.
@@ -78,22 +311,102 @@ class TaskStore:
         if task.id not in self.tasks:
             raise A2AServerError(f"Task {task.id} not found")
             
-        task.updatedAt = task.updatedAt  # Update timestamp
-        self.tasks[task.id] = task
+        task.updatedAt = datetime.now(UTC)
+        await self._archive(task, await self._compact(task))
+        self._store(task)
         return task
+
+    async def append_messages(self,
+                              task_id: str,
+                              messages: List[Message],
+                              state: Optional[TaskState] = None) -> Task:
+        """Append messages to a task, optionally changing its state, without rewriting it.
+        
+        Args:
+            task_id: The ID of the task.
+            messages: The messages to append.
+            state: The new state of the task, if it changes.
+            
+        Returns:
+            The updated task.
+            
+        Raises:
+            A2AServerError: If the task doesn't exist.
+        """
+        task = await self.get_task(task_id)
+        if not task:
+            raise A2AServerError(f"Task {task_id} not found")
+        task.messages.extend(messages)
+        if state is not None:
+            task.state = state
+        return await self.update_task(task)
         
-    async def list_tasks(self, limit: int = 10, skip: int = 0) -> List[Task]:
-        """List tasks.
+    async def list_tasks(self, limit: int = 10, skip: int = 0, state: Optional[TaskState] = None) -> List[Task]:
+        """List tasks by offset, most recently updated first.
+        
+        Prefer :meth:`list_tasks_page`, whose cost does not grow with the offset.
         
         Args:
             limit: Maximum number of tasks to return.
             skip: Number of tasks to skip.
+            state: Only list tasks in this state.
             
         Returns:
             A list of tasks.
         """
-        task_list = list(self.tasks.values())
-        return task_list[skip:skip+limit]
+        await self.purge_expired()
+        index = self._state_index.get(state, []) if state is not None else self._index
+        end = max(len(index) - skip, 0)
+        return [self.tasks[task_id] for _, task_id in reversed(index[max(end - limit, 0):end])]
+
+    async def list_tasks_page(self,
+                              limit: int = 10,
+                              cursor: Optional[str] = None,
+                              state: Optional[TaskState] = None) -> ListTasksResponse:
+        """List a page of tasks, most recently updated first.
+        
+        A task updated while a client is paging moves to the front and may be
+        missed or seen twice by that client.
+        
+        Args:
+            limit: Maximum number of tasks to return.
+            cursor: The nextCursor of the previous page, or None for the first page.
+            state: Only list tasks in this state.
+            
+        Returns:
+            The page, with the cursor of the next page if there is one.
+        """
+        await self.purge_expired()
+        index = self._state_index.get(state, []) if state is not None else self._index
+        end = bisect.bisect_left(index, self.decode_cursor(cursor)) if cursor else len(index)
+        keys = index[max(end - limit, 0):end]
+        return ListTasksResponse(
+            tasks=[self.tasks[task_id] for _, task_id in reversed(keys)],
+            nextCursor=self.encode_cursor(keys[0]) if keys and end - limit > 0 else None,
+        )
+        
+    async def get_messages(self, task_id: str, start: int = 0, limit: int = 100) -> Optional[ListMessagesResponse]:
+        """Get a range of a task's message history, including compacted messages.
+        
+        Args:
+            task_id: The ID of the task.
+            start: Position of the first message, 0 being the first message of the task.
+            limit: Maximum number of messages to return.
+            
+        Returns:
+            The messages, oldest first, and the length of the history, or None if the
+            task doesn't exist.
+        """
+        task = await self.get_task(task_id)
+        if not task:
+            return None
+        archived = task.archivedMessageCount
+        end = start + max(limit, 0)
+        messages = []
+        if start < archived and self.compaction is not None:
+            messages = await self.compaction.archive.read(task_id, start, min(end, archived))
+        messages.extend(task.messages[max(start - archived, 0):max(end - archived, 0)])
+        return ListMessagesResponse(messages=messages, total=archived + len(task.messages))
         
     async def cancel_task(self, task_id: str) -> Task:
         """Cancel a task.
@@ -112,9 +425,43 @@ class TaskStore:
             raise A2AServerError(f"Task {task_id} not found")
             
         task.state = TaskState.CANCELED
-        task.updatedAt = task.updatedAt  # Update timestamp
         return await self.update_task(task)
 
+    async def delete_task(self, task_id: str) -> bool:
+        """Delete a task.
+        
+        Args:
+            task_id: The ID of the task.
+            
+        Returns:
+            True if the task existed.
+        """
+        if self.tasks.pop(task_id, None) is None:
+            return False
+        self._index_remove(task_id)
+        if self.compaction is not None:
+            await self.compaction.archive.delete(task_id)
+        return True
+
+    async def purge_expired(self) -> int:
+        """Delete expired tasks.
+        
+        Returns:
+            The number of tasks deleted.
+        """
+        if self.ttl is None:
+            return 0
+        cutoff = (int((time.time() - self.ttl) * 1_000_000), "")
+        expired = [task_id for _, task_id in self._index[:bisect.bisect_right(self._index, cutoff)]]
+        for task_id in expired:
+            await self.delete_task(task_id)
+        return len(expired)
+
+    async def close(self) -> None:
+        """Release the resources of the store."""
+        if self.compaction is not None:
+            await self.compaction.archive.close()
+
 
 class A2ARequestContext:
     """Context for processing A2A requests."""
@@ -197,17 +544,32 @@ class AILFASA2AServer:
     def __init__(self, 
                  agent_description: AgentDescription,
                  executor: A2AAgentExecutor,
-                 task_store: Optional[TaskStore] = None):
+                 task_store: Optional[TaskStore] = None,
+                 purge_interval: float = 60.0,
+                 admission: Optional[AdmissionController] = None,
+                 tenant_header: str = "X-Tenant-ID",
+                 idempotency: Optional[IdempotencyCache] = None):
         """Initialize the A2A server.
         
         Args:
             agent_description: The AILF agent description.
             executor: The agent executor that implements the agent logic.
             task_store: Optional task store implementation.
+            purge_interval: Seconds between deletions of expired tasks, when the
+                task store has a TTL.
+            admission: Admission controller limiting concurrent executions. If None,
+                every message is executed at once.
+            tenant_header: Request header naming the tenant for per-tenant limits.
+            idempotency: Cache of results by Idempotency-Key header, so that retried
+                messages are not executed again. If None, the header is ignored.
         """
         self.agent_description = agent_description
         self.executor = executor
-        self.task_store = task_store or TaskStore()
+        self.task_store = task_store if task_store is not None else TaskStore()
+        self.purge_interval = purge_interval
+        self.admission = admission
+        self.tenant_header = tenant_header
+        self.idempotency = idempotency
         self.agent_card = agent_description.to_a2a_agent_card()
         
     @asynccontextmanager
@@ -224,11 +586,86 @@ class AILFASA2AServer:
         logger.info("Starting A2A server")
         app.state.task_store = self.task_store
         app.state.executor = self.executor
+        purge_task = None
+        if self.task_store.ttl is not None:
+            purge_task = asyncio.create_task(self._purge_expired_tasks())
         
         yield
         
         # Shutdown logic
         logger.info("Shutting down A2A server")
+        if purge_task is not None:
+            purge_task.cancel()
+            await asyncio.gather(purge_task, return_exceptions=True)
+        await self.task_store.close()
+        if self.idempotency is not None:
+            await self.idempotency.close()
+
+    async def _purge_expired_tasks(self) -> None:
+        """Delete expired tasks every `purge_interval` seconds."""
+        while True:
+            await asyncio.sleep(self.purge_interval)
+            try:
+                purged = await self.task_store.purge_expired()
+                if purged:
+                    logger.debug(f"Purged {purged} expired tasks")
+            except Exception:
+                logger.exception("Error purging expired tasks")
+        
+    def resolve_tenant(self, request: Request) -> Optional[str]:
+        """Get the tenant of a request, whose executions count against the tenant's limits.
+        
+        Override to identify tenants another way, e.g. from an authentication token.
+        
+        Args:
+            request: The incoming request.
+            
+        Returns:
+            The tenant, or None for the default tenant.
+        """
+        return request.headers.get(self.tenant_header)
+
+    async def _admit(self, request: Request) -> Optional[AdmissionTicket]:
+        """Wait for an execution slot, turning a rejection into a 429 or 503 response."""
+        if self.admission is None:
+            return None
+        try:
+            return await self.admission.acquire(self.resolve_tenant(request))
+        except A2AOverloadedError as e:
+            raise HTTPException(
+                status_code=e.status_code, detail=str(e), headers={"Retry-After": str(e.retry_after)}
+            )
+
+    def _release(self, ticket: Optional[AdmissionTicket]) -> None:
+        if ticket is not None:
+            self.admission.release(ticket)
+
+    async def _begin_execution(self,
+                               task_id: str,
+                               endpoint: str,
+                               request: SendMessageRequest,
+                               http_request: Request) -> Tuple[Optional[IdempotentExecution], bool]:
+        """Look up the Idempotency-Key of a request.
+        
+        Returns:
+            The execution recording the request's result, or None without a key, and
+            whether this request must execute the message.
+        """
+        key = http_request.headers.get("Idempotency-Key")
+        if self.idempotency is None or not key:
+            return None, True
+        try:
+            return await self.idempotency.begin(f"{task_id}:{endpoint}:{key}", request_fingerprint(request))
+        except IdempotencyError as e:
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+
+    async def _finish_execution(self,
+                                execution: Optional[IdempotentExecution],
+                                status_code: int,
+                                body: Optional[Dict[str, Any]] = None) -> None:
+        if execution is not None:
+            execution.finish(status_code, body)
+            await self.idempotency.complete(execution)
         
     def create_app(self) -> FastAPI:
         """Create a FastAPI application for the A2A server.
@@ -250,10 +687,23 @@ class AILFASA2AServer:
             return {"task": task.model_dump()}
             
         @app.get("/tasks")
-        async def list_tasks(limit: int = 10, skip: int = 0) -> Dict[str, Any]:
-            """List tasks."""
-            tasks = await self.task_store.list_tasks(limit, skip)
-            return {"tasks": [task.model_dump() for task in tasks]}
+        async def list_tasks(limit: int = 10,
+                             skip: int = 0,
+                             cursor: Optional[str] = None,
+                             state: Optional[TaskState] = None) -> Dict[str, Any]:
+            """List tasks, most recently updated first.
+            
+            Pages by cursor: pass the returned nextCursor to get the next page.
+            `skip` pages by offset and returns no cursor.
+            """
+            if skip:
+                tasks = await self.task_store.list_tasks(limit, skip, state)
+                return {"tasks": [task.model_dump() for task in tasks]}
+            try:
+                page = await self.task_store.list_tasks_page(limit, cursor, state)
+            except A2AServerError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            return page.model_dump()
             
         @app.get("/tasks/{task_id}")
         async def get_task(task_id: str) -> Dict[str, Any]:
@@ -262,6 +712,17 @@ class AILFASA2AServer:
             if not task:
                 raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
             return {"task": task.model_dump()}
+
+        @app.get("/tasks/{task_id}/messages")
+        async def get_messages(task_id: str, start: int = 0, limit: int = 100) -> Dict[str, Any]:
+            """Get a range of a task's message history, oldest first.
+            
+            Includes the messages compacted out of the task.
+            """
+            history = await self.task_store.get_messages(task_id, start, limit)
+            if history is None:
+                raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+            return history.model_dump()
             
         @app.post("/tasks/{task_id}/cancel")
         async def cancel_task(task_id: str) -> Dict[str, Any]:
@@ -272,49 +733,100 @@ class AILFASA2AServer:
             except A2AServerError as e:
                 raise HTTPException(status_code=404, detail=str(e))
                 
-        @app.post("/tasks/{task_id}/messages")
-        async def send_message(task_id: str, request: SendMessageRequest) -> Dict[str, Any]:
-            """Send a message to a task."""
-            task = await self.task_store.get_task(task_id)
-            if not task:
-                raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+        async def execute_message(task_id: str,
+                                  request: SendMessageRequest,
+                                  http_request: Request) -> Dict[str, Any]:
+            """Execute a message sent to a task and return the response body."""
+            ticket = await self._admit(http_request)
+            try:
+                try:
+                    # Append the new message without rewriting the task
+                    task = await self.task_store.append_messages(task_id, [request.message], TaskState.RUNNING)
+                except A2AServerError:
+                    raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+            
+                try:
+                    # Create context and execute agent
+                    context = A2ARequestContext(task=task, message=request.message)
+                    result = await self.executor.execute(context)
                 
-            # Update task with the new message
-            task.messages.append(request.message)
-            task.state = TaskState.RUNNING
-            await self.task_store.update_task(task)
+                    if isinstance(result, Task):
+                        # Update task with result
+                        await self.task_store.update_task(result)
+                        return {"task": result.model_dump()}
+                    else:
+                        # Should not happen for non-streaming endpoint
+                        raise HTTPException(status_code=500, detail="Unexpected streaming result")
+                except Exception as e:
+                    logger.exception("Error executing agent")
+                    task.state = TaskState.FAILED
+                    await self.task_store.update_task(task)
+                    raise HTTPException(status_code=500, detail=str(e))
+            finally:
+                self._release(ticket)
+
+        @app.post("/tasks/{task_id}/messages")
+        async def send_message(task_id: str,
+                               request: SendMessageRequest,
+                               http_request: Request,
+                               response: Response) -> Dict[str, Any]:
+            """Send a message to a task.
             
+            With admission control, waits for an execution slot and responds 429 or
+            503 with a Retry-After header when the server is overloaded. With an
+            Idempotency-Key header, a repeated request returns the first request's
+            response instead of executing again.
+            """
+            execution, owner = await self._begin_execution(task_id, "messages", request, http_request)
+            if not owner:
+                status_code, body = await execution.result()
+                if status_code != 200:
+                    raise HTTPException(status_code=status_code, detail=(body or {}).get("detail"))
+                response.headers["Idempotent-Replayed"] = "true"
+                return body
             try:
-                # Create context and execute agent
-                context = A2ARequestContext(task=task, message=request.message)
-                result = await self.executor.execute(context)
-                
-                if isinstance(result, Task):
-                    # Update task with result
-                    await self.task_store.update_task(result)
-                    return {"task": result.model_dump()}
-                else:
-                    # Should not happen for non-streaming endpoint
-                    raise HTTPException(status_code=500, detail="Unexpected streaming result")
-            except Exception as e:
-                logger.exception("Error executing agent")
-                task.state = TaskState.FAILED
-                await self.task_store.update_task(task)
-                raise HTTPException(status_code=500, detail=str(e))
+                body = await execute_message(task_id, request, http_request)
+            except HTTPException as e:
+                await self._finish_execution(execution, e.status_code, {"detail": e.detail})
+                raise
+            except BaseException as e:
+                await self._finish_execution(execution, 500, {"detail": str(e)})
+                raise
+            await self._finish_execution(execution, 200, body)
+            return body
                 
         @app.post("/tasks/{task_id}/messages:stream")
-        async def stream_message(task_id: str, request: SendMessageStreamingRequest) -> StreamingResponse:
-            """Send a message to a task and stream the response."""
-            task = await self.task_store.get_task(task_id)
-            if not task:
+        async def stream_message(task_id: str,
+                                 request: SendMessageStreamingRequest,
+                                 http_request: Request) -> StreamingResponse:
+            """Send a message to a task and stream the response.
+            
+            The execution slot is held until the stream ends. With an Idempotency-Key
+            header, a repeated request receives the first request's events instead of
+            executing again.
+            """
+            execution, owner = await self._begin_execution(task_id, "messages:stream", request, http_request)
+            if not owner:
+                return EventSourceResponse(execution.follow(), headers={"Idempotent-Replayed": "true"})
+            try:
+                ticket = await self._admit(http_request)
+            except HTTPException as e:
+                await self._finish_execution(execution, e.status_code, {"detail": e.detail})
+                raise
+            try:
+                # Append the new message without rewriting the task
+                task = await self.task_store.append_messages(task_id, [request.message], TaskState.RUNNING)
+            except A2AServerError:
+                self._release(ticket)
+                await self._finish_execution(execution, 404, {"detail": f"Task {task_id} not found"})
                 raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
-                
-            # Update task with the new message
-            task.messages.append(request.message)
-            task.state = TaskState.RUNNING
-            await self.task_store.update_task(task)
+            except BaseException as e:
+                # The stream never starts, so its generator cannot release the slot
+                self._release(ticket)
+                await self._finish_execution(execution, 500, {"detail": str(e)})
+                raise
             
-            async def event_generator():
+            async def execute():
                 try:
                     # Create context and execute agent
                     context = A2ARequestContext(task=task, message=request.message)
@@ -356,6 +868,24 @@ class AILFASA2AServer:
                         "event": "error",
                         "data": json.dumps({"detail": str(e)})
                     }
+                finally:
+                    self._release(ticket)
+
+            async def event_generator():
+                # Record the events so that repeated requests can replay them
+                status_code = 500
+                try:
+                    async with aclosing(execute()) as events:
+                        failed = False
+                        async for event in events:
+                            if execution is not None:
+                                execution.add_event(event)
+                            failed = failed or event["event"] == "error"
+                            yield event
+                    if not failed:
+                        status_code = 200
+                finally:
+                    await self._finish_execution(execution, status_code)
             
             return EventSourceResponse(event_generator())
             
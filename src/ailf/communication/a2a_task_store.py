@@ -0,0 +1,692 @@
+"""Persistent task stores for A2A servers.
+
+The default :class:`~ailf.communication.a2a_server.TaskStore` keeps tasks in
+process memory, so they are lost on restart and cannot be shared by server
+replicas. The stores in this module implement the same interface on durable,
+shareable storage:
+
+* :class:`SQLiteTaskStore` keeps tasks in a SQLite database file.
+* :class:`RedisTaskStore` keeps tasks in Redis, shared by every replica that
+  connects to the same server.
+
+Both index tasks by state and ``updatedAt`` and page with cursors, so listing
+the newest tasks, or the next page, does not scan the whole store. Messages
+are stored separately from the rest of the task and are append-only: adding a
+message to a long conversation writes that message, not the whole task.
+Tasks expire `ttl` seconds after their last update.
+
+With a :class:`~ailf.communication.a2a_server.HistoryCompaction` policy,
+messages compacted out of a task stay in the store's message storage, and
+reading a task loads only the messages still inline. :class:`SQLiteMessageArchive`
+gives the in-memory task store a place on disk for compacted messages.
+
+Example:
+    >>> store = SQLiteTaskStore("tasks.db", ttl=7 * 24 * 3600)
+    >>> server = AILFASA2AServer(agent_description, executor, task_store=store)
+"""
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ailf.communication.a2a_server import A2AServerError, HistoryCompaction, MessageArchive, TaskStore
+from ailf.schemas.a2a import ListMessagesResponse, ListTasksResponse, Message, Task, TaskState
+
+if TYPE_CHECKING:
+    from ailf.messaging.redis_pool import RedisPoolRegistry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    updated_at INTEGER NOT NULL,
+    expires_at INTEGER,
+    message_count INTEGER NOT NULL,
+    archived_count INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_updated ON tasks (updated_at, id);
+CREATE INDEX IF NOT EXISTS tasks_state_updated ON tasks (state, updated_at, id);
+CREATE INDEX IF NOT EXISTS tasks_expires ON tasks (expires_at) WHERE expires_at IS NOT NULL;
+CREATE TABLE IF NOT EXISTS task_messages (
+    task_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (task_id, seq)
+) WITHOUT ROWID;
+"""
+
+
+_ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS archived_messages (
+    task_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (task_id, seq)
+) WITHOUT ROWID;
+"""
+
+
+def _connect(path: str, schema: str) -> sqlite3.Connection:
+    """Open a SQLite database usable from worker threads and create its tables."""
+    connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    if path != ":memory:":
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(schema)
+    return connection
+
+
+async def _run_in_transaction(connection: sqlite3.Connection,
+                              lock: threading.Lock,
+                              operation: Callable[..., Any],
+                              *args: Any) -> Any:
+    """Run an operation in a transaction on a worker thread."""
+    def run() -> Any:
+        with lock:
+            connection.execute("BEGIN")
+            try:
+                result = operation(*args)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return result
+    return await asyncio.to_thread(run)
+
+
+def _task_data(task: Task) -> str:
+    """Serialize a task without its messages."""
+    return task.model_dump_json(exclude={"messages"})
+
+
+def _load_task(data: Any, messages: Sequence[Any]) -> Task:
+    """Rebuild a task from its serialized fields and messages."""
+    fields = json.loads(data)
+    fields["messages"] = [json.loads(message) for message in messages]
+    return Task.model_validate(fields)
+
+
+class SQLiteTaskStore(TaskStore):
+    """Task store backed by a SQLite database.
+
+    Queries run in a worker thread so they do not block the event loop.
+    """
+
+    def __init__(self,
+                 path: str = ":memory:",
+                 ttl: Optional[float] = None,
+                 compaction: Optional[HistoryCompaction] = None):
+        """Initialize the store, creating its tables if needed.
+
+        Args:
+            path: Path of the database file. ":memory:" keeps the database in memory.
+            ttl: Seconds after its last update at which a task expires. None keeps tasks forever.
+            compaction: Policy moving older messages out of stored tasks. Compacted
+                messages stay in the database.
+        """
+        super().__init__(ttl, compaction)
+        self.path = path
+        self._connection = _connect(path, _SCHEMA)
+        self._lock = threading.Lock()
+
+    async def _run(self, operation: Callable[..., Any], *args: Any) -> Any:
+        """Run an operation in a transaction on a worker thread."""
+        return await _run_in_transaction(self._connection, self._lock, operation, *args)
+
+    def _expires_at(self, updated_at: int) -> Optional[int]:
+        return updated_at + int(self.ttl * 1_000_000) if self.ttl is not None else None
+
+    def _now(self) -> int:
+        return int(time.time() * 1_000_000)
+
+    def _insert_messages(self, task_id: str, messages: Sequence[Message], start: int) -> None:
+        self._connection.executemany(
+            "INSERT INTO task_messages (task_id, seq, data) VALUES (?, ?, ?)",
+            [(task_id, start + offset, message.model_dump_json()) for offset, message in enumerate(messages)],
+        )
+
+    def _write(self, task: Task, replace: bool, overflow: Sequence[Message] = ()) -> None:
+        """Insert a task, or replace it when `replace` is set, appending new messages only.
+
+        `overflow` holds the messages just compacted out of the task, which are
+        written to the history if they are not stored yet.
+        """
+        updated_at = self.sort_key(task)[0]
+        row = self._connection.execute("SELECT message_count FROM tasks WHERE id = ?", (task.id,)).fetchone()
+        if row is not None and not replace:
+            raise A2AServerError(f"Task {task.id} already exists")
+        stored = row[0] if row is not None else 0
+        messages = [*overflow, *task.messages]
+        first = task.archivedMessageCount - len(overflow)
+        total = first + len(messages)
+        if not first <= stored <= total:
+            # Messages were rewritten; replace everything after the archived ones
+            self._connection.execute("DELETE FROM task_messages WHERE task_id = ? AND seq >= ?", (task.id, first))
+            stored = first
+        self._insert_messages(task.id, messages[stored - first:], stored)
+        self._connection.execute(
+            "INSERT OR REPLACE INTO tasks (id, state, updated_at, expires_at, message_count, archived_count, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (task.id, task.state.value, updated_at, self._expires_at(updated_at), total,
+             task.archivedMessageCount, _task_data(task)),
+        )
+
+    def _read(self, task_id: str) -> Optional[Task]:
+        row = self._connection.execute(
+            "SELECT data, expires_at, archived_count FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[1] is not None and row[1] <= self._now():
+            self._delete(task_id)
+            return None
+        messages = self._connection.execute(
+            "SELECT data FROM task_messages WHERE task_id = ? AND seq >= ? ORDER BY seq", (task_id, row[2])
+        ).fetchall()
+        return _load_task(row[0], [message[0] for message in messages])
+
+    def _read_many(self, rows: List[Tuple[str, str]]) -> List[Task]:
+        """Load the inline messages of listed tasks in one query and rebuild the tasks."""
+        if not rows:
+            return []
+        messages: Dict[str, List[str]] = {task_id: [] for task_id, _ in rows}
+        placeholders = ", ".join("?" * len(rows))
+        for task_id, data in self._connection.execute(
+            "SELECT m.task_id, m.data FROM task_messages m JOIN tasks t ON t.id = m.task_id "
+            f"WHERE m.task_id IN ({placeholders}) AND m.seq >= t.archived_count ORDER BY m.task_id, m.seq",
+            list(messages),
+        ):
+            messages[task_id].append(data)
+        return [_load_task(data, messages[task_id]) for task_id, data in rows]
+
+    def _delete(self, task_id: str) -> bool:
+        self._connection.execute("DELETE FROM task_messages WHERE task_id = ?", (task_id,))
+        return self._connection.execute("DELETE FROM tasks WHERE id = ?", (task_id,)).rowcount > 0
+
+    async def create_task(self, task: Optional[Task] = None) -> Task:
+        task = task or Task(state=TaskState.CREATED)
+        await self._run(self._write, task, False, await self._compact(task))
+        return task
+
+    async def add_tasks(self, tasks: Iterable[Task], batch_size: int = 1000) -> int:
+        """Store many existing tasks, writing `batch_size` tasks per transaction."""
+        def add(batch: List[Tuple[Task, List[Message]]]) -> None:
+            for task, overflow in batch:
+                self._write(task, True, overflow)
+
+        count = 0
+        batch = []
+        for task in tasks:
+            batch.append((task, await self._compact(task)))
+            if len(batch) >= batch_size:
+                await self._run(add, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            await self._run(add, batch)
+            count += len(batch)
+        return count
+
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        return await self._run(self._read, task_id)
+
+    async def update_task(self, task: Task) -> Task:
+        def update(overflow: List[Message]) -> None:
+            if self._connection.execute("SELECT 1 FROM tasks WHERE id = ?", (task.id,)).fetchone() is None:
+                raise A2AServerError(f"Task {task.id} not found")
+            self._write(task, True, overflow)
+
+        task.updatedAt = datetime.now(UTC)
+        await self._run(update, await self._compact(task))
+        return task
+
+    async def append_messages(self,
+                              task_id: str,
+                              messages: List[Message],
+                              state: Optional[TaskState] = None) -> Task:
+        if self.compaction is not None:
+            # Compaction needs the inline messages, so load the task and store it back
+            return await super().append_messages(task_id, messages, state)
+
+        def append() -> Task:
+            row = self._connection.execute(
+                "SELECT data, message_count, expires_at FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+            if row is None or (row[2] is not None and row[2] <= self._now()):
+                raise A2AServerError(f"Task {task_id} not found")
+            fields = json.loads(row[0])
+            now = datetime.now(UTC)
+            fields["updatedAt"] = now.isoformat()
+            if state is not None:
+                fields["state"] = state.value
+            count = row[1] + len(messages)
+            self._insert_messages(task_id, messages, row[1])
+            updated_at = int(now.timestamp() * 1_000_000)
+            self._connection.execute(
+                "UPDATE tasks SET state = ?, updated_at = ?, expires_at = ?, message_count = ?, data = ? "
+                "WHERE id = ?",
+                (fields["state"], updated_at, self._expires_at(updated_at), count, json.dumps(fields), task_id),
+            )
+            return self._read(task_id)
+
+        return await self._run(append)
+
+    def _filters(self, state: Optional[TaskState]) -> Tuple[List[str], List[Any]]:
+        clauses, params = [], []
+        if state is not None:
+            clauses.append("state = ?")
+            params.append(state.value)
+        if self.ttl is not None:
+            clauses.append("(expires_at IS NULL OR expires_at > ?)")
+            params.append(self._now())
+        return clauses, params
+
+    async def list_tasks(self, limit: int = 10, skip: int = 0, state: Optional[TaskState] = None) -> List[Task]:
+        def list_offset() -> List[Task]:
+            clauses, params = self._filters(state)
+            where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+            rows = self._connection.execute(
+                f"SELECT id, data FROM tasks {where}ORDER BY updated_at DESC, id DESC LIMIT ? OFFSET ?",
+                params + [limit, skip],
+            ).fetchall()
+            return self._read_many(rows)
+
+        return await self._run(list_offset)
+
+    async def list_tasks_page(self,
+                              limit: int = 10,
+                              cursor: Optional[str] = None,
+                              state: Optional[TaskState] = None) -> ListTasksResponse:
+        key = self.decode_cursor(cursor) if cursor else None
+
+        def list_page() -> ListTasksResponse:
+            clauses, params = self._filters(state)
+            if key is not None:
+                # Spelled out rather than as a row value so the index range scan is used
+                clauses.append("updated_at <= ? AND (updated_at < ? OR id < ?)")
+                params.extend([key[0], key[0], key[1]])
+            where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+            rows = self._connection.execute(
+                f"SELECT id, data, updated_at FROM tasks {where}ORDER BY updated_at DESC, id DESC LIMIT ?",
+                params + [limit + 1],
+            ).fetchall()
+            page = rows[:limit]
+            return ListTasksResponse(
+                tasks=self._read_many([(task_id, data) for task_id, data, _ in page]),
+                nextCursor=self.encode_cursor((page[-1][2], page[-1][0])) if len(rows) > limit else None,
+            )
+
+        return await self._run(list_page)
+
+    async def get_messages(self, task_id: str, start: int = 0, limit: int = 100) -> Optional[ListMessagesResponse]:
+        def read() -> Optional[ListMessagesResponse]:
+            row = self._connection.execute(
+                "SELECT message_count, expires_at FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= self._now()):
+                return None
+            rows = self._connection.execute(
+                "SELECT data FROM task_messages WHERE task_id = ? AND seq >= ? ORDER BY seq LIMIT ?",
+                # A negative LIMIT means no limit in SQLite
+                (task_id, start, max(limit, 0)),
+            ).fetchall()
+            return ListMessagesResponse(
+                messages=[Message.model_validate_json(data) for data, in rows], total=row[0]
+            )
+
+        return await self._run(read)
+
+    async def cancel_task(self, task_id: str) -> Task:
+        return await self.append_messages(task_id, [], TaskState.CANCELED)
+
+    async def delete_task(self, task_id: str) -> bool:
+        return await self._run(self._delete, task_id)
+
+    async def purge_expired(self) -> int:
+        if self.ttl is None:
+            return 0
+
+        def purge() -> int:
+            now = self._now()
+            self._connection.execute(
+                "DELETE FROM task_messages WHERE task_id IN (SELECT id FROM tasks WHERE expires_at <= ?)", (now,)
+            )
+            return self._connection.execute("DELETE FROM tasks WHERE expires_at <= ?", (now,)).rowcount
+
+        return await self._run(purge)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class SQLiteMessageArchive(MessageArchive):
+    """Archive keeping messages compacted out of tasks in a SQLite database.
+
+    Lets the in-memory task store bound its memory use in long conversations.
+
+    Example:
+        >>> compaction = HistoryCompaction(keep_last=20, archive=SQLiteMessageArchive("history.db"))
+        >>> store = TaskStore(compaction=compaction)
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """Initialize the archive, creating its table if needed.
+
+        Args:
+            path: Path of the database file. ":memory:" keeps the database in memory.
+        """
+        self.path = path
+        self._connection = _connect(path, _ARCHIVE_SCHEMA)
+        self._lock = threading.Lock()
+
+    async def write(self, task_id: str, start: int, messages: List[Message]) -> None:
+        def write() -> None:
+            self._connection.execute(
+                "DELETE FROM archived_messages WHERE task_id = ? AND seq >= ?", (task_id, start)
+            )
+            self._connection.executemany(
+                "INSERT INTO archived_messages (task_id, seq, data) VALUES (?, ?, ?)",
+                [(task_id, start + offset, message.model_dump_json()) for offset, message in enumerate(messages)],
+            )
+
+        await _run_in_transaction(self._connection, self._lock, write)
+
+    async def read(self, task_id: str, start: int, end: int) -> List[Message]:
+        def read() -> List[Message]:
+            rows = self._connection.execute(
+                "SELECT data FROM archived_messages WHERE task_id = ? AND seq >= ? AND seq < ? ORDER BY seq",
+                (task_id, start, end),
+            ).fetchall()
+            return [Message.model_validate_json(data) for data, in rows]
+
+        return await _run_in_transaction(self._connection, self._lock, read)
+
+    async def delete(self, task_id: str) -> None:
+        def delete() -> None:
+            self._connection.execute("DELETE FROM archived_messages WHERE task_id = ?", (task_id,))
+
+        await _run_in_transaction(self._connection, self._lock, delete)
+
+    async def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class RedisTaskStore(TaskStore):
+    """Task store backed by Redis, shareable by several server replicas.
+
+    Each task is a hash holding its serialized fields and state, with its
+    messages in a separate list. Sorted sets scored by ``updatedAt`` index all
+    tasks and the tasks of each state. Expiry uses Redis key TTLs; index
+    entries of expired tasks are removed by :meth:`purge_expired`.
+
+    Concurrent updates of one task from several replicas are last-writer-wins.
+    """
+
+    def __init__(self,
+                 redis_url: str = "redis://localhost:6379/0",
+                 key_prefix: str = "a2a",
+                 ttl: Optional[float] = None,
+                 pool_registry: Optional["RedisPoolRegistry"] = None,
+                 compaction: Optional[HistoryCompaction] = None):
+        """Initialize the store.
+
+        Args:
+            redis_url: URL of the Redis server.
+            key_prefix: Prefix of every key the store writes.
+            ttl: Seconds after its last update at which a task expires. None keeps tasks forever.
+            pool_registry: Registry providing the shared connection pool. Defaults to the
+                process-wide registry.
+            compaction: Policy moving older messages out of stored tasks. Compacted
+                messages stay in the task's message list in Redis.
+        """
+        from ailf.messaging.redis_pool import RedisPoolRegistry
+
+        super().__init__(ttl, compaction)
+        self.redis_url = redis_url
+        self.key_prefix = key_prefix
+        self.pool_registry = pool_registry or RedisPoolRegistry.default()
+        self._redis = None
+
+    @property
+    def redis(self) -> Any:
+        """The asyncio Redis client, created on first use."""
+        if self._redis is None:
+            self._redis = self.pool_registry.async_client(url=self.redis_url)
+        return self._redis
+
+    def _task_key(self, task_id: str) -> str:
+        return f"{self.key_prefix}:task:{task_id}"
+
+    def _messages_key(self, task_id: str) -> str:
+        return f"{self.key_prefix}:task:{task_id}:messages"
+
+    def _index_key(self, state: Optional[TaskState] = None) -> str:
+        if state is None:
+            return f"{self.key_prefix}:tasks:updated"
+        return f"{self.key_prefix}:tasks:state:{state.value}"
+
+    def _queue_write(self,
+                     pipe: Any,
+                     task_id: str,
+                     data: str,
+                     state: str,
+                     updated_at: int,
+                     previous_state: Optional[str],
+                     messages: Sequence[str],
+                     keep_messages: Optional[int] = None) -> None:
+        """Queue the commands that store a task's fields, new messages and index entries.
+
+        With `keep_messages`, stored messages after the first `keep_messages` are
+        removed before the new ones are appended.
+        """
+        task_key, messages_key = self._task_key(task_id), self._messages_key(task_id)
+        pipe.hset(task_key, mapping={"data": data, "state": state, "updated": updated_at})
+        if keep_messages == 0:
+            pipe.delete(messages_key)
+        elif keep_messages is not None:
+            pipe.ltrim(messages_key, 0, keep_messages - 1)
+        if messages:
+            pipe.rpush(messages_key, *messages)
+        pipe.zadd(self._index_key(), {task_id: updated_at})
+        if previous_state is not None and previous_state != state:
+            pipe.zrem(self._index_key(TaskState(previous_state)), task_id)
+        pipe.zadd(self._index_key(TaskState(state)), {task_id: updated_at})
+        if self.ttl is not None:
+            expires_at_ms = updated_at // 1000 + int(self.ttl * 1000)
+            pipe.pexpireat(task_key, expires_at_ms)
+            pipe.pexpireat(messages_key, expires_at_ms)
+
+    async def _store_task(self, task: Task, must_exist: Optional[bool], overflow: Sequence[Message] = ()) -> None:
+        """Write a task, appending only the messages beyond those already stored.
+
+        `overflow` holds the messages just compacted out of the task, which are
+        written to the history if they are not stored yet.
+        """
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hget(self._task_key(task.id), "state")
+            pipe.llen(self._messages_key(task.id))
+            previous_state, stored = await pipe.execute()
+        if must_exist is True and previous_state is None:
+            raise A2AServerError(f"Task {task.id} not found")
+        if must_exist is False and previous_state is not None:
+            raise A2AServerError(f"Task {task.id} already exists")
+        previous_state = previous_state.decode() if isinstance(previous_state, bytes) else previous_state
+        messages = [*overflow, *task.messages]
+        first = task.archivedMessageCount - len(overflow)
+        # Messages were rewritten unless the stored ones end within the task's; keep the archived ones
+        keep = None if first <= stored <= first + len(messages) else first
+        start = stored if keep is None else first
+        async with self.redis.pipeline(transaction=True) as pipe:
+            self._queue_write(
+                pipe, task.id, _task_data(task), task.state.value, self.sort_key(task)[0], previous_state,
+                [message.model_dump_json() for message in messages[start - first:]], keep,
+            )
+            await pipe.execute()
+
+    async def create_task(self, task: Optional[Task] = None) -> Task:
+        task = task or Task(state=TaskState.CREATED)
+        await self._store_task(task, must_exist=False, overflow=await self._compact(task))
+        return task
+
+    async def add_tasks(self, tasks: Iterable[Task]) -> int:
+        count = 0
+        for task in tasks:
+            await self._store_task(task, must_exist=None, overflow=await self._compact(task))
+            count += 1
+        return count
+
+    def _queue_read(self, pipe: Any, task_id: str) -> None:
+        """Queue the commands reading a task's fields, message count and latest messages."""
+        pipe.hget(self._task_key(task_id), "data")
+        pipe.llen(self._messages_key(task_id))
+        # With compaction at most keep_last messages are inline, so only read the tail
+        pipe.lrange(self._messages_key(task_id), -self.compaction.keep_last if self.compaction else 0, -1)
+
+    async def _load(self, task_id: str, data: Any, total: int, tail: List[Any]) -> Task:
+        """Rebuild a task read by :meth:`_queue_read`, keeping only its inline messages."""
+        inline = total - json.loads(data).get("archivedMessageCount", 0)
+        if inline > len(tail):
+            tail = await self.redis.lrange(self._messages_key(task_id), total - inline, -1)
+        return _load_task(data, tail[len(tail) - inline:] if inline > 0 else [])
+
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            self._queue_read(pipe, task_id)
+            data, total, tail = await pipe.execute()
+        return await self._load(task_id, data, total, tail) if data is not None else None
+
+    async def update_task(self, task: Task) -> Task:
+        task.updatedAt = datetime.now(UTC)
+        await self._store_task(task, must_exist=True, overflow=await self._compact(task))
+        return task
+
+    async def append_messages(self,
+                              task_id: str,
+                              messages: List[Message],
+                              state: Optional[TaskState] = None) -> Task:
+        if self.compaction is not None:
+            # Compaction needs the inline messages, so load the task and store it back
+            return await super().append_messages(task_id, messages, state)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hget(self._task_key(task_id), "data")
+            pipe.hget(self._task_key(task_id), "state")
+            data, previous_state = await pipe.execute()
+        if data is None:
+            raise A2AServerError(f"Task {task_id} not found")
+        previous_state = previous_state.decode() if isinstance(previous_state, bytes) else previous_state
+        fields = json.loads(data)
+        now = datetime.now(UTC)
+        fields["updatedAt"] = now.isoformat()
+        if state is not None:
+            fields["state"] = state.value
+        async with self.redis.pipeline(transaction=True) as pipe:
+            self._queue_write(
+                pipe, task_id, json.dumps(fields), fields["state"], int(now.timestamp() * 1_000_000),
+                previous_state, [message.model_dump_json() for message in messages],
+            )
+            await pipe.execute()
+        return await self.get_task(task_id)
+
+    def _min_score(self) -> Any:
+        """Lowest score of an unexpired task."""
+        if self.ttl is None:
+            return "-inf"
+        return int((time.time() - self.ttl) * 1_000_000)
+
+    async def _load_listed(self, entries: Sequence[Tuple[Any, float]]) -> List[Tuple[Task, Tuple[int, str]]]:
+        """Load listed tasks, dropping index entries whose task has expired."""
+        if not entries:
+            return []
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for member, _ in entries:
+                self._queue_read(pipe, member.decode() if isinstance(member, bytes) else member)
+            results = await pipe.execute()
+        loaded = []
+        for position, (member, score) in enumerate(entries):
+            data, total, tail = results[3 * position:3 * position + 3]
+            task_id = member.decode() if isinstance(member, bytes) else member
+            if data is not None:
+                loaded.append((await self._load(task_id, data, total, tail), (int(score), task_id)))
+        return loaded
+
+    async def list_tasks(self, limit: int = 10, skip: int = 0, state: Optional[TaskState] = None) -> List[Task]:
+        entries = await self.redis.zrevrangebyscore(
+            self._index_key(state), "+inf", self._min_score(), start=skip, num=limit, withscores=True
+        )
+        return [task for task, _ in await self._load_listed(entries)]
+
+    async def list_tasks_page(self,
+                              limit: int = 10,
+                              cursor: Optional[str] = None,
+                              state: Optional[TaskState] = None) -> ListTasksResponse:
+        key = self.decode_cursor(cursor) if cursor else None
+        maximum = key[0] if key is not None else "+inf"
+        entries: List[Tuple[Any, float]] = []
+        offset = 0
+        # Members sharing the cursor's score are ordered by ID; skip those at or after the cursor
+        while len(entries) <= limit:
+            batch = await self.redis.zrevrangebyscore(
+                self._index_key(state), maximum, self._min_score(),
+                start=offset, num=limit + 1, withscores=True,
+            )
+            offset += len(batch)
+            for member, score in batch:
+                task_id = member.decode() if isinstance(member, bytes) else member
+                if key is None or int(score) < key[0] or task_id < key[1]:
+                    entries.append((member, score))
+            if len(batch) < limit + 1:
+                break
+        page = entries[:limit]
+        loaded = await self._load_listed(page)
+        next_cursor = None
+        if len(entries) > limit:
+            member, score = page[-1]
+            next_cursor = self.encode_cursor((int(score), member.decode() if isinstance(member, bytes) else member))
+        return ListTasksResponse(tasks=[task for task, _ in loaded], nextCursor=next_cursor)
+
+    async def get_messages(self, task_id: str, start: int = 0, limit: int = 100) -> Optional[ListMessagesResponse]:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.exists(self._task_key(task_id))
+            pipe.llen(self._messages_key(task_id))
+            # LRANGE with an end before the start would count from the tail instead
+            if limit > 0:
+                pipe.lrange(self._messages_key(task_id), start, start + limit - 1)
+            exists, total, *ranges = await pipe.execute()
+        if not exists:
+            return None
+        messages = ranges[0] if ranges else []
+        return ListMessagesResponse(messages=[Message.model_validate_json(data) for data in messages], total=total)
+
+    async def cancel_task(self, task_id: str) -> Task:
+        return await self.append_messages(task_id, [], TaskState.CANCELED)
+
+    async def delete_task(self, task_id: str) -> bool:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._task_key(task_id), self._messages_key(task_id))
+            pipe.zrem(self._index_key(), task_id)
+            for state in TaskState:
+                pipe.zrem(self._index_key(state), task_id)
+            results = await pipe.execute()
+        return results[0] > 0
+
+    async def purge_expired(self) -> int:
+        if self.ttl is None:
+            return 0
+        cutoff = f"({self._min_score()}"
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(self._index_key(), "-inf", cutoff)
+            for state in TaskState:
+                pipe.zremrangebyscore(self._index_key(state), "-inf", cutoff)
+            results = await pipe.execute()
+        return results[0]
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
@@ -0,0 +1,219 @@
+"""Lazy decoding of ACP messages.
+
+Validating a full :class:`ACPMessage` costs a JSON parse and a Pydantic
+validation of the whole payload. Agents on broadcast topics drop most of the
+messages they receive, so that work is usually wasted.
+
+:func:`decode_envelope` parses only the header of a serialized ACP message.
+The scanner walks the top-level object and skips over the payload without
+building it, so routing on message type, sender and recipient costs about
+the same for a 10 byte payload as for a 10 MB one. The payload is parsed on
+first access and validated against the schema of its message type
+(:data:`ailf.schemas.acp.ACP_PAYLOAD_MODELS`) only when asked for; both
+results are cached on the envelope.
+
+Example:
+    >>> envelope = decode_envelope(raw)
+    >>> if envelope.message_type == ACPMessageType.TASK_REQUEST:
+    ...     request = envelope.payload_model  # TaskRequestPayload
+"""
+
+import json
+import re
+from functools import cached_property
+from json.decoder import scanstring
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from ailf.schemas.acp import ACP_PAYLOAD_MODELS, ACPMessage, ACPMessageHeader, ACPMessageType
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Strings and brackets; skipping a nested value only needs to balance brackets outside strings
+_NESTED_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]', re.DOTALL)
+_decoder = json.JSONDecoder()
+
+
+class ACPDecodeError(ValueError):
+    """Exception raised when a raw message is not a well-formed ACP envelope."""
+    pass
+
+
+def _skip_whitespace(raw: str, pos: int) -> int:
+    return _WHITESPACE.match(raw, pos).end()
+
+
+def _skip_value(raw: str, pos: int) -> int:
+    """Return the end position of the JSON value starting at `pos` without decoding it."""
+    char = raw[pos:pos + 1]
+    if char == '"':
+        return scanstring(raw, pos + 1)[1]
+    if char in ("{", "["):
+        depth = 0
+        for token in _NESTED_TOKEN.finditer(raw, pos):
+            text = token.group()
+            if text == "{" or text == "[":
+                depth += 1
+            elif text == "}" or text == "]":
+                depth -= 1
+                if depth == 0:
+                    return token.end()
+        raise ACPDecodeError("Unterminated JSON object or array")
+    return _decoder.raw_decode(raw, pos)[1]
+
+
+def _iter_fields(raw: str) -> Iterator[Tuple[str, int, int]]:
+    """Yield (key, start, end) for each member of the top-level JSON object.
+
+    Members are produced one at a time, so callers stop scanning as soon as
+    they have the member they need.
+    """
+    pos = _skip_whitespace(raw, 0)
+    if raw[pos:pos + 1] != "{":
+        raise ACPDecodeError("ACP message must be a JSON object")
+    pos = _skip_whitespace(raw, pos + 1)
+    if raw[pos:pos + 1] == "}":
+        return
+
+    while True:
+        if raw[pos:pos + 1] != '"':
+            raise ACPDecodeError(f"Expected a member name at position {pos}")
+        key, pos = scanstring(raw, pos + 1)
+        pos = _skip_whitespace(raw, pos)
+        if raw[pos:pos + 1] != ":":
+            raise ACPDecodeError(f"Expected ':' at position {pos}")
+        start = _skip_whitespace(raw, pos + 1)
+        end = _skip_value(raw, start)
+        yield key, start, end
+
+        pos = _skip_whitespace(raw, end)
+        char = raw[pos:pos + 1]
+        if char == ",":
+            pos = _skip_whitespace(raw, pos + 1)
+        elif char == "}":
+            return
+        else:
+            raise ACPDecodeError(f"Expected ',' or '}}' at position {pos}")
+
+
+class ACPEnvelope:
+    """A received ACP message whose payload is decoded on demand.
+
+    Attributes:
+        message_type: Type of the message, from the header
+        sender_agent_id: Sender, from the header
+        recipient_agent_id: Recipient from the header, None for broadcasts
+        header_data: The raw header as a dict
+    """
+
+    def __init__(self, raw: str, header_data: Dict[str, Any], message_type: ACPMessageType,
+                 fields: Iterator[Tuple[str, int, int]], payload_span: Optional[Tuple[int, int]] = None):
+        self.raw = raw
+        self.header_data = header_data
+        self.message_type = message_type
+        self.sender_agent_id: str = header_data.get("sender_agent_id")
+        self.recipient_agent_id: Optional[str] = header_data.get("recipient_agent_id")
+        self._fields = fields
+        self._payload_span = payload_span
+
+    @property
+    def message_id(self) -> Optional[str]:
+        """The message ID as sent, without UUID validation."""
+        return self.header_data.get("message_id")
+
+    @cached_property
+    def header(self) -> ACPMessageHeader:
+        """The validated header model."""
+        return ACPMessageHeader.model_validate(self.header_data)
+
+    @cached_property
+    def payload(self) -> Dict[str, Any]:
+        """The payload as a dict, parsed on first access.
+
+        Raises:
+            ACPDecodeError: If the message has no payload object
+        """
+        if self._payload_span is None:
+            try:
+                for key, start, end in self._fields:
+                    if key == "payload":
+                        self._payload_span = (start, end)
+                        break
+            except ValueError as e:
+                raise ACPDecodeError(f"Malformed ACP message: {e}") from e
+        if self._payload_span is None:
+            raise ACPDecodeError("ACP message has no payload")
+
+        start, end = self._payload_span
+        try:
+            payload = json.loads(self.raw[start:end])
+        except ValueError as e:
+            raise ACPDecodeError(f"Malformed ACP payload: {e}") from e
+        if not isinstance(payload, dict):
+            raise ACPDecodeError("ACP payload must be a JSON object")
+        return payload
+
+    @cached_property
+    def payload_model(self) -> BaseModel:
+        """The payload validated against the schema of its message type.
+
+        Raises:
+            pydantic.ValidationError: If the payload does not match the schema
+        """
+        return ACP_PAYLOAD_MODELS[self.message_type].model_validate(self.payload)
+
+    @cached_property
+    def message(self) -> ACPMessage:
+        """The full ACPMessage, with the payload as a dict."""
+        return ACPMessage(header=self.header, payload=self.payload)
+
+
+def decode_envelope(raw_message: Union[str, bytes]) -> ACPEnvelope:
+    """Decode the header of a serialized ACP message.
+
+    Only the header object is parsed, and only the fields needed for routing
+    are checked. The rest of the header is validated by
+    :attr:`ACPEnvelope.header`, and the payload is left undecoded.
+
+    Args:
+        raw_message: A JSON-serialized ACPMessage
+
+    Returns:
+        The envelope
+
+    Raises:
+        ACPDecodeError: If the message is not JSON, has no header, or the
+            header has no valid message type or sender
+    """
+    if isinstance(raw_message, (bytes, bytearray, memoryview)):
+        try:
+            raw_message = bytes(raw_message).decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise ACPDecodeError(f"ACP message is not UTF-8: {e}") from e
+
+    fields = _iter_fields(raw_message)
+    header_data = None
+    payload_span = None
+    try:
+        for key, start, end in fields:
+            if key == "header":
+                header_data = json.loads(raw_message[start:end])
+                break
+            if key == "payload":
+                payload_span = (start, end)
+    except ValueError as e:
+        raise ACPDecodeError(f"Malformed ACP message: {e}") from e
+
+    if not isinstance(header_data, dict):
+        raise ACPDecodeError("ACP message has no header object")
+    try:
+        message_type = ACPMessageType(header_data.get("message_type"))
+    except ValueError as e:
+        raise ACPDecodeError(f"Unknown ACP message type: {header_data.get('message_type')!r}") from e
+    if not isinstance(header_data.get("sender_agent_id"), str):
+        raise ACPDecodeError("ACP header has no sender_agent_id")
+    recipient = header_data.get("recipient_agent_id")
+    if recipient is not None and not isinstance(recipient, str):
+        raise ACPDecodeError("ACP header recipient_agent_id must be a string")
+
+    return ACPEnvelope(raw_message, header_data, message_type, fields, payload_span)
@@ -9,8 +9,9 @@ import logging
 import uuid
 import json
 import asyncio
-from typing import Any, Dict, Optional, Union, Callable, Awaitable
+from typing import Any, Dict, Optional, Set, Union, Callable, Awaitable
 
+from ailf.communication.acp_envelope import ACPDecodeError, ACPEnvelope, decode_envelope
 from ailf.messaging.base import MessagingBackendBase
 from ailf.schemas.acp import (
     ACPMessage, 
@@ -50,6 +51,7 @@ class ACPHandler:
         self.config = config or {}
         self.broadcast_topic = self.config.get("broadcast_topic", DEFAULT_BROADCAST_TOPIC)
         self._message_handlers: Dict[ACPMessageType, Callable[[ACPMessage], Awaitable[None]]] = {}
+        self._lazy_message_types: Set[ACPMessageType] = set()
         self._register_default_handlers()
         logger.info(f"ACPHandler initialized for agent_id: {self.agent_id} using {type(messaging_backend).__name__}")
 
@@ -59,12 +61,16 @@ class ACPHandler:
         self.register_handler(ACPMessageType.TASK_REQUEST)(self._handle_task_request)
         logger.debug("Default ACP message handlers for STATUS_UPDATE and TASK_REQUEST registered.")
 
-    def register_handler(self, message_type: ACPMessageType) -> Callable[[Callable[[ACPMessage], Awaitable[None]]], Callable[[ACPMessage], Awaitable[None]]]:
+    def register_handler(self, message_type: ACPMessageType, lazy: bool = False) -> Callable[[Callable[[ACPMessage], Awaitable[None]]], Callable[[ACPMessage], Awaitable[None]]]:
         """
         Decorator to register a handler function for a specific ACPMessageType.
 
         :param message_type: The ACPMessageType to register the handler for.
         :type message_type: ACPMessageType
+        :param lazy: Pass the handler an :class:`ACPEnvelope` instead of an ACPMessage.
+                     The payload is then only decoded and validated if the handler
+                     reads ``envelope.payload`` or ``envelope.payload_model``.
+        :type lazy: bool
         :raises TypeError: If the registered handler is not a coroutine function.
         :raises ValueError: If a handler for the message_type is already registered.
 
@@ -83,6 +89,8 @@ class ACPHandler:
                 raise ValueError(f"Handler for message type {message_type.value} is already registered with {self._message_handlers[message_type].__name__}.")
             
             self._message_handlers[message_type] = handler_func
+            if lazy:
+                self._lazy_message_types.add(message_type)
             logger.info(f"Handler registered for ACPMessageType: {message_type.value} -> {handler_func.__name__}")
             return handler_func
         return decorator
@@ -190,20 +198,52 @@ class ACPHandler:
     async def handle_incoming_raw_message(self, topic: str, message_data: Union[str, bytes]):
         """
         Callback for the messaging backend to pass raw messages.
-        It deserializes and then dispatches the message.
+
+        Only the message header is decoded before routing. Messages for other
+        recipients, or of a type without a registered handler, are dropped
+        without parsing or validating their payload.
         """
-        logger.debug(f"ACPHandler ({self.agent_id}) received raw message on topic '{topic}'. Type: {type(message_data)}")
-        acp_message = await self.receive_message(message_data)
-        
-        if acp_message:
-            if acp_message.header.recipient_agent_id and acp_message.header.recipient_agent_id != self.agent_id:
-                logger.debug(f"Message ID {acp_message.header.message_id} on topic '{topic}' is for recipient "
-                             f"{acp_message.header.recipient_agent_id}, not this agent ({self.agent_id}). Ignoring.")
-                return
+        try:
+            envelope = decode_envelope(message_data)
+        except ACPDecodeError as e:
+            logger.warning(f"Could not parse ACP message received on topic '{topic}': {e}. Data snippet: {str(message_data)[:200]}")
+            return
+
+        if envelope.recipient_agent_id and envelope.recipient_agent_id != self.agent_id:
+            logger.debug(f"Message ID {envelope.message_id} on topic '{topic}' is for recipient "
+                         f"{envelope.recipient_agent_id}, not this agent ({self.agent_id}). Ignoring.")
+            return
+
+        await self.dispatch_envelope(envelope)
+
+    async def dispatch_envelope(self, envelope: ACPEnvelope) -> None:
+        """
+        Dispatches a header-decoded message to the handler registered for its type.
 
-            await self.dispatch_message(acp_message)
+        Handlers registered with ``lazy=True`` receive the envelope itself; others
+        receive the ACPMessage, which is only built once a handler is found.
+
+        :param envelope: The envelope to dispatch.
+        :type envelope: ACPEnvelope
+        """
+        handler = self._message_handlers.get(envelope.message_type)
+        if handler is None:
+            logger.debug(f"No handler registered for message type: {envelope.message_type.value} (ID: {envelope.message_id}). Ignoring.")
+            return
+
+        if envelope.message_type in self._lazy_message_types:
+            argument = envelope
         else:
-            logger.warning(f"Could not parse ACP message received on topic '{topic}'. Data snippet: {str(message_data)[:200]}")
+            try:
+                argument = envelope.message
+            except (ValidationError, ValueError) as e:
+                logger.error(f"Failed to parse ACP message {envelope.message_id} of type {envelope.message_type.value}: {e}")
+                return
+
+        try:
+            await handler(argument)
+        except Exception as e:
+            logger.error(f"Error executing handler {handler.__name__} for message {envelope.message_id}: {e}", exc_info=True)
 
     async def dispatch_message(self, message: ACPMessage) -> None:
         """
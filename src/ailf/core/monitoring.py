@@ -50,13 +50,14 @@ Use this module to implement systematic monitoring across your application.
 """
 import importlib.util
 import os
+import re
 import time
 import enum
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union, cast, Type, Protocol, Callable
+from typing import Any, Dict, List, Optional, Sequence, Union, cast, Type, Protocol, Callable
 import logfire
 import prometheus_client
 
@@ -378,6 +379,31 @@ class MetricsExporter(ABC):
         """Export AI-specific stats."""
         pass
 
+    def export_gauges(self, name: str, gauges: Dict[str, float]) -> None:
+        """Export gauge metrics: current values that can go up and down.
+
+        Exporters without gauge support report them as counters.
+        """
+        self.export_counters(name, gauges)
+
+    def export_histogram(self, name: str, key: str, observations: Sequence[float],
+                         buckets: Optional[Sequence[float]] = None) -> None:
+        """Export observations of a distribution, such as handler latencies in seconds.
+
+        Exporters without histogram support report the mean and maximum as timers.
+
+        Args:
+            name: Component name
+            key: Metric name within the component
+            observations: Values observed since the last export
+            buckets: Upper bounds of the histogram buckets
+        """
+        if observations:
+            self.export_timers(name, {
+                f"{key}_avg": sum(observations) / len(observations),
+                f"{key}_max": max(observations),
+            })
+
 
 class ConsoleMetricsExporter(MetricsExporter):
     """Simple exporter that logs metrics to the console."""
@@ -392,6 +418,11 @@ class ConsoleMetricsExporter(MetricsExporter):
         for key, value in timers.items():
             logger.info(f"METRIC - {name} - Timer - {key}: {value:.2f}s")
     
+    def export_gauges(self, name: str, gauges: Dict[str, float]) -> None:
+        """Export gauge metrics to console."""
+        for key, value in gauges.items():
+            logger.info(f"METRIC - {name} - Gauge - {key}: {value}")
+
     def export_ai_stats(self, stats: 'AIStats') -> None:
         """Export AI-specific stats to console."""
         stat_data = stats.get_stats()
@@ -443,6 +474,17 @@ class LogfireMetricsExporter(MetricsExporter):
                 duration_seconds=value
             )
     
+    def export_gauges(self, name: str, gauges: Dict[str, float]) -> None:
+        """Export gauge metrics to Logfire."""
+
+        for key, value in gauges.items():
+            logfire.log(
+                "gauge_metric: {component} {metric_name} = {value}",
+                component=name,
+                metric_name=key,
+                value=value
+            )
+
     def export_ai_stats(self, stats: 'AIStats') -> None:
         """Export AI-specific stats to Logfire."""
        
@@ -458,6 +500,12 @@ class LogfireMetricsExporter(MetricsExporter):
         )
 
 
+def _prometheus_name(name: str) -> str:
+    """Replace characters Prometheus does not allow (or reserves, like ":") in metric names."""
+    name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
 class PrometheusMetricsExporter(MetricsExporter):
     """Exporter that exposes metrics for Prometheus scraping."""
     
@@ -485,7 +533,7 @@ class PrometheusMetricsExporter(MetricsExporter):
         """Export counter metrics to Prometheus."""
        
         for key, value in counters.items():
-            metric_name = f"{name}_{key}"
+            metric_name = _prometheus_name(f"{name}_{key}")
             if metric_name not in self.counters:
                 self.counters[metric_name] = prometheus_client.Counter(
                     metric_name, f"Counter metric for {key}"
@@ -501,13 +549,39 @@ class PrometheusMetricsExporter(MetricsExporter):
         """Export timer metrics to Prometheus."""
        
         for key, value in timers.items():
-            metric_name = f"{name}_{key}_seconds"
+            metric_name = _prometheus_name(f"{name}_{key}_seconds")
             if metric_name not in self.gauges:
                 self.gauges[metric_name] = prometheus_client.Gauge(
                     metric_name, f"Timer metric for {key} in seconds"
                 )
             
             self.gauges[metric_name].set(value)
+
+    def export_gauges(self, name: str, gauges: Dict[str, float]) -> None:
+        """Export gauge metrics to Prometheus."""
+
+        for key, value in gauges.items():
+            metric_name = _prometheus_name(f"{name}_{key}")
+            if metric_name not in self.gauges:
+                self.gauges[metric_name] = prometheus_client.Gauge(
+                    metric_name, f"Gauge metric for {key}"
+                )
+
+            self.gauges[metric_name].set(value)
+
+    def export_histogram(self, name: str, key: str, observations: Sequence[float],
+                         buckets: Optional[Sequence[float]] = None) -> None:
+        """Export observations to a Prometheus histogram."""
+
+        metric_name = _prometheus_name(f"{name}_{key}")
+        if metric_name not in self.histograms:
+            self.histograms[metric_name] = prometheus_client.Histogram(
+                metric_name, f"Histogram of {key}",
+                buckets=tuple(buckets) if buckets else prometheus_client.Histogram.DEFAULT_BUCKETS
+            )
+
+        for value in observations:
+            self.histograms[metric_name].observe(value)
     
     def export_ai_stats(self, stats: 'AIStats') -> None:
         """Export AI-specific stats to Prometheus."""
@@ -3,9 +3,7 @@
 import json
 from typing import Any, Dict, List, Optional, Union
 
-# Updated import pattern to address deprecation warning
-from redis import asyncio as redis
-
+from ailf.messaging.redis_pool import RedisPoolRegistry
 from ailf.schemas.memory import MemoryItem
 
 class RedisDistributedCache:
@@ -13,7 +11,8 @@ class RedisDistributedCache:
     Manages a distributed cache using Redis, storing MemoryItem objects.
     """
 
-    def __init__(self, redis_url: str, default_ttl: int = 3600, key_prefix: str = "ailf:cache:"):
+    def __init__(self, redis_url: str, default_ttl: int = 3600, key_prefix: str = "ailf:cache:",
+                 pool_registry: Optional[RedisPoolRegistry] = None):
         """
         Initializes the Redis distributed cache.
 
@@ -23,11 +22,26 @@ class RedisDistributedCache:
         :type default_ttl: int
         :param key_prefix: Prefix for all keys stored in Redis to avoid collisions.
         :type key_prefix: str
+        :param pool_registry: Registry providing the shared connection pool. Defaults to the process-wide registry.
+        :type pool_registry: Optional[RedisPoolRegistry]
         """
-        self.redis_client = redis.from_url(redis_url)
+        self.pool_registry = pool_registry or RedisPoolRegistry.default()
+        self.redis_url = redis_url
+        self._redis_client = None
         self.default_ttl = default_ttl
         self.key_prefix = key_prefix
 
+    @property
+    def redis_client(self) -> Any:
+        """The asyncio Redis client, created on first use in the running event loop."""
+        if self._redis_client is None:
+            self._redis_client = self.pool_registry.async_client(url=self.redis_url)
+        return self._redis_client
+
+    @redis_client.setter
+    def redis_client(self, client: Any) -> None:
+        self._redis_client = client
+
     def _get_redis_key(self, item_id: str) -> str:
         """Constructs the full Redis key with the prefix."""
         return f"{self.key_prefix}{item_id}"
@@ -151,6 +165,10 @@ class RedisDistributedCache:
         return await self.redis_client.ping()
 
     async def close(self) -> None:
-        """Closes the Redis connection."""
-        await self.redis_client.close()
-        await self.redis_client.connection_pool.disconnect()
+        """Closes the Redis connection.
+
+        The connection pool is shared with other consumers and stays open.
+        """
+        if self._redis_client is not None:
+            await self._redis_client.close()
+            self._redis_client = None
@@ -7,6 +7,7 @@ import redis.asyncio as aioredis # type: ignore
 
 from ailf.memory.base import ShortTermMemory
 from ailf.memory.interfaces import AgentMemoryInterface
+from ailf.messaging.redis_pool import RedisPoolRegistry
 from ailf.schemas.memory import MemoryItem
 from ailf.schemas.agent_memory import Interaction, AgentFact
 
@@ -118,20 +119,28 @@ class RedisAgentMemory(AgentMemoryInterface):
     
     def __init__(
         self,
-        redis_client: aioredis.Redis,
+        redis_client: Optional[aioredis.Redis] = None,
         prefix: str = "agent_memory",
         max_interactions: int = 1000,
-        max_facts: int = 1000
+        max_facts: int = 1000,
+        redis_url: str = "redis://localhost:6379/0",
+        pool_registry: Optional[RedisPoolRegistry] = None
     ):
         """Initialize Redis-backed agent memory.
         
         Args:
-            redis_client: An initialized Redis client
+            redis_client: An initialized Redis client. If omitted, a client for
+                `redis_url` is created on a shared connection pool
             prefix: Key prefix for all Redis keys to avoid collisions
             max_interactions: Maximum number of interactions to store
             max_facts: Maximum number of facts to store
+            redis_url: URL of the Redis server, used when no client is given
+            pool_registry: Registry providing the shared connection pool
+                (defaults to the process-wide registry)
         """
-        self.redis = redis_client
+        self.redis_url = redis_url
+        self.pool_registry = pool_registry
+        self._redis = redis_client
         self.prefix = prefix
         self.max_interactions = max_interactions
         self.max_facts = max_facts
@@ -143,6 +152,17 @@ class RedisAgentMemory(AgentMemoryInterface):
         self.facts_hash = f"{prefix}:facts:hash"  # Hash for fact data
         self.working_memory_hash = f"{prefix}:working_memory"  # Hash for working memory
     
+    @property
+    def redis(self) -> aioredis.Redis:
+        """The Redis client, created on first use in the running event loop if none was given."""
+        if self._redis is None:
+            self._redis = (self.pool_registry or RedisPoolRegistry.default()).async_client(url=self.redis_url)
+        return self._redis
+    
+    @redis.setter
+    def redis(self, client: aioredis.Redis) -> None:
+        self._redis = client
+    
     async def add_interaction(self, query: str, result: Any, metadata: Optional[Dict[str, Any]] = None) -> str:
         """Add an interaction to memory.
         
@@ -1,12 +1,31 @@
 """Messaging utilities, including ZeroMQ and Redis implementations."""
 from . import zmq
+from . import zmq_async
+from . import zmq_payload
 from . import devices
-from .redis_streams import RedisStreamsBackend
+from .redis_pool import RedisPoolRegistry
+from .redis_client_cache import RedisClientCache
+from .redis_streams import LanePolicy, RedisStreamsBackend, StreamLane
+from .stream_telemetry import StreamTelemetry
 from .mock_redis_streams import MockRedisStreamsBackend
+from .in_process import InProcessBackend, InProcessBroker
+from .claim_check import ClaimCheckBackend, StorageClaimCheckStore, RedisClaimCheckStore
 
 __all__ = [
     "zmq",
+    "zmq_async",
+    "zmq_payload",
     "devices",
+    "RedisPoolRegistry",
+    "RedisClientCache",
     "RedisStreamsBackend",
-    "MockRedisStreamsBackend"
+    "StreamLane",
+    "LanePolicy",
+    "StreamTelemetry",
+    "MockRedisStreamsBackend",
+    "InProcessBackend",
+    "InProcessBroker",
+    "ClaimCheckBackend",
+    "StorageClaimCheckStore",
+    "RedisClaimCheckStore"
 ]
@@ -39,7 +39,7 @@ import asyncio
 import json
 from typing import Any, Callable, Dict, Optional, Union
 
-from ..logging import setup_logging
+from ailf.core.logging import setup_logging
 from .redis import AsyncRedisClient
 
 logger = setup_logging(__name__)
@@ -0,0 +1,464 @@
+"""Claim-check offloading of large messages for messaging backends.
+
+Large payloads bloat broker memory and slow down every consumer that reads
+them. :class:`ClaimCheckBackend` wraps any :class:`MessagingBackendBase`:
+messages above a size threshold are written to a :class:`ClaimCheckStore`
+and replaced on the wire with a small reference (the "claim check").
+Subscribers get the original payload back, fetched from the store when the
+reference is received or, with ``resolve=False``, only when they ask for it.
+
+A reference is the prefix ``ailf-claim-check:`` followed by a JSON document::
+
+    ailf-claim-check:{"key": "...", "size": 1048576, "type": "bytes", "expires_at": 1760000000.0}
+
+Stores:
+
+- :class:`StorageClaimCheckStore` keeps payloads in any ``StorageBase``
+  (``LocalStorage``, ``GCSStorage``, ...). Expired payloads are removed by
+  :meth:`ClaimCheckStore.collect_garbage`.
+- :class:`RedisClaimCheckStore` keeps payloads in Redis keys with a TTL, so
+  Redis expires them itself.
+
+Example:
+    >>> store = StorageClaimCheckStore(LocalStorage("./claims"))
+    >>> backend = ClaimCheckBackend(RedisStreamsBackend(url), store, threshold=64 * 1024)
+    >>> await backend.connect()
+    >>> await backend.publish("documents", large_document)  # Stream holds a reference
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import re
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+from ailf.core.storage_base import StorageBase
+from ailf.messaging.base import MessagingBackendBase, MessageHandlerCallback
+
+logger = logging.getLogger(__name__)
+
+CLAIM_CHECK_PREFIX = "ailf-claim-check:"
+_CLAIM_CHECK_PREFIX_BYTES = CLAIM_CHECK_PREFIX.encode("utf-8")
+
+DEFAULT_THRESHOLD = 256 * 1024
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+# Keys are generated as uuid4().hex; anything else may be a path traversal
+_KEY_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+
+class ClaimCheckError(Exception):
+    """Exception raised when a claim check cannot be resolved."""
+    pass
+
+
+def _check_key(key: Any) -> str:
+    """Return `key` if it has the format of a generated key, else raise ClaimCheckError."""
+    if not isinstance(key, str) or not _KEY_PATTERN.fullmatch(key):
+        raise ClaimCheckError(f"Invalid claim check key {key!r}")
+    return key
+
+
+@dataclass(frozen=True)
+class ClaimCheck:
+    """A reference to a payload held in a claim-check store.
+
+    Attributes:
+        key: Key of the payload in the store
+        size: Size of the payload in bytes
+        type: "str" or "bytes", the type the payload was published as
+        expires_at: Unix time after which the payload may be collected
+    """
+    key: str
+    size: int
+    type: str
+    expires_at: float
+
+    def encode(self) -> str:
+        """Serialize the reference for the wire."""
+        return CLAIM_CHECK_PREFIX + json.dumps(
+            {"key": self.key, "size": self.size, "type": self.type, "expires_at": self.expires_at},
+            separators=(",", ":")
+        )
+
+    @classmethod
+    def decode(cls, message: Union[str, bytes]) -> Optional["ClaimCheck"]:
+        """Parse a reference from a received message.
+
+        Args:
+            message: A message as delivered by a backend
+
+        Returns:
+            The reference, or None if the message is not a claim check
+
+        Raises:
+            ClaimCheckError: If the reference has a key that the backend
+                could not have generated
+        """
+        if isinstance(message, (bytes, bytearray)):
+            if not message.startswith(_CLAIM_CHECK_PREFIX_BYTES):
+                return None
+            message = bytes(message).decode("utf-8")
+        elif not isinstance(message, str) or not message.startswith(CLAIM_CHECK_PREFIX):
+            return None
+
+        try:
+            data = json.loads(message[len(CLAIM_CHECK_PREFIX):])
+            key = _check_key(data["key"])
+            return cls(
+                key=key,
+                size=int(data["size"]),
+                type=data["type"],
+                expires_at=float(data["expires_at"])
+            )
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed claim check reference")
+            return None
+
+
+class ClaimCheckStore(ABC):
+    """Base class for stores that hold offloaded payloads."""
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes, ttl: float) -> None:
+        """Store a payload.
+
+        Args:
+            key: Key to store the payload under
+            data: Payload bytes
+            ttl: Seconds to keep the payload
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Fetch a payload.
+
+        Args:
+            key: Key of the payload
+
+        Returns:
+            The payload, or None if it does not exist or has expired
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """Delete a payload.
+
+        Args:
+            key: Key of the payload
+
+        Returns:
+            True if a payload was deleted
+        """
+        pass
+
+    async def collect_garbage(self) -> int:
+        """Delete expired payloads.
+
+        Stores whose backend expires entries itself do not need to override this.
+
+        Returns:
+            Number of payloads deleted
+        """
+        return 0
+
+
+class StorageClaimCheckStore(ClaimCheckStore):
+    """Claim-check store on top of a ``StorageBase``.
+
+    ``StorageBase`` only stores JSON, so each payload is saved as a JSON
+    document holding its base64-encoded bytes and expiry time. Each payload
+    also gets an empty marker under ``<prefix>/expiry/`` whose name holds the
+    expiry time, so garbage collection lists markers instead of reading every
+    payload. Storage calls are blocking and run in a worker thread.
+
+    Args:
+        storage: Storage to keep payloads in, e.g. ``LocalStorage`` or ``GCSStorage``
+        prefix: Directory within the storage for payloads
+    """
+
+    def __init__(self, storage: StorageBase, prefix: str = "claim_checks"):
+        self.storage = storage
+        self.prefix = prefix.strip("/")
+
+    def _path(self, key: str) -> str:
+        return f"{self.prefix}/{_check_key(key)}.json"
+
+    def _marker_dir(self) -> str:
+        return f"{self.prefix}/expiry"
+
+    def _marker_path(self, key: str, expires_at: float) -> str:
+        return f"{self._marker_dir()}/{expires_at:.3f}_{key}.json"
+
+    async def put(self, key: str, data: bytes, ttl: float) -> None:
+        expires_at = time.time() + ttl
+        document = {
+            "expires_at": expires_at,
+            "data": base64.b64encode(data).decode("ascii")
+        }
+        # Marker first: a marker without a payload is harmless, the reverse is never collected
+        await asyncio.to_thread(self.storage.save_json, {}, self._marker_path(key, expires_at))
+        await asyncio.to_thread(self.storage.save_json, document, self._path(key))
+
+    async def get(self, key: str) -> Optional[bytes]:
+        document = await asyncio.to_thread(self.storage.get_json, self._path(key))
+        if not document or document.get("expires_at", 0) < time.time():
+            return None
+        return base64.b64decode(document["data"])
+
+    async def delete(self, key: str) -> bool:
+        # The expiry marker is left for garbage collection to remove
+        return await asyncio.to_thread(self.storage.delete, self._path(key))
+
+    async def collect_garbage(self) -> int:
+        return await asyncio.to_thread(self._collect_garbage)
+
+    def _collect_garbage(self) -> int:
+        """Delete payloads whose expiry marker has passed (blocking)."""
+        try:
+            names = self.storage.list_directory(self._marker_dir())
+        except FileNotFoundError:
+            return 0
+
+        now = time.time()
+        deleted = 0
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            expires_at, _, key = name[:-len(".json")].partition("_")
+            try:
+                expired = float(expires_at) < now
+            except ValueError:
+                continue
+            if not expired or not _KEY_PATTERN.fullmatch(key):
+                continue
+            if self.storage.delete(self._path(key)):
+                deleted += 1
+            self.storage.delete(f"{self._marker_dir()}/{name}")
+        return deleted
+
+
+class RedisClaimCheckStore(ClaimCheckStore):
+    """Claim-check store on Redis keys with a TTL.
+
+    Redis expires payloads itself, so garbage collection is a no-op.
+
+    Args:
+        client: A ``redis.asyncio.Redis`` client
+        key_prefix: Prefix for payload keys
+    """
+
+    def __init__(self, client: Any, key_prefix: str = "ailf:claim_check:"):
+        self.client = client
+        self.key_prefix = key_prefix
+
+    async def put(self, key: str, data: bytes, ttl: float) -> None:
+        await self.client.set(self.key_prefix + key, data, px=max(int(ttl * 1000), 1))
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.key_prefix + key)
+
+    async def delete(self, key: str) -> bool:
+        return bool(await self.client.delete(self.key_prefix + key))
+
+
+class ClaimCheckBackend(MessagingBackendBase):
+    """
+    A messaging backend wrapper that offloads large messages to a store.
+
+    Messages larger than `threshold` bytes are written to `store` and the
+    wrapped backend carries only a reference. Messages that are not ``str``
+    or ``bytes`` (e.g. objects on the in-process backend) are passed through.
+
+    Resolved payloads are kept in an LRU cache bounded by `cache_bytes`, so
+    a payload fanned out to several local subscribers is fetched once.
+
+    :param backend: The backend that carries the messages.
+    :type backend: MessagingBackendBase
+    :param store: Where large payloads are kept.
+    :type store: ClaimCheckStore
+    :param threshold: Size in bytes above which messages are offloaded. Defaults to 256 KiB.
+    :type threshold: int, optional
+    :param ttl: Seconds offloaded payloads are kept. Defaults to one day.
+    :type ttl: float, optional
+    :param cache_bytes: Capacity of the resolved payload cache. 0 disables it. Defaults to 64 MiB.
+    :type cache_bytes: int, optional
+    :param gc_interval: Seconds between garbage collection runs while connected.
+                        None disables periodic collection. Defaults to None.
+    :type gc_interval: Optional[float]
+    """
+    def __init__(self,
+                 backend: MessagingBackendBase,
+                 store: ClaimCheckStore,
+                 threshold: int = DEFAULT_THRESHOLD,
+                 ttl: float = DEFAULT_TTL,
+                 cache_bytes: int = DEFAULT_CACHE_BYTES,
+                 gc_interval: Optional[float] = None):
+        self.backend = backend
+        self.store = store
+        self.threshold = threshold
+        self.ttl = ttl
+        self.cache_bytes = cache_bytes
+        self.gc_interval = gc_interval
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cached_bytes = 0
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._gc_task: Optional[asyncio.Task] = None
+
+    async def connect(self) -> None:
+        """Connects the wrapped backend and starts periodic garbage collection."""
+        await self.backend.connect()
+        if self.gc_interval is not None and self._gc_task is None:
+            self._gc_task = asyncio.create_task(self._collect_periodically())
+
+    async def disconnect(self) -> None:
+        """Stops garbage collection and disconnects the wrapped backend."""
+        if self._gc_task is not None:
+            self._gc_task.cancel()
+            await asyncio.gather(self._gc_task, return_exceptions=True)
+            self._gc_task = None
+        await self.backend.disconnect()
+
+    async def publish(self, topic: str, message: Union[str, bytes], **kwargs: Any) -> None:
+        """
+        Publishes a message, offloading it to the store if it is too large.
+
+        :param topic: The topic to publish to.
+        :type topic: str
+        :param message: The message content.
+        :type message: Union[str, bytes]
+        :param kwargs: Supports `ttl` (float) to override the payload TTL. Other
+                       arguments are passed to the wrapped backend.
+        :type kwargs: Any
+        """
+        ttl = kwargs.pop("ttl", self.ttl)
+        if isinstance(message, str):
+            data, kind = message.encode("utf-8"), "str"
+        elif isinstance(message, (bytes, bytearray, memoryview)):
+            data, kind = bytes(message), "bytes"
+        else:
+            await self.backend.publish(topic, message, **kwargs)
+            return
+
+        if len(data) <= self.threshold:
+            await self.backend.publish(topic, message, **kwargs)
+            return
+
+        claim = ClaimCheck(key=uuid.uuid4().hex, size=len(data), type=kind, expires_at=time.time() + ttl)
+        await self.store.put(claim.key, data, ttl)
+        logger.debug(f"Offloaded {claim.size} byte message on topic '{topic}' as claim check {claim.key}")
+        await self.backend.publish(topic, claim.encode(), **kwargs)
+
+    async def subscribe(self,
+                        topic: str,
+                        callback: MessageHandlerCallback,
+                        resolve: bool = True,
+                        **kwargs: Any) -> None:
+        """
+        Subscribes to a topic, resolving claim checks for the callback.
+
+        :param topic: The topic to subscribe to.
+        :type topic: str
+        :param callback: The async callback function to handle incoming messages.
+        :type callback: MessageHandlerCallback
+        :param resolve: Fetch offloaded payloads before calling `callback`. When
+                        False, the callback receives the :class:`ClaimCheck` and
+                        fetches the payload with :meth:`resolve` only if it needs it.
+        :type resolve: bool
+        :param kwargs: Passed to the wrapped backend.
+        :type kwargs: Any
+        """
+        async def on_message(received_topic: str, message: Union[str, bytes]) -> None:
+            claim = ClaimCheck.decode(message)
+            if claim is None:
+                await callback(received_topic, message)
+            elif resolve:
+                await callback(received_topic, await self.resolve(claim))
+            else:
+                await callback(received_topic, claim)
+
+        await self.backend.subscribe(topic, on_message, **kwargs)
+
+    async def unsubscribe(self, topic: str, **kwargs: Any) -> None:
+        """Unsubscribes from a topic on the wrapped backend."""
+        await self.backend.unsubscribe(topic, **kwargs)
+
+    async def resolve(self, claim: ClaimCheck) -> Union[str, bytes]:
+        """
+        Fetches the payload of a claim check.
+
+        Concurrent requests for the same payload share one fetch, and resolved
+        payloads are served from the cache.
+
+        :param claim: The claim check to resolve.
+        :type claim: ClaimCheck
+        :return: The payload, with the type it was published as.
+        :rtype: Union[str, bytes]
+        :raises ClaimCheckError: If the payload has expired or is missing.
+        """
+        data = self._cache.get(claim.key)
+        if data is not None:
+            self._cache.move_to_end(claim.key)
+        elif claim.key in self._pending:
+            data = await asyncio.shield(self._pending[claim.key])
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[claim.key] = future
+            try:
+                data = await self.store.get(claim.key)
+                if data is None:
+                    raise ClaimCheckError(f"Claim check {claim.key} has expired or does not exist")
+                self._remember(claim.key, data)
+                future.set_result(data)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                # Waiters re-raise it; avoid "exception was never retrieved"
+                future.exception()
+                raise
+            finally:
+                del self._pending[claim.key]
+
+        return data.decode("utf-8") if claim.type == "str" else data
+
+    async def collect_garbage(self) -> int:
+        """
+        Deletes expired payloads from the store.
+
+        :return: Number of payloads deleted.
+        :rtype: int
+        """
+        deleted = await self.store.collect_garbage()
+        if deleted:
+            logger.debug(f"Collected {deleted} expired claim check payload(s)")
+        return deleted
+
+    def _remember(self, key: str, data: bytes) -> None:
+        """Add a payload to the LRU cache, evicting the oldest entries."""
+        if len(data) > self.cache_bytes:
+            return
+        self._cache[key] = data
+        self._cached_bytes += len(data)
+        while self._cached_bytes > self.cache_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_bytes -= len(evicted)
+
+    async def _collect_periodically(self) -> None:
+        """Internal task that runs garbage collection every `gc_interval` seconds."""
+        while True:
+            await asyncio.sleep(self.gc_interval)
+            try:
+                await self.collect_garbage()
+            except Exception as e:
+                logger.error(f"Claim check garbage collection failed: {e}", exc_info=True)
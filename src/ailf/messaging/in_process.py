@@ -0,0 +1,315 @@
+"""In-process asyncio implementation of the MessagingBackendBase.
+
+This module provides a messaging backend for single-node deployments where
+every agent runs in the same process. Messages travel through asyncio queues
+and are passed by reference, so there is no broker, socket or serialization
+on the path.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from ailf.messaging.base import MessagingBackendBase, MessageHandlerCallback
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_QUEUE_SIZE = 1000
+
+
+@dataclass
+class _ConsumerGroup:
+    """A queue shared by competing consumers of one topic."""
+    queue: asyncio.Queue
+    consumers: List[asyncio.Task] = field(default_factory=list)
+
+
+class InProcessBroker:
+    """
+    Routes messages between in-process backends.
+
+    Every topic has a set of consumer groups. A published message is delivered
+    once to every group (fan-out), and within a group it is handled by exactly
+    one consumer (competing consumers), like Redis Streams consumer groups.
+
+    Backends created without an explicit broker share :meth:`default`, so
+    agents in one process reach each other without any wiring.
+    """
+
+    _default: Optional["InProcessBroker"] = None
+
+    def __init__(self):
+        self._topics: Dict[str, Dict[str, _ConsumerGroup]] = defaultdict(dict)
+
+    @classmethod
+    def default(cls) -> "InProcessBroker":
+        """
+        Get the process-wide broker.
+
+        Its queues are created on first use and bound to the event loop running
+        at that time, so it must not be shared across event loops (for example
+        between tests that each run their own loop); pass a private broker to
+        the backends instead.
+
+        :return: The shared broker instance.
+        :rtype: InProcessBroker
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def topics(self) -> List[str]:
+        """
+        List the topics that currently have consumer groups.
+
+        :return: Topic names.
+        :rtype: List[str]
+        """
+        return [topic for topic, groups in self._topics.items() if groups]
+
+    def groups(self, topic: str) -> List[str]:
+        """
+        List the consumer groups of a topic.
+
+        :param topic: The topic name.
+        :type topic: str
+        :return: Group names.
+        :rtype: List[str]
+        """
+        return list(self._topics.get(topic, {}))
+
+    def backlog(self, topic: str, group: str) -> int:
+        """
+        Get the number of messages waiting in a consumer group.
+
+        :param topic: The topic name.
+        :type topic: str
+        :param group: The consumer group name.
+        :type group: str
+        :return: Number of undelivered messages, or 0 if the group does not exist.
+        :rtype: int
+        """
+        consumer_group = self._topics.get(topic, {}).get(group)
+        return consumer_group.queue.qsize() if consumer_group else 0
+
+    def _get_group(self, topic: str, group: str, max_queue_size: int) -> _ConsumerGroup:
+        """Get or create a consumer group."""
+        groups = self._topics[topic]
+        if group not in groups:
+            groups[group] = _ConsumerGroup(queue=asyncio.Queue(maxsize=max_queue_size))
+        return groups[group]
+
+    def _remove_consumers(self, topic: str, group: str, tasks: List[asyncio.Task]) -> None:
+        """Detach consumer tasks from a group and drop the group once it is empty."""
+        groups = self._topics.get(topic)
+        if not groups or group not in groups:
+            return
+        consumer_group = groups[group]
+        consumer_group.consumers = [task for task in consumer_group.consumers if task not in tasks]
+        if not consumer_group.consumers:
+            del groups[group]
+            if not groups:
+                del self._topics[topic]
+
+    async def publish(self, topic: str, message: Any, block: bool = True) -> int:
+        """
+        Deliver a message to every consumer group of a topic.
+
+        With ``block=False`` delivery is all-or-nothing: if any group's queue is
+        full, no group receives the message. With ``block=True`` the message is
+        put to all groups concurrently, so a full group delays this call but
+        does not hold back delivery to the others.
+
+        :param topic: The topic to publish to.
+        :type topic: str
+        :param message: The message object; it is passed by reference.
+        :type message: Any
+        :param block: Wait for room when a group's queue is full. When False, raise instead.
+        :type block: bool
+        :return: Number of groups the message was delivered to.
+        :rtype: int
+        :raises asyncio.QueueFull: If ``block`` is False and a group's queue is full.
+        """
+        queues = [consumer_group.queue for consumer_group in self._topics.get(topic, {}).values()]
+        if not block:
+            if any(queue.full() for queue in queues):
+                raise asyncio.QueueFull(f"A consumer group of topic '{topic}' is full")
+            for queue in queues:
+                queue.put_nowait(message)
+        elif len(queues) == 1:
+            await queues[0].put(message)
+        elif queues:
+            await asyncio.gather(*(queue.put(message) for queue in queues))
+        return len(queues)
+
+    async def join(self, topic: Optional[str] = None) -> None:
+        """
+        Wait until every queued message has been handled.
+
+        :param topic: Only wait for this topic. Defaults to all topics.
+        :type topic: Optional[str]
+        """
+        topics = [topic] if topic is not None else list(self._topics)
+        for name in topics:
+            for consumer_group in list(self._topics.get(name, {}).values()):
+                await consumer_group.queue.join()
+
+
+class InProcessBackend(MessagingBackendBase):
+    """
+    A messaging backend that delivers messages through in-process asyncio queues.
+
+    Messages are not serialized: the object given to :meth:`publish` is the
+    object passed to subscriber callbacks. Each consumer group has a bounded
+    queue, and publishers wait when a queue is full, so slow consumers slow
+    producers down instead of growing memory without limit.
+
+    :param broker: Broker to attach to. Defaults to the process-wide broker.
+    :type broker: Optional[InProcessBroker]
+    :param max_queue_size: Default capacity of consumer group queues. Defaults to 1000.
+    :type max_queue_size: int, optional
+    """
+    def __init__(self,
+                 broker: Optional[InProcessBroker] = None,
+                 max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE):
+        self.broker = broker or InProcessBroker.default()
+        self.max_queue_size = max_queue_size
+        self._subscriptions: Dict[str, Dict[str, List[asyncio.Task]]] = defaultdict(dict)
+        self._is_connected = False
+
+    async def connect(self) -> None:
+        """Marks the backend as connected. There is nothing to connect to."""
+        self._is_connected = True
+
+    async def disconnect(self) -> None:
+        """Cancels all consumer tasks started by this backend."""
+        for topic in list(self._subscriptions):
+            await self.unsubscribe(topic)
+        self._is_connected = False
+
+    async def publish(self, topic: str, message: Any, **kwargs: Any) -> None:
+        """
+        Publishes a message to every consumer group of a topic.
+
+        Messages published to a topic without subscribers are dropped.
+
+        :param topic: The topic to publish to.
+        :type topic: str
+        :param message: The message object. Any type is accepted and passed by reference.
+        :type message: Any
+        :param kwargs: Supports `block` (bool, default True). When False, raise
+                       ``asyncio.QueueFull`` instead of waiting for queue space.
+        :type kwargs: Any
+        :raises ConnectionError: If the backend is not connected.
+        """
+        if not self._is_connected:
+            raise ConnectionError("InProcessBackend: Not connected. Call connect() first.")
+
+        await self.broker.publish(topic, message, block=kwargs.get('block', True))
+
+    async def send_message(self, target: str, message: Any) -> None:
+        """
+        Sends a message to an agent's topic.
+
+        This lets the backend be used as the message client of the routing layer.
+
+        :param target: The target agent ID, used as the topic.
+        :type target: str
+        :param message: The message object.
+        :type message: Any
+        """
+        await self.publish(target, message)
+
+    async def subscribe(self,
+                        topic: str,
+                        callback: MessageHandlerCallback,
+                        group: Optional[str] = None,
+                        concurrency: int = 1,
+                        max_queue_size: Optional[int] = None,
+                        **kwargs: Any) -> None:
+        """
+        Subscribes to a topic.
+
+        Without a `group`, the subscription gets its own group and receives every
+        message. Subscriptions sharing a `group` split the messages between them.
+
+        :param topic: The topic to subscribe to.
+        :type topic: str
+        :param callback: The async callback function to handle incoming messages.
+        :type callback: MessageHandlerCallback
+        :param group: Consumer group name. Defaults to a private group.
+        :type group: Optional[str]
+        :param concurrency: Number of consumer tasks to start for this subscription. Defaults to 1.
+        :type concurrency: int
+        :param max_queue_size: Capacity of the group's queue when the group is created.
+                               Defaults to `self.max_queue_size`.
+        :type max_queue_size: Optional[int]
+        :param kwargs: Additional arguments (not used by this backend).
+        :type kwargs: Any
+        :raises ConnectionError: If the backend is not connected.
+        :raises ValueError: If `concurrency` is less than 1.
+        """
+        if not self._is_connected:
+            raise ConnectionError("InProcessBackend: Not connected. Call connect() first.")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        group_name = group or f"{topic}:{uuid.uuid4().hex[:8]}"
+        consumer_group = self.broker._get_group(
+            topic, group_name, max_queue_size if max_queue_size is not None else self.max_queue_size
+        )
+
+        tasks = [
+            asyncio.create_task(self._consume(topic, consumer_group.queue, callback))
+            for _ in range(concurrency)
+        ]
+        consumer_group.consumers.extend(tasks)
+        self._subscriptions[topic].setdefault(group_name, []).extend(tasks)
+        logger.debug(f"Subscribed to topic '{topic}' in group '{group_name}' with {concurrency} consumer(s).")
+
+    async def _consume(self, topic: str, queue: asyncio.Queue, callback: MessageHandlerCallback) -> None:
+        """Internal method that hands queued messages to a callback."""
+        while True:
+            message = await queue.get()
+            try:
+                await callback(topic, message)
+            except Exception as e:
+                logger.error(f"Error processing message on topic '{topic}': {e}", exc_info=True)
+            finally:
+                queue.task_done()
+
+    async def unsubscribe(self, topic: str, group: Optional[str] = None, **kwargs: Any) -> None:
+        """
+        Unsubscribes from a topic and cancels the consumer tasks.
+
+        Queued messages of a group are discarded once its last consumer leaves.
+
+        :param topic: The topic to unsubscribe from.
+        :type topic: str
+        :param group: Only leave this consumer group. Defaults to all groups of this backend.
+        :type group: Optional[str]
+        :param kwargs: Additional arguments (not used by this backend).
+        :type kwargs: Any
+        """
+        groups = self._subscriptions.get(topic)
+        if not groups:
+            logger.warning(f"No active subscription found for topic '{topic}' to unsubscribe from.")
+            return
+
+        names = [group] if group is not None else list(groups)
+        cancelled: List[Tuple[str, List[asyncio.Task]]] = []
+        for name in names:
+            tasks = groups.pop(name, [])
+            for task in tasks:
+                task.cancel()
+            cancelled.append((name, tasks))
+        if not groups:
+            del self._subscriptions[topic]
+
+        for name, tasks in cancelled:
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.broker._remove_consumers(topic, name, tasks)
+        logger.debug(f"Unsubscribed from topic '{topic}'.")
@@ -7,7 +7,7 @@ pub/sub messaging, and stream processing for distributed agent communication.
 Key Components:
     RedisConfig: Configuration model for Redis connections
     RedisClient: Synchronous Redis client implementation
-    AsyncRedisClient: Asynchronous Redis client implementation
+    AsyncRedisClient: Asynchronous Redis client implementation, with optional auto-pipelining
     RedisPubSub: Higher-level pub/sub implementation
 
 Example:
@@ -47,11 +47,12 @@ Example:
         >>> pubsub.subscribe("channel", message_handler)
         >>> pubsub.run()  # Blocks and processes messages
 """
+import asyncio
 import json
 import threading
 import time
 from contextlib import asynccontextmanager, contextmanager
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 import redis
 from pydantic import BaseModel
@@ -59,6 +60,8 @@ from redis.asyncio import Redis as AsyncRedis
 from redis.exceptions import RedisError
 
 from ailf.core.logging import setup_logging
+from ailf.messaging.redis_client_cache import RedisClientCache
+from ailf.messaging.redis_pool import RedisPoolRegistry
 
 logger = setup_logging(__name__)
 
@@ -81,6 +84,14 @@ class RedisConfig(BaseModel):
         retry_on_timeout: Whether to retry commands on timeout errors
         max_connections: Maximum number of connections in the connection pool
         decode_responses: Whether to decode byte responses to strings
+        auto_pipeline: Whether AsyncRedisClient batches concurrent commands into pipelines
+        auto_pipeline_window: Seconds to collect commands before sending a batch;
+            0 sends the commands issued in one event-loop tick
+        auto_pipeline_max_batch: Send a batch as soon as it holds this many commands
+        client_cache: Whether ``get`` (and ``get_json``) results are cached in
+            process and invalidated by the server (RESP3 client tracking)
+        client_cache_prefixes: Key prefixes to cache; empty caches every key
+        client_cache_max_entries: Maximum number of keys in the client-side cache
     """
     host: str = "localhost"
     port: int = 6379
@@ -93,49 +104,64 @@ class RedisConfig(BaseModel):
     retry_on_timeout: bool = True
     max_connections: int = 10
     decode_responses: bool = True
+    auto_pipeline: bool = False
+    auto_pipeline_window: float = 0.0
+    auto_pipeline_max_batch: int = 1000
+    client_cache: bool = False
+    client_cache_prefixes: Tuple[str, ...] = ()
+    client_cache_max_entries: int = 10000
 
     class Config:
         """Pydantic model configuration."""
         frozen = True
 
 
+def _client_cache(config: RedisConfig, pool_registry: RedisPoolRegistry) -> Optional[RedisClientCache]:
+    """Get the shared client-side cache for a configuration, if it enables one."""
+    if not getattr(config, "client_cache", False):
+        return None
+    return pool_registry.client_cache(
+        config,
+        prefixes=config.client_cache_prefixes,
+        max_entries=config.client_cache_max_entries
+    )
+
+
 class RedisClient:
     """Synchronous Redis client for agent communication.
 
     This class provides a simplified interface to Redis operations with
     error handling, logging, and convenience methods for common operations.
 
+    Connections come from a pool shared with every other client that has
+    the same connection settings (see :class:`RedisPoolRegistry`). With
+    ``config.client_cache`` enabled, ``get`` and ``get_json`` are served from
+    a shared :class:`RedisClientCache` that the server keeps up to date.
+
     Attributes:
         config: Redis connection configuration
         client: Raw Redis client instance
     """
 
-    def __init__(self, config: Optional[RedisConfig] = None):
+    def __init__(self, config: Optional[RedisConfig] = None,
+                 pool_registry: Optional[RedisPoolRegistry] = None):
         """Initialize the Redis client.
 
         Args:
             config: Redis connection configuration (optional)
+            pool_registry: Registry providing the connection pool (optional,
+                defaults to the process-wide registry)
         """
         self.config = config or RedisConfig()
+        self.pool_registry = pool_registry or RedisPoolRegistry.default()
         self._client = None
+        self._cache = _client_cache(self.config, self.pool_registry)
         self.connect()
 
     def connect(self) -> None:
         """Connect to Redis server."""
         try:
-            self._client = redis.Redis(
-                host=self.config.host,
-                port=self.config.port,
-                db=self.config.db,
-                password=self.config.password,
-                ssl=self.config.ssl,
-                socket_timeout=self.config.socket_timeout,
-                socket_connect_timeout=self.config.socket_connect_timeout,
-                socket_keepalive=self.config.socket_keepalive,
-                # retry_on_timeout parameter is deprecated in newer Redis versions
-                decode_responses=self.config.decode_responses,
-                max_connections=self.config.max_connections
-            )
+            self._client = self.pool_registry.client(self.config)
             # Test the connection
             self._client.ping()
             logger.info(
@@ -155,6 +181,11 @@ class RedisClient:
             self.connect()
         return self._client
 
+    def _invalidate(self, key: str) -> None:
+        """Drop a written key from the client-side cache before the server's invalidation arrives."""
+        if self._cache is not None:
+            self._cache.invalidate([key])
+
     def close(self) -> None:
         """Close the Redis connection."""
         if self._client:
@@ -184,11 +215,19 @@ class RedisClient:
         Returns:
             The value of the key, or None if it doesn't exist
         """
+        if self._cache is not None:
+            hit, value = self._cache.get(key)
+            if hit:
+                return value
+            token = self._cache.begin(key)
         try:
-            return self.client.get(key)
+            value = self.client.get(key)
         except RedisError as e:
             logger.error(f"Error getting key {key}: {str(e)}")
             return None
+        if self._cache is not None:
+            self._cache.put(key, value, token)
+        return value
 
     def set(self, key: str, value: str, expire: Optional[int] = None) -> bool:
         """Set a value in Redis.
@@ -206,6 +245,8 @@ class RedisClient:
         except RedisError as e:
             logger.error(f"Error setting key {key}: {str(e)}")
             return False
+        finally:
+            self._invalidate(key)
 
     def delete(self, key: str) -> bool:
         """Delete a key from Redis.
@@ -221,6 +262,8 @@ class RedisClient:
         except RedisError as e:
             logger.error(f"Error deleting key {key}: {str(e)}")
             return False
+        finally:
+            self._invalidate(key)
 
     def exists(self, key: str) -> bool:
         """Check if a key exists in Redis.
@@ -305,42 +348,129 @@ class RedisClient:
             return False
 
 
+class _AutoPipeline:
+    """Batches commands issued close together into single pipeline round trips.
+
+    Commands are queued with :meth:`execute`, which returns a future for the
+    command's own reply. The queue is sent as one non-transactional pipeline
+    at the end of the current event-loop tick (or after `window` seconds), or
+    as soon as it holds `max_batch` commands. Replies are read with
+    ``raise_on_error=False``, so a failing command fails only its own future.
+    """
+
+    def __init__(self, get_client: Callable[[], Any], window: float = 0.0, max_batch: int = 1000):
+        self._get_client = get_client
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: List[tuple] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._in_flight: set = set()
+
+    def execute(self, command: str, *args: Any, **kwargs: Any) -> asyncio.Future:
+        """Queue a command and return a future for its reply."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((command, args, kwargs, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            if self.window > 0:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Send the queued commands as one pipeline."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: List[tuple]) -> None:
+        """Execute a batch and hand each reply to its caller."""
+        try:
+            client = await self._get_client()
+            pipe = client.pipeline(transaction=False)
+            for command, args, kwargs, _ in batch:
+                getattr(pipe, command)(*args, **kwargs)
+            replies = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (*_, future), reply in zip(batch, replies):
+            if future.done():
+                continue  # The caller was cancelled
+            if isinstance(reply, Exception):
+                future.set_exception(reply)
+            else:
+                future.set_result(reply)
+
+    async def drain(self) -> None:
+        """Send queued commands and wait for every batch in flight."""
+        self._flush()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+
 class AsyncRedisClient:
     """Asynchronous Redis client for agent communication.
 
     This class provides an async interface to Redis operations with
     error handling, logging, and convenience methods.
 
+    With ``config.auto_pipeline`` enabled, ``get``, ``set``, ``delete``,
+    ``exists`` and ``publish`` calls (and ``get_json``/``set_json`` through
+    them) issued by concurrent coroutines within one event-loop tick, or
+    within ``config.auto_pipeline_window`` seconds, are sent as a single
+    pipeline. Each call still returns its own reply and handles its own errors.
+
+    Connections come from a pool shared with every other client on the same
+    event loop that has the same connection settings (see
+    :class:`RedisPoolRegistry`). With ``config.client_cache`` enabled,
+    ``get`` and ``get_json`` are served from a shared
+    :class:`RedisClientCache` that the server keeps up to date.
+
     Attributes:
         config: Redis connection configuration
         client: Raw Redis async client instance
     """
 
-    def __init__(self, config: Optional[RedisConfig] = None):
+    def __init__(self, config: Optional[RedisConfig] = None,
+                 pool_registry: Optional[RedisPoolRegistry] = None):
         """Initialize the async Redis client.
 
         Args:
             config: Redis connection configuration (optional)
+            pool_registry: Registry providing the connection pool (optional,
+                defaults to the process-wide registry)
         """
         self.config = config or RedisConfig()
+        self.pool_registry = pool_registry or RedisPoolRegistry.default()
         self._client = None
+        self._cache = _client_cache(self.config, self.pool_registry)
+        self._auto_pipeline: Optional[_AutoPipeline] = None
+        if getattr(self.config, "auto_pipeline", False):
+            self._auto_pipeline = _AutoPipeline(
+                lambda: self.client,
+                window=self.config.auto_pipeline_window,
+                max_batch=self.config.auto_pipeline_max_batch
+            )
 
     async def connect(self) -> None:
         """Connect to Redis server asynchronously."""
         try:
-            self._client = AsyncRedis(
-                host=self.config.host,
-                port=self.config.port,
-                db=self.config.db,
-                password=self.config.password,
-                ssl=self.config.ssl,
-                socket_timeout=self.config.socket_timeout,
-                socket_connect_timeout=self.config.socket_connect_timeout,
-                socket_keepalive=self.config.socket_keepalive,
-                # retry_on_timeout parameter is deprecated in newer Redis versions
-                decode_responses=self.config.decode_responses,
-                max_connections=self.config.max_connections
-            )
+            self._client = self.pool_registry.async_client(self.config)
             # Test the connection
             await self._client.ping()
             logger.info(
@@ -360,8 +490,15 @@ class AsyncRedisClient:
             await self.connect()
         return self._client
 
+    def _invalidate(self, key: str) -> None:
+        """Drop a written key from the client-side cache before the server's invalidation arrives."""
+        if self._cache is not None:
+            self._cache.invalidate([key])
+
     async def close(self) -> None:
         """Close the Redis connection asynchronously."""
+        if self._auto_pipeline:
+            await self._auto_pipeline.drain()
         if self._client:
             # Use aclose() instead of close() as recommended by Redis library
             await self._client.aclose()
@@ -382,6 +519,13 @@ class AsyncRedisClient:
         finally:
             await pipe.execute()
 
+    async def _execute(self, command: str, *args: Any, **kwargs: Any) -> Any:
+        """Run a command directly, or through the auto-pipeline when enabled."""
+        if self._auto_pipeline:
+            return await self._auto_pipeline.execute(command, *args, **kwargs)
+        client = await self.client
+        return await getattr(client, command)(*args, **kwargs)
+
     async def get(self, key: str) -> Optional[str]:
         """Get a value from Redis asynchronously.
 
@@ -391,12 +535,19 @@ class AsyncRedisClient:
         Returns:
             The value of the key, or None if it doesn't exist
         """
+        if self._cache is not None:
+            hit, value = self._cache.get(key)
+            if hit:
+                return value
+            token = self._cache.begin(key)
         try:
-            client = await self.client
-            return await client.get(key)
+            value = await self._execute("get", key)
         except RedisError as e:
             logger.error(f"Error getting key {key}: {str(e)}")
             return None
+        if self._cache is not None:
+            self._cache.put(key, value, token)
+        return value
 
     async def set(self, key: str, value: str, expire: Optional[int] = None) -> bool:
         """Set a value in Redis asynchronously.
@@ -410,11 +561,12 @@ class AsyncRedisClient:
             True if successful, False otherwise
         """
         try:
-            client = await self.client
-            return await client.set(key, value, ex=expire)
+            return await self._execute("set", key, value, ex=expire)
         except RedisError as e:
             logger.error(f"Error setting key {key}: {str(e)}")
             return False
+        finally:
+            self._invalidate(key)
 
     async def delete(self, key: str) -> bool:
         """Delete a key from Redis asynchronously.
@@ -426,11 +578,12 @@ class AsyncRedisClient:
             True if the key was deleted, False otherwise
         """
         try:
-            client = await self.client
-            return bool(await client.delete(key))
+            return bool(await self._execute("delete", key))
         except RedisError as e:
             logger.error(f"Error deleting key {key}: {str(e)}")
             return False
+        finally:
+            self._invalidate(key)
 
     async def exists(self, key: str) -> bool:
         """Check if a key exists in Redis asynchronously.
@@ -442,8 +595,7 @@ class AsyncRedisClient:
             True if the key exists, False otherwise
         """
         try:
-            client = await self.client
-            return bool(await client.exists(key))
+            return bool(await self._execute("exists", key))
         except RedisError as e:
             logger.error(f"Error checking key {key}: {str(e)}")
             return False
@@ -499,8 +651,7 @@ class AsyncRedisClient:
             if isinstance(message, dict):
                 message = json.dumps(message)
 
-            client = await self.client
-            return await client.publish(channel, message)
+            return await self._execute("publish", channel, message)
         except RedisError as e:
             logger.error(f"Error publishing to channel {channel}: {str(e)}")
             return 0
@@ -0,0 +1,305 @@
+"""Client-Side Caching of Redis Reads.
+
+Keys that are read often and written rarely (configuration, working memory,
+agent profiles) cost a network round trip on every ``get``. A
+:class:`RedisClientCache` keeps their values in process memory and relies on
+the server to say when they change.
+
+The cache holds one dedicated RESP3 connection with
+``CLIENT TRACKING ON BCAST`` enabled for the configured key prefixes (every
+key when no prefix is given). In broadcasting mode the server pushes an
+invalidation for every write to a matching key, no matter which connection
+read it, so reads can keep using the shared connection pools. The connection
+is serviced by a daemon thread, which makes one cache usable from both
+``RedisClient`` and ``AsyncRedisClient``.
+
+Correctness rules:
+
+* Values are only served while tracking is active. When the tracking
+  connection drops, the cache is flushed and bypassed until it reconnects.
+* A value fetched while an invalidation for its key arrives is not cached.
+* Writes made through a client invalidate the key locally as well, so the
+  writer reads its own writes before the server push arrives.
+
+The cache is bounded by ``max_entries`` with least-recently-used eviction.
+Hit, miss, invalidation and eviction counts are available from
+:meth:`RedisClientCache.stats` and :meth:`RedisClientCache.export`.
+
+Example:
+    >>> config = RedisConfig(client_cache=True, client_cache_prefixes=("config:", "profile:"))
+    >>> client = AsyncRedisClient(config)
+    >>> await client.get_json("config:agent")  # network
+    >>> await client.get_json("config:agent")  # memory
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from redis.exceptions import RedisError
+
+from ailf.core.logging import setup_logging
+
+logger = setup_logging(__name__)
+
+DEFAULT_MAX_ENTRIES = 10000
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Usage statistics of a client-side cache.
+
+    Attributes:
+        hits: Reads served from memory
+        misses: Cacheable reads that went to Redis
+        invalidations: Keys dropped because the server or a local write changed them
+        evictions: Keys dropped to stay within max_entries
+        flushes: Times the whole cache was dropped (server flush or lost tracking)
+    """
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+    flushes: int = 0
+
+
+def _decode_key(key: Any) -> str:
+    return key.decode("utf-8", "surrogateescape") if isinstance(key, bytes) else str(key)
+
+
+class RedisClientCache:
+    """
+    In-process cache of Redis values invalidated by server-pushed tracking messages.
+
+    :param connection_factory: Creates the RESP3 (``protocol=3``) connection used for tracking.
+    :type connection_factory: Callable[[], redis.Connection]
+    :param prefixes: Key prefixes to cache and track. Empty caches every key.
+    :type prefixes: Sequence[str]
+    :param max_entries: Maximum number of cached keys. Defaults to 10000.
+    :type max_entries: int
+    :param poll_interval: Seconds between checks for a stop request while idle. Defaults to 1.
+    :type poll_interval: float
+    :param reconnect_delay: Seconds to wait before reconnecting a lost tracking connection. Defaults to 1.
+    :type reconnect_delay: float
+    """
+
+    def __init__(self,
+                 connection_factory: Callable[[], Any],
+                 prefixes: Sequence[str] = (),
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 poll_interval: float = 1.0,
+                 reconnect_delay: float = 1.0):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.connection_factory = connection_factory
+        self.prefixes: Tuple[str, ...] = tuple(prefixes)
+        self.max_entries = max_entries
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        # Fetches in flight: key -> token; an invalidation removes the token so the result is discarded
+        self._pending: Dict[str, object] = {}
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+        self._tracking = False
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def tracking(self) -> bool:
+        """Whether the tracking connection is active and the cache is in use."""
+        return self._tracking
+
+    def matches(self, key: str) -> bool:
+        """
+        Check whether a key is covered by the cache's prefixes.
+
+        :param key: The key.
+        :type key: str
+        :return: True if reads of the key are cached.
+        :rtype: bool
+        """
+        return not self.prefixes or key.startswith(self.prefixes)
+
+    def start(self) -> None:
+        """Start the tracking thread. Calling it again has no effect."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="redis-client-cache", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the tracking thread and flush the cache.
+
+        :param timeout: Seconds to wait for the thread to finish.
+        :type timeout: Optional[float]
+        """
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+        self._set_tracking(False)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a key.
+
+        :param key: The key.
+        :type key: str
+        :return: (True, value) on a hit, (False, None) otherwise. A cached value may be None
+            for a key known not to exist.
+        :rtype: Tuple[bool, Any]
+        """
+        if not self._tracking or not self.matches(key):
+            return False, None
+        with self._lock:
+            if self._tracking and key in self._entries:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return True, self._entries[key]
+            self._stats.misses += 1
+        return False, None
+
+    def begin(self, key: str) -> Optional[object]:
+        """
+        Register a read of `key` that is about to go to Redis.
+
+        :param key: The key.
+        :type key: str
+        :return: A token to pass to :meth:`put`, or None if the key is not cacheable now.
+        :rtype: Optional[object]
+        """
+        if not self.matches(key):
+            return None
+        with self._lock:
+            if not self._tracking:
+                return None
+            token = self._pending[key] = object()
+        return token
+
+    def put(self, key: str, value: Any, token: Optional[object]) -> None:
+        """
+        Cache the result of a read started with :meth:`begin`.
+
+        The value is dropped if the key was invalidated, or tracking was
+        lost, while the read was in flight.
+
+        :param key: The key.
+        :type key: str
+        :param value: The value read from Redis.
+        :type value: Any
+        :param token: The token returned by :meth:`begin`.
+        :type token: Optional[object]
+        """
+        if token is None:
+            return
+        with self._lock:
+            if self._pending.get(key) is not token:
+                return
+            del self._pending[key]
+            if not self._tracking:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def invalidate(self, keys: Optional[Iterable[Any]]) -> None:
+        """
+        Drop keys from the cache.
+
+        :param keys: Keys to drop, or None to drop everything.
+        :type keys: Optional[Iterable[Any]]
+        """
+        with self._lock:
+            if keys is None:
+                self._flush()
+                return
+            for key in keys:
+                key = _decode_key(key)
+                self._pending.pop(key, None)
+                if self._entries.pop(key, _MISSING) is not _MISSING:
+                    self._stats.invalidations += 1
+
+    def _flush(self) -> None:
+        """Drop every entry and in-flight read (called with the lock held)."""
+        self._entries.clear()
+        self._pending.clear()
+        self._stats.flushes += 1
+
+    def _set_tracking(self, tracking: bool) -> None:
+        with self._lock:
+            if self._tracking and not tracking:
+                self._flush()
+            self._tracking = tracking
+
+    def _on_invalidation(self, response: Any) -> None:
+        """Handle an ``invalidate`` push message: ["invalidate", [keys] or None]."""
+        keys = response[1] if len(response) > 1 else None
+        self.invalidate(keys)
+
+    def _tracking_command(self) -> Tuple[str, ...]:
+        args = ["CLIENT", "TRACKING", "ON", "BCAST"]
+        for prefix in self.prefixes:
+            args.extend(["PREFIX", prefix])
+        return tuple(args)
+
+    def _run(self) -> None:
+        """Keep a tracking connection open and apply its invalidations until stopped."""
+        while not self._stop.is_set():
+            connection = None
+            try:
+                connection = self.connection_factory()
+                connection.connect()
+                # Invalidations arrive as RESP3 push messages parsed by the connection
+                connection._parser.set_invalidation_push_handler(self._on_invalidation)
+                connection.send_command(*self._tracking_command())
+                reply = connection.read_response()
+                if _decode_key(reply) != "OK":
+                    raise RedisError(f"CLIENT TRACKING failed: {reply!r}")
+                self._set_tracking(True)
+                logger.debug(f"Redis client-side cache tracking prefixes {self.prefixes or 'all keys'}")
+
+                while not self._stop.is_set():
+                    if connection.can_read(timeout=self.poll_interval):
+                        connection.read_response(push_request=True)
+            except Exception as e:
+                if not self._stop.is_set():
+                    logger.warning(f"Redis client-side cache tracking lost, bypassing cache: {e}")
+            finally:
+                self._set_tracking(False)
+                if connection is not None:
+                    try:
+                        connection.disconnect()
+                    except Exception:
+                        pass
+            self._stop.wait(self.reconnect_delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get usage statistics.
+
+        :return: Statistics, with the current number of entries as "size".
+        :rtype: Dict[str, Any]
+        """
+        with self._lock:
+            return {"size": len(self._entries), "tracking": self._tracking, **asdict(self._stats)}
+
+    def export(self, exporter: Any, name: str = "redis_client_cache") -> None:
+        """
+        Send statistics to a metrics exporter.
+
+        :param exporter: An ``ailf.core.monitoring.MetricsExporter``.
+        :type exporter: MetricsExporter
+        :param name: Metric name.
+        :type name: str
+        """
+        stats = self.stats()
+        exporter.export_gauges(name, {"size": stats.pop("size"), "tracking": int(stats.pop("tracking"))})
+        exporter.export_counters(name, stats)
+
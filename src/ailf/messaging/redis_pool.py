@@ -0,0 +1,666 @@
+"""Shared Redis Connection Pools.
+
+Every Redis consumer in the framework (``RedisClient``, ``AsyncRedisClient``,
+``RedisStreamsBackend``, ``RedisDistributedCache``, ``RedisAgentMemory``)
+gets its connections from a process-wide :class:`RedisPoolRegistry` instead
+of opening its own pool. Consumers with the same connection settings share
+one bounded pool, so a process running many agents keeps a fixed number of
+sockets to each Redis server.
+
+Pools are blocking: when all ``max_connections`` connections are in use,
+callers wait up to ``timeout`` seconds for one to be released. Connections
+send a PING before use once they have been idle for ``health_check_interval``
+seconds, and connections idle for longer than ``idle_timeout`` are closed by
+a background reaper (they reconnect transparently on next use).
+
+asyncio pools are bound to the event loop that created them, so the registry
+keeps one set of async pools per loop. Outside of a running loop there is no
+loop to share a pool on: each caller gets a pool of its own, which the client
+from :meth:`RedisPoolRegistry.async_client` closes with itself. Consumers
+should create their async clients lazily, inside the loop that uses them.
+
+Commands that hold a connection for long, like the blocking ``XREADGROUP``
+of stream subscribers, use :meth:`RedisPoolRegistry.dedicated_async_client`
+so that they do not starve other callers of the shared pool.
+
+Each pool tracks connections in use, callers waiting, and time spent waiting
+for a connection. :meth:`RedisPoolRegistry.stats` returns them, and
+:meth:`RedisPoolRegistry.export` sends them to a ``MetricsExporter``.
+
+Example:
+    >>> registry = RedisPoolRegistry.default()
+    >>> client = registry.async_client(url="redis://localhost:6379/0")
+    >>> await client.set("key", "value")
+    >>> registry.stats()
+    {'localhost:6379/0 (async)': {'max_connections': 50, 'in_use': 0, ...}}
+"""
+import asyncio
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import redis
+import redis.asyncio
+from redis.asyncio.connection import parse_url as parse_async_url
+from redis.connection import parse_url as parse_sync_url
+
+from ailf.core.logging import setup_logging
+from ailf.messaging.redis_client_cache import DEFAULT_MAX_ENTRIES, RedisClientCache
+
+logger = setup_logging(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 50
+DEFAULT_POOL_TIMEOUT = 20.0
+DEFAULT_HEALTH_CHECK_INTERVAL = 30
+DEFAULT_IDLE_TIMEOUT = 300.0
+DEFAULT_REAP_INTERVAL = 60.0
+
+
+@dataclass
+class PoolStats:
+    """Usage statistics of a connection pool.
+
+    Attributes:
+        in_use: Connections currently checked out
+        waiters: Callers currently waiting for a connection
+        acquired: Connections handed out so far
+        failures: Acquisitions that failed (pool exhausted or connection error)
+        wait_time_total: Seconds spent acquiring connections, summed
+        wait_time_max: Longest single acquisition in seconds
+        reaped: Idle connections closed by the reaper
+    """
+    in_use: int = 0
+    waiters: int = 0
+    acquired: int = 0
+    failures: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+    reaped: int = 0
+
+    def record_wait(self, wait_time: float, acquired: bool) -> None:
+        """Record an acquisition attempt that took `wait_time` seconds."""
+        if acquired:
+            self.acquired += 1
+            self.in_use += 1
+        else:
+            self.failures += 1
+        self.wait_time_total += wait_time
+        self.wait_time_max = max(self.wait_time_max, wait_time)
+
+    def record_released(self) -> None:
+        """Record a released connection."""
+        self.in_use = max(self.in_use - 1, 0)
+
+
+class InstrumentedConnectionPool(redis.BlockingConnectionPool):
+    """Blocking connection pool that records usage statistics."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+        self._idle_since: Dict[Any, float] = {}
+        self._stats_lock = threading.Lock()
+
+    def get_connection(self, *args: Any, **kwargs: Any):
+        start = time.monotonic()
+        with self._stats_lock:
+            self.stats.waiters += 1
+        try:
+            connection = super().get_connection(*args, **kwargs)
+        except Exception:
+            with self._stats_lock:
+                self.stats.waiters -= 1
+                self.stats.record_wait(time.monotonic() - start, acquired=False)
+            raise
+
+        with self._stats_lock:
+            self.stats.waiters -= 1
+            self.stats.record_wait(time.monotonic() - start, acquired=True)
+            self._idle_since.pop(connection, None)
+        return connection
+
+    def release(self, connection) -> None:
+        super().release(connection)
+        with self._stats_lock:
+            self.stats.record_released()
+            self._idle_since[connection] = time.monotonic()
+
+    def reap_idle(self, idle_timeout: float) -> int:
+        """Disconnect connections that have been idle for `idle_timeout` seconds.
+
+        Connections stay in the pool and reconnect on next use.
+
+        Returns:
+            Number of connections closed
+        """
+        now = time.monotonic()
+        reaped = 0
+        # Holding the queue's mutex keeps other threads from taking a connection mid-disconnect
+        with self.pool.mutex:
+            for connection in self.pool.queue:
+                since = self._idle_since.get(connection)
+                if connection is None or since is None or now - since < idle_timeout:
+                    continue
+                connection.disconnect()
+                reaped += 1
+                with self._stats_lock:
+                    del self._idle_since[connection]
+        with self._stats_lock:
+            self.stats.reaped += reaped
+        return reaped
+
+
+class InstrumentedAsyncConnectionPool(redis.asyncio.BlockingConnectionPool):
+    """asyncio blocking connection pool that records usage statistics."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+        self._idle_since: Dict[Any, float] = {}
+
+    async def get_connection(self, *args: Any, **kwargs: Any):
+        start = time.monotonic()
+        self.stats.waiters += 1
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except BaseException:
+            self.stats.waiters -= 1
+            self.stats.record_wait(time.monotonic() - start, acquired=False)
+            raise
+
+        self.stats.waiters -= 1
+        self.stats.record_wait(time.monotonic() - start, acquired=True)
+        self._idle_since.pop(connection, None)
+        return connection
+
+    async def release(self, connection) -> None:
+        await super().release(connection)
+        self.stats.record_released()
+        self._idle_since[connection] = time.monotonic()
+
+    async def reap_idle(self, idle_timeout: float) -> int:
+        """Disconnect connections that have been idle for `idle_timeout` seconds.
+
+        Connections stay in the pool and reconnect on next use.
+
+        Returns:
+            Number of connections closed
+        """
+        now = time.monotonic()
+        idle = [
+            connection for connection in self._available_connections
+            if connection in self._idle_since and now - self._idle_since[connection] >= idle_timeout
+        ]
+        if not idle:
+            return 0
+
+        # Take the connections out while disconnecting so no caller picks one up half-closed
+        for connection in idle:
+            self._available_connections.remove(connection)
+            del self._idle_since[connection]
+        try:
+            for connection in idle:
+                await connection.disconnect()
+        finally:
+            self._available_connections.extend(idle)
+            async with self._condition:
+                self._condition.notify_all()
+        self.stats.reaped += len(idle)
+        return len(idle)
+
+
+def _hashable(value: Any) -> Any:
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def _pool_key(kwargs: Dict[str, Any]) -> Tuple:
+    return tuple(sorted((name, _hashable(value)) for name, value in kwargs.items()))
+
+
+def config_connection_kwargs(config: Any) -> Dict[str, Any]:
+    """Build connection keyword arguments from a RedisConfig.
+
+    Args:
+        config: ``ailf.messaging.redis.RedisConfig`` or ``ailf.schemas.redis.RedisConfig``
+
+    Returns:
+        Keyword arguments for a connection pool
+    """
+    kwargs = {
+        "host": config.host,
+        "port": config.port,
+        "db": config.db,
+        "password": config.password,
+        "socket_timeout": config.socket_timeout,
+        "socket_connect_timeout": config.socket_connect_timeout,
+        "socket_keepalive": config.socket_keepalive,
+        "decode_responses": config.decode_responses,
+        "max_connections": config.max_connections,
+    }
+    if config.ssl:
+        kwargs["ssl"] = True
+    return kwargs
+
+
+class RedisPoolRegistry:
+    """
+    Process-wide registry of shared, instrumented Redis connection pools.
+
+    Pools are keyed by their connection settings: consumers asking for the
+    same server, database and options get the same pool.
+
+    Consumers created without an explicit registry share :meth:`default`.
+
+    :param max_connections: Connections per pool, unless the caller's settings give one. Defaults to 50.
+    :type max_connections: int
+    :param timeout: Seconds to wait for a free connection before raising ``ConnectionError``. Defaults to 20.
+    :type timeout: float
+    :param health_check_interval: Idle seconds after which a connection is PINGed before use. Defaults to 30.
+    :type health_check_interval: int
+    :param idle_timeout: Idle seconds after which the reaper closes a connection. None disables reaping.
+    :type idle_timeout: Optional[float]
+    :param reap_interval: Seconds between reaper runs. Defaults to 60.
+    :type reap_interval: float
+    """
+
+    _default: Optional["RedisPoolRegistry"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 timeout: float = DEFAULT_POOL_TIMEOUT,
+                 health_check_interval: int = DEFAULT_HEALTH_CHECK_INTERVAL,
+                 idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+                 reap_interval: float = DEFAULT_REAP_INTERVAL):
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        self._sync_pools: Dict[Tuple, InstrumentedConnectionPool] = {}
+        # Keyed by event loop; the pools and tasks keep their loop alive, so
+        # the entries of closed loops are dropped by _discard_closed_loops
+        self._async_pools: Dict[Any, Dict[Tuple, InstrumentedAsyncConnectionPool]] = {}
+        self._names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._reaper_thread: Optional[threading.Thread] = None
+        self._reaper_stop = threading.Event()
+        self._reaper_tasks: Dict[Any, asyncio.Task] = {}
+        self._caches: Dict[Tuple, RedisClientCache] = {}
+        self._cache_names: Dict[int, str] = {}
+
+    @classmethod
+    def default(cls) -> "RedisPoolRegistry":
+        """
+        Get the process-wide registry.
+
+        :return: The shared registry instance.
+        :rtype: RedisPoolRegistry
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def _pool_kwargs(self, config: Any, url: Optional[str], parse_url) -> Dict[str, Any]:
+        """Merge connection settings with registry defaults."""
+        if url is not None:
+            kwargs = parse_url(url)
+        elif config is not None:
+            kwargs = config_connection_kwargs(config)
+        else:
+            kwargs = {"host": "localhost", "port": 6379, "db": 0}
+        kwargs.setdefault("max_connections", self.max_connections)
+        kwargs.setdefault("timeout", self.timeout)
+        kwargs.setdefault("health_check_interval", self.health_check_interval)
+        return kwargs
+
+    def _create_pool(self, pool_class: type, kwargs: Dict[str, Any]):
+        """Create a pool. Override to change how connections are made."""
+        return pool_class(**kwargs)
+
+    def _name(self, pool: Any, kwargs: Dict[str, Any], is_async: bool) -> str:
+        """Build a readable, unique name for a pool's metrics."""
+        location = kwargs.get("path") or f"{kwargs.get('host', 'localhost')}:{kwargs.get('port', 6379)}"
+        name = f"{location}/{kwargs.get('db', 0)}" + (" (async)" if is_async else "")
+        taken = set(self._names.values())
+        candidate, index = name, 2
+        while candidate in taken:
+            candidate, index = f"{name} #{index}", index + 1
+        self._names[id(pool)] = candidate
+        return candidate
+
+    def get_pool(self, config: Any = None, url: Optional[str] = None) -> InstrumentedConnectionPool:
+        """
+        Get the shared synchronous pool for a configuration or URL.
+
+        :param config: Connection settings (a RedisConfig). Ignored if `url` is given.
+        :type config: Any
+        :param url: Redis URL, e.g. "redis://localhost:6379/0".
+        :type url: Optional[str]
+        :return: The shared pool.
+        :rtype: InstrumentedConnectionPool
+        """
+        kwargs = self._pool_kwargs(config, url, parse_sync_url)
+        if kwargs.pop("ssl", False):
+            kwargs["connection_class"] = redis.SSLConnection
+        key = _pool_key(kwargs)
+        with self._lock:
+            pool = self._sync_pools.get(key)
+            if pool is None:
+                pool = self._create_pool(InstrumentedConnectionPool, kwargs)
+                self._sync_pools[key] = pool
+                logger.debug(f"Created Redis pool {self._name(pool, kwargs, False)}")
+                self._start_thread_reaper()
+        return pool
+
+    def get_async_pool(self, config: Any = None, url: Optional[str] = None) -> InstrumentedAsyncConnectionPool:
+        """
+        Get the shared asyncio pool for a configuration or URL in the current event loop.
+
+        Called outside of a running loop, returns a new pool that is not shared
+        or tracked by the registry; the caller owns it and must disconnect it.
+
+        :param config: Connection settings (a RedisConfig). Ignored if `url` is given.
+        :type config: Any
+        :param url: Redis URL, e.g. "redis://localhost:6379/0".
+        :type url: Optional[str]
+        :return: The shared pool.
+        :rtype: InstrumentedAsyncConnectionPool
+        """
+        kwargs = self._pool_kwargs(config, url, parse_async_url)
+        if kwargs.pop("ssl", False):
+            kwargs["connection_class"] = redis.asyncio.SSLConnection
+        loop = _running_loop()
+        if loop is _NO_LOOP:
+            # A shared pool would bind to whichever loop used it first
+            return self._create_pool(InstrumentedAsyncConnectionPool, kwargs)
+        key = _pool_key(kwargs)
+        with self._lock:
+            self._discard_closed_loops()
+            pools = self._async_pools.setdefault(loop, {})
+            pool = pools.get(key)
+            if pool is None:
+                pool = self._create_pool(InstrumentedAsyncConnectionPool, kwargs)
+                pools[key] = pool
+                logger.debug(f"Created Redis pool {self._name(pool, kwargs, True)}")
+                self._start_task_reaper(loop)
+        return pool
+
+    def client(self, config: Any = None, url: Optional[str] = None) -> redis.Redis:
+        """
+        Create a synchronous client on a shared pool.
+
+        Closing the client does not close the pool.
+
+        :return: A client using the shared pool.
+        :rtype: redis.Redis
+        """
+        return redis.Redis(connection_pool=self.get_pool(config, url))
+
+    def async_client(self, config: Any = None, url: Optional[str] = None) -> redis.asyncio.Redis:
+        """
+        Create an asyncio client on a shared pool of the current event loop.
+
+        Closing the client does not close the pool. Outside of a running loop
+        the client gets a pool of its own, which closing the client closes.
+
+        :return: A client using the shared pool.
+        :rtype: redis.asyncio.Redis
+        """
+        if _running_loop() is _NO_LOOP:
+            return redis.asyncio.Redis.from_pool(self.get_async_pool(config, url))
+        return redis.asyncio.Redis(connection_pool=self.get_async_pool(config, url))
+
+    def dedicated_async_client(self, config: Any = None, url: Optional[str] = None) -> redis.asyncio.Redis:
+        """
+        Create an asyncio client with a connection of its own, outside the shared pools.
+
+        Use it for commands that hold a connection for long, such as a blocking
+        ``XREADGROUP``, so that they do not take connections from publishers in
+        the shared pool. Closing the client closes its connection.
+
+        :return: A client with a single connection.
+        :rtype: redis.asyncio.Redis
+        """
+        kwargs = self._pool_kwargs(config, url, parse_async_url)
+        if kwargs.pop("ssl", False):
+            kwargs["connection_class"] = redis.asyncio.SSLConnection
+        kwargs["max_connections"] = 1
+        return redis.asyncio.Redis.from_pool(self._create_pool(InstrumentedAsyncConnectionPool, kwargs))
+
+    def _create_connection(self, kwargs: Dict[str, Any]) -> Any:
+        """Create a standalone connection. Override to change how connections are made."""
+        connection_class = kwargs.pop("connection_class", redis.Connection)
+        return connection_class(**kwargs)
+
+    def client_cache(self,
+                     config: Any = None,
+                     url: Optional[str] = None,
+                     prefixes: Sequence[str] = (),
+                     max_entries: int = DEFAULT_MAX_ENTRIES) -> RedisClientCache:
+        """
+        Get the shared client-side cache for a server and set of key prefixes.
+
+        The cache is created and its tracking connection started on first
+        use; later callers with the same settings share it. `max_entries` is
+        taken from the first caller.
+
+        :param config: Connection settings (a RedisConfig). Ignored if `url` is given.
+        :type config: Any
+        :param url: Redis URL, e.g. "redis://localhost:6379/0".
+        :type url: Optional[str]
+        :param prefixes: Key prefixes to cache. Empty caches every key.
+        :type prefixes: Sequence[str]
+        :param max_entries: Maximum number of cached keys.
+        :type max_entries: int
+        :return: The shared cache.
+        :rtype: RedisClientCache
+        """
+        kwargs = self._pool_kwargs(config, url, parse_sync_url)
+        for pool_option in ("max_connections", "timeout"):
+            kwargs.pop(pool_option)
+        if kwargs.pop("ssl", False):
+            kwargs["connection_class"] = redis.SSLConnection
+        # Invalidations are RESP3 push messages
+        kwargs["protocol"] = 3
+        key = (_pool_key(kwargs), tuple(prefixes))
+        with self._lock:
+            cache = self._caches.get(key)
+            if cache is None:
+                cache = RedisClientCache(
+                    lambda: self._create_connection(dict(kwargs)), prefixes=prefixes, max_entries=max_entries
+                )
+                self._caches[key] = cache
+                location = kwargs.get("path") or f"{kwargs.get('host', 'localhost')}:{kwargs.get('port', 6379)}"
+                name = f"{location}/{kwargs.get('db', 0)}"
+                if prefixes:
+                    name += f" [{','.join(prefixes)}]"
+                self._cache_names[id(cache)] = name
+                cache.start()
+        return cache
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get usage statistics of every client-side cache.
+
+        :return: Statistics by cache name.
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        with self._lock:
+            caches = list(self._caches.values())
+        return {self._cache_names[id(cache)]: cache.stats() for cache in caches}
+
+    def _discard_closed_loops(self) -> None:
+        """Drop the asyncio pools and reaper tasks of closed event loops (called with the lock held).
+
+        A closed loop cannot run a disconnect, so the pools just drop their
+        connections, whose sockets are closed when they are collected.
+        """
+        for loop in [loop for loop in self._async_pools if loop.is_closed()]:
+            for pool in self._async_pools.pop(loop).values():
+                self._names.pop(id(pool), None)
+                pool.reset()
+        for loop in [loop for loop in self._reaper_tasks if loop.is_closed()]:
+            del self._reaper_tasks[loop]
+
+    def _pools(self) -> List[Tuple[Any, bool]]:
+        with self._lock:
+            self._discard_closed_loops()
+            pools: List[Tuple[Any, bool]] = [(pool, False) for pool in self._sync_pools.values()]
+            for loop_pools in list(self._async_pools.values()):
+                pools.extend((pool, True) for pool in loop_pools.values())
+        return pools
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get usage statistics of every pool.
+
+        :return: Statistics by pool name.
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        result = {}
+        for pool, _ in self._pools():
+            result[self._names.get(id(pool), repr(pool))] = {
+                "max_connections": pool.max_connections,
+                **asdict(pool.stats),
+            }
+        return result
+
+    def export(self, exporter: Any) -> None:
+        """
+        Send pool statistics to a metrics exporter.
+
+        Connection counts go to ``export_gauges``, totals to
+        ``export_counters`` and wait times to ``export_timers``, under the
+        name ``redis_pool.<pool name>``. Client-side cache statistics are
+        exported under ``redis_client_cache.<cache name>``.
+
+        :param exporter: An ``ailf.core.monitoring.MetricsExporter``.
+        :type exporter: MetricsExporter
+        """
+        with self._lock:
+            caches = list(self._caches.values())
+        for cache in caches:
+            cache.export(exporter, f"redis_client_cache.{self._cache_names[id(cache)]}")
+        for name, stats in self.stats().items():
+            metric_name = f"redis_pool.{name}"
+            exporter.export_gauges(metric_name, {
+                key: stats[key] for key in ("max_connections", "in_use", "waiters")
+            })
+            exporter.export_counters(metric_name, {
+                key: stats[key] for key in ("acquired", "failures", "reaped")
+            })
+            exporter.export_timers(metric_name, {
+                "wait_time_total": stats["wait_time_total"],
+                "wait_time_max": stats["wait_time_max"],
+            })
+
+    def reap_idle(self) -> int:
+        """
+        Close idle connections of the synchronous pools now.
+
+        :return: Number of connections closed.
+        :rtype: int
+        """
+        if self.idle_timeout is None:
+            return 0
+        with self._lock:
+            pools = list(self._sync_pools.values())
+        return sum(pool.reap_idle(self.idle_timeout) for pool in pools)
+
+    async def reap_idle_async(self) -> int:
+        """
+        Close idle connections of the current event loop's asyncio pools now.
+
+        :return: Number of connections closed.
+        :rtype: int
+        """
+        if self.idle_timeout is None:
+            return 0
+        with self._lock:
+            pools = list(self._async_pools.get(_running_loop(), {}).values())
+        reaped = 0
+        for pool in pools:
+            reaped += await pool.reap_idle(self.idle_timeout)
+        return reaped
+
+    def _start_thread_reaper(self) -> None:
+        """Start the reaper thread for synchronous pools (called with the lock held)."""
+        if self.idle_timeout is None or self._reaper_thread is not None:
+            return
+
+        def run() -> None:
+            while not self._reaper_stop.wait(self.reap_interval):
+                try:
+                    self.reap_idle()
+                except Exception as e:
+                    logger.error(f"Error reaping idle Redis connections: {e}")
+
+        self._reaper_thread = threading.Thread(target=run, name="redis-pool-reaper", daemon=True)
+        self._reaper_thread.start()
+
+    def _start_task_reaper(self, loop: Any) -> None:
+        """Start the reaper task for a loop's asyncio pools (called with the lock held)."""
+        if self.idle_timeout is None or loop in self._reaper_tasks:
+            return
+
+        async def run() -> None:
+            while True:
+                await asyncio.sleep(self.reap_interval)
+                try:
+                    await self.reap_idle_async()
+                except Exception as e:
+                    logger.error(f"Error reaping idle Redis connections: {e}")
+
+        self._reaper_tasks[loop] = loop.create_task(run())
+
+    def close(self) -> None:
+        """Stop the reaper thread and client-side caches, and disconnect every synchronous pool."""
+        self._reaper_stop.set()
+        with self._lock:
+            pools = list(self._sync_pools.values())
+            self._sync_pools.clear()
+            self._reaper_thread = None
+            caches = list(self._caches.values())
+            self._caches.clear()
+        for cache in caches:
+            self._cache_names.pop(id(cache), None)
+            cache.stop()
+        for pool in pools:
+            self._names.pop(id(pool), None)
+            pool.disconnect()
+        self._reaper_stop.clear()
+
+    async def aclose(self) -> None:
+        """Stop the reaper task and disconnect the asyncio pools of the current event loop."""
+        loop = _running_loop()
+        task = self._reaper_tasks.pop(loop, None)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        with self._lock:
+            pools = list(self._async_pools.pop(loop, {}).values())
+        for pool in pools:
+            self._names.pop(id(pool), None)
+            await pool.disconnect()
+
+
+class _NoLoop:
+    """Key of the asyncio pools created outside of an event loop."""
+
+
+_NO_LOOP = _NoLoop()
+
+
+def _running_loop() -> Any:
+    """Get the running event loop, or a placeholder outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return _NO_LOOP
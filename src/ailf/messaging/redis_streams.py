@@ -6,15 +6,75 @@ using Redis Streams for durable message queuing and asynchronous communication.
 
 import asyncio
 import logging
-from typing import Any, Dict, Optional, Union, List
+import time
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import Any, Dict, Optional, Sequence, Tuple, Union, List
 
 import redis.asyncio as redis
 from redis.exceptions import RedisError
 
 from ailf.messaging.base import MessagingBackendBase, MessageHandlerCallback
+from ailf.messaging.redis_pool import RedisPoolRegistry
+from ailf.messaging.stream_telemetry import HandlerMetrics, StreamTelemetry
 
 logger = logging.getLogger(__name__)
 
+
+class LanePolicy(str, Enum):
+    """How a subscription with priority lanes divides reads between its lanes."""
+    WEIGHTED = "weighted"  # every round reads from each lane in proportion to its weight
+    STRICT = "strict"      # always read the highest-priority lane that has messages
+
+
+@dataclass(frozen=True)
+class StreamLane:
+    """
+    One prioritized stream of a subscription.
+
+    Lanes are given to :meth:`RedisStreamsBackend.subscribe` highest priority
+    first. Publishers choose a lane by publishing to its stream.
+
+    :param stream: Name of the Redis Stream backing the lane, e.g. "tasks:high".
+    :type stream: str
+    :param weight: Share of reads under :attr:`LanePolicy.WEIGHTED`. Defaults to 1.
+    :type weight: int
+    """
+    stream: str
+    weight: int = 1
+
+    def __post_init__(self):
+        if self.weight < 1:
+            raise ValueError(f"Lane weight must be at least 1, got {self.weight}")
+
+
+@dataclass
+class LaneStats:
+    """
+    Delivery statistics of a lane.
+
+    Lag is the time between a message being added to the stream and its
+    handler being called, taken from the millisecond timestamp in the entry ID.
+    """
+    delivered: int = 0
+    lag_ms_last: float = 0.0
+    lag_ms_max: float = 0.0
+    lag_ms_total: float = 0.0
+
+    def record(self, message_id: bytes) -> None:
+        """Record the delivery of an entry."""
+        lag_ms = max(time.time() * 1000 - int(message_id.split(b'-', 1)[0]), 0.0)
+        self.delivered += 1
+        self.lag_ms_last = lag_ms
+        self.lag_ms_max = max(self.lag_ms_max, lag_ms)
+        self.lag_ms_total += lag_ms
+
+    @property
+    def lag_ms_avg(self) -> float:
+        """Average lag in milliseconds."""
+        return self.lag_ms_total / self.delivered if self.delivered else 0.0
+
+
 class RedisStreamsBackend(MessagingBackendBase):
     """
     A messaging backend that uses Redis Streams for message persistence and delivery.
@@ -32,20 +92,36 @@ class RedisStreamsBackend(MessagingBackendBase):
     :type default_block_ms: int, optional
     :param default_count: Default number of messages to fetch per read. Defaults to 10.
     :type default_count: int, optional
+    :param pool_registry: Registry providing the shared connection pool. Defaults to the process-wide registry.
+    :type pool_registry: RedisPoolRegistry, optional
+    :param telemetry_interval: Seconds between consumer telemetry samples sent to `telemetry_exporters`
+        while connected. None disables periodic telemetry. See :class:`StreamTelemetry`.
+    :type telemetry_interval: float, optional
+    :param telemetry_exporters: ``ailf.core.monitoring`` exporters that receive the telemetry.
+    :type telemetry_exporters: Sequence[MetricsExporter], optional
     """
     def __init__(self, 
                  redis_url: str,
                  consumer_group_prefix: str = "ailf_group",
                  consumer_name_prefix: str = "ailf_consumer",
                  default_block_ms: int = 1000,
-                 default_count: int = 10):
+                 default_count: int = 10,
+                 pool_registry: Optional[RedisPoolRegistry] = None,
+                 telemetry_interval: Optional[float] = None,
+                 telemetry_exporters: Sequence[Any] = ()):
         self.redis_url = redis_url
+        self.pool_registry = pool_registry or RedisPoolRegistry.default()
+        self.telemetry = StreamTelemetry(self, telemetry_exporters, telemetry_interval or 15.0)
+        self.telemetry_interval = telemetry_interval
         self._redis_client: Optional[redis.Redis] = None
         self.consumer_group_prefix = consumer_group_prefix
         self.consumer_name_prefix = consumer_name_prefix
         self.default_block_ms = default_block_ms
         self.default_count = default_count
         self._subscription_tasks: Dict[str, asyncio.Task] = {}
+        self._lane_stats: Dict[str, Dict[str, LaneStats]] = {}
+        self._subscription_groups: Dict[str, Tuple[str, List[str]]] = {}
+        self._handler_metrics: Dict[str, HandlerMetrics] = {}
         self._is_connecting = False
         self._is_connected = False
 
@@ -58,10 +134,12 @@ class RedisStreamsBackend(MessagingBackendBase):
         self._is_connecting = True
         try:
             logger.info(f"Connecting to Redis at {self.redis_url}...")
-            self._redis_client = redis.from_url(self.redis_url)
+            self._redis_client = self.pool_registry.async_client(url=self.redis_url)
             await self._redis_client.ping() # type: ignore
             self._is_connected = True
             logger.info(f"Successfully connected to Redis at {self.redis_url}.")
+            if self.telemetry_interval is not None:
+                self.telemetry.start()
         except RedisError as e:
             logger.error(f"Failed to connect to Redis at {self.redis_url}: {e}")
             self._redis_client = None
@@ -73,6 +151,7 @@ class RedisStreamsBackend(MessagingBackendBase):
     async def disconnect(self) -> None:
         """Closes the connection to the Redis server and cancels subscription tasks."""
         logger.info("Disconnecting from Redis...")
+        await self.telemetry.stop()
         for topic, task in self._subscription_tasks.items():
             if not task.done():
                 task.cancel()
@@ -81,7 +160,8 @@ class RedisStreamsBackend(MessagingBackendBase):
 
         if self._redis_client:
             try:
-                await self._redis_client.close()
+                # Returns connections to the shared pool; the pool itself stays open
+                await self._redis_client.aclose()
                 logger.info("Redis connection closed.")
             except RedisError as e:
                 logger.error(f"Error while closing Redis connection: {e}")
@@ -135,6 +215,9 @@ class RedisStreamsBackend(MessagingBackendBase):
                         create_group: bool = True,
                         block_ms: Optional[int] = None,
                         count: Optional[int] = None,
+                        lanes: Optional[Sequence[StreamLane]] = None,
+                        lane_policy: Union[LanePolicy, str] = LanePolicy.WEIGHTED,
+                        max_starvation_ms: Optional[int] = 5000,
                         **kwargs: Any) -> None:
         """
         Subscribes to a Redis Stream using a consumer group.
@@ -142,6 +225,17 @@ class RedisStreamsBackend(MessagingBackendBase):
         This method creates a consumer group (if it doesn't exist and `create_group` is True)
         and starts a task to listen for new messages on the stream.
 
+        With `lanes`, the subscription named `topic` reads the lanes' streams
+        instead, under one consumer group created on each of them. Under
+        :attr:`LanePolicy.WEIGHTED` every read round takes up to `count`
+        messages split between the lanes by weight, so a busy low-priority lane
+        cannot delay a high-priority one by more than its share. Under
+        :attr:`LanePolicy.STRICT` the highest-priority lane with messages is
+        always read first; a lane that has not been read for `max_starvation_ms`
+        is read next regardless of priority. The callback receives the lane's
+        stream name as the topic. Per-lane delivery lag is available from
+        :meth:`lane_stats`.
+
         :param topic: The name of the Redis Stream.
         :type topic: str
         :param callback: The async callback function to handle incoming messages.
@@ -154,6 +248,13 @@ class RedisStreamsBackend(MessagingBackendBase):
         :type block_ms: Optional[int]
         :param count: Max number of messages to fetch per read. Defaults to `self.default_count`.
         :type count: Optional[int]
+        :param lanes: Prioritized streams to read, highest priority first. Defaults to the `topic` stream alone.
+        :type lanes: Optional[Sequence[StreamLane]]
+        :param lane_policy: How reads are divided between lanes. Defaults to weighted.
+        :type lane_policy: Union[LanePolicy, str]
+        :param max_starvation_ms: Under the strict policy, longest time a lane with messages goes unread.
+            None disables starvation protection. Defaults to 5000.
+        :type max_starvation_ms: Optional[int]
         :param kwargs: Additional arguments (not currently used by this backend for subscribe).
         :type kwargs: Any
         :raises ConnectionError: If not connected to Redis.
@@ -170,91 +271,328 @@ class RedisStreamsBackend(MessagingBackendBase):
         _block_ms = block_ms if block_ms is not None else self.default_block_ms
         _count = count if count is not None else self.default_count
 
+        if lanes is not None:
+            lanes = list(lanes)
+            if not lanes:
+                raise ValueError("lanes must not be empty")
+            lane_policy = LanePolicy(lane_policy)
+        streams = [lane.stream for lane in lanes] if lanes is not None else [topic]
+
         if create_group:
-            try:
-                await self._redis_client.xgroup_create(name=topic, groupname=group_name, id='0', mkstream=True) # type: ignore
-                logger.info(f"Consumer group '{group_name}' created for stream '{topic}' or already exists.")
-            except RedisError as e:
-                if 'BUSYGROUP' in str(e):
-                    logger.info(f"Consumer group '{group_name}' already exists for stream '{topic}'.")
-                else:
-                    logger.error(f"Failed to create consumer group '{group_name}' for stream '{topic}': {e}")
-                    raise
+            for stream in streams:
+                await self._create_group(stream, group_name)
         
         # Start a background task to listen for messages
-        task = asyncio.create_task(self._listen_for_messages(topic, group_name, _consumer_name, callback, _block_ms, _count))
+        self._subscription_groups[topic] = (group_name, streams)
+        metrics = self._handler_metrics[topic] = HandlerMetrics()
+        if lanes is not None:
+            self._lane_stats[topic] = {lane.stream: LaneStats() for lane in lanes}
+            task = asyncio.create_task(self._listen_for_lanes(
+                topic, lanes, group_name, _consumer_name, callback, _block_ms, _count, lane_policy, max_starvation_ms,
+                metrics
+            ))
+        else:
+            task = asyncio.create_task(self._listen_for_messages(
+                topic, group_name, _consumer_name, callback, _block_ms, _count, metrics
+            ))
         self._subscription_tasks[topic] = task
         logger.info(f"Subscribed to stream '{topic}' with consumer '{_consumer_name}' in group '{group_name}'. Listening task started.")
 
+    async def _create_group(self, stream: str, group_name: str) -> None:
+        """Create a consumer group on a stream, creating the stream if needed."""
+        try:
+            await self._redis_client.xgroup_create(name=stream, groupname=group_name, id='0', mkstream=True) # type: ignore
+            logger.info(f"Consumer group '{group_name}' created for stream '{stream}' or already exists.")
+        except RedisError as e:
+            if 'BUSYGROUP' in str(e):
+                logger.info(f"Consumer group '{group_name}' already exists for stream '{stream}'.")
+            else:
+                logger.error(f"Failed to create consumer group '{group_name}' for stream '{stream}': {e}")
+                raise
+
+    async def _handle_entries(self,
+                              stream_name: str,
+                              group_name: str,
+                              entries: List[Tuple[bytes, Dict[bytes, bytes]]],
+                              callback: MessageHandlerCallback,
+                              metrics: Optional[HandlerMetrics] = None,
+                              stats: Optional[LaneStats] = None) -> None:
+        """Pass entries read from one stream to the callback, then acknowledge them."""
+        message_ids_to_ack = []
+        for message_id, message_data in entries:
+            try:
+                # Assuming message is stored in a field named 'message'
+                payload = message_data.get(b'message') 
+                if payload is None:
+                    logger.warning(f"Message {message_id.decode()} in stream {stream_name} has no 'message' field. Data: {message_data}")
+                    # Still ACK it to remove from PEL
+                    message_ids_to_ack.append(message_id)
+                    continue
+                
+                if stats is not None:
+                    stats.record(message_id)
+                # The callback expects topic (stream_name) and the raw message (bytes or str)
+                # Here, we pass the stream_name as topic and payload as message
+                started = time.perf_counter()
+                try:
+                    await callback(stream_name, payload) # Payload is already bytes
+                except Exception:
+                    if metrics is not None:
+                        metrics.record(time.perf_counter() - started, ok=False)
+                    raise
+                if metrics is not None:
+                    metrics.record(time.perf_counter() - started)
+                message_ids_to_ack.append(message_id)
+            except Exception as e:
+                logger.error(f"Error processing message {message_id.decode()} from stream {stream_name}: {e}", exc_info=True)
+                # Decide on error handling: NACK, requeue, or simply log and move on.
+                # For now, we will still ACK to prevent reprocessing loop for poison pills.
+                # A dead-letter queue mechanism would be better for production.
+                message_ids_to_ack.append(message_id)
+        
+        if message_ids_to_ack and self._redis_client and self._is_connected:
+            await self._redis_client.xack(stream_name, group_name, *message_ids_to_ack) # type: ignore
+            logger.debug(f"Acknowledged {len(message_ids_to_ack)} messages from stream '{stream_name}'.")
+
     async def _listen_for_messages(self, 
                                    stream_name: str, 
                                    group_name: str, 
                                    consumer_name: str, 
                                    callback: MessageHandlerCallback, 
                                    block_ms: int, 
-                                   count: int):
+                                   count: int,
+                                   metrics: Optional[HandlerMetrics] = None):
         """Internal method to continuously listen for messages on a stream."""
         if not self._redis_client or not self._is_connected:
             logger.error(f"Redis client not available for listening on {stream_name}. Exiting listener.")
             return
 
         logger.info(f"Listener started for {stream_name} / {group_name} / {consumer_name}")
-        while self._is_connected: # Loop while connected
-            try:
-                # '>' means get new messages not yet delivered to other consumers in this group
-                messages = await self._redis_client.xreadgroup( # type: ignore
+        # Blocking reads hold their connection, so they get one outside the shared pool
+        reader = self.pool_registry.dedicated_async_client(url=self.redis_url)
+        try:
+            while self._is_connected: # Loop while connected
+                try:
+                    # '>' means get new messages not yet delivered to other consumers in this group
+                    messages = await reader.xreadgroup( # type: ignore
+                        groupname=group_name,
+                        consumername=consumer_name,
+                        streams={stream_name: '>'},
+                        count=count,
+                        block=block_ms
+                    )
+
+                    if not messages:
+                        await asyncio.sleep(0.01) # Short sleep if no messages to prevent tight loop if block_ms is very low
+                        continue
+
+                    for stream_key, stream_messages in messages:
+                        await self._handle_entries(stream_key.decode('utf-8'), group_name, stream_messages, callback, metrics)
+
+                except asyncio.CancelledError:
+                    logger.info(f"Listener task for stream '{stream_name}' cancelled.")
+                    break # Exit loop if task is cancelled
+                except RedisError as e:
+                    logger.error(f"Redis error while listening to stream '{stream_name}': {e}")
+                    if not self._is_connected: # If connection lost, break
+                        logger.warning(f"Redis connection lost. Stopping listener for {stream_name}.")
+                        break
+                    await asyncio.sleep(5) # Wait before retrying on other Redis errors
+                except Exception as e:
+                    logger.error(f"Unexpected error in listener for stream '{stream_name}': {e}", exc_info=True)
+                    await asyncio.sleep(5) # Wait before retrying
+        finally:
+            await reader.aclose()
+
+        logger.info(f"Listener stopped for {stream_name} / {group_name} / {consumer_name}")
+
+    async def _read_lane_round(self,
+                               lanes: List[StreamLane],
+                               group_name: str,
+                               consumer_name: str,
+                               count: int,
+                               policy: LanePolicy,
+                               max_starvation_ms: Optional[int],
+                               last_read: Dict[str, float]) -> Dict[str, list]:
+        """Read one round of new entries from the lanes without blocking."""
+        if policy == LanePolicy.WEIGHTED:
+            total_weight = sum(lane.weight for lane in lanes)
+            # One non-blocking XREADGROUP per lane, sent in a single round trip
+            pipe = self._redis_client.pipeline(transaction=False) # type: ignore
+            for lane in lanes:
+                pipe.xreadgroup(
                     groupname=group_name,
                     consumername=consumer_name,
-                    streams={stream_name: '>'},
-                    count=count,
-                    block=block_ms
+                    streams={lane.stream: '>'},
+                    count=max(1, count * lane.weight // total_weight)
                 )
+            replies = await pipe.execute()
+            return {
+                lane.stream: reply[0][1]
+                for lane, reply in zip(lanes, replies) if reply and reply[0][1]
+            }
 
-                if not messages:
-                    await asyncio.sleep(0.01) # Short sleep if no messages to prevent tight loop if block_ms is very low
-                    continue
+        # Strict priority, except that lanes left unread for too long go first
+        now = time.monotonic()
+        order = list(lanes)
+        if max_starvation_ms is not None:
+            starving = sorted(
+                (lane for lane in lanes if (now - last_read[lane.stream]) * 1000 >= max_starvation_ms),
+                key=lambda lane: last_read[lane.stream]
+            )
+            order = starving + [lane for lane in lanes if lane not in starving]
+        for lane in order:
+            reply = await self._redis_client.xreadgroup( # type: ignore
+                groupname=group_name,
+                consumername=consumer_name,
+                streams={lane.stream: '>'},
+                count=count
+            )
+            if reply and reply[0][1]:
+                return {lane.stream: reply[0][1]}
+            # An empty lane is not starving
+            last_read[lane.stream] = now
+        return {}
 
-                message_ids_to_ack = []
-                for stream_key, stream_messages in messages:
-                    for message_id, message_data in stream_messages:
-                        try:
-                            # Assuming message is stored in a field named 'message'
-                            payload = message_data.get(b'message') 
-                            if payload is None:
-                                logger.warning(f"Message {message_id.decode()} in stream {stream_key.decode()} has no 'message' field. Data: {message_data}")
-                                # Still ACK it to remove from PEL
-                                message_ids_to_ack.append(message_id)
-                                continue
-                            
-                            # The callback expects topic (stream_name) and the raw message (bytes or str)
-                            # Here, we pass the stream_name as topic and payload as message
-                            await callback(stream_key.decode('utf-8'), payload) # Payload is already bytes
-                            message_ids_to_ack.append(message_id)
-                        except Exception as e:
-                            logger.error(f"Error processing message {message_id.decode()} from stream {stream_key.decode()}: {e}", exc_info=True)
-                            # Decide on error handling: NACK, requeue, or simply log and move on.
-                            # For now, we will still ACK to prevent reprocessing loop for poison pills.
-                            # A dead-letter queue mechanism would be better for production.
-                            message_ids_to_ack.append(message_id)
-                
-                if message_ids_to_ack and self._redis_client and self._is_connected:
-                    await self._redis_client.xack(stream_name, group_name, *message_ids_to_ack) # type: ignore
-                    logger.debug(f"Acknowledged {len(message_ids_to_ack)} messages from stream '{stream_name}'.")
+    async def _listen_for_lanes(self,
+                                topic: str,
+                                lanes: List[StreamLane],
+                                group_name: str,
+                                consumer_name: str,
+                                callback: MessageHandlerCallback,
+                                block_ms: int,
+                                count: int,
+                                policy: LanePolicy,
+                                max_starvation_ms: Optional[int],
+                                metrics: Optional[HandlerMetrics] = None):
+        """Internal method to continuously read prioritized lanes of a subscription."""
+        if not self._redis_client or not self._is_connected:
+            logger.error(f"Redis client not available for listening on {topic}. Exiting listener.")
+            return
 
-            except asyncio.CancelledError:
-                logger.info(f"Listener task for stream '{stream_name}' cancelled.")
-                break # Exit loop if task is cancelled
-            except RedisError as e:
-                logger.error(f"Redis error while listening to stream '{stream_name}': {e}")
-                if not self._is_connected: # If connection lost, break
-                    logger.warning(f"Redis connection lost. Stopping listener for {stream_name}.")
+        stats = self._lane_stats[topic]
+        last_read = {lane.stream: time.monotonic() for lane in lanes}
+        logger.info(f"Lane listener started for {topic} ({policy.value}) / {group_name} / {consumer_name}")
+        # The blocking read holds its connection, so it gets one outside the shared pool
+        reader = self.pool_registry.dedicated_async_client(url=self.redis_url)
+        try:
+            while self._is_connected:
+                try:
+                    batches = await self._read_lane_round(
+                        lanes, group_name, consumer_name, count, policy, max_starvation_ms, last_read
+                    )
+                    if not batches:
+                        # All lanes are empty: block on all of them until something arrives
+                        messages = await reader.xreadgroup( # type: ignore
+                            groupname=group_name,
+                            consumername=consumer_name,
+                            streams={lane.stream: '>' for lane in lanes},
+                            count=count,
+                            block=block_ms
+                        )
+                        if not messages:
+                            await asyncio.sleep(0.01)
+                            continue
+                        batches = {stream_key.decode('utf-8'): entries for stream_key, entries in messages}
+
+                    # Handle what was read in priority order
+                    for lane in lanes:
+                        entries = batches.get(lane.stream)
+                        if entries:
+                            last_read[lane.stream] = time.monotonic()
+                            await self._handle_entries(lane.stream, group_name, entries, callback, metrics, stats[lane.stream])
+
+                except asyncio.CancelledError:
+                    logger.info(f"Lane listener task for '{topic}' cancelled.")
                     break
-                await asyncio.sleep(5) # Wait before retrying on other Redis errors
-            except Exception as e:
-                logger.error(f"Unexpected error in listener for stream '{stream_name}': {e}", exc_info=True)
-                await asyncio.sleep(5) # Wait before retrying
-        
-        logger.info(f"Listener stopped for {stream_name} / {group_name} / {consumer_name}")
+                except RedisError as e:
+                    logger.error(f"Redis error while listening to lanes of '{topic}': {e}")
+                    if not self._is_connected:
+                        logger.warning(f"Redis connection lost. Stopping lane listener for {topic}.")
+                        break
+                    await asyncio.sleep(5)
+                except Exception as e:
+                    logger.error(f"Unexpected error in lane listener for '{topic}': {e}", exc_info=True)
+                    await asyncio.sleep(5)
+        finally:
+            await reader.aclose()
+
+        logger.info(f"Lane listener stopped for {topic} / {group_name} / {consumer_name}")
+
+    def lane_stats(self, topic: str) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-lane delivery statistics of a subscription made with `lanes`.
+
+        :param topic: The subscription's topic.
+        :type topic: str
+        :return: Statistics by lane stream: delivered, lag_ms_last, lag_ms_max, lag_ms_total and lag_ms_avg.
+        :rtype: Dict[str, Dict[str, float]]
+        """
+        return {
+            stream: {**asdict(stats), "lag_ms_avg": stats.lag_ms_avg}
+            for stream, stats in self._lane_stats.get(topic, {}).items()
+        }
+
+    def handler_metrics(self, topic: str) -> Optional[HandlerMetrics]:
+        """
+        Get the handler counts and latency histogram of a subscription.
+
+        :param topic: The subscription's topic.
+        :type topic: str
+        :return: The metrics, or None if there is no such subscription.
+        :rtype: Optional[HandlerMetrics]
+        """
+        return self._handler_metrics.get(topic)
+
+    async def _group_backlog(self, stream: str, group_name: str) -> Dict[str, Any]:
+        """Read lag, pending count and oldest pending age of a consumer group on a stream."""
+        lag = None
+        for info in await self._redis_client.xinfo_groups(stream): # type: ignore
+            name = info.get('name')
+            if (name.decode('utf-8') if isinstance(name, bytes) else name) == group_name:
+                lag = info.get('lag')
+                break
+        summary = await self._redis_client.xpending(stream, group_name) # type: ignore
+        oldest_age = None
+        if summary['pending'] and summary['min']:
+            oldest_id = summary['min'].decode('utf-8') if isinstance(summary['min'], bytes) else summary['min']
+            oldest_ms = int(oldest_id.split('-', 1)[0])
+            oldest_age = max(time.time() - oldest_ms / 1000, 0.0)
+        return {"lag": lag, "pending": summary['pending'], "oldest_pending_age_seconds": oldest_age}
+
+    async def subscription_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get consumer-group backlog and handler statistics of every subscription.
+
+        Lag is None when the server does not report it (Redis before 7.0) or
+        after entries were deleted from the stream.
+
+        :return: By topic: group, lag, pending, oldest_pending_age_seconds, handled, errors,
+            handler_latency (cumulative histogram) and the same backlog fields per stream under "streams".
+        :rtype: Dict[str, Dict[str, Any]]
+        :raises ConnectionError: If not connected to Redis.
+        """
+        if not self._redis_client or not self._is_connected:
+            raise ConnectionError("Not connected to Redis. Call connect() first.")
+
+        result = {}
+        for topic, (group_name, streams) in list(self._subscription_groups.items()):
+            per_stream = {stream: await self._group_backlog(stream, group_name) for stream in streams}
+            lags = [backlog["lag"] for backlog in per_stream.values()]
+            ages = [backlog["oldest_pending_age_seconds"] for backlog in per_stream.values()
+                    if backlog["oldest_pending_age_seconds"] is not None]
+            metrics = self._handler_metrics[topic]
+            result[topic] = {
+                "group": group_name,
+                "lag": None if None in lags else sum(lags),
+                "pending": sum(backlog["pending"] for backlog in per_stream.values()),
+                "oldest_pending_age_seconds": max(ages) if ages else None,
+                "handled": metrics.handled,
+                "errors": metrics.errors,
+                "handler_latency": metrics.histogram(),
+                "streams": per_stream,
+            }
+        return result
 
     async def unsubscribe(self, topic: str, **kwargs: Any) -> None:
         """
@@ -268,6 +606,9 @@ class RedisStreamsBackend(MessagingBackendBase):
         :param kwargs: Additional arguments (not currently used by this backend).
         :type kwargs: Any
         """
+        self._lane_stats.pop(topic, None)
+        self._subscription_groups.pop(topic, None)
+        self._handler_metrics.pop(topic, None)
         if topic in self._subscription_tasks:
             task = self._subscription_tasks.pop(topic)
             if not task.done():
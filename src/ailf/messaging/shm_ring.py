@@ -0,0 +1,602 @@
+"""Shared-memory ring-buffer implementation of the MessagingBackendBase.
+
+This module provides a messaging backend for agents running as separate
+processes on one host. Messages are copied once into a shared-memory ring
+and read by the receiving process without any syscall on the data path.
+
+Layout:
+    A *bus* is the inbox of one consuming process. It consists of a small
+    control segment plus one single-producer/single-consumer ring per
+    producer. Producers claim a ring slot when they attach, so a bus with
+    many producers (MPSC) is built from lock-free SPSC rings and never needs
+    an atomic compare-and-swap.
+
+    Records are variable-size: a 16-byte header (body length, topic length,
+    position, checksum) followed by the topic and the payload, padded to 16
+    bytes. The consumer demultiplexes records to subscribers by topic.
+
+Memory ordering:
+    Python offers no memory fences, so on weakly ordered CPUs (ARM) the new
+    head can become visible before the record bytes. Each record header
+    therefore carries the record's position and a CRC32 over the header and
+    body, written last. The reader treats a record whose position or
+    checksum does not match as not yet written and retries later, so a torn
+    record is never delivered.
+
+Wakeup:
+    A consumer with nothing to read sets a *sleeping* flag in the control
+    segment and waits on a named FIFO doorbell. Producers only write to the
+    doorbell when that flag is set, so a busy consumer costs producers no
+    syscalls (the same idea as a futex). The consumer also re-polls after
+    ``poll_interval`` so a wakeup lost to memory reordering only delays a
+    message, never strands it.
+
+Example:
+    >>> # Process A
+    >>> inbox = ShmRingBackend(inbox="agent-a")
+    >>> await inbox.connect()
+    >>> await inbox.subscribe("agent-a", handle_message)
+    >>>
+    >>> # Process B
+    >>> sender = ShmRingBackend()
+    >>> await sender.connect()
+    >>> await sender.publish("agent-a", b"hello")  # Delivered to the bus named "agent-a"
+
+Note:
+    POSIX only: slot claiming uses ``fcntl`` locks and the doorbell uses a FIFO.
+"""
+
+import asyncio
+import fcntl
+import logging
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from collections import defaultdict
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ailf.messaging.base import MessagingBackendBase, MessageHandlerCallback
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RING_SIZE = 1 << 20
+DEFAULT_MAX_PRODUCERS = 16
+
+# Ring header: each position lives on its own cache line
+_RING_HEADER_SIZE = 192
+_CAPACITY_OFFSET = 0
+_HEAD_OFFSET = 64
+_TAIL_OFFSET = 128
+
+# Bus control segment
+_MAX_PRODUCERS_OFFSET = 0
+_SLEEPING_OFFSET = 64
+_SLOTS_OFFSET = 128
+
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+# body length, topic length, reserved, low 32 bits of the record position, CRC32
+_RECORD_HEADER = struct.Struct("<IHHII")
+_RECORD_PREFIX = struct.Struct("<IHHI")
+_WRAP_MARKER = 0xFFFFFFFF
+_ALIGN = 16
+
+
+def _align(size: int) -> int:
+    """Round a size up to the record alignment."""
+    return (size + _ALIGN - 1) & ~(_ALIGN - 1)
+
+
+def _checksum(body: int, topic_length: int, position: int, *parts: bytes) -> int:
+    """Compute the CRC32 that commits a record."""
+    checksum = zlib.crc32(_RECORD_PREFIX.pack(body, topic_length, 0, position & 0xFFFFFFFF))
+    for part in parts:
+        checksum = zlib.crc32(part, checksum)
+    return checksum
+
+
+def _pack_record_header(buffer: memoryview, index: int, body: int, topic_length: int,
+                        position: int, *parts: bytes) -> None:
+    """Write a record header, including the checksum over the record."""
+    _RECORD_HEADER.pack_into(
+        buffer, index, body, topic_length, 0, position & 0xFFFFFFFF,
+        _checksum(body, topic_length, position, *parts)
+    )
+
+
+def _segment_name(bus: str, slot: Optional[int] = None) -> str:
+    """Build the shared memory name of a bus control segment or ring."""
+    return f"ailf_{bus}" if slot is None else f"ailf_{bus}_{slot}"
+
+
+def _runtime_path(bus: str, suffix: str) -> str:
+    """Build the path of a bus doorbell or lock file."""
+    return os.path.join(tempfile.gettempdir(), f"ailf_{bus}.{suffix}")
+
+
+def _open_segment(name: str, create: bool = False, size: int = 0) -> SharedMemory:
+    """Open a shared memory segment that the resource tracker does not own.
+
+    The tracker would unlink a segment when the process that opened it
+    exits, while other processes still use it. Segment lifetime is managed
+    by the bus owner instead.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, create=create, size=size, track=False)
+    shm = SharedMemory(name=name, create=create, size=size)
+    resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _unlink_segment(shm: SharedMemory) -> None:
+    """Unlink a segment opened with _open_segment."""
+    if sys.version_info < (3, 13):
+        # unlink() unregisters the segment, so hand it back to the tracker first
+        resource_tracker.register(shm._name, "shared_memory")
+    shm.unlink()
+
+
+def _unlink(name: str) -> None:
+    """Unlink a segment by name if it exists."""
+    try:
+        shm = _open_segment(name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    _unlink_segment(shm)
+
+
+class ShmRing:
+    """
+    A single-producer/single-consumer ring of variable-size records in shared memory.
+
+    The producer only writes the head and the consumer only writes the tail,
+    so no locks are needed. Positions grow monotonically and are reduced
+    modulo the capacity to index the data area.
+
+    :param shm: The shared memory segment holding the ring.
+    :type shm: SharedMemory
+    """
+
+    def __init__(self, shm: SharedMemory):
+        self._shm = shm
+        self.capacity: int = _U64.unpack_from(shm.buf, _CAPACITY_OFFSET)[0]
+        self._data = shm.buf[_RING_HEADER_SIZE:_RING_HEADER_SIZE + self.capacity]
+        self._head: int = _U64.unpack_from(shm.buf, _HEAD_OFFSET)[0]
+        self._tail: int = _U64.unpack_from(shm.buf, _TAIL_OFFSET)[0]
+
+    @classmethod
+    def create(cls, name: str, capacity: int = DEFAULT_RING_SIZE) -> "ShmRing":
+        """
+        Create a new ring.
+
+        :param name: Shared memory segment name.
+        :type name: str
+        :param capacity: Size of the data area in bytes, rounded up to a multiple of 16.
+        :type capacity: int
+        :return: The new ring.
+        :rtype: ShmRing
+        """
+        capacity = _align(capacity)
+        shm = _open_segment(name, create=True, size=_RING_HEADER_SIZE + capacity)
+        _U64.pack_into(shm.buf, _CAPACITY_OFFSET, capacity)
+        _U64.pack_into(shm.buf, _HEAD_OFFSET, 0)
+        _U64.pack_into(shm.buf, _TAIL_OFFSET, 0)
+        return cls(shm)
+
+    @classmethod
+    def attach(cls, name: str) -> "ShmRing":
+        """
+        Attach to an existing ring.
+
+        :param name: Shared memory segment name.
+        :type name: str
+        :return: The ring.
+        :rtype: ShmRing
+        """
+        return cls(_open_segment(name))
+
+    @property
+    def name(self) -> str:
+        """Get the shared memory segment name."""
+        return self._shm.name
+
+    @property
+    def max_record_size(self) -> int:
+        """Get the largest topic plus payload size that fits in one record."""
+        return self.capacity // 2 - _RECORD_HEADER.size
+
+    def __len__(self) -> int:
+        """Get the number of bytes waiting to be read."""
+        return _U64.unpack_from(self._shm.buf, _HEAD_OFFSET)[0] - self._tail
+
+    def write(self, topic: bytes, payload: Union[bytes, memoryview]) -> bool:
+        """
+        Append a record. Must only be called by the ring's single producer.
+
+        :param topic: Encoded topic.
+        :type topic: bytes
+        :param payload: Message payload.
+        :type payload: Union[bytes, memoryview]
+        :return: True if written, False if the ring does not have room.
+        :rtype: bool
+        :raises ValueError: If the topic is longer than 65535 bytes or the record can never fit in the ring.
+        """
+        if len(topic) > 0xFFFF:
+            raise ValueError(f"Topic of {len(topic)} bytes exceeds the limit of 65535")
+        body = len(topic) + len(payload)
+        if body > self.max_record_size:
+            raise ValueError(f"Record of {body} bytes exceeds ring limit of {self.max_record_size}")
+
+        size = _align(_RECORD_HEADER.size + body)
+        head = self._head
+        index = head % self.capacity
+        contiguous = self.capacity - index
+        needed = size if size <= contiguous else contiguous + size
+        tail = _U64.unpack_from(self._shm.buf, _TAIL_OFFSET)[0]
+        if self.capacity - (head - tail) < needed:
+            return False
+
+        if size > contiguous:
+            # Not enough room before the end: mark the rest as skipped
+            _pack_record_header(self._data, index, _WRAP_MARKER, 0, head)
+            head += contiguous
+            index = 0
+
+        start = index + _RECORD_HEADER.size
+        self._data[start:start + len(topic)] = topic
+        self._data[start + len(topic):start + body] = payload
+        _pack_record_header(self._data, index, body, len(topic), head, topic, payload)
+
+        self._head = head + size
+        _U64.pack_into(self._shm.buf, _HEAD_OFFSET, self._head)
+        return True
+
+    def read(self) -> Optional[Tuple[bytes, bytes]]:
+        """
+        Take the next record. Must only be called by the ring's single consumer.
+
+        A record whose position or checksum does not match is treated as not
+        written yet, since its bytes may become visible after the head.
+
+        :return: Tuple of (topic, payload), or None if the ring is empty.
+        :rtype: Optional[Tuple[bytes, bytes]]
+        """
+        head = _U64.unpack_from(self._shm.buf, _HEAD_OFFSET)[0]
+        tail = self._tail
+        record = None
+        while tail != head:
+            index = tail % self.capacity
+            body, topic_length, _, position, checksum = _RECORD_HEADER.unpack_from(self._data, index)
+            if position != tail & 0xFFFFFFFF:
+                break
+            if body == _WRAP_MARKER:
+                if checksum != _checksum(body, 0, position):
+                    break
+                tail += self.capacity - index
+                continue
+            if body > self.max_record_size or topic_length > body:
+                break
+
+            start = index + _RECORD_HEADER.size
+            topic = bytes(self._data[start:start + topic_length])
+            payload = bytes(self._data[start + topic_length:start + body])
+            if checksum != _checksum(body, topic_length, position, topic, payload):
+                break
+            tail += _align(_RECORD_HEADER.size + body)
+            record = (topic, payload)
+            break
+
+        if tail != self._tail:
+            self._tail = tail
+            _U64.pack_into(self._shm.buf, _TAIL_OFFSET, tail)
+        return record
+
+    def close(self) -> None:
+        """Detach from the ring."""
+        self._data.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Remove the ring segment. Only the bus owner should call this."""
+        _unlink_segment(self._shm)
+
+
+class _BusProducer:
+    """A claimed producer slot on another process's bus."""
+
+    def __init__(self, bus: str, ring_size: int):
+        control = _open_segment(_segment_name(bus))
+        max_producers = _U32.unpack_from(control.buf, _MAX_PRODUCERS_OFFSET)[0]
+
+        self._control = control
+        self._lock_fd: Optional[int] = None
+        try:
+            self.slot = self._claim_slot(bus, max_producers)
+        except ConnectionError:
+            control.close()
+            raise
+
+        name = _segment_name(bus, self.slot)
+        try:
+            self.ring = ShmRing.create(name, ring_size)
+        except FileExistsError:
+            # A previous producer in this slot left; the consumer still reads its ring
+            self.ring = ShmRing.attach(name)
+        _U64.pack_into(control.buf, _SLOTS_OFFSET + self.slot * 8, 1)
+
+        try:
+            self._bell_fd: Optional[int] = os.open(_runtime_path(bus, "bell"), os.O_WRONLY | os.O_NONBLOCK)
+        except OSError:
+            self._bell_fd = None
+
+    def _claim_slot(self, bus: str, max_producers: int) -> int:
+        """Take an exclusive lock on a free slot; the lock is released if this process dies."""
+        for slot in range(max_producers):
+            fd = os.open(_runtime_path(bus, f"{slot}.lock"), os.O_CREAT | os.O_RDWR, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                continue
+            self._lock_fd = fd
+            return slot
+        raise ConnectionError(f"Bus '{bus}' has no free producer slots ({max_producers} in use)")
+
+    def write(self, topic: bytes, payload: Union[bytes, memoryview]) -> bool:
+        """Write a record and ring the doorbell if the consumer is asleep."""
+        if not self.ring.write(topic, payload):
+            return False
+        if self._bell_fd is not None and _U32.unpack_from(self._control.buf, _SLEEPING_OFFSET)[0]:
+            try:
+                os.write(self._bell_fd, b"\0")
+            except BlockingIOError:
+                pass  # The doorbell is already full of wakeups
+        return True
+
+    def close(self) -> None:
+        """Release the slot. The ring stays until the consumer has drained it."""
+        self.ring.close()
+        self._control.close()
+        if self._bell_fd is not None:
+            os.close(self._bell_fd)
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+
+
+class ShmRingBackend(MessagingBackendBase):
+    """
+    A messaging backend that moves messages between processes through shared-memory rings.
+
+    A backend may own an inbox bus, which it reads and demultiplexes to its
+    subscribers by topic, and may publish to any number of buses owned by
+    other backends (including its own). By default a topic is delivered to
+    the bus with the same name, so agents named after their inbox can reach
+    each other without extra configuration.
+
+    :param inbox: Name of the bus this backend owns and reads. None for publish-only backends.
+    :type inbox: Optional[str]
+    :param routes: Mapping of topic to bus name for topics not named after their bus.
+    :type routes: Optional[Dict[str, str]]
+    :param ring_size: Data area size of each producer ring in bytes. Defaults to 1 MiB.
+    :type ring_size: int, optional
+    :param max_producers: Number of producer slots on the inbox bus. Defaults to 16.
+    :type max_producers: int, optional
+    :param poll_interval: Longest time in seconds the consumer sleeps between checks. Defaults to 0.05.
+    :type poll_interval: float, optional
+    :param batch_size: Records read from one ring before moving to the next. Defaults to 64.
+    :type batch_size: int, optional
+    """
+    def __init__(self,
+                 inbox: Optional[str] = None,
+                 routes: Optional[Dict[str, str]] = None,
+                 ring_size: int = DEFAULT_RING_SIZE,
+                 max_producers: int = DEFAULT_MAX_PRODUCERS,
+                 poll_interval: float = 0.05,
+                 batch_size: int = 64):
+        self.inbox = inbox
+        self.routes = dict(routes or {})
+        self.ring_size = ring_size
+        self.max_producers = max_producers
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+
+        self._subscriptions: Dict[str, List[MessageHandlerCallback]] = defaultdict(list)
+        self._producers: Dict[str, _BusProducer] = {}
+        self._control: Optional[SharedMemory] = None
+        self._rings: Dict[int, ShmRing] = {}
+        self._bell_fds: List[int] = []
+        self._bell = asyncio.Event()
+        self._reader_task: Optional[asyncio.Task] = None
+        self._is_connected = False
+
+    async def connect(self) -> None:
+        """Creates the inbox bus, if any, and starts reading it."""
+        if self._is_connected:
+            return
+        if self.inbox is not None:
+            self._create_inbox()
+            self._reader_task = asyncio.create_task(self._read_loop())
+        self._is_connected = True
+        logger.info(f"ShmRingBackend connected (inbox: {self.inbox}).")
+
+    def _create_inbox(self) -> None:
+        """Create the control segment, doorbell and slot lock files of the inbox bus."""
+        name = _segment_name(self.inbox)
+        # Remove leftovers of a previous owner that did not shut down cleanly
+        _unlink(name)
+        for slot in range(self.max_producers):
+            _unlink(_segment_name(self.inbox, slot))
+
+        control = _open_segment(name, create=True, size=_SLOTS_OFFSET + self.max_producers * 8)
+        control.buf[:] = bytes(control.size)
+        _U32.pack_into(control.buf, _MAX_PRODUCERS_OFFSET, self.max_producers)
+        self._control = control
+
+        bell = _runtime_path(self.inbox, "bell")
+        if os.path.exists(bell):
+            os.unlink(bell)
+        os.mkfifo(bell, 0o600)
+        read_fd = os.open(bell, os.O_RDONLY | os.O_NONBLOCK)
+        # Holding a writer open keeps the FIFO from reporting EOF when producers leave
+        write_fd = os.open(bell, os.O_WRONLY | os.O_NONBLOCK)
+        self._bell_fds = [read_fd, write_fd]
+        asyncio.get_running_loop().add_reader(read_fd, self._bell.set)
+
+    async def disconnect(self) -> None:
+        """Stops reading, releases producer slots and removes the inbox bus."""
+        self._is_connected = False
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+
+        for producer in self._producers.values():
+            producer.close()
+        self._producers.clear()
+
+        if self._control is not None:
+            asyncio.get_running_loop().remove_reader(self._bell_fds[0])
+            for fd in self._bell_fds:
+                os.close(fd)
+            self._bell_fds = []
+            for slot, ring in self._rings.items():
+                ring.close()
+            self._rings.clear()
+            for slot in range(self.max_producers):
+                _unlink(_segment_name(self.inbox, slot))
+                lock = _runtime_path(self.inbox, f"{slot}.lock")
+                if os.path.exists(lock):
+                    os.unlink(lock)
+            os.unlink(_runtime_path(self.inbox, "bell"))
+            self._control.close()
+            _unlink_segment(self._control)
+            self._control = None
+        logger.info("ShmRingBackend disconnected.")
+
+    async def publish(self, topic: str, message: Union[str, bytes], **kwargs: Any) -> None:
+        """
+        Publishes a message to the bus the topic routes to.
+
+        kwargs can include `bus` (str) to override routing and `block` (bool,
+        default True). When the target ring is full, the publisher waits for
+        the consumer to make room unless `block` is False.
+
+        :param topic: The topic to publish to.
+        :type topic: str
+        :param message: The message content. If str, it will be utf-8 encoded.
+        :type message: Union[str, bytes]
+        :param kwargs: Supports `bus` and `block`.
+        :type kwargs: Any
+        :raises ConnectionError: If not connected or the bus does not exist.
+        :raises asyncio.QueueFull: If `block` is False and the ring is full.
+        :raises ValueError: If the topic is longer than 65535 bytes once encoded or the
+                            message is larger than a ring can hold.
+        """
+        if not self._is_connected:
+            raise ConnectionError("ShmRingBackend: Not connected. Call connect() first.")
+
+        bus = kwargs.get('bus') or self.routes.get(topic, topic)
+        producer = self._producers.get(bus)
+        if producer is None:
+            try:
+                producer = _BusProducer(bus, self.ring_size)
+            except FileNotFoundError as e:
+                raise ConnectionError(f"ShmRingBackend: Bus '{bus}' does not exist.") from e
+            self._producers[bus] = producer
+
+        payload = message.encode('utf-8') if isinstance(message, str) else message
+        topic_bytes = topic.encode('utf-8')
+        while not producer.write(topic_bytes, payload):
+            if not kwargs.get('block', True):
+                raise asyncio.QueueFull(f"Ring for bus '{bus}' is full")
+            await asyncio.sleep(0.0005)
+
+    async def subscribe(self, topic: str, callback: MessageHandlerCallback, **kwargs: Any) -> None:
+        """
+        Subscribes to a topic arriving on this backend's inbox.
+
+        :param topic: The topic to subscribe to.
+        :type topic: str
+        :param callback: The async callback function to handle incoming messages.
+        :type callback: MessageHandlerCallback
+        :param kwargs: Additional arguments (not used by this backend).
+        :type kwargs: Any
+        :raises ConnectionError: If the backend has no inbox or is not connected.
+        """
+        if self.inbox is None or not self._is_connected:
+            raise ConnectionError("ShmRingBackend: Subscribing needs a connected backend with an inbox.")
+        self._subscriptions[topic].append(callback)
+
+    async def unsubscribe(self, topic: str, **kwargs: Any) -> None:
+        """
+        Unsubscribes from a topic. Later messages for the topic are dropped.
+
+        :param topic: The topic to unsubscribe from.
+        :type topic: str
+        :param kwargs: Additional arguments (not used by this backend).
+        :type kwargs: Any
+        """
+        if self._subscriptions.pop(topic, None) is None:
+            logger.warning(f"No active subscription found for topic '{topic}' to unsubscribe from.")
+
+    def _attach_new_rings(self) -> None:
+        """Attach to rings of producers that joined since the last check."""
+        for slot in range(self.max_producers):
+            if slot not in self._rings and _U64.unpack_from(self._control.buf, _SLOTS_OFFSET + slot * 8)[0]:
+                self._rings[slot] = ShmRing.attach(_segment_name(self.inbox, slot))
+
+    async def _drain(self) -> int:
+        """Read available records from every ring and hand them to subscribers."""
+        count = 0
+        for ring in list(self._rings.values()):
+            for _ in range(self.batch_size):
+                record = ring.read()
+                if record is None:
+                    break
+                count += 1
+                topic = record[0].decode('utf-8')
+                for callback in list(self._subscriptions.get(topic, ())):
+                    try:
+                        await callback(topic, record[1])
+                    except Exception as e:
+                        logger.error(f"Error processing message on topic '{topic}': {e}", exc_info=True)
+        return count
+
+    def _pending(self) -> bool:
+        """Check if any ring has unread records."""
+        return any(len(ring) for ring in self._rings.values())
+
+    async def _read_loop(self) -> None:
+        """Internal method that reads the inbox until disconnected."""
+        # Checking the flag as well as relying on cancellation: wait_for can
+        # swallow a cancel that races with the doorbell on older Pythons
+        while self._is_connected:
+            self._attach_new_rings()
+            if await self._drain():
+                await asyncio.sleep(0)
+                continue
+
+            # Announce that we are going to sleep, then check once more so a
+            # record written just before the announcement is not missed
+            _U32.pack_into(self._control.buf, _SLEEPING_OFFSET, 1)
+            self._attach_new_rings()
+            if not self._pending():
+                try:
+                    await asyncio.wait_for(self._bell.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+            _U32.pack_into(self._control.buf, _SLEEPING_OFFSET, 0)
+            self._bell.clear()
+            try:
+                while os.read(self._bell_fds[0], 4096):
+                    pass
+            except BlockingIOError:
+                pass
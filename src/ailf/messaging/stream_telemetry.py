@@ -0,0 +1,224 @@
+"""Consumer Telemetry for Redis Streams Subscriptions.
+
+A consumer that falls behind shows up first as a growing backlog in Redis,
+long before anyone notices slow responses. :class:`StreamTelemetry` samples
+every subscription of a :class:`~ailf.messaging.redis_streams.RedisStreamsBackend`
+periodically and reports:
+
+* lag: entries added to the stream but not yet delivered to the consumer
+  group (``XINFO GROUPS``; Redis 7 or later)
+* pending: entries delivered but not yet acknowledged (``XPENDING``)
+* oldest pending age: seconds since the oldest pending entry was added
+* processing rate: messages handled per second since the previous sample
+* handler latency: a histogram of callback durations
+
+It also derives ``backlog`` (lag plus pending) and ``estimated_drain_seconds``
+(backlog divided by the processing rate). Both are meant as autoscaling
+signals: add workers to the consumer group when they stay high.
+
+Samples are sent to ``ailf.core.monitoring`` exporters as
+``redis_streams.<topic>`` metrics, so Prometheus scrapes them like any
+other metric.
+
+Example:
+    >>> telemetry = StreamTelemetry(backend, [PrometheusMetricsExporter(port=9100)], interval=15)
+    >>> telemetry.start()
+    >>> telemetry.latest["tasks"]["backlog"]
+    1200
+"""
+import asyncio
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from ailf.core.logging import setup_logging
+
+if TYPE_CHECKING:
+    from ailf.core.monitoring import MetricsExporter
+    from ailf.messaging.redis_streams import RedisStreamsBackend
+
+logger = setup_logging(__name__)
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class HandlerMetrics:
+    """
+    Counts and latency histogram of a subscription's message handler.
+
+    :param buckets: Upper bounds in seconds of the latency histogram buckets.
+    :type buckets: Sequence[float]
+    :param max_observations: Latencies kept for exporters between exports.
+    :type max_observations: int
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS, max_observations: int = 10000):
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.handled = 0
+        self.errors = 0
+        self.latency_total = 0.0
+        self._observations: deque = deque(maxlen=max_observations)
+
+    def record(self, latency: float, ok: bool = True) -> None:
+        """
+        Record one handler call.
+
+        :param latency: Duration of the call in seconds.
+        :type latency: float
+        :param ok: Whether the handler succeeded.
+        :type ok: bool
+        """
+        self.handled += 1
+        if not ok:
+            self.errors += 1
+        self.latency_total += latency
+        for index, bound in enumerate(self.buckets):
+            if latency <= bound:
+                self.bucket_counts[index] += 1
+                break
+        else:
+            self.bucket_counts[-1] += 1
+        self._observations.append(latency)
+
+    def histogram(self) -> Dict[str, int]:
+        """
+        Get the cumulative latency histogram.
+
+        :return: Number of calls at or below each bucket bound, keyed "le_<bound>" and "le_inf".
+        :rtype: Dict[str, int]
+        """
+        result = {}
+        total = 0
+        for bound, count in zip(self.buckets, self.bucket_counts):
+            total += count
+            result[f"le_{bound}"] = total
+        result["le_inf"] = total + self.bucket_counts[-1]
+        return result
+
+    def drain_observations(self) -> List[float]:
+        """
+        Take the latencies recorded since the previous call.
+
+        :return: Latencies in seconds.
+        :rtype: List[float]
+        """
+        observations = list(self._observations)
+        self._observations.clear()
+        return observations
+
+
+class StreamTelemetry:
+    """
+    Periodic lag and throughput telemetry for the subscriptions of a RedisStreamsBackend.
+
+    :param backend: The backend whose subscriptions are sampled.
+    :type backend: RedisStreamsBackend
+    :param exporters: Exporters that receive every sample.
+    :type exporters: Sequence[MetricsExporter]
+    :param interval: Seconds between samples. Defaults to 15.
+    :type interval: float
+    """
+
+    def __init__(self,
+                 backend: "RedisStreamsBackend",
+                 exporters: Sequence["MetricsExporter"] = (),
+                 interval: float = 15.0):
+        self.backend = backend
+        self.exporters = list(exporters)
+        self.interval = interval
+        self.latest: Dict[str, Dict[str, Any]] = {}
+        self._previous: Dict[str, tuple] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def collect(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Take a sample of every subscription.
+
+        :return: Sample by subscription topic. See the module documentation for the fields.
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        stats = await self.backend.subscription_stats()
+        now = time.monotonic()
+        for topic, sample in stats.items():
+            previous_time, previous_handled = self._previous.get(topic, (None, 0))
+            if previous_time is None or now <= previous_time:
+                rate = 0.0
+            else:
+                rate = max(sample["handled"] - previous_handled, 0) / (now - previous_time)
+            self._previous[topic] = (now, sample["handled"])
+
+            sample["processing_rate"] = rate
+            sample["backlog"] = (sample["lag"] or 0) + sample["pending"]
+            sample["estimated_drain_seconds"] = sample["backlog"] / rate if rate else None
+        for topic in set(self._previous) - set(stats):
+            del self._previous[topic]
+        self.latest = stats
+        return stats
+
+    def export(self, exporter: "MetricsExporter", sample: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """
+        Send a sample to an exporter.
+
+        Only the handler latencies recorded since the previous export are sent
+        to the histogram, so use :meth:`export_all` to feed several exporters.
+
+        :param exporter: An ``ailf.core.monitoring.MetricsExporter``.
+        :type exporter: MetricsExporter
+        :param sample: The sample to send. Defaults to the latest one.
+        :type sample: Optional[Dict[str, Dict[str, Any]]]
+        """
+        self._export([exporter], sample if sample is not None else self.latest)
+
+    def export_all(self, sample: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """Send a sample to every configured exporter."""
+        self._export(self.exporters, sample if sample is not None else self.latest)
+
+    def _export(self, exporters: Sequence["MetricsExporter"], sample: Dict[str, Dict[str, Any]]) -> None:
+        for topic, stats in sample.items():
+            name = f"redis_streams.{topic}"
+            gauges = {
+                key: stats[key] for key in
+                ("lag", "pending", "oldest_pending_age_seconds", "processing_rate", "backlog", "estimated_drain_seconds")
+                if stats.get(key) is not None
+            }
+            metrics = self.backend.handler_metrics(topic)
+            observations = metrics.drain_observations() if metrics is not None else []
+            for exporter in exporters:
+                exporter.export_gauges(name, gauges)
+                exporter.export_counters(name, {"handled": stats["handled"], "errors": stats["errors"]})
+                if metrics is not None:
+                    exporter.export_histogram(name, "handler_latency_seconds", observations, metrics.buckets)
+
+    async def sample_and_export(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Take a sample and send it to every configured exporter.
+
+        :return: The sample.
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        sample = await self.collect()
+        self.export_all(sample)
+        return sample
+
+    def start(self) -> None:
+        """Start sampling every `interval` seconds in the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sample_and_export()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error collecting stream telemetry: {e}")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,186 @@
+"""
+Hashed timer wheel for tracking deadlines of many long-lived objects.
+
+A timer wheel buckets deadlines into fixed-width time slots arranged in a
+ring. Scheduling, refreshing and cancelling a deadline are O(1), and each
+call to :meth:`TimerWheel.advance` only touches the slots that elapsed since
+the previous call, so expiry is O(1) amortized per tracked key instead of a
+periodic O(N) scan.
+
+Refreshing a key (for example on connection activity) only records its new
+deadline; the key is moved to the right slot lazily when its old slot comes
+due. This keeps the hot path to a single dictionary write.
+
+Examples:
+    >>> wheel = TimerWheel(tick=1.0)
+    >>> wheel.schedule("client-1", timeout=30.0)
+    >>> wheel.touch("client-1", timeout=30.0)  # on activity
+    >>> expired = wheel.advance()             # from a periodic task
+"""
+
+import math
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Set
+
+
+class TimerWheel:
+    """Hashed timer wheel keyed by arbitrary hashable keys."""
+
+    def __init__(
+        self,
+        tick: float = 1.0,
+        slots: int = 512,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the timer wheel.
+
+        Args:
+            tick: Width of one slot in seconds (expiry resolution)
+            slots: Number of slots in the ring
+            clock: Monotonic clock used for deadlines
+        """
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+        if slots <= 0:
+            raise ValueError("slots must be positive")
+
+        self.tick = tick
+        self.slots = slots
+        self._clock = clock
+        self._wheel: List[Set[Hashable]] = [set() for _ in range(slots)]
+        self._deadlines: Dict[Hashable, float] = {}
+        self._slot_of: Dict[Hashable, int] = {}
+        self._current_tick = self._tick_for(clock())
+
+    def __len__(self) -> int:
+        """Get the number of tracked keys."""
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a key is tracked."""
+        return key in self._deadlines
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        """Get the current deadline of a key.
+
+        Args:
+            key: Tracked key
+
+        Returns:
+            Optional[float]: Deadline on the wheel's clock, or None if not tracked
+        """
+        return self._deadlines.get(key)
+
+    def schedule(self, key: Hashable, timeout: float, now: Optional[float] = None) -> None:
+        """Track a key that expires ``timeout`` seconds from now.
+
+        Scheduling an already tracked key replaces its deadline. A later
+        deadline is re-slotted lazily like :meth:`touch`; an earlier one moves
+        the key to its new slot right away so it is not expired late.
+
+        Args:
+            key: Key to track
+            timeout: Seconds until the key expires
+            now: Current time on the wheel's clock (defaults to the clock)
+        """
+        now = self._clock() if now is None else now
+        deadline = now + timeout
+        previous = self._deadlines.get(key)
+        self._deadlines[key] = deadline
+        if previous is not None:
+            if deadline >= previous:
+                return
+            self._wheel[self._slot_of[key]].discard(key)
+
+        self._insert(key, deadline)
+
+    def touch(self, key: Hashable, timeout: float, now: Optional[float] = None) -> None:
+        """Push back the deadline of a tracked key.
+
+        This is the activity hot path: it only records the new deadline and
+        leaves slot placement to :meth:`advance`. Unknown keys are ignored.
+
+        Args:
+            key: Tracked key
+            timeout: Seconds from now until the key expires
+            now: Current time on the wheel's clock (defaults to the clock)
+        """
+        if key in self._deadlines:
+            self._deadlines[key] = (self._clock() if now is None else now) + timeout
+
+    def cancel(self, key: Hashable) -> bool:
+        """Stop tracking a key.
+
+        Args:
+            key: Key to stop tracking
+
+        Returns:
+            bool: True if the key was tracked
+        """
+        if self._deadlines.pop(key, None) is None:
+            return False
+        slot = self._slot_of.pop(key, None)
+        if slot is not None:
+            self._wheel[slot].discard(key)
+        return True
+
+    def advance(self, now: Optional[float] = None) -> List[Hashable]:
+        """Advance the wheel and collect expired keys.
+
+        Only the slots that elapsed since the previous call are inspected.
+        Keys whose deadline was pushed back are re-slotted instead of expired.
+        Expired keys are no longer tracked when this method returns.
+
+        Args:
+            now: Current time on the wheel's clock (defaults to the clock)
+
+        Returns:
+            List[Hashable]: Keys whose deadline has passed
+        """
+        now = self._clock() if now is None else now
+        target_tick = self._tick_for(now)
+        if target_tick < self._current_tick:
+            return []
+
+        # A full revolution visits every slot, so never walk further than that
+        first_tick = max(self._current_tick, target_tick - self.slots + 1)
+        expired: List[Hashable] = []
+
+        for tick in range(first_tick, target_tick + 1):
+            slot = tick % self.slots
+            bucket = self._wheel[slot]
+            if not bucket:
+                continue
+
+            self._wheel[slot] = set()
+            for key in bucket:
+                deadline = self._deadlines[key]
+                if deadline <= now:
+                    del self._deadlines[key]
+                    del self._slot_of[key]
+                    expired.append(key)
+                else:
+                    self._insert(key, deadline, min_tick=target_tick + 1)
+
+        self._current_tick = target_tick + 1
+        return expired
+
+    def _tick_for(self, timestamp: float) -> int:
+        """Convert a timestamp to an absolute tick number."""
+        return math.floor(timestamp / self.tick)
+
+    def _insert(self, key: Hashable, deadline: float, min_tick: Optional[int] = None) -> None:
+        """Place a key in the slot for its deadline.
+
+        Deadlines further out than one revolution land in an earlier slot and
+        are re-slotted when that slot comes due.
+
+        Args:
+            key: Key to place
+            deadline: Deadline of the key
+            min_tick: Earliest tick the key may be placed at
+        """
+        tick = max(self._tick_for(deadline), self._current_tick if min_tick is None else min_tick)
+        slot = tick % self.slots
+        self._wheel[slot].add(key)
+        self._slot_of[key] = slot
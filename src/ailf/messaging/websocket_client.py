@@ -5,6 +5,7 @@ This module provides a WebSocket client implementation with support for:
 - Automatic reconnection
 - Message serialization/deserialization
 - Structured message handling
+- Negotiated binary (msgpack) framing with threshold-based compression
 - Asynchronous event-driven architecture
 
 Examples:
@@ -32,11 +33,18 @@ from websockets.exceptions import (
 
 from ailf.schemas.websockets import (
     WebSocketMessage, StandardMessage, MessageType,
-    ConnectMessage, ConnectAckMessage, ErrorMessage
+    ConnectMessage, ConnectAckMessage, ErrorMessage,
+    MessageEncoding, MessageCompression
+)
+from .websocket_codec import (
+    CodecError, MessageCodec, DEFAULT_COMPRESSION_THRESHOLD,
+    available_encodings, available_compressions
 )
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_INCOMING_MESSAGES = 1000
+
 T = TypeVar('T', bound=BaseModel)
 MessageHandler = Callable[[WebSocketMessage], None]
 
@@ -83,7 +91,11 @@ class WebSocketClient:
         ping_interval: Optional[float] = 30.0,
         ping_timeout: Optional[float] = 10.0,
         extra_headers: Optional[Dict[str, str]] = None,
-        connection_timeout: float = 10.0
+        connection_timeout: float = 10.0,
+        encodings: Optional[List[MessageEncoding]] = None,
+        compressions: Optional[List[MessageCompression]] = None,
+        permessage_deflate: bool = True,
+        max_incoming_messages: int = DEFAULT_MAX_INCOMING_MESSAGES
     ):
         """Initialize the WebSocket client.
         
@@ -96,6 +108,13 @@ class WebSocketClient:
             ping_timeout: Timeout for ping responses
             extra_headers: Additional HTTP headers for the connection
             connection_timeout: Timeout for connection attempts
+            encodings: Encodings to offer the server, in preference order
+                (defaults to all available, msgpack first)
+            compressions: Compressions to offer the server, in preference order
+                (defaults to all available)
+            permessage_deflate: Whether to request the permessage-deflate extension
+            max_incoming_messages: Maximum number of messages kept for receive();
+                once full, the oldest message is dropped for each new one
         """
         self.uri = uri
         self.auto_reconnect = auto_reconnect
@@ -105,17 +124,27 @@ class WebSocketClient:
         self.ping_timeout = ping_timeout
         self.extra_headers = extra_headers or {}
         self.connection_timeout = connection_timeout
+        self.encodings = encodings or available_encodings()
+        self.compressions = compressions or available_compressions()
+        self.permessage_deflate = permessage_deflate
         
         self._connection: Optional[WebSocketClientProtocol] = None
         self._state = ConnectionState.DISCONNECTED
         self._reconnect_attempts = 0
         self._message_handlers: List[MessageHandler] = []
-        self._incoming_queue: asyncio.Queue = asyncio.Queue()
+        self._incoming_queue: asyncio.Queue = asyncio.Queue(maxsize=max_incoming_messages)
+        self._handler_queue: asyncio.Queue = asyncio.Queue()
         self._outgoing_queue: asyncio.Queue = asyncio.Queue()
         self._tasks: List[asyncio.Task] = []
         self._session_id: Optional[str] = None
         self._client_id = str(uuid.uuid4())
         self._close_event = asyncio.Event()
+        self._codec = MessageCodec()
+    
+    @property
+    def codec(self) -> MessageCodec:
+        """Get the codec negotiated with the server."""
+        return self._codec
     
     @property
     def connected(self) -> bool:
@@ -164,6 +193,8 @@ class WebSocketClient:
         self._state = ConnectionState.CONNECTING
         self._reconnect_attempts = 0
         self._close_event.clear()
+        # The handshake is always plain JSON
+        self._codec = MessageCodec()
         
         try:
             connection_timeout = timeout or self.connection_timeout
@@ -175,11 +206,47 @@ class WebSocketClient:
             self._connection = await asyncio.wait_for(
                 websockets.connect(
                     self.uri,
-                    extra_headers=headers
+                    extra_headers=headers,
+                    compression="deflate" if self.permessage_deflate else None
                 ),
                 timeout=connection_timeout
             )
             
+            # Run the handshake on the socket directly, before the worker
+            # tasks start consuming frames
+            connect_msg = ConnectMessage(
+                client_id=self._client_id,
+                auth_token=auth_token,
+                version="1.0",
+                id=str(uuid.uuid4()),
+                encodings=[MessageEncoding(encoding).value for encoding in self.encodings],
+                compressions=[MessageCompression(compression).value for compression in self.compressions]
+            )
+            await self._connection.send(self._codec.encode(connect_msg))
+            
+            try:
+                response = self._codec.decode(
+                    await asyncio.wait_for(self._connection.recv(), timeout=connection_timeout)
+                )
+            except asyncio.TimeoutError:
+                logger.error("Connection acknowledgment timeout")
+                await self._close_connection()
+                raise ConnectionError("Connection acknowledgment timeout")
+                
+            if response.get("type") != MessageType.CONNECT_ACK:
+                logger.error("Invalid connection acknowledgment")
+                await self._close_connection()
+                raise ConnectionError("Invalid connection acknowledgment")
+                
+            ack = ConnectAckMessage.parse_obj(response)
+            self._session_id = ack.session_id
+            self._codec = MessageCodec(
+                ack.encoding,
+                ack.compression,
+                ack.compression_threshold or DEFAULT_COMPRESSION_THRESHOLD
+            )
+            self._state = ConnectionState.CONNECTED
+            
             # Start worker tasks
             self._tasks = [
                 asyncio.create_task(self._receive_loop()),
@@ -192,38 +259,9 @@ class WebSocketClient:
                 self._tasks.append(
                     asyncio.create_task(self._ping_loop())
                 )
-            
-            # Send connect message
-            connect_msg = ConnectMessage(
-                client_id=self._client_id,
-                auth_token=auth_token,
-                version="1.0",
-                id=str(uuid.uuid4())
-            )
-            
-            await self._outgoing_queue.put(connect_msg)
-            
-            # Wait for connect acknowledgment or timeout
-            try:
-                response = await asyncio.wait_for(
-                    self._wait_for_message_type(MessageType.CONNECT_ACK),
-                    timeout=connection_timeout
-                )
                 
-                if isinstance(response, ConnectAckMessage):
-                    self._session_id = response.session_id
-                    self._state = ConnectionState.CONNECTED
-                    logger.info(f"Connected to WebSocket server: {self.uri}")
-                    return True
-                else:
-                    logger.error("Invalid connection acknowledgment")
-                    await self.disconnect()
-                    raise ConnectionError("Invalid connection acknowledgment")
-                    
-            except asyncio.TimeoutError:
-                logger.error("Connection acknowledgment timeout")
-                await self.disconnect()
-                raise ConnectionError("Connection acknowledgment timeout")
+            logger.info(f"Connected to WebSocket server: {self.uri}")
+            return True
             
         except asyncio.TimeoutError:
             self._state = ConnectionState.DISCONNECTED
@@ -258,7 +296,7 @@ class WebSocketClient:
                 if reason:
                     disconnect_msg["reason"] = reason
                     
-                await self._connection.send(json.dumps(disconnect_msg))
+                await self._connection.send(self._codec.encode(disconnect_msg))
             except Exception:
                 # Ignore errors during disconnect
                 pass
@@ -334,6 +372,10 @@ class WebSocketClient:
     async def receive(self, timeout: Optional[float] = None) -> WebSocketMessage:
         """Receive a message from the server.
         
+        Messages wait for receive() in a bounded queue. A client that only
+        uses message handlers can ignore it: when it is full, the oldest
+        message is dropped.
+        
         Args:
             timeout: Optional timeout in seconds
             
@@ -395,10 +437,8 @@ class WebSocketClient:
                 message = await self._outgoing_queue.get()
                 
                 try:
-                    if isinstance(message, BaseModel):
-                        data = message.json()
-                    elif isinstance(message, dict):
-                        data = json.dumps(message)
+                    if isinstance(message, (BaseModel, dict)):
+                        data = self._codec.encode(message)
                     else:
                         data = str(message)
                         
@@ -420,7 +460,7 @@ class WebSocketClient:
         """Background task for handling messages."""
         try:
             while True:
-                message = await self._incoming_queue.get()
+                message = await self._handler_queue.get()
                 
                 for handler in self._message_handlers:
                     try:
@@ -428,7 +468,7 @@ class WebSocketClient:
                     except Exception as e:
                         logger.error(f"Error in message handler: {e}")
                         
-                self._incoming_queue.task_done()
+                self._handler_queue.task_done()
                 
         except asyncio.CancelledError:
             # Task was cancelled, exit quietly
@@ -479,10 +519,7 @@ class WebSocketClient:
             data: Raw message data
         """
         try:
-            if isinstance(data, bytes):
-                data = data.decode('utf-8')
-                
-            message_dict = json.loads(data)
+            message_dict = self._codec.decode(data)
             
             # Determine message type
             message_type = message_dict.get("type")
@@ -496,6 +533,8 @@ class WebSocketClient:
                     message = ErrorMessage.parse_obj(message_dict)
                 elif message_type == MessageType.CONNECT_ACK:
                     message = ConnectAckMessage.parse_obj(message_dict)
+                elif message_type == MessageType.STANDARD:
+                    message = StandardMessage.parse_obj(message_dict)
                 else:
                     # Default to generic WebSocketMessage
                     message = WebSocketMessage.parse_obj(message_dict)
@@ -509,11 +548,17 @@ class WebSocketClient:
                     timestamp=message_dict.get("timestamp")
                 )
                 
-            # Add message to the incoming queue
-            await self._incoming_queue.put(message)
+            # Queue the message for receive(), and separately for the
+            # handlers so the two consumers do not steal from each other
+            if self._incoming_queue.full():
+                dropped = self._incoming_queue.get_nowait()
+                logger.debug(f"Receive queue full, dropped message {dropped.message_id}")
+            self._incoming_queue.put_nowait(message)
+            if self._message_handlers:
+                await self._handler_queue.put(message)
             
-        except json.JSONDecodeError:
-            logger.error("Received invalid JSON")
+        except CodecError as e:
+            logger.error(f"Received invalid frame: {e}")
         except Exception as e:
             logger.error(f"Error processing incoming message: {e}")
     
@@ -572,41 +617,12 @@ class WebSocketClient:
                 # Try again later
                 asyncio.create_task(self._reconnect())
     
-    async def _wait_for_message_type(
-        self, 
-        message_type: MessageType, 
-        timeout: Optional[float] = None
-    ) -> WebSocketMessage:
-        """Wait for a specific message type.
-        
-        Args:
-            message_type: Type of message to wait for
-            timeout: Optional timeout
-            
-        Returns:
-            WebSocketMessage: Received message of the specified type
-            
-        Raises:
-            asyncio.TimeoutError: If timeout occurs
-        """
-        start_time = time.time()
-        while timeout is None or (time.time() - start_time) < timeout:
-            # Get message with remaining timeout
-            remaining = None
-            if timeout is not None:
-                remaining = timeout - (time.time() - start_time)
-                if remaining <= 0:
-                    raise asyncio.TimeoutError()
-                    
-            message = await self.receive(timeout=remaining)
-            
-            if message.type == message_type:
-                return message
-                
-            # Put the message back for regular processing
-            self._incoming_queue.put_nowait(message)
-            
-            # Small delay to avoid CPU spinning
-            await asyncio.sleep(0.01)
-            
-        raise asyncio.TimeoutError()
+    async def _close_connection(self) -> None:
+        """Close a socket whose handshake failed."""
+        if self._connection:
+            try:
+                await self._connection.close()
+            except Exception:
+                # Ignore errors during close
+                pass
+        self._connection = None
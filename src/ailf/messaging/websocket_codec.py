@@ -0,0 +1,386 @@
+"""
+Wire codec for WebSocket messages.
+
+This module encodes and decodes WebSocket messages for both the client and
+the server. Peers negotiate an encoding and a compression scheme during the
+connect handshake:
+
+- Text frames always carry plain JSON, so the handshake and legacy peers keep
+  working unchanged.
+- Binary frames start with a one-byte header (high nibble: encoding, low
+  nibble: compression) followed by the body. The body is msgpack or JSON and
+  is compressed only when it is larger than the negotiated threshold.
+
+Pydantic messages are written straight to the wire: JSON uses the Rust
+serializer (``model_dump_json``) and msgpack streams the model fields into a
+packer, so no intermediate dictionary is built for the top-level message.
+
+Examples:
+    >>> codec = MessageCodec(MessageEncoding.MSGPACK, MessageCompression.DEFLATE)
+    >>> frame = codec.encode(StandardMessage(payload={"text": "hello"}))
+    >>> message_dict = codec.decode(frame)
+"""
+
+import json
+import logging
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Union
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from ailf.schemas.websockets import MessageCompression, MessageEncoding
+
+logger = logging.getLogger(__name__)
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Default size (bytes) above which binary frames are compressed
+DEFAULT_COMPRESSION_THRESHOLD = 4096
+
+# Default limit (bytes) on the decompressed size of a frame body
+DEFAULT_MAX_MESSAGE_SIZE = 1024 * 1024
+
+# Binary frame header values
+_ENCODING_IDS = {MessageEncoding.JSON: 0x0, MessageEncoding.MSGPACK: 0x1}
+_COMPRESSION_IDS = {
+    MessageCompression.NONE: 0x0,
+    MessageCompression.DEFLATE: 0x1,
+    MessageCompression.ZSTD: 0x2,
+}
+_ENCODINGS_BY_ID = {value: key for key, value in _ENCODING_IDS.items()}
+_COMPRESSIONS_BY_ID = {value: key for key, value in _COMPRESSION_IDS.items()}
+
+
+class CodecError(Exception):
+    """Exception raised when a frame cannot be encoded or decoded."""
+    pass
+
+
+def available_encodings() -> List[MessageEncoding]:
+    """Get the encodings supported by this process, in preference order.
+
+    Returns:
+        List[MessageEncoding]: Supported encodings, most preferred first
+    """
+    encodings = [MessageEncoding.JSON]
+    if MSGPACK_AVAILABLE:
+        encodings.insert(0, MessageEncoding.MSGPACK)
+    return encodings
+
+
+def available_compressions() -> List[MessageCompression]:
+    """Get the compression schemes supported by this process, in preference order.
+
+    Returns:
+        List[MessageCompression]: Supported compressions, most preferred first
+    """
+    compressions = [MessageCompression.DEFLATE, MessageCompression.NONE]
+    if ZSTD_AVAILABLE:
+        compressions.insert(0, MessageCompression.ZSTD)
+    return compressions
+
+
+def _msgpack_default(value: Any) -> Any:
+    """Convert values msgpack cannot pack natively.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        Any: A msgpack-compatible representation
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not msgpack serializable")
+
+
+class MessageCodec:
+    """Encoder/decoder for a negotiated WebSocket encoding and compression."""
+
+    def __init__(
+        self,
+        encoding: MessageEncoding = MessageEncoding.JSON,
+        compression: MessageCompression = MessageCompression.NONE,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        compression_level: int = 3,
+        max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE
+    ):
+        """Initialize the codec.
+
+        Args:
+            encoding: Encoding used for outgoing frames
+            compression: Compression used for outgoing frames above the threshold
+            compression_threshold: Minimum body size in bytes before compressing
+            compression_level: Compression level passed to zlib/zstd
+            max_message_size: Maximum decompressed size in bytes of an incoming frame
+
+        Raises:
+            CodecError: If the encoding or compression is not available
+        """
+        encoding = MessageEncoding(encoding)
+        compression = MessageCompression(compression)
+
+        if encoding == MessageEncoding.MSGPACK and not MSGPACK_AVAILABLE:
+            raise CodecError("msgpack not installed. Please install with 'pip install msgpack'")
+        if compression == MessageCompression.ZSTD and not ZSTD_AVAILABLE:
+            raise CodecError(
+                "zstandard not installed. Please install with 'pip install zstandard'"
+            )
+
+        self.encoding = encoding
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+        self.max_message_size = max_message_size
+
+        self._packer = msgpack.Packer(default=_msgpack_default) if MSGPACK_AVAILABLE else None
+        self._zstd_compressor = (
+            zstandard.ZstdCompressor(level=compression_level) if ZSTD_AVAILABLE else None
+        )
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if ZSTD_AVAILABLE else None
+
+    @property
+    def is_binary(self) -> bool:
+        """Check if outgoing frames are sent as binary frames."""
+        return (
+            self.encoding != MessageEncoding.JSON
+            or self.compression != MessageCompression.NONE
+        )
+
+    @classmethod
+    def negotiate(
+        cls,
+        offered_encodings: Sequence[Union[str, MessageEncoding]],
+        offered_compressions: Sequence[Union[str, MessageCompression]],
+        allowed_encodings: Optional[Sequence[MessageEncoding]] = None,
+        allowed_compressions: Optional[Sequence[MessageCompression]] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        max_message_size: int = DEFAULT_MAX_MESSAGE_SIZE
+    ) -> "MessageCodec":
+        """Pick the best encoding and compression both peers support.
+
+        The peer's offer order is treated as its preference order.
+
+        Args:
+            offered_encodings: Encodings offered by the peer
+            offered_compressions: Compressions offered by the peer
+            allowed_encodings: Encodings this side accepts (defaults to all available)
+            allowed_compressions: Compressions this side accepts (defaults to all available)
+            compression_threshold: Minimum body size in bytes before compressing
+            max_message_size: Maximum decompressed size in bytes of an incoming frame
+
+        Returns:
+            MessageCodec: Codec for the negotiated settings
+        """
+        local_encodings = set(available_encodings())
+        if allowed_encodings is not None:
+            local_encodings &= set(allowed_encodings)
+        local_compressions = set(available_compressions())
+        if allowed_compressions is not None:
+            local_compressions &= set(allowed_compressions)
+
+        encoding = MessageEncoding.JSON
+        for offered in offered_encodings:
+            try:
+                candidate = MessageEncoding(offered)
+            except ValueError:
+                continue
+            if candidate in local_encodings:
+                encoding = candidate
+                break
+
+        compression = MessageCompression.NONE
+        for offered in offered_compressions:
+            try:
+                candidate = MessageCompression(offered)
+            except ValueError:
+                continue
+            if candidate in local_compressions:
+                compression = candidate
+                break
+
+        return cls(encoding, compression, compression_threshold, max_message_size=max_message_size)
+
+    def encode(self, message: Union[Dict[str, Any], BaseModel, str]) -> Union[str, bytes]:
+        """Encode a message into a WebSocket frame.
+
+        Args:
+            message: Message to encode (Pydantic model, dict, or pre-encoded string)
+
+        Returns:
+            Union[str, bytes]: Text frame for plain JSON, bytes for binary frames
+
+        Raises:
+            CodecError: If the message cannot be encoded
+        """
+        if isinstance(message, str):
+            return message
+
+        try:
+            if self.encoding == MessageEncoding.MSGPACK:
+                body = self._pack(message)
+            elif isinstance(message, BaseModel):
+                body = message.model_dump_json().encode("utf-8")
+            else:
+                body = json.dumps(message, default=_msgpack_default).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            raise CodecError(f"Failed to encode message: {e}") from e
+
+        if not self.is_binary:
+            return body.decode("utf-8")
+
+        compression = MessageCompression.NONE
+        if (
+            self.compression != MessageCompression.NONE
+            and len(body) >= self.compression_threshold
+        ):
+            compression = self.compression
+            body = self._compress(body)
+
+        header = (_ENCODING_IDS[self.encoding] << 4) | _COMPRESSION_IDS[compression]
+        return bytes((header,)) + body
+
+    def decode(self, data: Union[str, bytes, bytearray, memoryview]) -> Dict[str, Any]:
+        """Decode a WebSocket frame into a message dictionary.
+
+        Frames are self-describing, so any codec instance can decode frames
+        produced with any encoding or compression.
+
+        Args:
+            data: Raw frame data
+
+        Returns:
+            Dict[str, Any]: The decoded message
+
+        Raises:
+            CodecError: If the frame is malformed or uses an unavailable scheme
+        """
+        try:
+            if isinstance(data, str):
+                result = json.loads(data)
+            else:
+                view = memoryview(data)
+                if not view:
+                    raise CodecError("Empty binary frame")
+
+                header = view[0]
+                encoding = _ENCODINGS_BY_ID.get(header >> 4)
+                compression = _COMPRESSIONS_BY_ID.get(header & 0x0F)
+                if encoding is None or compression is None:
+                    raise CodecError(f"Unknown frame header: {header:#04x}")
+
+                body = view[1:]
+                if compression != MessageCompression.NONE:
+                    body = self._decompress(body, compression)
+
+                if encoding == MessageEncoding.MSGPACK:
+                    if not MSGPACK_AVAILABLE:
+                        raise CodecError("Received msgpack frame but msgpack is not installed")
+                    result = msgpack.unpackb(body, raw=False)
+                else:
+                    result = json.loads(bytes(body))
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"Failed to decode frame: {e}") from e
+
+        if not isinstance(result, dict):
+            raise CodecError("Decoded frame is not an object")
+        return result
+
+    def _pack(self, message: Union[Dict[str, Any], BaseModel]) -> bytes:
+        """Pack a message with msgpack.
+
+        Pydantic models are streamed field by field into the packer instead
+        of being dumped to a dictionary first.
+
+        Args:
+            message: Message to pack
+
+        Returns:
+            bytes: Packed message
+        """
+        packer = self._packer
+        if not isinstance(message, BaseModel):
+            return packer.pack(message)
+
+        fields = message.__dict__
+        extra = message.__pydantic_extra__ or {}
+        chunks = [packer.pack_map_header(len(fields) + len(extra))]
+        for key, value in fields.items():
+            chunks.append(packer.pack(key))
+            chunks.append(packer.pack(value))
+        for key, value in extra.items():
+            chunks.append(packer.pack(key))
+            chunks.append(packer.pack(value))
+        return b"".join(chunks)
+
+    def _compress(self, body: bytes) -> bytes:
+        """Compress a frame body with the negotiated scheme.
+
+        Args:
+            body: Body to compress
+
+        Returns:
+            bytes: Compressed body
+        """
+        if self.compression == MessageCompression.ZSTD:
+            return self._zstd_compressor.compress(body)
+        return zlib.compress(body, self.compression_level)
+
+    def _decompress(self, body: memoryview, compression: MessageCompression) -> bytes:
+        """Decompress a frame body without inflating more than max_message_size.
+
+        Args:
+            body: Compressed body
+            compression: Compression scheme from the frame header
+
+        Returns:
+            bytes: Decompressed body
+
+        Raises:
+            CodecError: If the body decompresses to more than max_message_size
+        """
+        limit = self.max_message_size
+        if compression == MessageCompression.ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise CodecError("Received zstd frame but zstandard is not installed")
+            # max_output_size only bounds frames that don't declare their size (-1)
+            content_size = zstandard.frame_content_size(body)
+            if content_size > limit:
+                raise CodecError(f"Decompressed frame exceeds {limit} bytes")
+            try:
+                return self._zstd_decompressor.decompress(body, max_output_size=limit)
+            except zstandard.ZstdError as e:
+                if content_size < 0:
+                    raise CodecError(f"Decompressed frame exceeds {limit} bytes or is corrupt: {e}") from e
+                raise
+
+        decompressor = zlib.decompressobj()
+        result = decompressor.decompress(body, limit + 1)
+        if len(result) > limit:
+            raise CodecError(f"Decompressed frame exceeds {limit} bytes")
+        if not decompressor.eof:
+            raise CodecError("Truncated deflate frame")
+        return result
@@ -7,6 +7,7 @@ This module provides a WebSocket server with support for:
 - Room-based grouping
 - Authentication integration
 - Customizable message handling
+- Negotiated binary (msgpack) framing with threshold-based compression
 
 Examples:
     >>> server = WebSocketServer(host="0.0.0.0", port=8765)
@@ -29,8 +30,10 @@ from websockets.exceptions import ConnectionClosed
 from ailf.schemas.websockets import (
     WebSocketMessage, ConnectMessage, ConnectAckMessage, 
     DisconnectMessage, StandardMessage, ErrorMessage,
-    MessageType
+    MessageType, MessageEncoding, MessageCompression
 )
+from .timer_wheel import TimerWheel
+from .websocket_codec import CodecError, MessageCodec, DEFAULT_COMPRESSION_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +71,7 @@ class Client:
         self.connected_at = time.time()
         self.last_activity = time.time()
         self.metadata: Dict[str, Any] = {}
+        self.codec = MessageCodec()
 
 
 class WebSocketServer:
@@ -85,7 +89,13 @@ class WebSocketServer:
         ping_timeout: Optional[float] = 10.0,
         max_message_size: int = 1024 * 1024,  # 1MB
         max_clients: Optional[int] = None,
-        server_id: Optional[str] = None
+        server_id: Optional[str] = None,
+        encodings: Optional[List[MessageEncoding]] = None,
+        compressions: Optional[List[MessageCompression]] = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        permessage_deflate: bool = True,
+        idle_timeout: Optional[float] = None,
+        liveness_tick: float = 1.0
     ):
         """Initialize the WebSocket server.
         
@@ -97,6 +107,18 @@ class WebSocketServer:
             max_message_size: Maximum message size in bytes
             max_clients: Maximum number of concurrent clients
             server_id: Server identifier
+            encodings: Encodings clients may negotiate (defaults to all available)
+            compressions: Compressions clients may negotiate (defaults to all available)
+            compression_threshold: Minimum frame body size in bytes before compressing
+            permessage_deflate: Whether to offer the permessage-deflate extension.
+                Disable it when clients negotiate application-level compression
+                so small frames are not compressed twice.
+            idle_timeout: Seconds without client activity before a client is
+                pinged, and disconnected if it does not answer within
+                ping_timeout. Defaults to ping_interval + ping_timeout + 30s
+                (or 120s without pings); idle tracking is off when ping_timeout
+                is None and no idle_timeout is given.
+            liveness_tick: Resolution in seconds of idle-client expiry
         """
         self.host = host
         self.port = port
@@ -105,10 +127,21 @@ class WebSocketServer:
         self.max_message_size = max_message_size
         self.max_clients = max_clients
         self.server_id = server_id or str(uuid.uuid4())
+        self.encodings = encodings
+        self.compressions = compressions
+        self.compression_threshold = compression_threshold
+        self.permessage_deflate = permessage_deflate
+        self.liveness_tick = liveness_tick
+        if idle_timeout is None and ping_timeout:
+            idle_timeout = ping_interval + ping_timeout + 30.0 if ping_interval else 120.0
+        self.idle_timeout = idle_timeout
         
         # Client tracking
         self.clients: Dict[str, Client] = {}
         self.rooms: Dict[str, Set[str]] = {}
+        self._socket_clients: Dict[WebSocketServerProtocol, Client] = {}
+        self._default_codec = MessageCodec(max_message_size=max_message_size)
+        self._liveness = TimerWheel(tick=liveness_tick)
         
         # Handlers with default implementations
         self.on_connect: ClientConnectHandler = self._default_connect_handler
@@ -120,6 +153,7 @@ class WebSocketServer:
         # Server state
         self._server: Optional[websockets.WebSocketServer] = None
         self._tasks: List[asyncio.Task] = []
+        self._probes: Set[asyncio.Task] = set()
         self._stop_event = asyncio.Event()
     
     async def start(self) -> None:
@@ -132,7 +166,8 @@ class WebSocketServer:
             self.port,
             ping_interval=self.ping_interval,
             ping_timeout=self.ping_timeout,
-            max_size=self.max_message_size
+            max_size=self.max_message_size,
+            compression="deflate" if self.permessage_deflate else None
         )
         
         # Start maintenance task
@@ -152,8 +187,8 @@ class WebSocketServer:
         # Set stop event
         self._stop_event.set()
         
-        # Cancel maintenance task
-        for task in self._tasks:
+        # Cancel maintenance task and pending liveness probes
+        for task in [*self._tasks, *self._probes]:
             task.cancel()
         
         # Close all client connections
@@ -180,13 +215,14 @@ class WebSocketServer:
             exclude: Optional list of client IDs to exclude
         """
         exclude_set = set(exclude) if exclude else set()
+        frames: Dict[tuple, Union[str, bytes]] = {}
         
         for client_id, client in list(self.clients.items()):
             if client_id in exclude_set:
                 continue
                 
             try:
-                await self._send_message_to_client(client.websocket, message)
+                await self._send_message_to_client(client.websocket, message, frames)
             except Exception as e:
                 logger.error(f"Error broadcasting to client {client_id}: {e}")
     
@@ -232,6 +268,7 @@ class WebSocketServer:
             return
             
         exclude_set = set(exclude) if exclude else set()
+        frames: Dict[tuple, Union[str, bytes]] = {}
         
         for client_id in list(self.rooms[room]):
             if client_id in exclude_set:
@@ -240,7 +277,7 @@ class WebSocketServer:
             client = self.clients.get(client_id)
             if client:
                 try:
-                    await self._send_message_to_client(client.websocket, message)
+                    await self._send_message_to_client(client.websocket, message, frames)
                 except Exception as e:
                     logger.error(f"Error broadcasting to client {client_id} in room {room}: {e}")
     
@@ -360,17 +397,35 @@ class WebSocketServer:
             # Create session ID
             session_id = str(uuid.uuid4())
             
+            # Negotiate wire encoding and compression
+            codec = MessageCodec.negotiate(
+                connect_message.encodings,
+                connect_message.compressions,
+                allowed_encodings=self.encodings,
+                allowed_compressions=self.compressions,
+                compression_threshold=self.compression_threshold,
+                max_message_size=self.max_message_size
+            )
+            
             # Register client
             client = Client(websocket, client_id, session_id)
             self.clients[client_id] = client
+            self._socket_clients[websocket] = client
+            if self.idle_timeout:
+                self._liveness.schedule(client_id, self.idle_timeout)
             
-            # Send connect acknowledgment
+            # Send connect acknowledgment (always plain JSON, before switching codecs)
             ack_message = ConnectAckMessage(
                 id=str(uuid.uuid4()),
                 session_id=session_id,
-                server_id=self.server_id
+                server_id=self.server_id,
+                client_id=client_id,
+                encoding=codec.encoding,
+                compression=codec.compression,
+                compression_threshold=codec.compression_threshold
             )
             await self._send_message_to_client(websocket, ack_message)
+            client.codec = codec
             
             logger.info(f"Client connected: {client_id} (session: {session_id})")
             
@@ -407,10 +462,7 @@ class WebSocketServer:
             raw_message = await asyncio.wait_for(websocket.recv(), timeout=10.0)
             
             # Parse message
-            if isinstance(raw_message, bytes):
-                raw_message = raw_message.decode('utf-8')
-                
-            message_dict = json.loads(raw_message)
+            message_dict = self._default_codec.decode(raw_message)
             
             # Check if it's a connect message
             if message_dict.get("type") != MessageType.CONNECT:
@@ -427,8 +479,8 @@ class WebSocketServer:
         except asyncio.TimeoutError:
             logger.warning("Connect message timeout")
             return None
-        except json.JSONDecodeError:
-            logger.warning("Invalid JSON in connect message")
+        except CodecError:
+            logger.warning("Invalid encoding in connect message")
             return None
         except Exception as e:
             logger.error(f"Error receiving connect message: {e}")
@@ -453,13 +505,13 @@ class WebSocketServer:
                 client = self.clients.get(client_id)
                 if client:
                     client.last_activity = time.time()
+                    if self.idle_timeout:
+                        self._liveness.touch(client_id, self.idle_timeout)
                 
                 # Parse message
                 try:
-                    if isinstance(raw_message, bytes):
-                        raw_message = raw_message.decode('utf-8')
-                        
-                    message_dict = json.loads(raw_message)
+                    codec = client.codec if client else self._default_codec
+                    message_dict = codec.decode(raw_message)
                     
                     # Handle disconnect message
                     if message_dict.get("type") == MessageType.DISCONNECT:
@@ -471,7 +523,7 @@ class WebSocketServer:
                     message_type = message_dict.get("type")
                     message: WebSocketMessage
                     
-                    if message_type == MessageType.MESSAGE:
+                    if message_type == MessageType.STANDARD:
                         message = StandardMessage.parse_obj(message_dict)
                     else:
                         message = WebSocketMessage.parse_obj(message_dict)
@@ -490,8 +542,8 @@ class WebSocketServer:
                     )
                     await self._send_message_to_client(websocket, error_message)
                     
-                except json.JSONDecodeError:
-                    logger.warning("Invalid JSON in message")
+                except CodecError:
+                    logger.warning("Invalid encoding in message")
                     # Send error response
                     error_message = ErrorMessage(
                         id=str(uuid.uuid4()),
@@ -525,23 +577,23 @@ class WebSocketServer:
             disconnect_message: Optional disconnect message
         """
         # Find client by websocket
-        client_id = None
-        for cid, client in list(self.clients.items()):
-            if client.websocket == websocket:
-                client_id = cid
-                break
+        client = self._socket_clients.pop(websocket, None)
                 
-        if client_id:
-            # Get client before removal
-            client = self.clients.get(client_id)
+        if client:
+            client_id = client.client_id
             
-            # Remove from rooms
-            if client:
-                for room in list(client.rooms):
-                    self.remove_from_room(client_id, room)
+            # Remove from rooms, dropping rooms that become empty
+            for room in client.rooms:
+                members = self.rooms.get(room)
+                if members is not None:
+                    members.discard(client_id)
+                    if not members:
+                        del self.rooms[room]
+            client.rooms.clear()
             
             # Remove client
             self.clients.pop(client_id, None)
+            self._liveness.cancel(client_id)
             
             # Call disconnect handler
             await self.on_disconnect(websocket, disconnect_message)
@@ -556,7 +608,7 @@ class WebSocketServer:
                 try:
                     await asyncio.wait_for(
                         self._stop_event.wait(),
-                        timeout=60.0  # Run maintenance every minute
+                        timeout=self.liveness_tick
                     )
                     break
                 except asyncio.TimeoutError:
@@ -564,7 +616,6 @@ class WebSocketServer:
                 
                 # Run maintenance tasks
                 await self._check_dead_connections()
-                self._clean_empty_rooms()
                 
         except asyncio.CancelledError:
             # Task was cancelled
@@ -573,48 +624,79 @@ class WebSocketServer:
             logger.error(f"Error in maintenance loop: {e}")
     
     async def _check_dead_connections(self) -> None:
-        """Check and remove dead connections."""
-        if not self.ping_timeout:
+        """Probe clients whose idle deadline has passed and drop the dead ones.
+        
+        Deadlines live in a timer wheel that is refreshed on every message,
+        so each call only inspects the slots that elapsed since the last one
+        rather than every connected client. A quiet client is not necessarily
+        a dead one, so expired clients are pinged first and only those that
+        do not answer are closed. Probes run as background tasks, so waiting
+        for a pong never delays the next pass.
+        """
+        if not self.idle_timeout:
             return
-            
-        now = time.time()
-        max_inactivity = self.ping_interval + self.ping_timeout + 30.0 if self.ping_interval else 120.0
         
-        for client_id, client in list(self.clients.items()):
-            if now - client.last_activity > max_inactivity:
-                logger.warning(f"Client {client_id} connection timed out")
-                try:
-                    await self._disconnect_client(
-                        client.websocket,
-                        DisconnectMessage(reason="Connection timeout")
-                    )
-                except Exception as e:
-                    logger.error(f"Error disconnecting timed-out client {client_id}: {e}")
+        for client_id in self._liveness.advance():
+            client = self.clients.get(client_id)
+            if client:
+                probe = asyncio.create_task(self._probe_client(client))
+                self._probes.add(probe)
+                probe.add_done_callback(self._probes.discard)
     
-    def _clean_empty_rooms(self) -> None:
-        """Remove empty rooms."""
-        empty_rooms = [room for room, clients in self.rooms.items() if not clients]
-        for room in empty_rooms:
-            del self.rooms[room]
+    async def _probe_client(self, client: Client) -> None:
+        """Ping an idle client, re-arming its deadline if it answers.
+        
+        Args:
+            client: Client whose idle deadline has passed
+        """
+        try:
+            pong_waiter = await client.websocket.ping()
+            await asyncio.wait_for(pong_waiter, timeout=self.ping_timeout or 10.0)
+        except (asyncio.TimeoutError, ConnectionClosed):
+            pass
+        else:
+            # advance() stopped tracking the client, so touch() would ignore it
+            if client.client_id in self.clients:
+                self._liveness.schedule(client.client_id, self.idle_timeout)
+            return
+        
+        logger.warning(f"Client {client.client_id} connection timed out")
+        try:
+            await self._disconnect_client(
+                client.websocket,
+                DisconnectMessage(reason="Connection timeout")
+            )
+            await client.websocket.close(1001, "Connection timeout")
+        except Exception as e:
+            logger.error(f"Error disconnecting timed-out client {client.client_id}: {e}")
     
     async def _send_message_to_client(
         self,
         websocket: WebSocketServerProtocol,
-        message: Union[Dict, WebSocketMessage]
+        message: Union[Dict, WebSocketMessage],
+        frames: Optional[Dict[tuple, Union[str, bytes]]] = None
     ) -> None:
         """Send a message to a client.
         
+        The message is encoded with the codec negotiated by the client.
+        
         Args:
             websocket: WebSocket connection
             message: Message to send
+            frames: Optional cache of encoded frames keyed by codec settings,
+                so a broadcast encodes each message once per distinct codec
         """
         try:
-            if isinstance(message, BaseModel):
-                data = message.json()
-            elif isinstance(message, dict):
-                data = json.dumps(message)
+            client = self._socket_clients.get(websocket)
+            codec = client.codec if client else self._default_codec
+            
+            if frames is None:
+                data = codec.encode(message)
             else:
-                data = str(message)
+                key = (codec.encoding, codec.compression, codec.compression_threshold)
+                data = frames.get(key)
+                if data is None:
+                    data = frames[key] = codec.encode(message)
                 
             await websocket.send(data)
         except Exception as e:
@@ -10,6 +10,10 @@ Key Components:
     ZMQClient: Implementation of the request-reply client pattern
     ZMQServer: Implementation of the request-reply server pattern
 
+Large payloads can skip JSON encoding with the ``*_payload`` methods, which
+send a small header frame plus raw buffer frames without copying them (see
+:mod:`ailf.messaging.zmq_payload`).
+
 Example:
     >>> from ailf.messaging.zmq import ZMQPublisher, ZMQSubscriber
     >>> 
@@ -34,11 +38,12 @@ import json
 import threading
 import time
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import zmq
 
 from ailf.core.logging import setup_logging
+from ailf.messaging.zmq_payload import PayloadMessage, PayloadSendHandle, parse_payload, send_payload
 
 # Initialize logging
 logger = setup_logging(__name__)
@@ -76,6 +81,23 @@ class ZMQBase:
             logger.error(f"Failed to connect to {address}: {str(e)}")
             raise
         
+    def _recv_payload(self, timeout: Optional[int], what: str) -> List[zmq.Frame]:
+        """Receive all frames of a multipart message without copying.
+
+        Args:
+            timeout: Timeout in milliseconds
+            what: Description of the awaited message used in the timeout error
+
+        Returns:
+            Received frames
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to an address")
+
+        if timeout is not None and not self.socket.poll(timeout, zmq.POLLIN):
+            raise zmq.ZMQError(f"Timeout waiting for {what}")
+        return self.socket.recv_multipart(copy=False)
+
     def close(self) -> None:
         """Close the socket and clean up resources."""
         if self.socket:
@@ -121,6 +143,34 @@ class ZMQPublisher(ZMQBase):
             
         self.socket.send_multipart([topic_bytes, message_bytes])
 
+    def publish_payload(
+        self,
+        topic: str,
+        header: Optional[Dict[str, Any]],
+        buffers: Sequence[Any],
+        track: bool = True
+    ) -> PayloadSendHandle:
+        """Publish raw buffers without encoding or copying them.
+
+        The buffers must not be modified until the returned handle is done.
+
+        Args:
+            topic: Message topic
+            header: Metadata sent in a separate JSON frame
+            buffers: Objects supporting the buffer protocol (bytes, memoryview, ndarray)
+            track: Whether to track when the buffers are released. Without
+                tracking, the buffers must not be reused and the handle's done
+                and wait raise PayloadError
+
+        Returns:
+            Handle telling when the buffers may be reused
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to an address")
+
+        topic_bytes = topic.encode('utf-8') if isinstance(topic, str) else topic
+        return send_payload(self.socket, header, buffers, prefix=[topic_bytes], track=track)
+
 
 class ZMQSubscriber(ZMQBase):
     """Subscriber implementation for the ZMQ PUB-SUB pattern."""
@@ -208,6 +258,20 @@ class ZMQSubscriber(ZMQBase):
         topic, message = self.receive(timeout)
         return topic.decode('utf-8'), json.loads(message.decode('utf-8'))
 
+    def receive_payload(self, timeout: int = None) -> Tuple[str, PayloadMessage]:
+        """Receive a message sent with ZMQPublisher.publish_payload.
+
+        Buffers are views over the received frames, not copies.
+
+        Args:
+            timeout: Timeout in milliseconds
+
+        Returns:
+            Tuple of (topic, payload)
+        """
+        frames = self._recv_payload(timeout, "message")
+        return frames[0].bytes.decode('utf-8'), parse_payload(frames[1:])
+
 
 class ZMQClient(ZMQBase):
     """Client implementation for the ZMQ REQ-REP pattern."""
@@ -280,6 +344,34 @@ class ZMQClient(ZMQBase):
         response = self.send_request(request, timeout)
         return json.loads(response.decode('utf-8'))
 
+    def send_request_payload(
+        self,
+        header: Optional[Dict[str, Any]],
+        buffers: Sequence[Any],
+        timeout: int = None
+    ) -> PayloadMessage:
+        """Send raw buffers as a request and receive a payload response.
+
+        Over tcp and ipc the request buffers are safe to modify once this
+        method returns, since the server has already received them. Over
+        inproc the server's frames share the caller's memory for as long as
+        it holds them.
+
+        Args:
+            header: Metadata sent in a separate JSON frame
+            buffers: Objects supporting the buffer protocol (bytes, memoryview, ndarray)
+            timeout: Timeout in milliseconds
+
+        Returns:
+            Response payload
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to an address")
+
+        # The reply proves delivery, so the send does not need a tracker
+        send_payload(self.socket, header, buffers, track=False)
+        return parse_payload(self._recv_payload(timeout, "response"))
+
 
 class ZMQServer(ZMQBase):
     """Server implementation for the ZMQ REQ-REP pattern."""
@@ -359,6 +451,40 @@ class ZMQServer(ZMQBase):
             
         # Send the response
         self.socket.send(response_bytes)
+
+    def receive_payload(self, timeout: int = None) -> PayloadMessage:
+        """Receive a request sent with ZMQClient.send_request_payload.
+
+        Args:
+            timeout: Timeout in milliseconds
+
+        Returns:
+            Request payload
+        """
+        return parse_payload(self._recv_payload(timeout, "request"))
+
+    def send_response_payload(
+        self,
+        header: Optional[Dict[str, Any]],
+        buffers: Sequence[Any],
+        track: bool = True
+    ) -> PayloadSendHandle:
+        """Send raw buffers as a response without copying them.
+
+        Args:
+            header: Metadata sent in a separate JSON frame
+            buffers: Objects supporting the buffer protocol (bytes, memoryview, ndarray)
+            track: Whether to track when the buffers are released. Without
+                tracking, the buffers must not be reused and the handle's done
+                and wait raise PayloadError
+
+        Returns:
+            Handle telling when the buffers may be reused
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to an address")
+
+        return send_payload(self.socket, header, buffers, track=track)
         
     def start(self, handler: callable, daemon: bool = True) -> None:
         """Start the server in a background thread.
@@ -0,0 +1,586 @@
+"""Asyncio ZeroMQ Messaging Module.
+
+This module provides ``zmq.asyncio`` counterparts of the blocking classes in
+:mod:`ailf.messaging.zmq`, so agents running on an event loop can use ZMQ
+without blocking the loop or hopping to threads.
+
+Key Components:
+    AsyncZMQBase: Base class managing an asyncio socket's lifecycle
+    AsyncZMQPublisher: Publisher for the PUB-SUB pattern
+    AsyncZMQSubscriber: Subscriber dispatching messages to async callbacks
+    AsyncZMQBackend: MessagingBackendBase implementation over PUB/SUB sockets
+    AsyncZMQClient: DEALER client with request pipelining and correlation IDs
+    AsyncZMQServer: ROUTER server handling many requests concurrently
+
+Example:
+    >>> server = AsyncZMQServer(max_concurrency=64)
+    >>> server.bind("tcp://*:5555")
+    >>> await server.start(handle_request)
+    >>>
+    >>> async with AsyncZMQClient() as client:
+    >>>     client.connect("tcp://localhost:5555")
+    >>>     replies = await asyncio.gather(*(client.send_request(r) for r in requests))
+
+Wire format:
+    The client sends ``[b"", correlation_id, payload]`` and the server replies
+    with ``[b"", correlation_id, response]``, so replies may arrive in any
+    order. The server also answers plain REQ clients (``[b"", payload]``),
+    so the blocking :class:`~ailf.messaging.zmq.ZMQClient` keeps working.
+"""
+
+import asyncio
+import itertools
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+import zmq
+import zmq.asyncio
+
+from ailf.core.logging import setup_logging
+from ailf.messaging.base import MessageHandlerCallback, MessagingBackendBase
+
+# Initialize logging
+logger = setup_logging(__name__)
+
+# Async request handler: takes the request payload and returns the response
+RequestHandler = Callable[[bytes], Awaitable[Union[str, bytes, dict]]]
+
+
+def _to_bytes(message: Union[str, bytes, dict]) -> bytes:
+    """Encode a message payload as bytes.
+
+    Args:
+        message: Message payload (string, bytes, or dict)
+
+    Returns:
+        Encoded payload
+    """
+    if isinstance(message, dict):
+        return json.dumps(message).encode('utf-8')
+    if isinstance(message, str):
+        return message.encode('utf-8')
+    return message
+
+
+class AsyncZMQBase:
+    """Base class for asyncio ZMQ communication classes."""
+
+    socket_type: Optional[int] = None
+
+    def __init__(self, context: Optional[zmq.asyncio.Context] = None):
+        """Initialize the base class.
+
+        Args:
+            context: Asyncio ZMQ context (defaults to the shared instance)
+        """
+        self.context = context or zmq.asyncio.Context.instance()
+        self.socket: Optional[zmq.asyncio.Socket] = self.context.socket(self.socket_type)
+        self.socket.setsockopt(zmq.LINGER, 0)
+        self._connected = False
+
+    def connect(self, address: str) -> None:
+        """Connect the socket to an address.
+
+        Wildcard TCP addresses (``tcp://*``) are bound instead, matching
+        :class:`~ailf.messaging.zmq.ZMQBase`.
+
+        Args:
+            address: Address to connect to
+        """
+        if self.socket is None:
+            raise RuntimeError("Socket not initialized")
+
+        try:
+            if address.startswith("tcp://*"):
+                self.socket.bind(address)
+            else:
+                self.socket.connect(address)
+            self._connected = True
+            logger.debug(f"Connected to {address}")
+        except zmq.ZMQError as e:
+            logger.error(f"Failed to connect to {address}: {str(e)}")
+            raise
+
+    def bind(self, address: str) -> str:
+        """Bind the socket to an address.
+
+        Args:
+            address: Address to bind to
+
+        Returns:
+            The bound endpoint (resolves wildcard ports)
+        """
+        if self.socket is None:
+            raise RuntimeError("Socket not initialized")
+
+        self.socket.bind(address)
+        self._connected = True
+        return self.socket.getsockopt_string(zmq.LAST_ENDPOINT)
+
+    def close(self) -> None:
+        """Close the socket and clean up resources."""
+        if self.socket:
+            self.socket.close()
+            self.socket = None
+            self._connected = False
+
+    async def __aenter__(self):
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit the async context manager."""
+        self.close()
+
+
+class AsyncZMQPublisher(AsyncZMQBase):
+    """Asyncio publisher for the ZMQ PUB-SUB pattern."""
+
+    socket_type = zmq.PUB
+
+    async def publish(self, topic: str, message: Union[str, bytes, dict]) -> None:
+        """Publish a message with the given topic.
+
+        Args:
+            topic: Message topic
+            message: Message payload (string, bytes, or dict)
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to an address")
+
+        await self.socket.send_multipart([topic.encode('utf-8'), _to_bytes(message)])
+
+
+class AsyncZMQSubscriber(AsyncZMQBase):
+    """Asyncio subscriber for the ZMQ PUB-SUB pattern.
+
+    Messages can be pulled with :meth:`receive` or pushed to per-topic
+    callbacks registered with :meth:`subscribe` once :meth:`start` is called.
+    """
+
+    socket_type = zmq.SUB
+
+    def __init__(self, context: Optional[zmq.asyncio.Context] = None):
+        """Initialize the subscriber.
+
+        Args:
+            context: Asyncio ZMQ context (defaults to the shared instance)
+        """
+        super().__init__(context)
+        self._callbacks: Dict[str, MessageHandlerCallback] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, topic: str, callback: Optional[MessageHandlerCallback] = None) -> None:
+        """Subscribe to a topic.
+
+        Args:
+            topic: Topic to subscribe to
+            callback: Optional async callback invoked with (topic, message)
+        """
+        self.socket.setsockopt(zmq.SUBSCRIBE, topic.encode('utf-8'))
+        if callback is not None:
+            self._callbacks[topic] = callback
+
+    def unsubscribe(self, topic: str) -> None:
+        """Unsubscribe from a topic.
+
+        Args:
+            topic: Topic to unsubscribe from
+        """
+        self.socket.setsockopt(zmq.UNSUBSCRIBE, topic.encode('utf-8'))
+        self._callbacks.pop(topic, None)
+
+    async def receive(self, timeout: Optional[float] = None) -> Tuple[str, bytes]:
+        """Receive a message.
+
+        Args:
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple of (topic, message)
+
+        Raises:
+            asyncio.TimeoutError: If no message arrives in time
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to an address")
+
+        topic, message = await asyncio.wait_for(self.socket.recv_multipart(), timeout)
+        return topic.decode('utf-8'), message
+
+    def start(self) -> None:
+        """Start dispatching received messages to the registered callbacks."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._dispatch_loop())
+
+    async def stop(self) -> None:
+        """Stop the dispatch task."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _dispatch_loop(self) -> None:
+        """Receive messages and invoke every callback whose topic is a prefix of theirs."""
+        while True:
+            try:
+                topic, message = await self.receive()
+            except asyncio.CancelledError:
+                raise
+            except zmq.ZMQError as e:
+                if e.errno == zmq.ETERM:
+                    break
+                logger.error(f"ZMQ error in subscriber: {str(e)}")
+                continue
+
+            # ZMQ filters by prefix, so a message can match several subscriptions
+            callbacks = [
+                callback for prefix, callback in list(self._callbacks.items())
+                if topic.startswith(prefix)
+            ]
+            for callback in callbacks:
+                try:
+                    await callback(topic, message)
+                except Exception as e:
+                    logger.error(f"Error in subscriber callback for '{topic}': {str(e)}")
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit the async context manager."""
+        await self.stop()
+        self.close()
+
+
+class AsyncZMQBackend(MessagingBackendBase):
+    """MessagingBackendBase implementation over asyncio PUB/SUB sockets.
+
+    :param publish_address: Address the publisher binds or connects to.
+    :type publish_address: str
+    :param subscribe_address: Address the subscriber connects or binds to.
+    :type subscribe_address: str
+    :param context: Optional asyncio ZMQ context.
+    :type context: Optional[zmq.asyncio.Context]
+    """
+
+    def __init__(
+        self,
+        publish_address: str,
+        subscribe_address: str,
+        context: Optional[zmq.asyncio.Context] = None
+    ):
+        self.publish_address = publish_address
+        self.subscribe_address = subscribe_address
+        self._context = context
+        self._publisher: Optional[AsyncZMQPublisher] = None
+        self._subscriber: Optional[AsyncZMQSubscriber] = None
+
+    async def connect(self) -> None:
+        """Create and connect the publisher and subscriber sockets."""
+        if self._publisher is not None:
+            return
+        self._publisher = AsyncZMQPublisher(self._context)
+        self._publisher.connect(self.publish_address)
+        self._subscriber = AsyncZMQSubscriber(self._context)
+        self._subscriber.connect(self.subscribe_address)
+        self._subscriber.start()
+
+    async def disconnect(self) -> None:
+        """Stop dispatching and close both sockets."""
+        if self._subscriber:
+            await self._subscriber.stop()
+            self._subscriber.close()
+            self._subscriber = None
+        if self._publisher:
+            self._publisher.close()
+            self._publisher = None
+
+    async def publish(self, topic: str, message: Union[str, bytes], **kwargs: Any) -> None:
+        """
+        Publish a message to a topic.
+
+        :param topic: The topic to publish to.
+        :type topic: str
+        :param message: The message content.
+        :type message: Union[str, bytes]
+        :raises ConnectionError: If not connected.
+        """
+        if not self._publisher:
+            raise ConnectionError("Not connected. Call connect() first.")
+        await self._publisher.publish(topic, message)
+
+    async def subscribe(self, topic: str, callback: MessageHandlerCallback, **kwargs: Any) -> None:
+        """
+        Subscribe to a topic.
+
+        :param topic: The topic to subscribe to.
+        :type topic: str
+        :param callback: Async callback invoked with the topic and raw message bytes.
+        :type callback: MessageHandlerCallback
+        :raises ConnectionError: If not connected.
+        """
+        if not self._subscriber:
+            raise ConnectionError("Not connected. Call connect() first.")
+        self._subscriber.subscribe(topic, callback)
+
+    async def unsubscribe(self, topic: str, **kwargs: Any) -> None:
+        """
+        Unsubscribe from a topic.
+
+        :param topic: The topic to unsubscribe from.
+        :type topic: str
+        """
+        if self._subscriber:
+            self._subscriber.unsubscribe(topic)
+
+
+class AsyncZMQClient(AsyncZMQBase):
+    """DEALER client with request pipelining and correlation IDs.
+
+    Any number of coroutines may call :meth:`send_request` concurrently over
+    one socket; each request carries a correlation ID and a background reader
+    resolves the matching future when its reply arrives.
+    """
+
+    socket_type = zmq.DEALER
+
+    def __init__(self, context: Optional[zmq.asyncio.Context] = None):
+        """Initialize the client.
+
+        Args:
+            context: Asyncio ZMQ context (defaults to the shared instance)
+        """
+        super().__init__(context)
+        self._pending: Dict[bytes, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._reader: Optional[asyncio.Task] = None
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of requests awaiting a reply."""
+        return len(self._pending)
+
+    async def send_request(
+        self,
+        request: Union[str, bytes, dict],
+        timeout: Optional[float] = None
+    ) -> bytes:
+        """Send a request and wait for its reply.
+
+        Args:
+            request: Request message
+            timeout: Timeout in seconds
+
+        Returns:
+            Response message
+
+        Raises:
+            asyncio.TimeoutError: If the reply does not arrive in time
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to an address")
+
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read_replies())
+
+        correlation_id = next(self._ids).to_bytes(8, 'big')
+        future = asyncio.get_running_loop().create_future()
+        self._pending[correlation_id] = future
+        try:
+            await self.socket.send_multipart([b"", correlation_id, _to_bytes(request)])
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(correlation_id, None)
+
+    async def send_request_string(self, request: str, timeout: Optional[float] = None) -> str:
+        """Send a string request and receive a string response.
+
+        Args:
+            request: Request string
+            timeout: Timeout in seconds
+
+        Returns:
+            Response string
+        """
+        response = await self.send_request(request, timeout)
+        return response.decode('utf-8')
+
+    async def send_request_json(
+        self,
+        request: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Send a JSON request and receive a JSON response.
+
+        Args:
+            request: Request dictionary
+            timeout: Timeout in seconds
+
+        Returns:
+            Response dictionary
+        """
+        response = await self.send_request(request, timeout)
+        return json.loads(response.decode('utf-8'))
+
+    async def _read_replies(self) -> None:
+        """Resolve pending requests as their replies arrive."""
+        while self._pending or self._connected:
+            try:
+                frames = await self.socket.recv_multipart()
+            except asyncio.CancelledError:
+                raise
+            except zmq.ZMQError as e:
+                if e.errno == zmq.ETERM or self.socket is None:
+                    break
+                logger.error(f"ZMQ error in client reader: {str(e)}")
+                continue
+
+            if len(frames) != 3:
+                logger.warning(f"Dropping malformed reply with {len(frames)} frames")
+                continue
+
+            future = self._pending.get(frames[1])
+            if future is not None and not future.done():
+                future.set_result(frames[2])
+
+    def close(self) -> None:
+        """Fail outstanding requests and close the socket."""
+        if self._reader and not self._reader.done():
+            self._reader.cancel()
+        self._reader = None
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Client closed"))
+        self._pending.clear()
+        super().close()
+
+
+class AsyncZMQServer(AsyncZMQBase):
+    """ROUTER server that handles many requests concurrently.
+
+    Each request runs in its own task, bounded by ``max_concurrency``, and
+    replies are routed back to the originating client by identity, so a slow
+    request no longer holds up the ones behind it.
+    """
+
+    socket_type = zmq.ROUTER
+
+    def __init__(
+        self,
+        max_concurrency: int = 100,
+        context: Optional[zmq.asyncio.Context] = None
+    ):
+        """Initialize the server.
+
+        Args:
+            max_concurrency: Maximum number of requests handled at once
+            context: Asyncio ZMQ context (defaults to the shared instance)
+        """
+        super().__init__(context)
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._handler: Optional[RequestHandler] = None
+        self._receiver: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        """Check if the server is accepting requests."""
+        return self._receiver is not None and not self._receiver.done()
+
+    async def start(self, handler: RequestHandler) -> None:
+        """Start serving requests.
+
+        Args:
+            handler: Async function taking the request bytes and returning a response
+        """
+        if not self._connected:
+            raise RuntimeError("Not connected to an address")
+        if self.running:
+            return
+
+        self._handler = handler
+        self._receiver = asyncio.create_task(self._receive_loop())
+
+    async def stop(self, timeout: float = 1.0) -> None:
+        """Stop accepting requests and wait for in-flight ones to finish.
+
+        Args:
+            timeout: Seconds to wait for in-flight requests
+        """
+        if self._receiver and not self._receiver.done():
+            self._receiver.cancel()
+            try:
+                await self._receiver
+            except asyncio.CancelledError:
+                pass
+        self._receiver = None
+
+        if self._inflight:
+            _, pending = await asyncio.wait(self._inflight, timeout=timeout)
+            for task in pending:
+                task.cancel()
+
+    async def _receive_loop(self) -> None:
+        """Accept requests and dispatch each to its own task."""
+        while True:
+            await self._semaphore.acquire()
+            try:
+                frames = await self.socket.recv_multipart()
+            except asyncio.CancelledError:
+                self._semaphore.release()
+                raise
+            except zmq.ZMQError as e:
+                self._semaphore.release()
+                if e.errno == zmq.ETERM:
+                    break
+                logger.error(f"ZMQ error in server: {str(e)}")
+                continue
+
+            task = asyncio.create_task(self._handle_request(frames))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _handle_request(self, frames: List[bytes]) -> None:
+        """Run the handler for one request and route the reply back.
+
+        Args:
+            frames: ``[identity, b"", payload]`` from REQ clients or
+                ``[identity, b"", correlation_id, payload]`` from AsyncZMQClient
+        """
+        try:
+            if len(frames) == 3:
+                envelope, payload = frames[:2], frames[2]
+            elif len(frames) == 4:
+                envelope, payload = frames[:3], frames[3]
+            else:
+                logger.warning(f"Dropping malformed request with {len(frames)} frames")
+                return
+
+            try:
+                response = await self._handler(payload)
+            except Exception as e:
+                logger.error(f"Handler error: {str(e)}")
+                response = {"error": str(e)}
+
+            if self.socket is not None:
+                await self.socket.send_multipart([*envelope, _to_bytes(response)])
+        finally:
+            self._semaphore.release()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit the async context manager."""
+        await self.stop()
+        self.close()
+
+
+# Define exports
+__all__ = [
+    'AsyncZMQBase',
+    'AsyncZMQPublisher',
+    'AsyncZMQSubscriber',
+    'AsyncZMQBackend',
+    'AsyncZMQClient',
+    'AsyncZMQServer'
+]
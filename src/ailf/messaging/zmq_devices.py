@@ -9,11 +9,16 @@ Key Components:
     DeviceManager: Factory for creating and managing ZMQ devices
     ThreadDevice: Device implementation running in a background thread
     ProcessDevice: Device implementation running in a separate process
+    ProxyDevice: Steerable device forwarding natively inside libzmq
+    CaptureCollector: Batched metrics collector fed by a proxy capture socket
 """
+import threading
+import time
+import uuid
 from contextlib import contextmanager
 from multiprocessing import Event, Process
 from threading import Thread
-from typing import Any, List, Optional, Sequence
+from typing import Any, List, Optional, Sequence, Tuple
 
 import zmq
 import zmq.auth
@@ -31,6 +36,14 @@ metrics = setup_monitoring(__name__)
 DEFAULT_LINGER = 0  # Default socket linger time in ms
 DEFAULT_POLL_TIMEOUT = 100  # Default poll timeout in ms
 DEFAULT_JOIN_TIMEOUT = 1.0  # Default thread/process join timeout in seconds
+DEFAULT_METRICS_FLUSH_INTERVAL = 1.0  # Default capture metrics flush interval in seconds
+
+# Socket types that let libzmq's proxy forward in both directions
+PROXY_SOCKET_TYPES = {
+    DeviceType.QUEUE: (zmq.ROUTER, zmq.DEALER),
+    DeviceType.FORWARDER: (zmq.XSUB, zmq.XPUB),
+    DeviceType.STREAMER: (zmq.PULL, zmq.PUSH),
+}
 
 
 class DeviceError(Exception):
@@ -61,20 +74,31 @@ class BaseDevice:
         """
         self.config = config
         self._context = context or zmq.Context.instance()
+        # Set by devices that create a private context, the only kind they terminate
+        self._owns_context = False
         self._frontend: Optional[zmq.Socket] = None
         self._backend: Optional[zmq.Socket] = None
+        self._monitor: Optional[zmq.Socket] = None
         self._running = False
         self._poller = zmq.Poller()
         self._should_stop = None
         self._auth: Optional[ThreadAuthenticator] = None
         
+    def _socket_types(self) -> Tuple[int, int]:
+        """Get the frontend and backend socket types for this device.
+
+        Returns:
+            Tuple of (frontend type, backend type)
+        """
+        device_type = DeviceType(self.config.device_type)
+        return device_type.frontend_type, device_type.backend_type
+
     def _setup_sockets(self) -> None:
         """Set up frontend and backend sockets with proper configuration."""
         # Create sockets
-        self._frontend = self._context.socket(
-            self.config.device_type.frontend_type)
-        self._backend = self._context.socket(
-            self.config.device_type.backend_type)
+        frontend_type, backend_type = self._socket_types()
+        self._frontend = self._context.socket(frontend_type)
+        self._backend = self._context.socket(backend_type)
 
         # Configure socket options
         for socket in (self._frontend, self._backend):
@@ -97,6 +121,19 @@ class BaseDevice:
             self._cleanup()
             raise DeviceError(f"Failed to bind sockets: {e}") from e
 
+        # Monitor socket receiving a copy of every forwarded message
+        if self.config.monitor_addr:
+            self._monitor = self._context.socket(self.config.monitor_type)
+            self._monitor.setsockopt(zmq.LINGER, DEFAULT_LINGER)
+            try:
+                if self.config.bind_monitor:
+                    self._monitor.bind(self.config.monitor_addr)
+                else:
+                    self._monitor.connect(self.config.monitor_addr)
+            except zmq.ZMQError as e:
+                self._cleanup()
+                raise DeviceError(f"Failed to set up monitor socket: {e}") from e
+
         # Set up monitoring
         self._poller.register(self._frontend, zmq.POLLIN)
         self._poller.register(self._backend, zmq.POLLIN)
@@ -140,15 +177,26 @@ class BaseDevice:
         if self._backend:
             self._backend.close()
             self._backend = None
+        if self._monitor:
+            self._monitor.close()
+            self._monitor = None
 
         # Clean up authentication if configured
         if hasattr(self, '_auth'):
             self._auth = None
 
         # Clean up context if we created it
-        if not self._context.closed and self._context is not zmq.Context.instance():
+        if self._owns_context and not self._context.closed:
             self._context.term()
 
+    def stop(self) -> None:
+        """Mark the device as stopped.
+
+        Subclasses signal their worker and release resources before or after
+        calling this method.
+        """
+        self._running = False
+
     def _forward_message(
         self,
         recv_socket: zmq.Socket,
@@ -191,12 +239,16 @@ class BaseDevice:
                 if events.get(self._frontend) == zmq.POLLIN:
                     message = self._frontend.recv_multipart()
                     self._backend.send_multipart(message)
+                    if self._monitor:
+                        self._monitor.send_multipart(message)
                     metrics.increment('messages_forwarded_frontend')
 
                 # Forward backend -> frontend
                 if events.get(self._backend) == zmq.POLLIN:
                     message = self._backend.recv_multipart()
                     self._frontend.send_multipart(message)
+                    if self._monitor:
+                        self._monitor.send_multipart(message)
                     metrics.increment('messages_forwarded_backend')
 
             except zmq.ZMQError as e:
@@ -245,7 +297,7 @@ class ThreadDevice(BaseDevice):
         
         self._thread = Thread(
             target=self._device_loop,
-            name=f"ZMQDevice-{self.config.device_type.name}",
+            name=f"ZMQDevice-{DeviceType(self.config.device_type).name}",
             daemon=True
         )
         self._thread.start()
@@ -303,7 +355,7 @@ class ProcessDevice(BaseDevice):
 
         self._process = Process(
             target=self._run_device_process,
-            name=f"DeviceProcess-{self.config.device_type.name}"
+            name=f"DeviceProcess-{DeviceType(self.config.device_type).name}"
         )
         self._process.start()
         self._running = True
@@ -339,6 +391,7 @@ class ProcessDevice(BaseDevice):
         """Main process function that sets up and runs the device loop."""
         try:
             self._context = zmq.Context()
+            self._owns_context = True
             self._poller = zmq.Poller()
             self._setup_sockets()
             self._device_loop()
@@ -358,6 +411,347 @@ class ProcessDevice(BaseDevice):
         self.stop()
 
 
+class CaptureCollector:
+    """Batched metrics collector fed by a proxy capture socket.
+
+    libzmq copies every forwarded frame to the proxy's capture socket. This
+    collector drains that socket in its own thread and publishes counts to
+    the metrics collector once per flush interval instead of once per
+    message, so metrics never sit on the forwarding path. Counts are best
+    effort: when the collector falls behind, the capture socket drops frames
+    instead of slowing the proxy down.
+    """
+
+    def __init__(
+        self,
+        context: zmq.Context,
+        address: str,
+        *,
+        flush_interval: float = DEFAULT_METRICS_FLUSH_INTERVAL,
+        metric_prefix: str = "proxy"
+    ):
+        """Initialize the collector.
+
+        Args:
+            context: ZMQ context shared with the proxy (required for inproc)
+            address: Address the proxy capture socket is bound to
+            flush_interval: Seconds between metrics flushes
+            metric_prefix: Prefix for the emitted metric names
+        """
+        self._context = context
+        self.address = address
+        self.flush_interval = flush_interval
+        self.metric_prefix = metric_prefix
+        self.messages = 0
+        self.bytes = 0
+        self._pending_messages = 0
+        self._pending_bytes = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[Thread] = None
+
+    def start(self) -> None:
+        """Start draining the capture socket in a background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        socket = self._context.socket(zmq.SUB)
+        socket.setsockopt(zmq.LINGER, DEFAULT_LINGER)
+        socket.setsockopt(zmq.SUBSCRIBE, b"")
+        socket.connect(self.address)
+        self._thread = Thread(
+            target=self._collect_loop,
+            args=(socket,),
+            name="ZMQCaptureCollector",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the collector and flush outstanding counts."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(DEFAULT_JOIN_TIMEOUT)
+            self._thread = None
+        self._flush()
+
+    def _collect_loop(self, socket: zmq.Socket) -> None:
+        """Drain the capture socket, counting frames in local batches.
+
+        Args:
+            socket: SUB socket connected to the capture address
+        """
+        poller = zmq.Poller()
+        poller.register(socket, zmq.POLLIN)
+        next_flush = time.monotonic() + self.flush_interval
+        try:
+            while not self._stop_event.is_set():
+                if poller.poll(DEFAULT_POLL_TIMEOUT):
+                    while True:
+                        try:
+                            frames = socket.recv_multipart(zmq.NOBLOCK, copy=False)
+                        except zmq.Again:
+                            break
+                        self._pending_messages += 1
+                        self._pending_bytes += sum(len(frame) for frame in frames)
+
+                if time.monotonic() >= next_flush:
+                    self._flush()
+                    next_flush = time.monotonic() + self.flush_interval
+        except zmq.ZMQError as e:
+            if e.errno != zmq.ETERM:
+                logger.error("Capture collector failed: %s", e)
+        finally:
+            socket.close()
+
+    def _flush(self) -> None:
+        """Publish the pending batch to the metrics collector."""
+        count, size = self._pending_messages, self._pending_bytes
+        if not count:
+            return
+        self._pending_messages = 0
+        self._pending_bytes = 0
+        self.messages += count
+        self.bytes += size
+        metrics.increment(f"{self.metric_prefix}_messages_forwarded", count)
+        metrics.increment(f"{self.metric_prefix}_bytes_forwarded", size)
+
+
+class ProxyDevice(BaseDevice):
+    """Steerable device that forwards messages natively inside libzmq.
+
+    Forwarding runs in ``zmq.proxy_steerable`` on a background thread, so no
+    Python code runs per message. Metrics are optional and collected out of
+    band from the proxy's capture socket by a :class:`CaptureCollector`.
+    When ``config.monitor_addr`` is set, the capture socket is the device's
+    monitor socket, so external monitors receive a copy of every forwarded
+    message too. The proxy is steered through its control socket.
+
+    Note:
+        libzmq 4.3.5 ignores the PAUSE command and stops forwarding for good
+        after RESUME, so :meth:`pause` and :meth:`resume` don't use them:
+        pausing terminates the proxy loop but keeps the sockets open, and
+        resuming runs a new loop on them.
+
+    QUEUE devices use ROUTER/DEALER and FORWARDER devices use XSUB/XPUB so
+    replies and subscriptions flow back through the proxy.
+    """
+
+    def __init__(
+        self,
+        config: DeviceConfig,
+        *,
+        context: Optional[zmq.Context] = None,
+        capture_metrics: bool = True,
+        metrics_flush_interval: float = DEFAULT_METRICS_FLUSH_INTERVAL
+    ):
+        """Initialize proxy device.
+
+        Args:
+            config: Device configuration
+            context: Optional ZMQ context
+            capture_metrics: Whether to count forwarded messages via a capture socket
+            metrics_flush_interval: Seconds between metrics flushes
+        """
+        super().__init__(config, context=context)
+        self.capture_metrics = capture_metrics
+        self.metrics_flush_interval = metrics_flush_interval
+        self._thread: Optional[Thread] = None
+        self._capture: Optional[zmq.Socket] = None
+        self._control: Optional[zmq.Socket] = None
+        self._control_client: Optional[zmq.Socket] = None
+        self._control_lock = threading.Lock()
+        self._collector: Optional[CaptureCollector] = None
+        self._paused = False
+
+    @property
+    def collector(self) -> Optional[CaptureCollector]:
+        """Get the capture metrics collector, if enabled."""
+        return self._collector
+
+    def _socket_types(self) -> Tuple[int, int]:
+        """Get the native proxy socket types for this device."""
+        return PROXY_SOCKET_TYPES[DeviceType(self.config.device_type)]
+
+    def _setup_sockets(self) -> None:
+        """Set up data, capture and control sockets for the proxy."""
+        super()._setup_sockets()
+
+        # libzmq's proxy drives its sockets itself; send/recv timeouts would
+        # make it abort on a slow peer instead of applying backpressure
+        for socket in (self._frontend, self._backend):
+            socket.setsockopt(zmq.RCVTIMEO, -1)
+            socket.setsockopt(zmq.SNDTIMEO, -1)
+
+        device_id = uuid.uuid4().hex
+        control_addr = f"inproc://ailf-proxy-control-{device_id}"
+        self._control = self._context.socket(zmq.PAIR)
+        self._control.setsockopt(zmq.LINGER, DEFAULT_LINGER)
+        self._control.bind(control_addr)
+        self._control_client = self._context.socket(zmq.PAIR)
+        self._control_client.setsockopt(zmq.LINGER, DEFAULT_LINGER)
+        self._control_client.connect(control_addr)
+
+        # The monitor socket doubles as the capture socket. PUB drops on
+        # high-water mark, so a slow collector or monitor never stalls forwarding
+        self._capture = self._monitor
+        if self.capture_metrics:
+            if self._capture is None:
+                self._capture = self._context.socket(zmq.PUB)
+                self._capture.setsockopt(zmq.LINGER, DEFAULT_LINGER)
+            capture_addr = f"inproc://ailf-proxy-capture-{device_id}"
+            self._capture.bind(capture_addr)
+            self._collector = CaptureCollector(
+                self._context,
+                capture_addr,
+                flush_interval=self.metrics_flush_interval,
+                metric_prefix=f"proxy_{DeviceType(self.config.device_type).name.lower()}"
+            )
+
+    def start(self) -> None:
+        """Start the proxy in a background thread."""
+        if self._thread and self._thread.is_alive():
+            logger.warning("Proxy device already running")
+            return
+
+        if self._paused:
+            logger.warning("Proxy device is paused, use resume()")
+            return
+
+        self._setup_sockets()
+        if self._collector:
+            self._collector.start()
+
+        self._start_thread()
+        self._running = True
+        metrics.increment("proxy_device_starts")
+
+    def _start_thread(self) -> None:
+        """Run the proxy loop in a new background thread."""
+        self._thread = Thread(
+            target=self._proxy_loop,
+            name=f"ZMQProxy-{DeviceType(self.config.device_type).name}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def _stop_thread(self) -> None:
+        """Terminate the proxy loop and wait for its thread."""
+        try:
+            self._send_command(b"TERMINATE")
+        except DeviceError as e:
+            logger.warning("Could not signal proxy termination: %s", e)
+
+        self._thread.join(DEFAULT_JOIN_TIMEOUT)
+        if self._thread.is_alive():
+            logger.warning("Proxy thread did not stop cleanly")
+            metrics.increment("proxy_device_timeout")
+        else:
+            metrics.increment("proxy_device_stops")
+        self._thread = None
+
+    def pause(self) -> None:
+        """Pause forwarding.
+
+        The sockets stay open, so messages queue up in them, up to their
+        high-water marks, until :meth:`resume`.
+
+        Raises:
+            DeviceError: If the proxy is not running
+        """
+        if self._paused:
+            return
+        if not self.is_alive():
+            raise DeviceError("Proxy device is not running")
+        self._stop_thread()
+        self._paused = True
+
+    def resume(self) -> None:
+        """Resume forwarding after a pause.
+
+        Raises:
+            DeviceError: If the proxy is not running
+        """
+        if not self._paused:
+            if not self.is_alive():
+                raise DeviceError("Proxy device is not running")
+            return
+        self._paused = False
+        self._start_thread()
+
+    def terminate(self) -> None:
+        """Terminate the proxy and release its resources."""
+        self.stop()
+
+    def stop(self) -> None:
+        """Stop the proxy thread and release its resources."""
+        if not self._thread and not self._paused:
+            return
+
+        if self._thread:
+            self._stop_thread()
+        self._paused = False
+
+        if self._collector:
+            self._collector.stop()
+        super().stop()
+        self._cleanup()
+
+    def is_alive(self) -> bool:
+        """Check if the proxy thread is running.
+
+        Returns:
+            bool: True if the proxy is forwarding or paused
+        """
+        return self._paused or bool(self._thread and self._thread.is_alive())
+
+    def _send_command(self, command: bytes) -> None:
+        """Send a steering command to the proxy.
+
+        Args:
+            command: A libzmq proxy command such as TERMINATE
+
+        Raises:
+            DeviceError: If the proxy is not running
+        """
+        if not self._control_client or not (self._thread and self._thread.is_alive()):
+            raise DeviceError("Proxy device is not running")
+        with self._control_lock:
+            self._control_client.send(command)
+
+    def _proxy_loop(self) -> None:
+        """Run the native proxy until it is terminated."""
+        try:
+            zmq.proxy_steerable(
+                self._frontend,
+                self._backend,
+                self._capture,
+                self._control
+            )
+        except zmq.ZMQError as e:
+            if e.errno != zmq.ETERM:
+                metrics.increment("device_errors")
+                logger.error("ZMQ error in proxy: %s", e)
+        logger.info("Proxy device terminated")
+
+    def _cleanup(self) -> None:
+        """Close capture and control sockets along with the data sockets."""
+        for name in ("_capture", "_control", "_control_client"):
+            socket = getattr(self, name)
+            if socket:
+                socket.close()
+                setattr(self, name, None)
+        super()._cleanup()
+
+    def __enter__(self) -> "ProxyDevice":
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.stop()
+
+
 class DeviceManager:
     """Manager for ZMQ devices."""
 
@@ -374,7 +768,8 @@ class DeviceManager:
         *,
         monitor: Optional[str] = None,
         auth_config: Optional[AuthConfig] = None,
-        use_process: bool = False
+        use_process: bool = False,
+        native: bool = False
     ) -> BaseDevice:
         """Create a new device with the specified configuration.
 
@@ -385,6 +780,7 @@ class DeviceManager:
             monitor: Optional monitor socket address
             auth_config: Optional authentication configuration
             use_process: Whether to use process-based device
+            native: Whether to forward inside libzmq with a ProxyDevice
 
         Returns:
             BaseDevice: Configured device instance
@@ -397,8 +793,11 @@ class DeviceManager:
             auth_config=auth_config
         )
 
-        device_class = ProcessDevice if use_process else ThreadDevice
-        device = device_class(config)
+        if native:
+            device = ProxyDevice(config, context=self._context)
+        else:
+            device_class = ProcessDevice if use_process else ThreadDevice
+            device = device_class(config)
         self._devices.append(device)
         return device
 
@@ -0,0 +1,284 @@
+"""Zero-copy Payload Transport for ZMQ.
+
+This module moves large payloads (documents, embedding blocks, NumPy arrays)
+over ZMQ sockets without serializing them into JSON or copying them on each
+hop.
+
+A payload message is a multipart message made of:
+
+1. A small JSON header frame holding the caller's metadata and a descriptor
+   (size, and dtype/shape for arrays) for every buffer.
+2. One raw frame per buffer, sent with ``copy=False`` straight from the
+   caller's memory.
+
+On receive, frames are read with ``copy=False`` and each buffer is exposed as
+a ``memoryview`` (or a NumPy array viewing it) over the frame's memory, so
+nothing is copied out of the socket.
+
+Buffer lifetime:
+    With ``copy=False`` libzmq keeps a reference to the sender's memory until
+    the message has actually left the process. :func:`send_payload` returns a
+    :class:`PayloadSendHandle` wrapping the ``zmq.MessageTracker``; the sender
+    must not modify the buffers until :attr:`PayloadSendHandle.done` is true
+    (or :meth:`PayloadSendHandle.wait` returns). The handle keeps the buffers
+    referenced until then. On the receiving side the :class:`PayloadMessage`
+    keeps its frames alive for as long as its buffers are in use.
+
+    Reusing the buffers is only safe with ``track=True``. A send with
+    ``track=False`` cannot tell when libzmq releases them, so the handle's
+    ``done`` and ``wait`` raise :class:`PayloadError` instead of guessing.
+
+Example:
+    >>> handle = publisher.publish_payload("embeddings", {"doc": "a"}, [vectors])
+    >>> handle.wait()  # safe to reuse `vectors` now
+    >>>
+    >>> topic, payload = subscriber.receive_payload()
+    >>> vectors = payload.buffers[0]  # NumPy array viewing the received frame
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import zmq
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Payloads smaller than this many bytes are copied; tracking costs more than copying
+ZERO_COPY_THRESHOLD = zmq.COPY_THRESHOLD
+
+PAYLOAD_FORMAT_VERSION = 1
+
+
+class PayloadError(Exception):
+    """Exception raised for malformed payload messages."""
+    pass
+
+
+@dataclass
+class PayloadMessage:
+    """A received payload message.
+
+    Attributes:
+        header: Metadata sent alongside the buffers
+        buffers: Zero-copy views of the buffer frames (memoryview or NumPy array)
+        frames: Underlying ZMQ frames; keep the message alive while using buffers
+    """
+    header: Dict[str, Any]
+    buffers: List[Any]
+    frames: List[zmq.Frame] = field(default_factory=list, repr=False)
+
+    @property
+    def nbytes(self) -> int:
+        """Get the total size of the buffers in bytes."""
+        return sum(len(frame) for frame in self.frames)
+
+
+class PayloadSendHandle:
+    """Tracks when the buffers of a zero-copy send may be reused.
+
+    The handle holds references to the sent buffers so they cannot be freed
+    while libzmq may still read from them.
+    """
+
+    def __init__(self, tracker: Optional[zmq.MessageTracker], buffers: Sequence[Any], tracked: bool = True):
+        """Initialize the handle.
+
+        Args:
+            tracker: Tracker returned by the send, or None if the buffers were copied
+            buffers: Buffers that were sent
+            tracked: False if the buffers were sent without copying or tracking
+        """
+        self.tracker = tracker
+        self.tracked = tracked
+        self._buffers: Optional[Sequence[Any]] = buffers
+
+    def _check_tracked(self) -> None:
+        if not self.tracked:
+            raise PayloadError("Sent with track=False; when libzmq releases the buffers is unknown")
+
+    @property
+    def done(self) -> bool:
+        """Check if libzmq has released the buffers.
+
+        Raises:
+            PayloadError: If the send was not tracked
+        """
+        self._check_tracked()
+        if self.tracker is None or self.tracker.done:
+            self._buffers = None
+            return True
+        return False
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until libzmq has released the buffers.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Raises:
+            zmq.NotDone: If the timeout expires first
+            PayloadError: If the send was not tracked
+        """
+        self._check_tracked()
+        if self.tracker is not None:
+            self.tracker.wait(timeout)
+        self._buffers = None
+
+    async def wait_async(self, poll_interval: float = 0.001) -> None:
+        """Wait without blocking the event loop until the buffers are released.
+
+        Args:
+            poll_interval: Seconds between checks
+
+        Raises:
+            PayloadError: If the send was not tracked
+        """
+        while not self.done:
+            await asyncio.sleep(poll_interval)
+
+
+def _describe(buffer: Any) -> Dict[str, Any]:
+    """Build the header descriptor for a buffer.
+
+    Args:
+        buffer: Object supporting the buffer protocol
+
+    Returns:
+        Descriptor with the buffer size and, for arrays, dtype and shape
+    """
+    if NUMPY_AVAILABLE and isinstance(buffer, np.ndarray):
+        return {"nbytes": buffer.nbytes, "dtype": buffer.dtype.str, "shape": list(buffer.shape)}
+    return {"nbytes": memoryview(buffer).nbytes}
+
+
+def _prepare_buffer(buffer: Any) -> Any:
+    """Make sure a buffer can be sent as a single contiguous frame.
+
+    Contiguous buffers are returned as-is. Non-contiguous arrays have to be
+    copied once into contiguous memory.
+
+    Args:
+        buffer: Object supporting the buffer protocol
+
+    Returns:
+        A contiguous buffer
+    """
+    if NUMPY_AVAILABLE and isinstance(buffer, np.ndarray):
+        return buffer if buffer.flags.c_contiguous else np.ascontiguousarray(buffer)
+    view = memoryview(buffer)
+    return buffer if view.c_contiguous else view.tobytes()
+
+
+def build_header(header: Optional[Dict[str, Any]], buffers: Sequence[Any]) -> bytes:
+    """Encode the header frame for a payload message.
+
+    Args:
+        header: Caller metadata (must be JSON serializable)
+        buffers: Buffers that follow the header
+
+    Returns:
+        Encoded header frame
+    """
+    return json.dumps({
+        "v": PAYLOAD_FORMAT_VERSION,
+        "header": header or {},
+        "buffers": [_describe(buffer) for buffer in buffers],
+    }).encode('utf-8')
+
+
+def send_payload(
+    socket: zmq.Socket,
+    header: Optional[Dict[str, Any]],
+    buffers: Sequence[Any],
+    prefix: Sequence[bytes] = (),
+    track: bool = True
+) -> PayloadSendHandle:
+    """Send a header and raw buffers as one multipart message without copying.
+
+    Payloads whose buffers total less than :data:`ZERO_COPY_THRESHOLD` bytes
+    are copied into the message instead, so the returned handle is already
+    done and the buffers may be reused immediately.
+
+    Args:
+        socket: Socket to send on
+        header: Caller metadata (must be JSON serializable)
+        buffers: Objects supporting the buffer protocol (bytes, memoryview, ndarray, ...)
+        prefix: Leading frames such as a topic or routing envelope
+        track: Whether to track when libzmq releases the buffers. Without
+            tracking, the buffers must not be reused at all
+
+    Returns:
+        Handle telling when the buffers may be reused
+    """
+    prepared = [_prepare_buffer(buffer) for buffer in buffers]
+    frames = [*prefix, build_header(header, prepared), *prepared]
+    if sum(memoryview(buffer).nbytes for buffer in prepared) < ZERO_COPY_THRESHOLD:
+        socket.send_multipart(frames, copy=True)
+        return PayloadSendHandle(None, ())
+    if not track:
+        socket.send_multipart(frames, copy=False)
+        return PayloadSendHandle(None, prepared, tracked=False)
+    tracker = socket.send_multipart(frames, copy=False, track=True)
+    return PayloadSendHandle(tracker, prepared)
+
+
+def parse_payload(frames: Sequence[zmq.Frame]) -> PayloadMessage:
+    """Reassemble a payload message from frames received with ``copy=False``.
+
+    Args:
+        frames: Header frame followed by buffer frames
+
+    Returns:
+        The payload with zero-copy views over the buffer frames
+
+    Raises:
+        PayloadError: If the frames do not form a payload message
+    """
+    if not frames:
+        raise PayloadError("Empty payload message")
+
+    try:
+        meta = json.loads(frames[0].bytes)
+        descriptors = meta["buffers"]
+        header = meta["header"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise PayloadError(f"Invalid payload header: {e}") from e
+
+    data_frames = list(frames[1:])
+    if len(descriptors) != len(data_frames):
+        raise PayloadError(
+            f"Header describes {len(descriptors)} buffers but {len(data_frames)} were received"
+        )
+
+    buffers: List[Any] = []
+    for descriptor, frame in zip(descriptors, data_frames):
+        view = frame.buffer
+        if view.nbytes != descriptor["nbytes"]:
+            raise PayloadError(
+                f"Buffer size mismatch: expected {descriptor['nbytes']}, got {view.nbytes}"
+            )
+        if "dtype" in descriptor and NUMPY_AVAILABLE:
+            array = np.frombuffer(view, dtype=np.dtype(descriptor["dtype"]))
+            buffers.append(array.reshape(descriptor["shape"]))
+        else:
+            buffers.append(view)
+
+    return PayloadMessage(header=header, buffers=buffers, frames=data_frames)
+
+
+__all__ = [
+    'NUMPY_AVAILABLE',
+    'ZERO_COPY_THRESHOLD',
+    'PayloadError',
+    'PayloadMessage',
+    'PayloadSendHandle',
+    'build_header',
+    'send_payload',
+    'parse_payload',
+]
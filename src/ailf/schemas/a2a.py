@@ -180,6 +180,14 @@ class Task(BaseModel):
         default_factory=list, 
         description="Messages in this task"
     )
+    archivedMessageCount: int = Field(
+        0, 
+        description="Number of earlier messages compacted out of messages; fetch them from the task's message history"
+    )
+    historySummary: Optional[str] = Field(
+        None, 
+        description="Summary of the compacted messages"
+    )
     inputModes: List[InputModes] = Field(
         default_factory=lambda: [InputModes.TEXT], 
         description="Input modes allowed for this task"
@@ -202,6 +210,27 @@ class Task(BaseModel):
     )
 
 
+class ListTasksResponse(BaseModel):
+    """A page of tasks, most recently updated first."""
+    tasks: List[Task] = Field(
+        default_factory=list, 
+        description="Tasks in this page"
+    )
+    nextCursor: Optional[str] = Field(
+        None, 
+        description="Cursor of the next page, or None on the last page"
+    )
+
+
+class ListMessagesResponse(BaseModel):
+    """A range of a task's message history, oldest first."""
+    messages: List[Message] = Field(
+        default_factory=list, 
+        description="Messages in this range"
+    )
+    total: int = Field(..., description="Number of messages in the whole history")
+
+
 class SendMessageRequest(BaseModel):
     """Request to send a message."""
     message: Message = Field(..., description="Message to send")
@@ -281,3 +281,20 @@ AnyACPMessage = Union[
     HeartbeatAckMessage
 ]
 
+
+# Payload model of each message type, for validating payloads on demand
+ACP_PAYLOAD_MODELS: Dict[ACPMessageType, type] = {
+    ACPMessageType.TASK_REQUEST: TaskRequestPayload,
+    ACPMessageType.TASK_RESULT: TaskResultPayload,
+    ACPMessageType.KNOWLEDGE_QUERY: KnowledgeQueryPayload,
+    ACPMessageType.KNOWLEDGE_RESPONSE: KnowledgeResponsePayload,
+    ACPMessageType.INFORMATION_SHARE: InformationSharePayload,
+    ACPMessageType.USER_INTERVENTION_REQUEST: UserInterventionRequestPayload,
+    ACPMessageType.UX_NEGOTIATION: UXNegotiationPayload,
+    ACPMessageType.STATUS_UPDATE: StatusUpdatePayload,
+    ACPMessageType.ERROR_MESSAGE: ErrorMessagePayload,
+    ACPMessageType.AGENT_REGISTRATION: AgentRegistrationPayload,
+    ACPMessageType.AGENT_DEREGISTRATION: AgentDeregistrationPayload,
+    ACPMessageType.HEARTBEAT: HeartbeatPayload,
+    ACPMessageType.HEARTBEAT_ACK: HeartbeatAckPayload,
+}
@@ -7,7 +7,7 @@ Key Components:
     RedisConfig: Configuration for Redis connections
 """
 
-from typing import Optional
+from typing import Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -26,6 +26,12 @@ class RedisConfig(BaseModel):
         socket_keepalive: Whether to enable TCP keepalive
         max_connections: Maximum number of connections in the connection pool
         decode_responses: Whether to decode byte responses to strings
+        auto_pipeline: Whether AsyncRedisClient batches concurrent commands into pipelines
+        auto_pipeline_window: Seconds to collect commands before sending a batch
+        auto_pipeline_max_batch: Send a batch as soon as it holds this many commands
+        client_cache: Whether reads are cached in process with server-pushed invalidation
+        client_cache_prefixes: Key prefixes to cache; empty caches every key
+        client_cache_max_entries: Maximum number of keys in the client-side cache
     """
     host: str = Field(default="localhost", description="Redis server hostname")
     port: int = Field(default=6379, description="Redis server port")
@@ -37,6 +43,12 @@ class RedisConfig(BaseModel):
     socket_keepalive: bool = Field(default=True, description="Whether to enable TCP keepalive")
     max_connections: int = Field(default=10, description="Maximum number of connections in the pool")
     decode_responses: bool = Field(default=True, description="Whether to decode byte responses to strings")
+    auto_pipeline: bool = Field(default=False, description="Whether to batch concurrent async commands into pipelines")
+    auto_pipeline_window: float = Field(default=0.0, ge=0, description="Seconds to collect commands before sending a batch; 0 sends one event-loop tick's commands")
+    auto_pipeline_max_batch: int = Field(default=1000, ge=1, description="Maximum number of commands in one batch")
+    client_cache: bool = Field(default=False, description="Whether to cache reads in process with RESP3 client tracking")
+    client_cache_prefixes: Tuple[str, ...] = Field(default=(), description="Key prefixes to cache; empty caches every key")
+    client_cache_max_entries: int = Field(default=10000, ge=1, description="Maximum number of keys in the client-side cache")
 
     model_config = {
         "frozen": True,
@@ -2,6 +2,7 @@
 
 This module contains schema definitions for the WebSocket messaging system.
 """
+import uuid
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
@@ -19,6 +20,21 @@ class MessageType(str, Enum):
     ERROR = "error"
 
 
+class MessageEncoding(str, Enum):
+    """Wire encodings a WebSocket peer can negotiate."""
+    
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+
+class MessageCompression(str, Enum):
+    """Payload compression schemes a WebSocket peer can negotiate."""
+    
+    NONE = "none"
+    DEFLATE = "deflate"
+    ZSTD = "zstd"
+
+
 class WebSocketMessage(BaseModel):
     """Base class for all WebSocket messages."""
     
@@ -39,6 +55,10 @@ class ConnectMessage(WebSocketMessage):
     client_id: Optional[str] = None
     auth_token: Optional[str] = None
     user_agent: Optional[str] = None
+    # Plain strings so offers of schemes this side does not know are
+    # ignored during negotiation instead of failing validation
+    encodings: List[str] = Field(default_factory=lambda: [MessageEncoding.JSON.value])
+    compressions: List[str] = Field(default_factory=lambda: [MessageCompression.NONE.value])
     
     
 class ConnectAckMessage(WebSocketMessage):
@@ -48,6 +68,9 @@ class ConnectAckMessage(WebSocketMessage):
     server_id: str
     client_id: str
     session_id: str
+    encoding: MessageEncoding = MessageEncoding.JSON
+    compression: MessageCompression = MessageCompression.NONE
+    compression_threshold: Optional[int] = None
     
 
 class DisconnectMessage(WebSocketMessage):
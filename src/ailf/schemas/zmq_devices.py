@@ -89,17 +89,17 @@ class DeviceConfig(BaseModel):
     @property
     def frontend_type(self) -> int:
         """Get frontend socket type."""
-        return self.device_type.frontend_type
+        return DeviceType(self.device_type).frontend_type
     
     @property
     def backend_type(self) -> int:
         """Get backend socket type."""
-        return self.device_type.backend_type
+        return DeviceType(self.device_type).backend_type
     
     @property
     def monitor_type(self) -> Optional[int]:
         """Get monitor socket type if monitor is configured."""
-        return self.device_type.monitor_type if self.monitor_addr else None
+        return DeviceType(self.device_type).monitor_type if self.monitor_addr else None
     
     model_config = {
         'validate_assignment': True,
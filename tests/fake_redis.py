@@ -0,0 +1,38 @@
+"""
+fakeredis-backed Redis pool registry shared by the test suites.
+"""
+
+from typing import Optional
+
+import fakeredis
+import fakeredis.aioredis
+
+from ailf.messaging.redis_pool import InstrumentedConnectionPool, RedisPoolRegistry
+
+
+class FakeRedisPoolRegistry(RedisPoolRegistry):
+    """Registry whose pools connect to an in-memory fakeredis server.
+
+    Background reaping and health checks are off unless asked for, since
+    fakeredis connections do not pass health checks after reconnecting.
+    """
+
+    def __init__(self, server: Optional[fakeredis.FakeServer] = None, **kwargs):
+        """Initialize the registry.
+
+        Args:
+            server: Server to connect to; registries given the same server share data.
+                Defaults to a new server.
+            **kwargs: Passed on to RedisPoolRegistry.
+        """
+        kwargs.setdefault("idle_timeout", None)
+        kwargs.setdefault("health_check_interval", 0)
+        super().__init__(**kwargs)
+        self.server = server or fakeredis.FakeServer()
+
+    def _create_pool(self, pool_class, kwargs):
+        if issubclass(pool_class, InstrumentedConnectionPool):
+            connection_class = fakeredis.FakeConnection
+        else:
+            connection_class = fakeredis.aioredis.FakeConnection
+        return pool_class(connection_class=connection_class, server=self.server, **kwargs)
@@ -0,0 +1,606 @@
+"""Benchmark suite for the messaging transports.
+
+This module runs the same workload over every messaging transport and
+reports messages/sec, p50/p99 one-way latency and process CPU time per
+message, across payload sizes and producer concurrency levels.
+
+Every run is offline:
+
+- ``in_process``: InProcessBackend
+- ``zmq_pubsub_inproc`` / ``zmq_pubsub_ipc``: AsyncZMQPublisher/AsyncZMQSubscriber
+- ``zmq_proxy_ipc``: a STREAMER ProxyDevice between asyncio PUSH/PULL sockets
+- ``zmq_blocking_pubsub_tcp``: ZMQPublisher/ZMQSubscriber on loopback, the
+  subscriber receiving in a thread
+- ``zmq_reqrep_tcp``: ZMQClient round trips to an echoing ZMQServer thread on
+  loopback; latency is the round trip
+- ``zmq_thread_device_ipc``: a STREAMER ThreadDevice, whose Python loop
+  forwards each message, between asyncio PUSH/PULL sockets
+- ``websocket_json`` / ``websocket_msgpack``: WebSocketClient to WebSocketServer on loopback
+- ``redis_streams``, ``redis_async_pubsub``, ``redis_pubsub``: RedisStreamsBackend,
+  AsyncRedisPubSub and RedisPubSub against the server at ``AILF_BENCH_REDIS_URL``
+  (default ``redis://localhost:6379/15``), or fakeredis when no server answers
+
+Each message carries its send time, so latency is measured from the publish
+call to the subscriber callback in the same process. CPU time includes every
+thread of the process, including brokers that run in it.
+
+Set ``AILF_BENCH_OUTPUT`` to a file path to write the results as JSON, for
+comparing releases. ``AILF_BENCH_MESSAGES`` overrides the message count.
+"""
+import asyncio
+import json
+import os
+import platform
+import socket
+import statistics
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, UTC
+from importlib import metadata
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import pytest
+import zmq
+import zmq.asyncio
+
+from ailf.messaging.in_process import InProcessBackend, InProcessBroker
+from ailf.messaging.zmq import ZMQClient, ZMQPublisher, ZMQServer, ZMQSubscriber
+from ailf.messaging.zmq_async import AsyncZMQPublisher, AsyncZMQSubscriber
+from ailf.messaging.zmq_devices import ProxyDevice, ThreadDevice
+from ailf.schemas.zmq_devices import DeviceConfig, DeviceType
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import fakeredis
+    import fakeredis.aioredis
+    FAKEREDIS_AVAILABLE = True
+except ImportError:
+    FAKEREDIS_AVAILABLE = False
+
+try:
+    import websockets  # noqa: F401
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+MESSAGE_COUNT = int(os.environ.get("AILF_BENCH_MESSAGES", "2000"))
+PAYLOAD_SIZES = [64, 1024, 16384]
+CONCURRENCY_LEVELS = [1, 8]
+DELIVERY_TIMEOUT = 30.0
+REDIS_URL = os.environ.get("AILF_BENCH_REDIS_URL", "redis://localhost:6379/15")
+OUTPUT_PATH = os.environ.get("AILF_BENCH_OUTPUT")
+
+Deliver = Callable[[Any], None]
+
+_results: List[Dict[str, Any]] = []
+
+
+def _free_port() -> int:
+    """Find a free TCP port on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _ipc_address() -> str:
+    """Build a unique ipc address."""
+    return f"ipc:///tmp/ailf-bench-{uuid.uuid4().hex[:8]}"
+
+
+def _stamped(size: int) -> str:
+    """Build a payload of `size` characters that starts with the send time.
+
+    Text payloads go through every transport unchanged, including the JSON
+    and UTF-8 decoding done by the Redis pub/sub classes.
+    """
+    stamp = f"{time.perf_counter():.9f}|"
+    return stamp + "x" * max(size - len(stamp), 0)
+
+
+def _sent_at(message: Any) -> float:
+    """Read the send time back from a delivered payload."""
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        message = bytes(message).decode("utf-8")
+    return float(message.split("|", 1)[0])
+
+
+# --- Transports --------------------------------------------------------------
+#
+# A transport starts a subscriber that calls `deliver` with each received
+# payload, sends payloads with `send`, and releases everything in `stop`.
+
+
+class InProcessTransport:
+    """InProcessBackend on a private broker."""
+
+    async def start(self, deliver: Deliver) -> None:
+        self.backend = InProcessBackend(broker=InProcessBroker())
+        await self.backend.connect()
+
+        async def on_message(topic, message):
+            deliver(message)
+
+        await self.backend.subscribe("bench", on_message)
+
+    async def send(self, payload: str) -> None:
+        await self.backend.publish("bench", payload)
+
+    async def stop(self) -> None:
+        await self.backend.disconnect()
+
+
+class ZMQPubSubTransport:
+    """AsyncZMQPublisher to AsyncZMQSubscriber over inproc or ipc."""
+
+    def __init__(self, transport: str):
+        self.transport = transport
+
+    async def start(self, deliver: Deliver) -> None:
+        self.context = zmq.asyncio.Context()
+        address = (
+            f"inproc://bench-{uuid.uuid4().hex[:8]}" if self.transport == "inproc"
+            else _ipc_address()
+        )
+        self.publisher = AsyncZMQPublisher(self.context)
+        self.subscriber = AsyncZMQSubscriber(self.context)
+        # PUB drops at the high-water mark; lift it so every message counts
+        self.publisher.socket.setsockopt(zmq.SNDHWM, 0)
+        self.subscriber.socket.setsockopt(zmq.RCVHWM, 0)
+        self.publisher.bind(address)
+        self.subscriber.connect(address)
+
+        async def on_message(topic, message):
+            deliver(message)
+
+        self.subscriber.subscribe("bench", on_message)
+        self.subscriber.start()
+        await asyncio.sleep(0.1)  # Let the subscription reach the publisher
+
+    async def send(self, payload: str) -> None:
+        await self.publisher.publish("bench", payload)
+
+    async def stop(self) -> None:
+        await self.subscriber.stop()
+        self.subscriber.close()
+        self.publisher.close()
+        self.context.term()
+
+
+class ZMQProxyTransport:
+    """Asyncio PUSH/PULL sockets through a STREAMER device over ipc.
+
+    Runs the native ProxyDevice by default, or the ThreadDevice whose Python
+    loop forwards each message.
+    """
+
+    def __init__(self, device_class: Any = ProxyDevice):
+        self.device_class = device_class
+
+    async def start(self, deliver: Deliver) -> None:
+        config = DeviceConfig(
+            device_type=DeviceType.STREAMER,
+            frontend_addr=_ipc_address(),
+            backend_addr=_ipc_address()
+        )
+        if self.device_class is ProxyDevice:
+            self.device = ProxyDevice(config, capture_metrics=False)
+        else:
+            self.device = self.device_class(config)
+        self.device.start()
+        self.context = zmq.asyncio.Context()
+        self.producer = self.context.socket(zmq.PUSH)
+        self.consumer = self.context.socket(zmq.PULL)
+        self.producer.connect(self.device.config.frontend_addr)
+        self.consumer.connect(self.device.config.backend_addr)
+
+        async def drain():
+            while True:
+                deliver(await self.consumer.recv())
+
+        self.task = asyncio.create_task(drain())
+
+    async def send(self, payload: str) -> None:
+        await self.producer.send(payload.encode("utf-8"))
+
+    async def stop(self) -> None:
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+        self.producer.close(0)
+        self.consumer.close(0)
+        self.context.term()
+        self.device.stop()
+
+
+class ZMQBlockingPubSubTransport:
+    """Blocking ZMQPublisher to ZMQSubscriber over loopback TCP.
+
+    The subscriber receives in a thread and hands messages to the event loop.
+    """
+
+    async def start(self, deliver: Deliver) -> None:
+        loop = asyncio.get_running_loop()
+        port = _free_port()
+        self.publisher = ZMQPublisher()
+        self.subscriber = ZMQSubscriber(["bench"])
+        self.publisher.socket.setsockopt(zmq.SNDHWM, 0)
+        self.subscriber.socket.setsockopt(zmq.RCVHWM, 0)
+        self.publisher.connect(f"tcp://*:{port}")  # Wildcard addresses bind
+        self.subscriber.connect(f"tcp://127.0.0.1:{port}")
+        self.running = True
+
+        def receive():
+            while self.running:
+                try:
+                    _, message = self.subscriber.receive(timeout=100)
+                except zmq.ZMQError:
+                    continue
+                loop.call_soon_threadsafe(deliver, message)
+
+        self.thread = threading.Thread(target=receive, daemon=True)
+        self.thread.start()
+        await asyncio.sleep(0.1)  # Let the subscription reach the publisher
+
+    async def send(self, payload: str) -> None:
+        self.publisher.publish("bench", payload)
+
+    async def stop(self) -> None:
+        self.running = False
+        self.thread.join(5)
+        self.subscriber.close()
+        self.publisher.close()
+
+
+class ZMQReqRepTransport:
+    """Blocking ZMQClient requests to a ZMQServer echoing them from a thread.
+
+    Each send is a full round trip, delivered when the reply arrives, so
+    producers are serialized on the client socket whatever the concurrency.
+    """
+
+    async def start(self, deliver: Deliver) -> None:
+        port = _free_port()
+        self.deliver = deliver
+        self.server = ZMQServer()
+        self.server.connect(f"tcp://*:{port}")  # Wildcard addresses bind
+        self.client = ZMQClient()
+        self.client.connect(f"tcp://127.0.0.1:{port}")
+        self.running = True
+
+        def serve():
+            while self.running:
+                try:
+                    request = self.server.receive(timeout=100)
+                except zmq.ZMQError:
+                    continue
+                self.server.send_response(request)
+
+        self.thread = threading.Thread(target=serve, daemon=True)
+        self.thread.start()
+
+    async def send(self, payload: str) -> None:
+        self.deliver(self.client.send_request(payload, timeout=5000))
+
+    async def stop(self) -> None:
+        self.running = False
+        self.thread.join(5)
+        self.client.close()
+        self.server.close()
+
+
+class WebSocketTransport:
+    """WebSocketClient sending to WebSocketServer over loopback."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+
+    async def start(self, deliver: Deliver) -> None:
+        from ailf.messaging.websocket_client import WebSocketClient
+        from ailf.messaging.websocket_server import WebSocketServer
+        from ailf.schemas.websockets import MessageCompression, MessageEncoding, StandardMessage
+
+        self.message_type = StandardMessage
+        self.server = WebSocketServer(host="127.0.0.1", port=_free_port(), ping_interval=None)
+
+        async def on_message(websocket, message):
+            deliver(message.payload["data"])
+
+        self.server.on_message = on_message
+        await self.server.start()
+        self.client = WebSocketClient(
+            f"ws://127.0.0.1:{self.server.port}",
+            auto_reconnect=False,
+            ping_interval=None,
+            encodings=[MessageEncoding(self.encoding)],
+            compressions=[MessageCompression.NONE]
+        )
+        await self.client.connect()
+
+    async def send(self, payload: str) -> None:
+        await self.client.send(self.message_type(payload={"data": payload}))
+
+    async def stop(self) -> None:
+        await self.client.disconnect()
+        await self.server.stop()
+
+
+def _redis_server() -> Optional[Tuple[str, Any]]:
+    """Pick the Redis server to benchmark against.
+
+    Returns:
+        ("redis", url) for a reachable server, ("fakeredis", FakeServer)
+        otherwise, or None if neither is available
+    """
+    if REDIS_AVAILABLE:
+        client = redis.Redis.from_url(REDIS_URL, socket_connect_timeout=0.5)
+        try:
+            client.ping()
+            return "redis", REDIS_URL
+        except redis.RedisError:
+            pass
+        finally:
+            client.close()
+    if FAKEREDIS_AVAILABLE:
+        return "fakeredis", fakeredis.FakeServer()
+    return None
+
+
+def _fakeredis_registry(server: Any):
+    """Build a pool registry whose connections go to a fakeredis server."""
+    from tests.fake_redis import FakeRedisPoolRegistry
+
+    return FakeRedisPoolRegistry(server)
+
+
+class RedisTransport:
+    """Base class for transports that talk to Redis or fakeredis."""
+
+    def __init__(self, server: Tuple[str, Any]):
+        from ailf.messaging.redis_pool import RedisPoolRegistry
+
+        self.kind, self.target = server
+        if self.kind == "fakeredis":
+            self.pool_registry = _fakeredis_registry(self.target)
+        else:
+            self.pool_registry = RedisPoolRegistry()
+
+    def _config(self):
+        """Build a RedisConfig for the benchmark server."""
+        from ailf.messaging.redis import RedisConfig
+
+        if self.kind == "fakeredis":
+            return RedisConfig()
+        url = urlparse(self.target)
+        return RedisConfig(
+            host=url.hostname or "localhost",
+            port=url.port or 6379,
+            db=int(url.path.lstrip("/") or 0),
+            password=url.password
+        )
+
+    @property
+    def url(self) -> str:
+        return self.target if self.kind == "redis" else "redis://fakeredis"
+
+    async def stop(self) -> None:
+        await self.pool_registry.aclose()
+        self.pool_registry.close()
+
+
+class RedisStreamsTransport(RedisTransport):
+    """RedisStreamsBackend publish and consumer-group subscribe."""
+
+    async def start(self, deliver: Deliver) -> None:
+        from ailf.messaging.redis_streams import RedisStreamsBackend
+
+        self.stream = f"ailf-bench-{uuid.uuid4().hex[:8]}"
+        self.backend = RedisStreamsBackend(
+            self.url, default_block_ms=100, default_count=100, pool_registry=self.pool_registry
+        )
+        await self.backend.connect()
+
+        async def on_message(topic, message):
+            deliver(message)
+
+        await self.backend.subscribe(self.stream, on_message)
+
+    async def send(self, payload: str) -> None:
+        await self.backend.publish(self.stream, payload)
+
+    async def stop(self) -> None:
+        await self.backend.unsubscribe(self.stream)
+        await self.backend._redis_client.delete(self.stream)
+        await self.backend.disconnect()
+        await super().stop()
+
+
+class RedisAsyncPubSubTransport(RedisTransport):
+    """AsyncRedisPubSub on one AsyncRedisClient."""
+
+    async def start(self, deliver: Deliver) -> None:
+        from ailf.messaging.async_redis import AsyncRedisPubSub
+        from ailf.messaging.redis import AsyncRedisClient
+
+        self.channel = f"ailf-bench-{uuid.uuid4().hex[:8]}"
+        self.pubsub = AsyncRedisPubSub(AsyncRedisClient(self._config(), pool_registry=self.pool_registry))
+
+        async def on_message(channel, message):
+            deliver(message)
+
+        await self.pubsub.subscribe(self.channel, on_message)
+
+    async def send(self, payload: str) -> None:
+        await self.pubsub.publish(self.channel, payload)
+
+    async def stop(self) -> None:
+        await self.pubsub.close()
+        await self.pubsub.client.close()
+        await super().stop()
+
+
+class RedisPubSubTransport(RedisTransport):
+    """Blocking RedisPubSub with its listener thread."""
+
+    async def start(self, deliver: Deliver) -> None:
+        from ailf.messaging.redis import RedisClient, RedisPubSub
+
+        loop = asyncio.get_running_loop()
+        self.channel = f"ailf-bench-{uuid.uuid4().hex[:8]}"
+        self.client = RedisClient(self._config(), pool_registry=self.pool_registry)
+        self.pubsub = RedisPubSub(self.client)
+        self.pubsub.subscribe(self.channel, lambda message: loop.call_soon_threadsafe(deliver, message))
+        self.thread = self.pubsub.run_in_thread()
+
+    async def send(self, payload: str) -> None:
+        self.pubsub.publish(self.channel, payload)
+
+    async def stop(self) -> None:
+        self.pubsub.stop()
+        self.thread.join(5)
+        self.client.close()
+        await super().stop()
+
+
+def _transports() -> Dict[str, Callable[[], Any]]:
+    """Map transport names to factories; unavailable transports are None."""
+    redis_server = _redis_server()
+
+    def needs_redis(factory):
+        return (lambda: factory(redis_server)) if redis_server else None
+
+    transports: Dict[str, Optional[Callable[[], Any]]] = {
+        "in_process": InProcessTransport,
+        "zmq_pubsub_inproc": lambda: ZMQPubSubTransport("inproc"),
+        "zmq_pubsub_ipc": None if sys.platform == "win32" else lambda: ZMQPubSubTransport("ipc"),
+        "zmq_proxy_ipc": None if sys.platform == "win32" else ZMQProxyTransport,
+        "zmq_blocking_pubsub_tcp": ZMQBlockingPubSubTransport,
+        "zmq_reqrep_tcp": ZMQReqRepTransport,
+        "zmq_thread_device_ipc": None if sys.platform == "win32" else lambda: ZMQProxyTransport(ThreadDevice),
+        "websocket_json": (lambda: WebSocketTransport("json")) if WEBSOCKETS_AVAILABLE else None,
+        "websocket_msgpack": (lambda: WebSocketTransport("msgpack")) if WEBSOCKETS_AVAILABLE else None,
+        "redis_streams": needs_redis(RedisStreamsTransport),
+        "redis_async_pubsub": needs_redis(RedisAsyncPubSubTransport),
+        "redis_pubsub": needs_redis(RedisPubSubTransport),
+    }
+    return transports
+
+
+TRANSPORTS = _transports()
+
+
+# --- Harness -----------------------------------------------------------------
+
+
+async def _run(transport: Any, size: int, concurrency: int, count: int) -> Dict[str, Any]:
+    """Send `count` messages through a transport and measure their delivery."""
+    latencies: List[float] = []
+    done = asyncio.Event()
+
+    def deliver(message: Any) -> None:
+        latencies.append(time.perf_counter() - _sent_at(message))
+        if len(latencies) >= count:
+            done.set()
+
+    async def produce(messages: int) -> None:
+        for _ in range(messages):
+            await transport.send(_stamped(size))
+
+    await transport.start(deliver)
+    shares = [count // concurrency + (i < count % concurrency) for i in range(concurrency)]
+    try:
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        await asyncio.gather(*(produce(share) for share in shares))
+        try:
+            await asyncio.wait_for(done.wait(), DELIVERY_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        elapsed = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+    finally:
+        await transport.stop()
+
+    delivered = len(latencies)
+    ordered = sorted(latencies)
+    return {
+        "payload_bytes": size,
+        "concurrency": concurrency,
+        "sent": count,
+        "delivered": delivered,
+        "messages_per_sec": delivered / elapsed if elapsed else 0.0,
+        "p50_us": statistics.median(ordered) * 1e6 if ordered else None,
+        "p99_us": ordered[max(int(delivered * 0.99) - 1, 0)] * 1e6 if ordered else None,
+        "cpu_us_per_message": cpu / delivered * 1e6 if delivered else None,
+    }
+
+
+def _write_results() -> None:
+    """Write collected results to AILF_BENCH_OUTPUT as JSON."""
+    try:
+        version = metadata.version("ailf")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    report = {
+        "suite": "messaging",
+        "version": version,
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "message_count": MESSAGE_COUNT,
+        "results": _results,
+    }
+    with open(OUTPUT_PATH, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def report():
+    """Print a summary table and write machine-readable results at the end."""
+    yield
+    if not _results:
+        return
+
+    print("\nMessaging Benchmarks:")
+    print(
+        f"{'Transport': <24} {'Bytes': <7} {'Conc': <5} {'Msgs/s': <10} "
+        f"{'p50 (us)': <10} {'p99 (us)': <10} {'CPU us/msg': <10}"
+    )
+    print("-" * 82)
+    for row in _results:
+        print(
+            f"{row['transport']: <24} {row['payload_bytes']: <7} {row['concurrency']: <5} "
+            f"{row['messages_per_sec']: <10.0f} {row['p50_us'] or 0: <10.1f} "
+            f"{row['p99_us'] or 0: <10.1f} {row['cpu_us_per_message'] or 0: <10.1f}"
+        )
+    if OUTPUT_PATH:
+        _write_results()
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+class TestMessagingBenchmarks:
+    """Throughput, latency and CPU per message for every transport."""
+
+    @pytest.mark.parametrize("transport", list(TRANSPORTS))
+    def test_transport(self, transport):
+        """Measure a transport across payload sizes and concurrency levels."""
+        factory = TRANSPORTS[transport]
+        if factory is None:
+            pytest.skip(f"{transport} is not available here")
+
+        for size in PAYLOAD_SIZES:
+            for concurrency in CONCURRENCY_LEVELS:
+                result = asyncio.run(_run(factory(), size, concurrency, MESSAGE_COUNT))
+                _results.append({"transport": transport, **result})
+
+                assert result["delivered"] == MESSAGE_COUNT, (
+                    f"{transport} delivered {result['delivered']} of {MESSAGE_COUNT} messages"
+                )
@@ -0,0 +1,145 @@
+"""Benchmark tests for blocking and asyncio ZMQ request-reply.
+
+This module compares request latency and throughput of the blocking REQ/REP
+pair (ZMQClient/ZMQServer) with the asyncio ROUTER/DEALER pair
+(AsyncZMQClient/AsyncZMQServer) when the handler has I/O latency.
+"""
+import asyncio
+import socket
+import statistics
+import threading
+import time
+from typing import Dict, List
+
+import pytest
+
+from ailf.messaging.zmq import ZMQClient, ZMQServer
+from ailf.messaging.zmq_async import AsyncZMQClient, AsyncZMQServer
+
+REQUEST_COUNT = 200
+HANDLER_LATENCY = 0.005  # Simulated I/O latency per request in seconds
+CONCURRENCY_LEVELS = [1, 8, 32]
+
+
+def _free_port() -> int:
+    """Find a free TCP port on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """Summarize per-request latencies in milliseconds."""
+    ordered = sorted(latencies)
+    return {
+        "p50": statistics.median(ordered) * 1000,
+        "p99": ordered[int(len(ordered) * 0.99) - 1] * 1000,
+        "throughput": len(ordered) / elapsed,
+    }
+
+
+def _bench_req_rep(concurrency: int) -> Dict[str, float]:
+    """Run REQUEST_COUNT requests against the blocking REQ/REP server."""
+    port = _free_port()
+    server = ZMQServer()
+    server.connect(f"tcp://*:{port}")
+
+    def handler(request: bytes) -> bytes:
+        time.sleep(HANDLER_LATENCY)
+        return request
+
+    server.start(handler)
+    latencies: List[float] = []
+    lock = threading.Lock()
+
+    def worker(count: int) -> None:
+        client = ZMQClient()
+        client.connect(f"tcp://127.0.0.1:{port}")
+        for _ in range(count):
+            start = time.perf_counter()
+            client.send_request(b"ping", timeout=5000)
+            with lock:
+                latencies.append(time.perf_counter() - start)
+        client.close()
+
+    threads = [
+        threading.Thread(target=worker, args=(REQUEST_COUNT // concurrency,))
+        for _ in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    server.stop()
+    server.close()
+    return _summarize(latencies, elapsed)
+
+
+async def _bench_router_dealer(concurrency: int) -> Dict[str, float]:
+    """Run REQUEST_COUNT requests against the asyncio ROUTER/DEALER server."""
+    port = _free_port()
+
+    async def handler(request: bytes) -> bytes:
+        await asyncio.sleep(HANDLER_LATENCY)
+        return request
+
+    server = AsyncZMQServer(max_concurrency=max(concurrency, 1))
+    server.bind(f"tcp://127.0.0.1:{port}")
+    await server.start(handler)
+
+    client = AsyncZMQClient()
+    client.connect(f"tcp://127.0.0.1:{port}")
+    latencies: List[float] = []
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            start = time.perf_counter()
+            await client.send_request(b"ping", timeout=5.0)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(REQUEST_COUNT // concurrency) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    client.close()
+    await server.stop()
+    server.close()
+    return _summarize(latencies, elapsed)
+
+
+@pytest.mark.benchmark
+class TestZMQRequestReplyBenchmarks:
+    """Latency benchmarks for REQ/REP and ROUTER/DEALER request-reply."""
+
+    @pytest.mark.slow
+    def test_req_rep_vs_router_dealer(self):
+        """Compare p50/p99 latency and throughput across concurrency levels."""
+        results = {}
+        for concurrency in CONCURRENCY_LEVELS:
+            results[("REQ/REP", concurrency)] = _bench_req_rep(concurrency)
+            results[("ROUTER/DEALER", concurrency)] = asyncio.run(
+                _bench_router_dealer(concurrency)
+            )
+
+        print("\nZMQ Request-Reply Latency:")
+        print(
+            f"{'Pattern': <15} {'Concurrency': <12} {'p50 (ms)': <10} "
+            f"{'p99 (ms)': <10} {'Requests/s': <10}"
+        )
+        print("-" * 60)
+        for (pattern, concurrency), stats in results.items():
+            print(
+                f"{pattern: <15} {concurrency: <12} {stats['p50']: <10.2f} "
+                f"{stats['p99']: <10.2f} {stats['throughput']: <10.0f}"
+            )
+
+        # The blocking server handles one request at a time, so concurrent
+        # callers queue behind each other; the ROUTER server overlaps them.
+        top = CONCURRENCY_LEVELS[-1]
+        assert (
+            results[("ROUTER/DEALER", top)]["throughput"]
+            > results[("REQ/REP", top)]["throughput"]
+        )
@@ -0,0 +1,179 @@
+"""Tests for A2A server admission control."""
+import asyncio
+
+import httpx
+import pytest
+
+from ailf.communication.a2a_admission import A2AOverloadedError, AdmissionController
+from ailf.communication.a2a_server import A2AAgentExecutor, AILFASA2AServer, TaskStore
+from ailf.schemas.a2a import Task, TaskState
+from ailf.schemas.agent import AgentDescription
+
+
+async def _waiting(controller, tenant=None):
+    """Start acquiring a slot and let the request reach the queue."""
+    acquiring = asyncio.ensure_future(controller.acquire(tenant))
+    await asyncio.sleep(0)
+    return acquiring
+
+
+class TestAdmissionController:
+    """Test AdmissionController."""
+
+    @pytest.mark.asyncio
+    async def test_waiting_requests_are_admitted_in_order(self):
+        """Test that requests over the limit wait and get freed slots first come, first served."""
+        controller = AdmissionController(max_concurrency=2)
+        held = [await controller.acquire(), await controller.acquire()]
+        first, second = await _waiting(controller), await _waiting(controller)
+
+        assert controller.get_stats()["queue_depth"] == 2
+        controller.release(held[0])
+        # Releasing a ticket twice frees one slot
+        controller.release(held[0])
+        await asyncio.sleep(0)
+
+        assert first.done() and not second.done()
+        assert controller.active == 2
+        controller.release(held[1])
+        assert (await second).queue_delay > 0
+        stats = controller.get_stats()
+        assert stats["admitted"] == 4
+        assert stats["queued"] == 2
+
+    @pytest.mark.asyncio
+    async def test_tenant_limits(self):
+        """Test that a busy tenant waits while others are admitted, and is rejected with 429 past its queue limit."""
+        controller = AdmissionController(max_concurrency=4, max_concurrency_per_tenant=1, max_queued_per_tenant=1)
+        held = await controller.acquire("a")
+        waiting = await _waiting(controller, "a")
+
+        other = await asyncio.wait_for(controller.acquire("b"), 0.1)
+        with pytest.raises(A2AOverloadedError) as rejected:
+            await controller.acquire("a")
+
+        assert rejected.value.status_code == 429
+        assert rejected.value.reason == "tenant_limit"
+        assert controller.get_stats()["tenants_active"] == {"a": 1, "b": 1}
+        controller.release(other)
+        assert not waiting.done()
+        controller.release(held)
+        assert (await waiting).tenant == "a"
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_with_retry_after(self):
+        """Test that a request arriving at a full queue is rejected at once with 503."""
+        controller = AdmissionController(max_concurrency=1, max_queue_size=1)
+        await controller.acquire()
+        await _waiting(controller)
+
+        with pytest.raises(A2AOverloadedError) as rejected:
+            await controller.acquire()
+
+        assert rejected.value.status_code == 503
+        assert rejected.value.reason == "queue_full"
+        assert rejected.value.retry_after >= 1
+        assert controller.get_stats()["rejected_queue_full"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sheds_when_waits_stay_above_target(self):
+        """Test that requests are shed once waits stay above the target for an interval."""
+        controller = AdmissionController(max_concurrency=1, target_queue_delay=0.001, queue_delay_interval=0.02)
+        held = await controller.acquire()
+        waiting = [await _waiting(controller) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        controller.release(held)
+        held = await waiting[0]
+        await asyncio.sleep(0.03)
+        controller.release(held)
+
+        with pytest.raises(A2AOverloadedError) as shed:
+            await waiting[1]
+        assert shed.value.reason == "shed"
+        assert (await waiting[2]).queue_delay > 0.001
+        assert controller.get_stats()["shed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_waiting_requests_time_out_or_cancel(self):
+        """Test that waiting requests give up after max_queue_delay and leave the queue when cancelled."""
+        controller = AdmissionController(max_concurrency=1, max_queue_delay=0.01)
+        held = await controller.acquire()
+        cancelled = await _waiting(controller)
+        cancelled.cancel()
+
+        with pytest.raises(A2AOverloadedError) as timed_out:
+            await controller.acquire()
+
+        assert timed_out.value.reason == "timeout"
+        assert controller.get_stats()["queue_depth"] == 0
+        controller.release(held)
+        assert controller.active == 0
+
+
+class BlockingExecutor(A2AAgentExecutor):
+    """Executor that completes tasks once released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    async def execute(self, context):
+        await self.release.wait()
+        context.task.state = TaskState.COMPLETED
+        return context.task
+
+
+@pytest.mark.asyncio
+async def test_server_rejects_when_overloaded():
+    """Test that the server answers 503 with Retry-After while the execution slot is taken."""
+    executor = BlockingExecutor()
+    server = AILFASA2AServer(
+        AgentDescription(agent_name="agent", agent_type="test", description="Test agent",
+                         supports_a2a=True, communication_endpoints=[]),
+        executor,
+        admission=AdmissionController(max_concurrency=1, max_queue_size=0),
+    )
+    transport = httpx.ASGITransport(app=server.create_app())
+    message = {"message": {"role": "user", "parts": [{"type": "text", "content": "hi"}]}}
+    async with httpx.AsyncClient(transport=transport, base_url="http://agent") as client:
+        task_id = (await client.post("/tasks")).json()["task"]["id"]
+        first = asyncio.ensure_future(client.post(f"/tasks/{task_id}/messages", json=message))
+        while server.admission.active == 0:
+            await asyncio.sleep(0.001)
+
+        rejected = await client.post(f"/tasks/{task_id}/messages", json=message, headers={"X-Tenant-ID": "a"})
+        executor.release.set()
+        completed = await first
+
+    assert rejected.status_code == 503
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert completed.json()["task"]["state"] == "completed"
+    assert server.admission.active == 0
+
+
+class FailingTaskStore(TaskStore):
+    """Task store whose appends fail with a storage error."""
+
+    async def append_messages(self, task_id, messages, state=None):
+        raise RuntimeError("database is locked")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["messages", "messages:stream"])
+async def test_store_errors_release_the_slot(path):
+    """Test that a storage error before execution gives the execution slot back."""
+    server = AILFASA2AServer(
+        AgentDescription(agent_name="agent", agent_type="test", description="Test agent",
+                         supports_a2a=True, communication_endpoints=[]),
+        BlockingExecutor(),
+        task_store=FailingTaskStore(),
+        admission=AdmissionController(max_concurrency=1, max_queue_size=0),
+    )
+    transport = httpx.ASGITransport(app=server.create_app(), raise_app_exceptions=False)
+    message = {"message": {"role": "user", "parts": [{"type": "text", "content": "hi"}]}}
+    async with httpx.AsyncClient(transport=transport, base_url="http://agent") as client:
+        task_id = (await client.post("/tasks")).json()["task"]["id"]
+        responses = [await client.post(f"/tasks/{task_id}/{path}", json=message) for _ in range(2)]
+
+    assert [response.status_code for response in responses] == [500, 500]
+    assert server.admission.active == 0
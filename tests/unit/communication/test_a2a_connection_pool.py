@@ -0,0 +1,149 @@
+"""Tests for pooled A2A client connections.
+
+Requests are served by an in-process ``httpx.MockTransport``, which records
+which pooled HTTP client sent each request.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from ailf.communication.a2a_client import A2AClient, A2AConnectionPool
+from ailf.communication.a2a_orchestration import A2AOrchestrator, OrchestrationConfig
+from ailf.communication.a2a_registry import A2ARegistryManager, RegistryEntry
+from ailf.schemas.a2a import Message, MessagePart
+
+
+def _task(task_id="task-1"):
+    return {"task": {"id": task_id, "state": "completed", "messages": []}}
+
+
+class RecordingConnectionPool(A2AConnectionPool):
+    """Pool whose clients answer every request with a completed task."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.created = []
+        self.requests = []
+
+    def _create_client(self):
+        client = None
+
+        def handler(request):
+            self.requests.append((client, request))
+            return httpx.Response(200, json=_task())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.created.append(client)
+        return client
+
+
+@pytest.fixture
+def pool():
+    """Provide a pool backed by a mock transport."""
+    return RecordingConnectionPool()
+
+
+def _entry(agent_id, url):
+    return RegistryEntry(
+        id=agent_id,
+        name=agent_id,
+        description="Test agent",
+        url=url,
+        provider={"name": "Test", "url": "http://example.com"},
+    )
+
+
+class TestA2AConnectionPool:
+    """Test A2AConnectionPool and its use by A2AClient."""
+
+    @pytest.mark.asyncio
+    async def test_requests_reuse_one_client(self, pool):
+        """Test that every request of a client goes through the same pooled HTTP client."""
+        client = A2AClient("http://agents.local/a", connection_pool=pool)
+        message = Message(role="user", parts=[MessagePart(type="text", content="hi")])
+
+        task = await client.create_task()
+        await client.send_message(task.id, message)
+        await client.get_task(task.id)
+
+        assert len(pool.created) == 1
+        assert {sent_by for sent_by, _ in pool.requests} == {pool.created[0]}
+        assert str(pool.requests[1][1].url) == "http://agents.local/a/tasks/task-1/messages"
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_clients_are_shared_per_origin(self, pool):
+        """Test that agents on one host share a client and other hosts get their own."""
+        assert pool.get("http://agents.local/a") is pool.get("http://agents.local:80/b")
+        assert pool.get("http://agents.local/a") is not pool.get("http://other.local/a")
+        assert pool.get("http://agents.local/a") is not pool.get("https://agents.local/a")
+
+        await pool.aclose()
+
+        assert all(client.is_closed for client in pool.created)
+        assert not pool.get("http://agents.local/a").is_closed
+        await pool.aclose()
+
+    def test_limits(self):
+        """Test that the pool settings become httpx connection limits."""
+        pool = A2AConnectionPool(max_connections_per_host=4, max_keepalive_connections=2, keepalive_expiry=10)
+
+        limits = pool._create_client()._transport._pool
+
+        assert limits._max_connections == 4
+        assert limits._max_keepalive_connections == 2
+        assert limits._keepalive_expiry == 10
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_only_an_owned_pool(self, pool):
+        """Test that a client closes its private pool but leaves a shared one open."""
+        async with A2AClient("http://agents.local/a") as owner:
+            http_client = owner.connection_pool.get(owner.base_url)
+        assert http_client.is_closed
+
+        async with A2AClient("http://agents.local/a", connection_pool=pool) as sharer:
+            await sharer.create_task()
+        assert not pool.created[0].is_closed
+        await pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_registry_manager_and_orchestrator_share_connections(self, pool):
+        """Test that clients handed out by the registry manager and orchestrator share a pool."""
+        manager = A2ARegistryManager(connection_pool=pool)
+        manager.local_registry.register_agent(_entry("agent1", "http://agents.local/agent1"))
+        manager.local_registry.register_agent(_entry("agent2", "http://agents.local/agent2"))
+        manager.get_agent = manager.discover_agent
+        orchestrator = A2AOrchestrator(
+            OrchestrationConfig(routes=[], entry_points=["agent1"]),
+            registry_manager=manager,
+            connection_pool=pool,
+        )
+
+        await (await manager.get_client_for_agent("agent2")).create_task()
+        await orchestrator.create_task("agent1")
+
+        assert len(pool.created) == 1
+        assert len(pool.requests) == 2
+        await pool.aclose()
+
+    def test_closed_loops_are_dropped(self, pool):
+        """Test that the clients of finished event loops do not accumulate."""
+        async def create_task():
+            return await A2AClient("http://agents.local/a", connection_pool=pool).create_task()
+
+        for _ in range(5):
+            asyncio.run(create_task())
+            assert len(pool._clients) == 1
+
+        assert len(pool.created) == 5
+        pool.get("http://agents.local/a")
+        assert len(pool._clients) == 1
+        assert len(pool.created) == 6
+
+    def test_default_pool_is_shared(self):
+        """Test that the registry manager and orchestrator default to the process-wide pool."""
+        orchestrator = A2AOrchestrator(OrchestrationConfig(routes=[], entry_points=[]))
+
+        assert orchestrator.connection_pool is A2AConnectionPool.default()
+        assert A2ARegistryManager().connection_pool is None
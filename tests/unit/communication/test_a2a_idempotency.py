@@ -0,0 +1,213 @@
+"""Tests for idempotency keys on A2A message endpoints.
+
+The server is called in-process through ``httpx.ASGITransport``.
+"""
+import asyncio
+import json
+
+import fakeredis
+import httpx
+import pytest
+import pytest_asyncio
+
+from ailf.communication.a2a_idempotency import (
+    IdempotencyCache,
+    IdempotencyError,
+    RedisIdempotencyCache,
+)
+from ailf.communication.a2a_server import A2AAgentExecutor, AILFASA2AServer, TaskStore
+from ailf.schemas.a2a import MessageDelta, MessagePartDelta, TaskDelta, TaskState
+from ailf.schemas.agent import AgentDescription
+from tests.fake_redis import FakeRedisPoolRegistry
+
+
+class CountingExecutor(A2AAgentExecutor):
+    """Executor that counts executions and can be held, failed or made to stream."""
+
+    def __init__(self):
+        self.executions = 0
+        self.release = None
+        self.failures = 0
+        self.stream = False
+
+    async def execute(self, context):
+        self.executions += 1
+        if self.release is not None:
+            await self.release.wait()
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("LLM unavailable")
+        if self.stream:
+            return self._deltas(context.task.id)
+        context.task.state = TaskState.COMPLETED
+        context.task.metadata = {"execution": self.executions}
+        return context.task
+
+    async def _deltas(self, task_id):
+        for content in ("a", "b"):
+            yield TaskDelta(id=task_id, messages=[MessageDelta(parts=[MessagePartDelta(content=content)])])
+        yield TaskDelta(id=task_id, state=TaskState.COMPLETED, done=True)
+
+
+@pytest.fixture
+def executor():
+    """Provide a counting executor."""
+    return CountingExecutor()
+
+
+@pytest_asyncio.fixture
+async def client(executor):
+    """Provide an HTTP client of a server with an idempotency cache."""
+    server = AILFASA2AServer(
+        AgentDescription(agent_name="agent", agent_type="test", description="Test agent",
+                         supports_a2a=True, communication_endpoints=[]),
+        executor,
+        idempotency=IdempotencyCache(),
+    )
+    transport = httpx.ASGITransport(app=server.create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://agent") as http_client:
+        http_client.task_id = (await http_client.post("/tasks")).json()["task"]["id"]
+        yield http_client
+
+
+def _message(content="hi"):
+    return {"message": {"role": "user", "parts": [{"type": "text", "content": content}]}}
+
+
+async def _send(client, key, content="hi"):
+    return await client.post(f"/tasks/{client.task_id}/messages", json=_message(content),
+                             headers={"Idempotency-Key": key})
+
+
+def _events(response):
+    return [json.loads(line[len("data: "):]) for line in response.text.splitlines() if line.startswith("data: ")]
+
+
+class TestIdempotentMessages:
+    """Test idempotency keys on the message endpoints of AILFASA2AServer."""
+
+    @pytest.mark.asyncio
+    async def test_retry_replays_response(self, client, executor):
+        """Test that a retried message returns the first response without executing again."""
+        first = await _send(client, "key-1")
+        retry = await _send(client, "key-1")
+        other = await _send(client, "key-2")
+
+        assert executor.executions == 2
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first.headers
+        assert other.json()["task"]["metadata"] == {"execution": 2}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_attach(self, client, executor):
+        """Test that duplicates arriving during the execution wait for its result."""
+        executor.release = asyncio.Event()
+        requests = [asyncio.ensure_future(_send(client, "key-1")) for _ in range(3)]
+        while executor.executions == 0:
+            await asyncio.sleep(0.001)
+        await asyncio.sleep(0.01)
+        executor.release.set()
+        responses = await asyncio.gather(*requests)
+
+        assert executor.executions == 1
+        assert len({json.dumps(response.json(), sort_keys=True) for response in responses}) == 1
+
+    @pytest.mark.asyncio
+    async def test_key_reused_for_other_message(self, client):
+        """Test that a key cannot be reused for a different message."""
+        await _send(client, "key-1", "hi")
+        response = await _send(client, "key-1", "bye")
+
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_replayed(self, client, executor):
+        """Test that a retry after a failed execution executes again."""
+        executor.failures = 1
+        failed = await _send(client, "key-1")
+        retry = await _send(client, "key-1")
+
+        assert failed.status_code == 500
+        assert retry.status_code == 200
+        assert executor.executions == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_replay(self, client, executor):
+        """Test that a repeated streaming request replays the recorded deltas."""
+        executor.stream = True
+        path = f"/tasks/{client.task_id}/messages:stream"
+        headers = {"Idempotency-Key": "key-1"}
+
+        first = await client.post(path, json=_message(), headers=headers)
+        retry = await client.post(path, json=_message(), headers=headers)
+
+        assert executor.executions == 1
+        assert len(_events(first)) == 3
+        assert _events(retry) == _events(first)
+        assert retry.headers["Idempotent-Replayed"] == "true"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["messages", "messages:stream"])
+    async def test_store_error_finishes_execution(self, path):
+        """Test that a retry after a task store error executes again instead of waiting."""
+        class FailingTaskStore(TaskStore):
+            async def append_messages(self, task_id, messages, state=None):
+                raise RuntimeError("database is locked")
+
+        server = AILFASA2AServer(
+            AgentDescription(agent_name="agent", agent_type="test", description="Test agent",
+                             supports_a2a=True, communication_endpoints=[]),
+            CountingExecutor(),
+            task_store=FailingTaskStore(),
+            idempotency=IdempotencyCache(),
+        )
+        transport = httpx.ASGITransport(app=server.create_app(), raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://agent") as client:
+            task_id = (await client.post("/tasks")).json()["task"]["id"]
+            url = f"/tasks/{task_id}/{path}"
+            headers = {"Idempotency-Key": "key-1"}
+            failed = await client.post(url, json=_message(), headers=headers)
+            retry = await asyncio.wait_for(client.post(url, json=_message(), headers=headers), 1.0)
+
+        assert failed.status_code == 500
+        assert retry.status_code == 500
+        assert "Idempotent-Replayed" not in retry.headers
+
+
+class TestIdempotencyCache:
+    """Test the result caches."""
+
+    @pytest.mark.asyncio
+    async def test_bounded_and_expiring(self):
+        """Test that the in-memory cache evicts the least recently used results and expires old ones."""
+        cache = IdempotencyCache(ttl=0.05, max_entries=2)
+        for key in ("a", "b", "c"):
+            execution, _ = await cache.begin(key, "fingerprint")
+            execution.finish(200, {"key": key})
+            await cache.complete(execution)
+
+        assert await cache.load("a") is None
+        assert (await cache.load("c"))["body"] == {"key": "c"}
+        await asyncio.sleep(0.06)
+        assert await cache.load("c") is None
+
+    @pytest.mark.asyncio
+    async def test_redis_cache_is_shared_by_replicas(self):
+        """Test that replicas sharing Redis refuse a running key and replay a finished one."""
+        server = fakeredis.FakeServer()
+        replicas = [RedisIdempotencyCache(pool_registry=FakeRedisPoolRegistry(server)) for _ in range(2)]
+
+        execution, owner = await replicas[0].begin("task:messages:key", "fingerprint")
+        with pytest.raises(IdempotencyError) as running:
+            await replicas[1].begin("task:messages:key", "fingerprint")
+        execution.finish(200, {"task": {"id": "task"}})
+        await replicas[0].complete(execution)
+        replay, replica_owner = await replicas[1].begin("task:messages:key", "fingerprint")
+
+        assert owner and not replica_owner
+        assert running.value.status_code == 409
+        assert replay.replayed
+        assert await replay.result() == (200, {"task": {"id": "task"}})
+        for replica in replicas:
+            await replica.close()
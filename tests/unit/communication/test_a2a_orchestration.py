@@ -17,18 +17,27 @@ from ailf.communication.a2a_client import A2AClient
 from ailf.communication.a2a_orchestration import (
     A2AOrchestrator,
     AgentRoute,
+    CompletionPolicy,
+    MergeStrategy,
     OrchestrationConfig,
     OrchestratorError,
     ParallelTaskGroup,
     RouteCondition,
     RouteType,
     SequentialTaskChain,
+    TaskHandler,
+    compile_condition,
+    compile_field_path,
+    split_sentences,
 )
 from ailf.communication.a2a_registry import A2ARegistryManager, RegistryEntry
 from ailf.schemas.a2a import (
     Message,
+    MessageDelta,
     MessagePart,
+    MessagePartDelta,
     Task,
+    TaskDelta,
     TaskState,
 )
 
@@ -380,6 +389,68 @@ class TestA2AOrchestrator:
             assert next_agent == "agent6"
 
 
+class TestRouteConditions:
+    """Test compiled route conditions and the route index."""
+
+    @pytest.fixture
+    def task(self):
+        """Create a task with a short conversation and metadata."""
+        return Task(
+            id="task1",
+            state=TaskState.RUNNING,
+            messages=[
+                Message(role="user", parts=[MessagePart(type="text", content="Please search the docs")]),
+                Message(role="assistant", parts=[MessagePart(type="text", content="Searching")]),
+            ],
+            metadata={"priority": 3, "tags": ["a", "b"]}
+        )
+
+    def test_field_paths_match_model_dump(self, task):
+        """Test that compiled paths read the same values as the task's dump."""
+        dump = task.model_dump()
+        assert compile_field_path("messages[-1].parts[0].content")(task) == "Searching"
+        assert compile_field_path("messages[0].role")(task) == "user"
+        assert compile_field_path("metadata.tags[1]")(task) == "b"
+        assert compile_field_path("state")(task) == dump["state"]
+        assert compile_field_path("messages[0]")(task) == dump["messages"][0]
+        assert compile_field_path("messages[5].role")(task) is None
+        assert compile_field_path("metadata.missing")(task) is None
+        assert compile_field_path("not_a_field")(task) is None
+        assert compile_field_path("messages[x]")(task) is None
+
+    def test_conditions(self, task):
+        """Test each operator, including on missing and mismatched values."""
+        def check(field, operator, value):
+            return compile_condition(RouteCondition(field=field, operator=operator, value=value, route_to="x"))(task)
+
+        assert check("messages[0].parts[0].content", "contains", "search")
+        assert check("state", "eq", TaskState.RUNNING)
+        assert check("metadata.priority", "gt", 2)
+        assert check("metadata.priority", "le", 3)
+        assert not check("metadata.priority", "lt", 3)
+        assert check("metadata.missing", "eq", None)
+        assert not check("metadata.missing", "contains", "x")
+        assert not check("metadata.priority", "gt", "high")
+        assert not check("state", "matches", "running")
+
+    @pytest.mark.asyncio
+    async def test_route_index_follows_config(self, orchestrator, task):
+        """Test that added routes are indexed on the next lookup and edited ones on reload."""
+        assert await orchestrator._find_next_agent("agent2", task) is None
+        assert await orchestrator._find_next_agent("agent9", task) is None
+
+        orchestrator.config.routes.append(AgentRoute(
+            source_agent="agent9",
+            type=RouteType.SEQUENTIAL,
+            destination_agents=["agent1"]
+        ))
+        assert await orchestrator._find_next_agent("agent9", task) == "agent1"
+
+        orchestrator.config.routes[1].conditions[1].value = "Search"
+        orchestrator.reload_routes()
+        assert await orchestrator._find_next_agent("agent2", task) == "agent4"
+
+
 @pytest.fixture
 def mock_orchestrator():
     """Create a mock orchestrator."""
@@ -580,5 +651,315 @@ class TestParallelTaskGroup:
         assert all_results["agent2"][0]["content"][0] == "Response from agent2"
 
 
+def _slow_agents(orchestrator, delays, failing=()):
+    """Make the mock orchestrator answer each task after a delay, tracking concurrency."""
+    state = {"active": 0, "max_active": 0}
+
+    async def send_message(task_id, message):
+        state["active"] += 1
+        state["max_active"] = max(state["max_active"], state["active"])
+        try:
+            await asyncio.sleep(delays[task_id])
+            if task_id in failing:
+                raise OrchestratorError(f"{task_id} failed")
+            return Task(id=task_id, state=TaskState.COMPLETED, messages=[])
+        finally:
+            state["active"] -= 1
+
+    orchestrator.send_message.side_effect = send_message
+    orchestrator.cancel_task = AsyncMock()
+    return state
+
+
+def _group(orchestrator, task_ids, **kwargs):
+    group = ParallelTaskGroup(orchestrator, **kwargs)
+    for task_id in task_ids:
+        group.tasks[task_id] = Task(id=task_id, state=TaskState.CREATED, messages=[])
+        group.agent_tasks[f"agent-{task_id}"] = [task_id]
+    return group
+
+
+class TestParallelTaskGroupConcurrency:
+    """Test concurrent fan-out and completion policies of the parallel task group."""
+
+    @pytest.mark.asyncio
+    async def test_requests_run_concurrently_within_limit(self, mock_orchestrator):
+        """Test that latency is that of the slowest agent and concurrency is bounded."""
+        delays = {f"t{i}": 0.05 for i in range(6)}
+        state = _slow_agents(mock_orchestrator, delays)
+        group = _group(mock_orchestrator, delays, max_concurrency=3)
+
+        start = asyncio.get_running_loop().time()
+        results = await group.send_message_to_all(Message(role="user", parts=[]))
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert set(results) == set(delays)
+        assert state["max_active"] == 3
+        assert elapsed < 0.2
+
+    @pytest.mark.asyncio
+    async def test_results_in_completion_order(self, mock_orchestrator):
+        """Test that results are yielded as agents answer, with timeouts as failures."""
+        delays = {"slow": 0.03, "fast": 0.0, "stuck": 1.0}
+        _slow_agents(mock_orchestrator, delays)
+        group = _group(mock_orchestrator, delays, timeout=0.5, agent_timeouts={"agent-stuck": 0.05})
+
+        results = [result async for result in group.iter_message_to_all(
+            Message(role="user", parts=[]), CompletionPolicy.QUORUM)]
+
+        assert [(r.task_id, r.succeeded) for r in results] == [("fast", True), ("slow", True)]
+        assert group.tasks["slow"].state == TaskState.COMPLETED
+
+        with pytest.raises(OrchestratorError):
+            await group.send_message_to_all(Message(role="user", parts=[]))
+        assert group.tasks["stuck"].state == TaskState.CREATED
+
+    @pytest.mark.asyncio
+    async def test_first_k_and_quorum_failures(self, mock_orchestrator):
+        """Test that first-k stops at k successes and quorum fails once it is out of reach."""
+        delays = {"a": 0.0, "b": 0.01, "c": 0.02, "d": 1.0}
+        _slow_agents(mock_orchestrator, delays, failing={"a", "b"})
+        group = _group(mock_orchestrator, delays)
+
+        first = await group.send_message_to_all(Message(role="user", parts=[]), CompletionPolicy.FIRST_K, k=1)
+        assert list(first) == ["c"]
+
+        with pytest.raises(OrchestratorError):
+            await group.send_message_to_all(Message(role="user", parts=[]), CompletionPolicy.QUORUM, k=3)
+        with pytest.raises(OrchestratorError):
+            await group.send_message_to_all(Message(role="user", parts=[]), CompletionPolicy.FIRST_K)
+        with pytest.raises(OrchestratorError, match="k >= 1"):
+            await group.send_message_to_all(Message(role="user", parts=[]), CompletionPolicy.QUORUM, k=0)
+        mock_orchestrator.cancel_task.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_first_success_cancels_the_rest(self, mock_orchestrator):
+        """Test that the tasks still running after the first success are canceled at their agents."""
+        delays = {"a": 0.0, "b": 1.0, "c": 1.0}
+        _slow_agents(mock_orchestrator, delays)
+        group = _group(mock_orchestrator, delays)
+
+        results = await group.send_message_to_all(Message(role="user", parts=[]), CompletionPolicy.FIRST_SUCCESS)
+
+        assert list(results) == ["a"]
+        assert sorted(call.args[0] for call in mock_orchestrator.cancel_task.call_args_list) == ["b", "c"]
+
+
+class FakeAgentClient:
+    """Client of an agent that answers after a delay, or fails."""
+
+    def __init__(self, agent_id, answer=None, delay=0.0):
+        self.agent_id = agent_id
+        self.answer = answer
+        self.delay = delay
+        self.created = 0
+        self.canceled = []
+
+    async def create_task(self):
+        self.created += 1
+        return Task(id=f"{self.agent_id}-{self.created}", state=TaskState.CREATED, messages=[])
+
+    async def send_message(self, task_id, message):
+        await asyncio.sleep(self.delay)
+        if self.answer is None:
+            raise httpx.ConnectError(f"{self.agent_id} is down")
+        return Task(id=task_id, state=TaskState.COMPLETED, messages=[
+            message,
+            Message(role="assistant", parts=[MessagePart(type="text", content=self.answer)])
+        ])
+
+    async def cancel_task(self, task_id):
+        self.canceled.append(task_id)
+        return Task(id=task_id, state=TaskState.CANCELED, messages=[])
+
+
+def _parallel_orchestrator(clients, **route_options):
+    """Create an orchestrator whose "router" agent fans out to the given clients."""
+    orchestrator = A2AOrchestrator(config=OrchestrationConfig(
+        routes=[AgentRoute(
+            source_agent="router",
+            type=RouteType.PARALLEL,
+            destination_agents=list(clients),
+            **route_options
+        )],
+        entry_points=["router"]
+    ))
+    orchestrator.clients = {"router": FakeAgentClient("router", "routing"), **clients}
+    orchestrator.task_handlers["root"] = TaskHandler(task_id="root", current_agent="router", history=["router"])
+    return orchestrator
+
+
+class TestParallelRoutes:
+    """Test parallel routes that clone a task to several agents and merge their answers."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_takes_the_slowest_agent(self):
+        """Test that agents work at once and their answers are concatenated."""
+        clients = {agent_id: FakeAgentClient(agent_id, f"answer {agent_id}", delay=0.05) for agent_id in "abc"}
+        orchestrator = _parallel_orchestrator(clients)
+
+        start = asyncio.get_running_loop().time()
+        task = await orchestrator.send_message("root", Message(role="user", parts=[]))
+        elapsed = asyncio.get_running_loop().time() - start
+
+        merged = task.messages[-1]
+        assert elapsed < 0.12
+        assert task.id == "root"
+        assert sorted(part.content for part in merged.parts) == ["answer a", "answer b", "answer c"]
+        assert {part.metadata["agent_id"] for part in merged.parts} == {"a", "b", "c"}
+        assert merged.metadata["merge_strategy"] == "concatenate"
+        assert orchestrator.task_handlers["a-1"].metadata["original_task_id"] == "root"
+        assert sorted(orchestrator.task_handlers["root"].history[1:]) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_vote_with_quorum_tolerates_failures(self):
+        """Test that a quorum ignores failed and slow agents and votes on the rest."""
+        clients = {
+            "a": FakeAgentClient("a", "42"),
+            "b": FakeAgentClient("b", " 42 ", delay=0.01),
+            "c": FakeAgentClient("c", "41", delay=1.0),
+            "d": FakeAgentClient("d"),
+        }
+        orchestrator = _parallel_orchestrator(clients, merge_strategy=MergeStrategy.VOTE,
+                                              completion_policy=CompletionPolicy.QUORUM, min_successes=2)
+
+        task = await orchestrator.send_message("root", Message(role="user", parts=[]))
+
+        merged = task.messages[-1]
+        assert merged.parts[0].content == "42"
+        assert merged.metadata["votes"]["agents"] == ["a", "b"]
+        errors = {r["agent_id"]: r["error"] for r in task.metadata["parallel"]["results"]}
+        assert errors == {"a": None, "d": "d is down", "b": None}
+        assert clients["c"].canceled == []
+
+    @pytest.mark.asyncio
+    async def test_reducer_and_failure_semantics(self):
+        """Test a registered reducer, per-agent timeouts, and failure when too few agents answer."""
+        clients = {
+            "a": FakeAgentClient("a", "1"),
+            "b": FakeAgentClient("b", "2", delay=1.0),
+            "c": FakeAgentClient("c", "3"),
+        }
+        orchestrator = _parallel_orchestrator(clients, merge_strategy=MergeStrategy.REDUCER,
+                                              reducer="sum", timeout=0.05,
+                                              completion_policy=CompletionPolicy.FIRST_K, min_successes=2)
+
+        async def add(results):
+            return str(sum(int(r.task.messages[-1].parts[0].content) for r in results))
+        orchestrator.register_reducer("sum", add)
+
+        task = await orchestrator.send_message("root", Message(role="user", parts=[]))
+        assert task.messages[-1].parts[0].content == "4"
+
+        orchestrator.config.routes[0].completion_policy = CompletionPolicy.ALL
+        with pytest.raises(OrchestratorError):
+            await orchestrator.send_message("root", Message(role="user", parts=[]))
+
+    def test_reducer_strategy_requires_reducer(self):
+        """Test that a reducer merge strategy must name a reducer."""
+        with pytest.raises(ValueError):
+            AgentRoute(source_agent="a", type=RouteType.PARALLEL, destination_agents=["b"],
+                       merge_strategy=MergeStrategy.REDUCER)
+
+
+class StreamingAgentClient:
+    """Client of an agent that streams a transformed copy of each input line after a delay."""
+
+    def __init__(self, agent_id, transform=str.upper, delay=0.0, fail=False):
+        self.agent_id = agent_id
+        self.transform = transform
+        self.delay = delay
+        self.fail = fail
+        self.tasks = {}
+        self.received = []
+
+    async def create_task(self):
+        task = Task(id=f"{self.agent_id}-{len(self.tasks) + 1}", state=TaskState.CREATED, messages=[])
+        self.tasks[task.id] = task
+        return task
+
+    async def stream_message(self, task_id, message):
+        self.received.append(message.parts[0].content)
+        if self.fail:
+            raise httpx.ConnectError(f"{self.agent_id} is down")
+        answer = ""
+        for line in message.parts[0].content.splitlines(keepends=True):
+            await asyncio.sleep(self.delay)
+            answer += self.transform(line)
+            yield TaskDelta(id=task_id, messages=[MessageDelta(
+                role="assistant", parts=[MessagePartDelta(type="text", content=self.transform(line))]
+            )])
+        task = self.tasks[task_id]
+        task.messages += [message, Message(role="assistant", parts=[MessagePart(type="text", content=answer)])]
+        task.state = TaskState.COMPLETED
+        yield TaskDelta(id=task_id, state=TaskState.COMPLETED, done=True)
+
+    async def get_task(self, task_id):
+        return self.tasks[task_id]
+
+
+def _pipelined_chain(clients, **kwargs):
+    orchestrator = A2AOrchestrator(config=OrchestrationConfig(routes=[], entry_points=[next(iter(clients))]))
+    orchestrator.clients = dict(clients)
+    return SequentialTaskChain(orchestrator, list(clients), pipelined=True, **kwargs)
+
+
+class TestPipelinedTaskChain:
+    """Test sequential chains whose agents start on the streamed output of the previous one."""
+
+    @pytest.mark.asyncio
+    async def test_stages_overlap(self):
+        """Test that the chain takes about as long as one stage and transforms every line."""
+        clients = {
+            "upper": StreamingAgentClient("upper", str.upper, delay=0.03),
+            "reverse": StreamingAgentClient("reverse", lambda line: line.rstrip("\n")[::-1] + "\n", delay=0.03),
+            "quote": StreamingAgentClient("quote", lambda line: "> " + line, delay=0.03),
+        }
+        chain = _pipelined_chain(clients)
+        await chain.start_chain()
+
+        start = asyncio.get_running_loop().time()
+        deltas = [delta async for delta in chain.stream_message(
+            Message(role="user", parts=[MessagePart(type="text", content="ab\ncd\nef\ngh\n")]))]
+        elapsed = asyncio.get_running_loop().time() - start
+
+        text = "".join(part.content for delta in deltas for m in delta.messages for part in m.parts)
+        assert text == "> BA\n> DC\n> FE\n> HG\n"
+        assert elapsed < 0.25  # 0.36s if the stages ran one after another
+        assert [delta.done for delta in deltas].count(True) == 1 and deltas[-1].done
+        assert deltas[-1].state == TaskState.COMPLETED
+        assert len(clients["reverse"].received) > 1
+        assert chain.task_id == "quote-1"
+        assert chain.current_index == 2
+        assert chain.orchestrator.task_handlers["quote-1"].history == ["upper", "reverse", "quote"]
+        assert [task.id for task in chain.tasks[-3:]] == ["upper-1", "reverse-1", "quote-1"]
+
+    @pytest.mark.asyncio
+    async def test_splitter_and_failures(self):
+        """Test that chunks follow the splitter and that a failing agent fails the chain."""
+        clients = {
+            "first": StreamingAgentClient("first", lambda line: line.replace("\n", " ")),
+            "second": StreamingAgentClient("second", str.lower),
+        }
+        chain = _pipelined_chain(clients, splitter=split_sentences)
+        await chain.start_chain()
+
+        task = await chain.send_message(Message(role="user", parts=[
+            MessagePart(type="text", content="One. Two\nthree! Four")]))
+
+        received = clients["second"].received
+        assert task.id == "second-1"
+        assert "".join(received) == "One. Two three! Four"
+        assert all(chunk.endswith((". ", "! ")) for chunk in received[:-1])
+        assert task.messages[-1].parts[0].content == received[-1].lower()
+
+        clients["failing"] = StreamingAgentClient("failing", fail=True)
+        chain = _pipelined_chain(clients)
+        chain.agent_sequence = ["first", "failing", "second"]
+        await chain.start_chain()
+        with pytest.raises(OrchestratorError):
+            await chain.send_message(Message(role="user", parts=[MessagePart(type="text", content="x\n")]))
+
+
 if __name__ == "__main__":
     unittest.main()
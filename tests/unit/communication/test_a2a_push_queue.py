@@ -0,0 +1,182 @@
+"""Tests for background delivery of A2A push notifications.
+
+Webhooks are served by an in-process ``httpx.MockTransport`` whose handler
+can be slowed down or made to fail.
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ailf.communication.a2a_client import A2AConnectionPool
+from ailf.communication.a2a_push import (
+    PushDeliveryQueue,
+    PushNotificationConfig,
+    PushNotificationEvent,
+    PushNotificationManager,
+)
+from ailf.schemas.a2a import MessageDelta, MessagePartDelta, TaskDelta, TaskState
+
+
+class WebhookPool(A2AConnectionPool):
+    """Pool whose clients post to a scripted webhook."""
+
+    def __init__(self):
+        super().__init__()
+        self.received = []
+        self.statuses = []
+        self.delay = 0.0
+        self.release = None
+        self.active = 0
+        self.max_active = 0
+
+    def _create_client(self):
+        async def handler(request):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            try:
+                if self.release is not None:
+                    await self.release.wait()
+                await asyncio.sleep(self.delay)
+                status = self.statuses.pop(0) if self.statuses else 200
+                if status == 200:
+                    self.received.append((request, json.loads(request.content)))
+                return httpx.Response(status)
+            finally:
+                self.active -= 1
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def pool():
+    """Provide a scripted webhook pool."""
+    return WebhookPool()
+
+
+def _manager(pool, **kwargs):
+    kwargs.setdefault("backoff_base", 0.001)
+    manager = PushNotificationManager(PushDeliveryQueue(connection_pool=pool, **kwargs))
+    for task_id in ("task-1", "task-2"):
+        manager.register_task(task_id, PushNotificationConfig(
+            url="https://example.com/webhook",
+            token="test-token",
+            headers={"X-Test": "true"}
+        ))
+    return manager
+
+
+def _delta(content, state=None, done=False):
+    return TaskDelta(
+        state=state,
+        messages=[MessageDelta(parts=[MessagePartDelta(content=content)])],
+        done=done,
+    )
+
+
+class TestPushDeliveryQueue:
+    """Test PushDeliveryQueue through PushNotificationManager."""
+
+    @pytest.mark.asyncio
+    async def test_sending_does_not_wait_for_the_webhook(self, pool):
+        """Test that send_notification returns before the receiver responds."""
+        manager = _manager(pool)
+        pool.release = asyncio.Event()
+
+        assert await asyncio.wait_for(manager.notify_task_state_change("task-1", TaskState.COMPLETED), 0.1)
+        assert pool.received == []
+
+        pool.release.set()
+        assert await manager.flush(1)
+        request, payload = pool.received[0]
+        assert request.headers["Authorization"] == "Bearer test-token"
+        assert request.headers["X-Test"] == "true"
+        assert payload["event_type"] == "task_state_change"
+        assert payload["data"]["state"] == "completed"
+        assert manager.delivery_queue.get_stats()["delivered"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff(self, pool):
+        """Test that server errors are retried and client errors are not."""
+        manager = _manager(pool, max_retries=2)
+        pool.statuses = [503, 500]
+        await manager.send_notification("task-1", "event", {"n": 1})
+        await manager.flush(1)
+
+        pool.statuses = [400]
+        await manager.send_notification("task-1", "event", {"n": 2})
+        await manager.flush(1)
+
+        stats = manager.delivery_queue.get_stats()
+        assert [payload["data"] for _, payload in pool.received] == [{"n": 1}]
+        assert stats["retried"] == 2
+        assert stats["delivered"] == 1
+        assert stats["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_waiting_deltas_are_coalesced(self, pool):
+        """Test that deltas queued behind a slow delivery of the same task are merged in order."""
+        manager = _manager(pool)
+        pool.release = asyncio.Event()
+
+        await manager.notify_task_delta("task-1", _delta("a"))
+        await asyncio.sleep(0)
+        await manager.notify_task_delta("task-1", _delta("b", state=TaskState.RUNNING))
+        await manager.notify_task_delta("task-1", _delta("c", done=True))
+        pool.release.set()
+        await manager.flush(1)
+
+        deltas = [payload["data"]["delta"] for _, payload in pool.received]
+        assert len(deltas) == 2
+        assert [m["parts"][0]["content"] for m in deltas[1]["messages"]] == ["b", "c"]
+        assert deltas[1]["state"] == "running"
+        assert deltas[1]["done"] is True
+        assert manager.delivery_queue.get_stats()["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_per_endpoint_concurrency_and_task_order(self, pool):
+        """Test that concurrency per endpoint is bounded and each task's events stay in order."""
+        manager = _manager(pool, max_concurrency_per_endpoint=2)
+        pool.delay = 0.01
+
+        for n in range(4):
+            await manager.send_notification("task-1", "event", {"n": n})
+            await manager.send_notification("task-2", "event", {"n": n})
+        await manager.flush(2)
+
+        assert pool.max_active == 2
+        for task_id in ("task-1", "task-2"):
+            order = [p["data"]["n"] for _, p in pool.received if p["task_id"] == task_id]
+            assert order == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_notifications(self, pool):
+        """Test that a full queue rejects notifications instead of blocking."""
+        manager = _manager(pool, max_queue_size=2)
+        pool.release = asyncio.Event()
+
+        results = [await manager.send_notification("task-1", "event", {"n": n}) for n in range(3)]
+
+        assert results == [True, True, False]
+        assert manager.delivery_queue.get_stats()["dropped"] == 1
+        pool.release.set()
+        await manager.aclose()
+        assert len(pool.received) == 2
+
+    @pytest.mark.asyncio
+    async def test_enqueue_right_after_a_worker_finishes(self, pool):
+        """Test that a worker that has just run out of work does not hold its slot."""
+        queue = PushDeliveryQueue(connection_pool=pool, max_concurrency_per_endpoint=1)
+        config = PushNotificationConfig(url="https://example.com/webhook", token="test-token")
+
+        def event(n):
+            return PushNotificationEvent(event_type="event", task_id="task-1", data={"n": n}, timestamp="now")
+
+        assert queue.enqueue(config, event(1))
+        # Wakes up as the worker returns, before its task has finished
+        await queue._idle_event().wait()
+        assert queue.enqueue(config, event(2))
+
+        assert await queue.flush(1.0)
+        assert [payload["data"] for _, payload in pool.received] == [{"n": 1}, {"n": 2}]
@@ -0,0 +1,224 @@
+"""Tests for A2A task stores.
+
+Every test runs against the in-memory TaskStore, SQLiteTaskStore and a
+RedisTaskStore backed by fakeredis.
+"""
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+from ailf.communication.a2a_server import A2AServerError, HistoryCompaction, TaskStore
+from ailf.communication.a2a_task_store import RedisTaskStore, SQLiteMessageArchive, SQLiteTaskStore
+from ailf.schemas.a2a import Message, MessagePart, Task, TaskState
+from tests.fake_redis import FakeRedisPoolRegistry
+
+
+def _create_store(kind, ttl=None, compaction=None):
+    if kind == "memory":
+        return TaskStore(ttl=ttl, compaction=compaction)
+    if kind == "sqlite":
+        return SQLiteTaskStore(ttl=ttl, compaction=compaction)
+    return RedisTaskStore(ttl=ttl, pool_registry=FakeRedisPoolRegistry(), compaction=compaction)
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite", "redis"])
+async def store_factory(request):
+    """Provide a factory of stores of each kind, closing them afterwards."""
+    stores = []
+
+    def factory(ttl=None, compaction=None):
+        stores.append(_create_store(request.param, ttl, compaction))
+        return stores[-1]
+
+    yield factory
+    for store in stores:
+        await store.close()
+
+
+def _message(content, role="user"):
+    return Message(role=role, parts=[MessagePart(type="text", content=content)])
+
+
+def _task(task_id, state=TaskState.RUNNING, minutes_ago=0, messages=()):
+    updated = datetime.now(UTC) - timedelta(minutes=minutes_ago)
+    return Task(id=task_id, state=state, messages=list(messages), updatedAt=updated, createdAt=updated)
+
+
+class TestTaskStores:
+    """Test the behavior shared by every task store."""
+
+    @pytest.mark.asyncio
+    async def test_create_get_update(self, store_factory):
+        """Test the task lifecycle and that updates persist messages and state."""
+        store = store_factory()
+        task = await store.create_task()
+
+        with pytest.raises(A2AServerError):
+            await store.create_task(Task(id=task.id))
+        task.messages.append(_message("hello"))
+        task.state = TaskState.COMPLETED
+        await store.update_task(task)
+
+        stored = await store.get_task(task.id)
+        assert stored.state == TaskState.COMPLETED
+        assert [m.parts[0].content for m in stored.messages] == ["hello"]
+        assert await store.get_task("missing") is None
+        with pytest.raises(A2AServerError):
+            await store.update_task(Task(id="missing"))
+
+    @pytest.mark.asyncio
+    async def test_append_messages(self, store_factory):
+        """Test that messages are appended in order and the state changes."""
+        store = store_factory()
+        task = await store.create_task(_task("t1", messages=[_message("a")]))
+
+        await store.append_messages(task.id, [_message("b")])
+        updated = await store.append_messages(task.id, [_message("c", "assistant")], TaskState.COMPLETED)
+
+        assert [m.parts[0].content for m in updated.messages] == ["a", "b", "c"]
+        stored = await store.get_task(task.id)
+        assert stored.state == TaskState.COMPLETED
+        assert [m.role for m in stored.messages] == ["user", "user", "assistant"]
+        assert (await store.cancel_task(task.id)).state == TaskState.CANCELED
+        with pytest.raises(A2AServerError):
+            await store.append_messages("missing", [_message("x")])
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_by_state(self, store_factory):
+        """Test that pages are newest first, filtered by state, and cover every task once."""
+        store = store_factory()
+        await store.add_tasks(
+            _task(f"t{i:02}", TaskState.COMPLETED if i % 2 else TaskState.RUNNING, minutes_ago=i)
+            for i in range(25)
+        )
+
+        seen, cursor = [], None
+        while True:
+            page = await store.list_tasks_page(limit=10, cursor=cursor)
+            seen.extend(task.id for task in page.tasks)
+            cursor = page.nextCursor
+            if cursor is None:
+                break
+        completed = await store.list_tasks_page(limit=100, state=TaskState.COMPLETED)
+        offset = await store.list_tasks(limit=5, skip=10)
+
+        assert seen == [f"t{i:02}" for i in range(25)]
+        assert [task.id for task in completed.tasks] == [f"t{i:02}" for i in range(1, 25, 2)]
+        assert completed.nextCursor is None
+        assert [task.id for task in offset] == [f"t{i:02}" for i in range(10, 15)]
+
+    @pytest.mark.asyncio
+    async def test_state_index_follows_updates(self, store_factory):
+        """Test that a task moves between state indexes and to the front when updated."""
+        store = store_factory()
+        await store.add_tasks([_task("old", minutes_ago=5), _task("new", minutes_ago=1)])
+
+        await store.append_messages("old", [], TaskState.COMPLETED)
+
+        running = await store.list_tasks_page(state=TaskState.RUNNING)
+        everything = await store.list_tasks_page()
+        assert [task.id for task in running.tasks] == ["new"]
+        assert [task.id for task in everything.tasks] == ["old", "new"]
+
+    @pytest.mark.asyncio
+    async def test_tasks_expire(self, store_factory):
+        """Test that tasks not updated within the TTL are hidden and purged."""
+        store = store_factory(ttl=60)
+        await store.add_tasks([_task("stale", minutes_ago=2), _task("fresh")])
+        await store.delete_task("fresh")
+        await store.create_task(_task("fresh"))
+
+        page = await store.list_tasks_page()
+        assert [task.id for task in page.tasks] == ["fresh"]
+        await store.purge_expired()
+        assert await store.get_task("stale") is None
+        assert await store.get_task("fresh") is not None
+
+    @pytest.mark.asyncio
+    async def test_compaction_bounds_inline_messages(self, store_factory):
+        """Test that old messages leave the task, are summarized once, and stay in the history."""
+        summarized = []
+
+        async def summarize(previous, messages):
+            summarized.extend(m.parts[0].content for m in messages)
+            return (previous or "") + "".join(m.parts[0].content for m in messages)
+
+        store = store_factory(compaction=HistoryCompaction(keep_last=3, summarizer=summarize))
+        await store.create_task(_task("t1", messages=[_message("0"), _message("1")]))
+        for n in range(2, 7):
+            await store.append_messages("t1", [_message(str(n))])
+        task = await store.get_task("t1")
+        task.messages.extend([_message("7"), _message("8")])
+        await store.update_task(task)
+
+        stored = await store.get_task("t1")
+        listed = (await store.list_tasks_page()).tasks[0]
+        history = await store.get_messages("t1")
+        window = await store.get_messages("t1", start=4, limit=3)
+
+        assert [m.parts[0].content for m in stored.messages] == ["6", "7", "8"]
+        assert [m.parts[0].content for m in listed.messages] == ["6", "7", "8"]
+        assert stored.archivedMessageCount == 6
+        assert stored.historySummary == "012345"
+        assert summarized == list("012345")
+        assert [m.parts[0].content for m in history.messages] == list("012345678")
+        assert history.total == 9
+        assert [m.parts[0].content for m in window.messages] == ["4", "5", "6"]
+        assert await store.get_messages("missing") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [0, -1])
+    async def test_get_messages_without_limit_left(self, store_factory, limit):
+        """Test that a zero or negative limit returns no messages rather than the whole history."""
+        store = store_factory()
+        await store.create_task(_task("t1", messages=[_message(str(n)) for n in range(3)]))
+
+        history = await store.get_messages("t1", start=0, limit=limit)
+
+        assert history.messages == []
+        assert history.total == 3
+
+
+def test_invalid_cursor():
+    """Test that a malformed cursor is rejected."""
+    with pytest.raises(A2AServerError):
+        TaskStore.decode_cursor("not a cursor")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_appends_without_rewriting_messages(tmp_path):
+    """Test that updates only insert new messages and that tasks survive reopening."""
+    store = SQLiteTaskStore(str(tmp_path / "tasks.db"))
+    task = await store.create_task(_task("t1", messages=[_message("a")]))
+    task.messages.append(_message("b"))
+    await store.update_task(task)
+    rows = store._connection.execute("SELECT seq, data FROM task_messages").fetchall()
+    await store.close()
+
+    reopened = SQLiteTaskStore(str(tmp_path / "tasks.db"))
+    stored = await reopened.get_task("t1")
+    await reopened.close()
+
+    assert [seq for seq, _ in rows] == [0, 1]
+    assert [m.parts[0].content for m in stored.messages] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_memory_store_spills_to_sqlite_archive(tmp_path):
+    """Test that the in-memory store keeps compacted messages in its archive only."""
+    archive = SQLiteMessageArchive(str(tmp_path / "history.db"))
+    store = TaskStore(compaction=HistoryCompaction(keep_last=2, archive=archive))
+    await store.create_task(_task("t1", messages=[_message(str(n)) for n in range(5)]))
+
+    archived = await archive.read("t1", 0, 10)
+    history = await store.get_messages("t1", start=1, limit=3)
+    await store.delete_task("t1")
+    deleted = await archive.read("t1", 0, 10)
+    await store.close()
+
+    assert [m.parts[0].content for m in archived] == ["0", "1", "2"]
+    assert [m.parts[0].content for m in history.messages] == ["1", "2", "3"]
+    assert deleted == []
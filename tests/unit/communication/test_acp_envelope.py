@@ -0,0 +1,130 @@
+"""Tests for lazy ACP envelope decoding.
+
+This module tests header-only decoding and the deferred payload handling
+used by ACPHandler when dispatching received messages.
+"""
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from ailf.communication.acp_envelope import ACPDecodeError, decode_envelope
+from ailf.communication.acp_handler import ACPHandler
+from ailf.schemas.acp import (
+    ACPMessage,
+    ACPMessageHeader,
+    ACPMessageType,
+    InformationSharePayload,
+    TaskRequestPayload,
+)
+
+
+def _serialize(message_type, payload, recipient=None):
+    header = ACPMessageHeader(
+        sender_agent_id="sender",
+        recipient_agent_id=recipient,
+        message_type=message_type
+    )
+    return ACPMessage(header=header, payload=payload).model_dump_json()
+
+
+class TestDecodeEnvelope:
+    """Test the decode_envelope function."""
+
+    def test_decodes_header_fields(self):
+        """Test that routing fields are available without touching the payload."""
+        raw = _serialize(ACPMessageType.TASK_REQUEST, {"task_name": "t"}, recipient="agent")
+        envelope = decode_envelope(raw.encode("utf-8"))
+
+        assert envelope.message_type == ACPMessageType.TASK_REQUEST
+        assert envelope.sender_agent_id == "sender"
+        assert envelope.recipient_agent_id == "agent"
+        assert "payload" not in envelope.__dict__
+
+    def test_payload_is_decoded_and_validated_on_demand(self):
+        """Test that the payload and its typed model are decoded lazily and cached."""
+        raw = _serialize(ACPMessageType.TASK_REQUEST, {"task_name": "t", "task_input": {"s": "}{]["}})
+        envelope = decode_envelope(raw)
+
+        assert envelope.payload == {"task_name": "t", "task_input": {"s": "}{]["}}
+        model = envelope.payload_model
+        assert isinstance(model, TaskRequestPayload)
+        assert envelope.payload_model is model
+        assert envelope.message.header.message_id == envelope.header.message_id
+
+    def test_payload_before_header(self):
+        """Test that member order does not matter."""
+        raw = json.dumps({
+            "payload": {"data_type": "note", "data_content": [1, {"a": "b"}]},
+            "header": {"sender_agent_id": "s", "message_type": "information_share"}
+        })
+        envelope = decode_envelope(raw)
+
+        assert isinstance(envelope.payload_model, InformationSharePayload)
+
+    @pytest.mark.parametrize("raw", [
+        "not json",
+        "[]",
+        json.dumps({"payload": {}}),
+        json.dumps({"header": {"sender_agent_id": "s", "message_type": "unknown"}, "payload": {}}),
+        json.dumps({"header": {"message_type": "heartbeat"}, "payload": {}}),
+        '{"header": {"sender_agent_id": "s", "message_type": "heartbeat"}, "payload": {"a": [1,}',
+    ])
+    def test_malformed_messages(self, raw):
+        """Test that malformed envelopes raise ACPDecodeError."""
+        with pytest.raises(ACPDecodeError):
+            envelope = decode_envelope(raw)
+            envelope.payload
+
+
+class TestACPHandlerDispatch:
+    """Test ACPHandler dispatch on decoded envelopes."""
+
+    @pytest.fixture
+    def handler(self):
+        """Provide a handler with a mock backend."""
+        return ACPHandler("agent", MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_unhandled_types_skip_payload_parsing(self, handler):
+        """Test that messages without a handler are dropped with an invalid payload."""
+        raw = _serialize(ACPMessageType.INFORMATION_SHARE, {"data_type": "x", "data_content": 1})
+        raw = raw.replace('"data_type":"x"', '"data_type":')
+
+        await handler.handle_incoming_raw_message("ailf.broadcast", raw)
+
+    @pytest.mark.asyncio
+    async def test_other_recipients_are_ignored(self, handler):
+        """Test that messages for another agent never reach a handler."""
+        received = []
+
+        @handler.register_handler(ACPMessageType.HEARTBEAT)
+        async def on_heartbeat(message):
+            received.append(message)
+
+        raw = _serialize(ACPMessageType.HEARTBEAT, {"agent_id": "a"}, recipient="someone-else")
+        await handler.handle_incoming_raw_message("ailf.broadcast", raw)
+
+        assert received == []
+
+    @pytest.mark.asyncio
+    async def test_lazy_and_eager_handlers(self, handler):
+        """Test that lazy handlers get envelopes and others get ACPMessages."""
+        received = []
+
+        @handler.register_handler(ACPMessageType.HEARTBEAT, lazy=True)
+        async def on_heartbeat(envelope):
+            received.append(envelope)
+
+        @handler.register_handler(ACPMessageType.INFORMATION_SHARE)
+        async def on_information(message):
+            received.append(message)
+
+        await handler.handle_incoming_raw_message("agent", _serialize(ACPMessageType.HEARTBEAT, {"agent_id": "a"}))
+        await handler.handle_incoming_raw_message(
+            "agent", _serialize(ACPMessageType.INFORMATION_SHARE, {"data_type": "x", "data_content": 1})
+        )
+
+        assert received[0].payload_model.agent_id == "a"
+        assert isinstance(received[1], ACPMessage)
+        assert received[1].payload["data_type"] == "x"
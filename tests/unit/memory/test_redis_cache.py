@@ -35,16 +35,21 @@ class TestRedisDistributedCache:
     @pytest.mark.asyncio
     async def test_init(self):
         """Test initialization of RedisDistributedCache."""
-        with patch('redis.asyncio.from_url') as mock_from_url:
-            cache = RedisDistributedCache(
-                redis_url="redis://localhost:6379/0", 
-                default_ttl=1800,
-                key_prefix="test:"
-            )
-            
-            mock_from_url.assert_called_once_with("redis://localhost:6379/0")
-            assert cache.default_ttl == 1800
-            assert cache.key_prefix == "test:"
+        registry = MagicMock()
+        cache = RedisDistributedCache(
+            redis_url="redis://localhost:6379/0", 
+            default_ttl=1800,
+            key_prefix="test:",
+            pool_registry=registry
+        )
+        
+        # The client is created lazily, inside the event loop that uses it
+        registry.async_client.assert_not_called()
+        assert cache.redis_client is registry.async_client.return_value
+        assert cache.redis_client is registry.async_client.return_value
+        registry.async_client.assert_called_once_with(url="redis://localhost:6379/0")
+        assert cache.default_ttl == 1800
+        assert cache.key_prefix == "test:"
     
     @pytest.mark.asyncio
     async def test_add_item_with_ttl(self, redis_cache, mock_redis):
@@ -0,0 +1,149 @@
+"""Tests for claim-check offloading of large messages.
+
+This module runs ClaimCheckBackend over the in-process backend with a
+LocalStorage store, so no external services are needed.
+"""
+
+import asyncio
+import json
+import uuid
+from unittest import mock
+
+import pytest
+import pytest_asyncio
+
+from ailf.core.local_storage import LocalStorage
+from ailf.messaging.claim_check import (
+    CLAIM_CHECK_PREFIX,
+    ClaimCheck,
+    ClaimCheckBackend,
+    ClaimCheckError,
+    StorageClaimCheckStore,
+)
+from ailf.messaging.in_process import InProcessBackend, InProcessBroker
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Provide a claim-check store on local storage."""
+    return StorageClaimCheckStore(LocalStorage(tmp_path))
+
+
+@pytest_asyncio.fixture
+async def backend(store):
+    """Provide a connected claim-check backend on a private broker."""
+    backend = ClaimCheckBackend(InProcessBackend(broker=InProcessBroker()), store, threshold=100)
+    await backend.connect()
+    yield backend
+    await backend.disconnect()
+
+
+class TestClaimCheckBackend:
+    """Test the ClaimCheckBackend class."""
+
+    @pytest.mark.asyncio
+    async def test_small_messages_pass_through(self, backend):
+        """Test that messages under the threshold are published unchanged."""
+        wire, received = [], []
+
+        async def on_wire(topic, message):
+            wire.append(message)
+
+        async def on_message(topic, message):
+            received.append(message)
+
+        await backend.backend.subscribe("agent", on_wire)
+        await backend.subscribe("agent", on_message)
+        await backend.publish("agent", "small")
+        await backend.backend.broker.join("agent")
+
+        assert wire == ["small"]
+        assert received == ["small"]
+
+    @pytest.mark.asyncio
+    async def test_large_messages_are_offloaded_and_resolved(self, backend):
+        """Test that large messages travel as references and keep their type."""
+        wire, received = [], []
+
+        async def on_wire(topic, message):
+            wire.append(message)
+
+        async def on_message(topic, message):
+            received.append(message)
+
+        await backend.backend.subscribe("agent", on_wire)
+        await backend.subscribe("agent", on_message)
+        await backend.publish("agent", "x" * 1000)
+        await backend.publish("agent", b"\x00" * 1000)
+        await backend.backend.broker.join("agent")
+
+        assert all(ClaimCheck.decode(message) is not None for message in wire)
+        assert all(len(message) < 200 for message in wire)
+        assert received == ["x" * 1000, b"\x00" * 1000]
+
+    @pytest.mark.asyncio
+    async def test_lazy_resolution_is_cached(self, backend, store):
+        """Test that resolve=False delivers the reference and resolving it is cached."""
+        received = []
+
+        async def on_message(topic, message):
+            received.append(message)
+
+        await backend.subscribe("agent", on_message, resolve=False)
+        await backend.publish("agent", "y" * 500)
+        await backend.backend.broker.join("agent")
+
+        claim = received[0]
+        assert isinstance(claim, ClaimCheck)
+        assert claim.size == 500
+
+        first, second = await asyncio.gather(backend.resolve(claim), backend.resolve(claim))
+        assert first == second == "y" * 500
+
+        await store.delete(claim.key)
+        assert await backend.resolve(claim) == "y" * 500
+
+    @pytest.mark.asyncio
+    async def test_expired_payloads_are_collected(self, backend, store):
+        """Test that garbage collection removes expired payloads only."""
+        received = []
+
+        async def on_message(topic, message):
+            received.append(message)
+
+        await backend.subscribe("agent", on_message, resolve=False)
+        await backend.publish("agent", "a" * 500, ttl=-1)
+        await backend.publish("agent", "b" * 500)
+        await backend.backend.broker.join("agent")
+
+        assert await backend.collect_garbage() == 1
+        with pytest.raises(ClaimCheckError):
+            await backend.resolve(received[0])
+        assert await backend.resolve(received[1]) == "b" * 500
+
+    @pytest.mark.asyncio
+    async def test_garbage_collection_does_not_read_payloads(self, store):
+        """Test that collection finds expired payloads from their expiry markers alone."""
+        old, new = uuid.uuid4().hex, uuid.uuid4().hex
+        await store.put(old, b"a" * 500, ttl=-1)
+        await store.put(new, b"b" * 500, ttl=60)
+
+        with mock.patch.object(store.storage, "get_json", side_effect=AssertionError("payload read")):
+            assert await store.collect_garbage() == 1
+
+        assert await store.get(old) is None
+        assert await store.get(new) == b"b" * 500
+        assert len(store.storage.list_directory("claim_checks/expiry")) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("key", ["../../secrets", "a" * 31 + "/", "A" * 32, 12])
+    async def test_crafted_keys_are_rejected(self, store, tmp_path, key):
+        """Test that keys other than generated ones never reach the storage."""
+        (tmp_path / "secrets.json").write_text('{"data": ""}')
+        message = CLAIM_CHECK_PREFIX + json.dumps({"key": key, "size": 1, "type": "str", "expires_at": 0})
+
+        with pytest.raises(ClaimCheckError):
+            ClaimCheck.decode(message)
+        with pytest.raises(ClaimCheckError):
+            await store.delete(key)
+        assert (tmp_path / "secrets.json").exists()
@@ -0,0 +1,229 @@
+"""Tests for the in-process messaging backend.
+
+This module tests fan-out, consumer groups and backpressure of the
+asyncio queue backend, and ACPHandler running on top of it.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from ailf.communication.acp_handler import ACPHandler
+from ailf.messaging.in_process import InProcessBackend, InProcessBroker
+from ailf.schemas.acp import ACPMessageType, InformationSharePayload
+
+
+@pytest_asyncio.fixture
+async def backend():
+    """Provide a connected backend on a private broker."""
+    backend = InProcessBackend(broker=InProcessBroker())
+    await backend.connect()
+    yield backend
+    await backend.disconnect()
+
+
+class TestInProcessBackend:
+    """Test the InProcessBackend class."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_passes_objects_by_reference(self, backend):
+        """Test that every subscriber receives the same object."""
+        received = []
+
+        async def on_message(topic, message):
+            received.append((topic, message))
+
+        await backend.subscribe("agent", on_message)
+        await backend.subscribe("agent", on_message)
+
+        payload = {"large": list(range(10))}
+        await backend.publish("agent", payload)
+        await backend.broker.join("agent")
+
+        assert len(received) == 2
+        assert all(topic == "agent" and message is payload for topic, message in received)
+
+    @pytest.mark.asyncio
+    async def test_consumer_group_splits_messages(self, backend):
+        """Test that consumers in one group each handle a share of the messages."""
+        handled = {"a": [], "b": []}
+
+        def handler(name):
+            async def on_message(topic, message):
+                handled[name].append(message)
+                await asyncio.sleep(0)
+            return on_message
+
+        await backend.subscribe("jobs", handler("a"), group="workers")
+        await backend.subscribe("jobs", handler("b"), group="workers")
+
+        for i in range(20):
+            await backend.publish("jobs", i)
+        await backend.broker.join("jobs")
+
+        assert sorted(handled["a"] + handled["b"]) == list(range(20))
+        assert handled["a"] and handled["b"]
+        assert backend.broker.groups("jobs") == ["workers"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure(self, backend):
+        """Test that publishers wait, or fail with block=False, when a queue is full."""
+        release = asyncio.Event()
+
+        async def slow(topic, message):
+            await release.wait()
+
+        await backend.subscribe("slow", slow, group="g", max_queue_size=2)
+        await backend.publish("slow", 1)
+        await asyncio.sleep(0)  # Consumer takes message 1 and blocks
+        await backend.publish("slow", 2)
+        await backend.publish("slow", 3)
+        assert backend.broker.backlog("slow", "g") == 2
+
+        with pytest.raises(asyncio.QueueFull):
+            await backend.publish("slow", 4, block=False)
+
+        blocked = asyncio.create_task(backend.publish("slow", 4))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await asyncio.wait_for(blocked, 1.0)
+        await backend.broker.join("slow")
+
+    @pytest.mark.asyncio
+    async def test_callback_errors_do_not_stop_consumer(self, backend):
+        """Test that a failing callback does not stop later deliveries."""
+        received = []
+
+        async def on_message(topic, message):
+            if message == "bad":
+                raise ValueError("boom")
+            received.append(message)
+
+        await backend.subscribe("t", on_message)
+        await backend.publish("t", "bad")
+        await backend.publish("t", "good")
+        await backend.broker.join("t")
+
+        assert received == ["good"]
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_removes_groups(self, backend):
+        """Test that unsubscribing drops the topic's groups from the broker."""
+        async def on_message(topic, message):
+            pass
+
+        await backend.subscribe("t", on_message, group="g")
+        await backend.unsubscribe("t")
+
+        assert backend.broker.topics() == []
+        await backend.publish("t", "dropped")
+
+    @pytest.mark.asyncio
+    async def test_send_message_targets_agent_topic(self, backend):
+        """Test the routing-layer send_message interface."""
+        received = asyncio.Queue()
+
+        async def on_message(topic, message):
+            await received.put((topic, message))
+
+        await backend.subscribe("agent-b", on_message)
+        await backend.send_message(target="agent-b", message="task")
+
+        assert await asyncio.wait_for(received.get(), 1.0) == ("agent-b", "task")
+
+    @pytest.mark.asyncio
+    async def test_publish_requires_connection(self):
+        """Test that publishing before connect raises ConnectionError."""
+        backend = InProcessBackend(broker=InProcessBroker())
+        with pytest.raises(ConnectionError):
+            await backend.publish("t", "m")
+
+    @pytest.mark.asyncio
+    async def test_non_blocking_publish_is_all_or_nothing(self, backend):
+        """Test that block=False delivers to no group when any group is full."""
+        release = asyncio.Event()
+        fast = []
+
+        async def slow(topic, message):
+            await release.wait()
+
+        async def record(topic, message):
+            fast.append(message)
+
+        # The full group is checked last, after the group with room
+        await backend.subscribe("t", record, group="fast")
+        await backend.subscribe("t", slow, group="slow", max_queue_size=1)
+        await backend.publish("t", 1)
+        await asyncio.sleep(0)  # Slow consumer takes message 1 and blocks
+        await backend.publish("t", 2)
+
+        with pytest.raises(asyncio.QueueFull):
+            await backend.publish("t", 3, block=False)
+        await asyncio.sleep(0.01)
+        assert fast == [1, 2]
+        assert backend.broker.backlog("t", "slow") == 1
+
+        release.set()
+        await backend.broker.join("t")
+
+    @pytest.mark.asyncio
+    async def test_blocking_publish_does_not_hold_back_other_groups(self, backend):
+        """Test that a full group does not delay delivery to the other groups."""
+        release = asyncio.Event()
+        fast = asyncio.Queue()
+
+        async def slow(topic, message):
+            await release.wait()
+
+        async def record(topic, message):
+            await fast.put(message)
+
+        await backend.subscribe("t", slow, group="slow", max_queue_size=1)
+        await backend.subscribe("t", record, group="fast")
+        await backend.publish("t", 1)
+        await asyncio.sleep(0)  # Slow consumer takes message 1 and blocks
+        await backend.publish("t", 2)
+
+        blocked = asyncio.create_task(backend.publish("t", 3))
+        received = [await asyncio.wait_for(fast.get(), 1.0) for _ in range(3)]
+        assert received == [1, 2, 3]
+        assert not blocked.done()
+
+        release.set()
+        await asyncio.wait_for(blocked, 1.0)
+        await backend.broker.join("t")
+
+
+class TestACPHandlerOverInProcess:
+    """Test ACPHandler with InProcessBackend as its transport."""
+
+    @pytest.mark.asyncio
+    async def test_direct_and_broadcast_messages(self):
+        """Test that agents on one broker exchange direct and broadcast ACP messages."""
+        broker = InProcessBroker()
+        sender = ACPHandler("agent-a", InProcessBackend(broker=broker))
+        receiver = ACPHandler("agent-b", InProcessBackend(broker=broker))
+        received = {"agent-a": [], "agent-b": []}
+
+        for handler in (sender, receiver):
+            @handler.register_handler(ACPMessageType.INFORMATION_SHARE)
+            async def on_share(message, agent_id=handler.agent_id):
+                received[agent_id].append(message)
+
+        async with sender, receiver:
+            payload = InformationSharePayload(data_type="note", data_content={"n": 1})
+            direct = await sender.send_message(ACPMessageType.INFORMATION_SHARE, payload,
+                                               recipient_agent_id="agent-b")
+            broadcast = await sender.send_message(ACPMessageType.INFORMATION_SHARE, payload)
+            await broker.join("agent-b")
+            await broker.join(sender.broadcast_topic)
+
+        assert [m.header.message_id for m in received["agent-b"]] == [
+            direct.header.message_id, broadcast.header.message_id]
+        assert [m.header.message_id for m in received["agent-a"]] == [broadcast.header.message_id]
+        assert received["agent-b"][0].payload == {"data_type": "note", "data_content": {"n": 1},
+                                                   "source_reliability": None}
+        assert broker.topics() == []
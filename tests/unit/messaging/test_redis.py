@@ -80,19 +80,15 @@ class TestRedisClient:
         # Create the Redis client
         client = RedisClient(RedisConfig(host='localhost', port=6379))
         
-        # Verify Redis client was created with the correct parameters
-        mock_redis.assert_called_with(
-            host='localhost',
-            port=6379,
-            db=0,
-            password=None,
-            ssl=False,
-            socket_timeout=5.0,
-            socket_connect_timeout=5.0,
-            socket_keepalive=True,
-            decode_responses=True,
-            max_connections=10
-        )
+        # Verify Redis client was created on a shared pool with the correct parameters
+        pool = mock_redis.call_args.kwargs["connection_pool"]
+        assert pool.connection_kwargs["host"] == 'localhost'
+        assert pool.connection_kwargs["port"] == 6379
+        assert pool.connection_kwargs["db"] == 0
+        assert pool.connection_kwargs["socket_timeout"] == 5
+        assert pool.connection_kwargs["decode_responses"] is True
+        assert pool.max_connections == 10
+        assert client.pool_registry.get_pool(client.config) is pool
 
     def test_get(self, mock_redis):
         """Test get method."""
@@ -0,0 +1,104 @@
+"""Tests for auto-pipelining in AsyncRedisClient.
+
+This module checks that concurrent commands share pipeline round trips while
+each caller gets its own reply and error.
+"""
+
+import asyncio
+from unittest import mock
+
+import pytest
+from redis.exceptions import ResponseError
+
+from ailf.messaging.redis import AsyncRedisClient, RedisConfig
+
+
+class FakePipeline:
+    """Pipeline that records queued commands and replies from a dict."""
+
+    def __init__(self, server):
+        self.server = server
+        self.commands = []
+
+    def __getattr__(self, command):
+        def queue(*args, **kwargs):
+            self.commands.append((command, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self, raise_on_error=True):
+        self.server.batches.append(len(self.commands))
+        replies = []
+        for command, args, kwargs in self.commands:
+            if command == "get" and args[0] == "broken":
+                replies.append(ResponseError("WRONGTYPE"))
+            elif command == "get":
+                replies.append(self.server.data.get(args[0]))
+            elif command == "set":
+                self.server.data[args[0]] = args[1]
+                replies.append(True)
+            elif command == "publish":
+                replies.append(1)
+        return replies
+
+
+@pytest.fixture
+def server():
+    """Provide a fake Redis server that counts pipeline round trips."""
+    server = mock.MagicMock()
+    server.data = {"a": "1", "b": "2"}
+    server.batches = []
+    server.pipeline.side_effect = lambda transaction=True: FakePipeline(server)
+    return server
+
+
+def _client(server, **config):
+    client = AsyncRedisClient(RedisConfig(auto_pipeline=True, **config))
+    client._client = server
+    return client
+
+
+class TestAutoPipeline:
+    """Test auto-pipelining of AsyncRedisClient commands."""
+
+    @pytest.mark.asyncio
+    async def test_commands_in_one_tick_share_a_round_trip(self, server):
+        """Test that concurrent commands are sent as one pipeline."""
+        client = _client(server)
+
+        results = await asyncio.gather(
+            client.get("a"), client.get("b"), client.set("c", "3"), client.publish("ch", {"x": 1})
+        )
+
+        assert results == ["1", "2", True, 1]
+        assert server.batches == [4]
+        assert server.data["c"] == "3"
+
+    @pytest.mark.asyncio
+    async def test_errors_are_isolated_per_command(self, server):
+        """Test that a failing command does not fail the rest of its batch."""
+        client = _client(server)
+
+        results = await asyncio.gather(client.get("broken"), client.get("a"), client.get_json("missing"))
+
+        assert results == [None, "1", None]
+        assert server.batches == [3]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_splits_batches(self, server):
+        """Test that a full batch is sent without waiting for the tick to end."""
+        client = _client(server, auto_pipeline_max_batch=2)
+
+        await asyncio.gather(*(client.get("a") for _ in range(5)))
+
+        assert server.batches == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, server):
+        """Test that commands go straight to the client without auto_pipeline."""
+        server.get = mock.AsyncMock(return_value="1")
+        client = AsyncRedisClient(RedisConfig())
+        client._client = server
+
+        assert await client.get("a") == "1"
+        assert server.batches == []
@@ -0,0 +1,218 @@
+"""Tests for Redis client-side caching.
+
+fakeredis does not implement CLIENT TRACKING, so these tests pair fakeredis
+data connections with a scripted tracking connection that delivers the
+invalidation push messages a Redis server would send.
+"""
+
+import queue
+import time
+from unittest import mock
+
+import fakeredis
+import pytest
+
+from ailf.messaging.redis import AsyncRedisClient, RedisClient, RedisConfig
+from ailf.messaging.redis_client_cache import RedisClientCache
+from tests.fake_redis import FakeRedisPoolRegistry
+
+
+class FakeParser:
+    """Parser stand-in that holds the invalidation handler."""
+
+    def __init__(self):
+        self.invalidation_handler = None
+
+    def set_invalidation_push_handler(self, handler):
+        self.invalidation_handler = handler
+
+
+class FakeTrackingConnection:
+    """Tracking connection that replays queued push messages."""
+
+    def __init__(self):
+        self._parser = FakeParser()
+        self.pushes = queue.Queue()
+        self.commands = []
+        self.connected = False
+        self.handled = 0
+
+    def connect(self):
+        self.connected = True
+
+    def send_command(self, *args):
+        self.commands.append(args)
+
+    def read_response(self, push_request=False):
+        if not push_request:
+            return b"OK"
+        push = self.pushes.get_nowait()
+        if isinstance(push, Exception):
+            raise push
+        self._parser.invalidation_handler(push)
+        self.handled += 1
+
+    def can_read(self, timeout=0):
+        try:
+            self.pushes.put(self.pushes.get(timeout=timeout))
+            return True
+        except queue.Empty:
+            return False
+
+    def disconnect(self):
+        self.connected = False
+
+
+class TrackingRedisPoolRegistry(FakeRedisPoolRegistry):
+    """Fakeredis-backed registry with a scripted tracking connection."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.tracking_connections = []
+
+    def _create_connection(self, kwargs):
+        assert kwargs["protocol"] == 3
+        connection = FakeTrackingConnection()
+        self.tracking_connections.append(connection)
+        return connection
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def registry():
+    """Provide a fakeredis-backed registry."""
+    registry = TrackingRedisPoolRegistry()
+    yield registry
+    registry.close()
+
+
+def _client(registry, **config):
+    client = RedisClient(RedisConfig(client_cache=True, **config), pool_registry=registry)
+    _wait_for(lambda: client._cache.tracking)
+    for cache in registry._caches.values():
+        cache.poll_interval = 0.01
+    return client
+
+
+def _push_invalidation(registry, keys):
+    connection = registry.tracking_connections[-1]
+    handled = connection.handled
+    connection.pushes.put(["invalidate", keys])
+    _wait_for(lambda: connection.handled > handled)
+
+
+class TestRedisClientCache:
+    """Test client-side caching through RedisClient."""
+
+    def test_reads_are_served_from_memory_until_invalidated(self, registry):
+        """Test that a cached value survives remote writes until the server invalidates it."""
+        client = _client(registry)
+        other = fakeredis.FakeRedis(server=registry.server, decode_responses=True)
+        other.set("config:agent", '{"v": 1}')
+
+        assert client.get_json("config:agent") == {"v": 1}
+        other.set("config:agent", '{"v": 2}')
+        assert client.get_json("config:agent") == {"v": 1}
+
+        _push_invalidation(registry, [b"config:agent"])
+
+        assert client.get_json("config:agent") == {"v": 2}
+        stats = registry.cache_stats()["localhost:6379/0"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["invalidations"] == 1
+
+    def test_local_writes_invalidate_immediately(self, registry):
+        """Test that a client reads its own writes without waiting for the server push."""
+        client = _client(registry)
+        client.set("key", "old")
+        assert client.get("key") == "old"
+
+        client.set("key", "new")
+        assert client.get("key") == "new"
+        client.delete("key")
+        assert client.get("key") is None
+
+    def test_prefixes_limit_caching_and_tracking(self, registry):
+        """Test that only keys under the configured prefixes are cached and tracked."""
+        client = _client(registry, client_cache_prefixes=("profile:",))
+        client.set("other", "1")
+        client.get("other")
+        client.get("other")
+
+        assert registry.tracking_connections[-1].commands[0] == (
+            "CLIENT", "TRACKING", "ON", "BCAST", "PREFIX", "profile:"
+        )
+        assert registry.cache_stats()["localhost:6379/0 [profile:]"]["hits"] == 0
+
+    def test_cache_is_bounded(self, registry):
+        """Test that least recently used keys are evicted past max_entries."""
+        client = _client(registry, client_cache_max_entries=2)
+        for key in ("a", "b", "a", "c"):
+            client.get(key)
+
+        assert list(client._cache._entries) == ["a", "c"]
+        assert client._cache.stats()["evictions"] == 1
+
+    def test_flush_and_lost_tracking_bypass_the_cache(self, registry):
+        """Test that a server flush empties the cache and a lost connection disables it."""
+        client = _client(registry)
+        client.get("key")
+        _push_invalidation(registry, None)
+        assert client._cache.stats()["size"] == 0
+
+        client._cache.reconnect_delay = 60
+        registry.tracking_connections[-1].pushes.put(ConnectionError("gone"))
+        _wait_for(lambda: not client._cache.tracking)
+        client.get("key")
+        client.get("key")
+
+        assert client._cache.stats()["hits"] == 0
+
+    def test_export(self, registry):
+        """Test that cache hit metrics are exported with the pool metrics."""
+        client = _client(registry)
+        client.get("key")
+        client.get("key")
+        exporter = mock.MagicMock()
+
+        registry.export(exporter)
+
+        counters = {call.args[0]: call.args[1] for call in exporter.export_counters.call_args_list}
+        assert counters["redis_client_cache.localhost:6379/0"]["hits"] == 1
+
+
+class TestAsyncRedisClientCache:
+    """Test client-side caching through AsyncRedisClient."""
+
+    @pytest.mark.asyncio
+    async def test_async_reads_share_the_cache(self, registry):
+        """Test that async clients use the same cache as sync clients."""
+        sync_client = _client(registry)
+        client = AsyncRedisClient(RedisConfig(client_cache=True), pool_registry=registry)
+        await client.set_json("profile:a", {"name": "a"})
+
+        assert await client.get_json("profile:a") == {"name": "a"}
+        assert await client.get_json("profile:a") == {"name": "a"}
+        assert client._cache is sync_client._cache
+        assert client._cache.stats()["hits"] == 1
+        await client.close()
+        await registry.aclose()
+
+
+def test_invalidation_during_a_read_is_not_cached():
+    """Test that a value fetched while its key is invalidated is discarded."""
+    cache = RedisClientCache(FakeTrackingConnection)
+    cache._set_tracking(True)
+
+    token = cache.begin("key")
+    cache.invalidate([b"key"])
+    cache.put("key", "stale", token)
+
+    assert cache.get("key") == (False, None)
@@ -0,0 +1,194 @@
+"""Tests for the shared Redis connection pool registry.
+
+This module checks pool sharing by connection settings, usage statistics and
+idle reaping, using fakeredis connections.
+"""
+
+import asyncio
+from unittest import mock
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from ailf.memory.redis_cache import RedisDistributedCache
+from ailf.messaging.redis import AsyncRedisClient, RedisClient, RedisConfig
+from tests.fake_redis import FakeRedisPoolRegistry
+
+
+@pytest.fixture
+def registry():
+    """Provide a fakeredis-backed registry without background reaping or health checks."""
+    registry = FakeRedisPoolRegistry()
+    yield registry
+    registry.close()
+
+
+class TestRedisPoolRegistry:
+    """Test RedisPoolRegistry."""
+
+    def test_pools_are_shared_by_connection_settings(self, registry):
+        """Test that equal settings share a pool and different ones do not."""
+        pool = registry.get_pool(RedisConfig())
+
+        assert registry.get_pool(RedisConfig()) is pool
+        assert registry.get_pool(url="redis://localhost:6379/0?decode_responses=True") is not pool
+        assert registry.get_pool(RedisConfig(db=1)) is not pool
+        assert pool.max_connections == 10
+        assert registry.get_pool(url="redis://localhost:6379/0").max_connections == 50
+
+    def test_clients_share_connections(self, registry):
+        """Test that clients with the same settings use the same pool and data."""
+        first = RedisClient(RedisConfig(), pool_registry=registry)
+        second = RedisClient(RedisConfig(), pool_registry=registry)
+
+        first.set("key", "value")
+
+        assert second.get("key") == "value"
+        assert first.client.connection_pool is second.client.connection_pool
+        stats = registry.stats()["localhost:6379/0"]
+        assert stats["in_use"] == 0
+        assert stats["acquired"] >= 4
+
+    def test_exhausted_pool_counts_failures(self, registry):
+        """Test that a caller waiting on a full pool times out and is counted."""
+        registry.timeout = 0.01
+        pool = registry.get_pool(RedisConfig(max_connections=1))
+        connection = pool.get_connection()
+
+        with pytest.raises(ConnectionError):
+            pool.get_connection()
+        pool.release(connection)
+
+        stats = registry.stats()["localhost:6379/0"]
+        assert stats["failures"] == 1
+        assert stats["waiters"] == 0
+        assert stats["wait_time_max"] >= 0.01
+
+    def test_idle_connections_are_reaped(self, registry):
+        """Test that connections idle past idle_timeout are disconnected."""
+        pool = registry.get_pool(RedisConfig())
+        connection = pool.get_connection()
+        connection.connect()
+        pool.release(connection)
+
+        registry.idle_timeout = 60
+        assert registry.reap_idle() == 0
+        registry.idle_timeout = 0
+        assert registry.reap_idle() == 1
+        assert registry.stats()["localhost:6379/0"]["reaped"] == 1
+        assert connection._sock is None
+
+    def test_export(self, registry):
+        """Test that statistics are sent to a metrics exporter."""
+        registry.get_pool(RedisConfig())
+        exporter = mock.MagicMock()
+
+        registry.export(exporter)
+
+        name, gauges = exporter.export_gauges.call_args.args
+        assert name == "redis_pool.localhost:6379/0"
+        assert gauges == {"max_connections": 10, "in_use": 0, "waiters": 0}
+        exporter.export_counters.assert_called_once()
+        exporter.export_timers.assert_called_once()
+
+
+    def test_async_clients_outside_a_loop_own_their_pools(self, registry):
+        """Test that clients created outside a loop do not share a pool bound to the first loop."""
+        first, second = registry.async_client(), registry.async_client()
+
+        async def ping(client):
+            try:
+                return await client.ping()
+            finally:
+                await client.aclose()
+
+        assert first.connection_pool is not second.connection_pool
+        assert asyncio.run(ping(first))
+        assert asyncio.run(ping(second))
+        assert registry.stats() == {}
+
+    def test_consumers_created_outside_a_loop_work_in_any_loop(self, registry):
+        """Test that consumers built outside a loop create their client in the loop that uses it."""
+        caches = [RedisDistributedCache("redis://localhost:6379/0", pool_registry=registry) for _ in range(2)]
+
+        async def ping(cache):
+            try:
+                return await cache.ping()
+            finally:
+                await cache.close()
+                await registry.aclose()
+
+        assert asyncio.run(ping(caches[0]))
+        assert asyncio.run(ping(caches[1]))
+
+    def test_closed_loops_are_dropped(self):
+        """Test that the pools and reaper tasks of finished event loops do not accumulate."""
+        registry = FakeRedisPoolRegistry(idle_timeout=60)
+
+        async def ping():
+            client = registry.async_client()
+            try:
+                return await client.ping()
+            finally:
+                await client.aclose()
+
+        try:
+            for _ in range(5):
+                assert asyncio.run(ping())
+                assert len(registry._async_pools) == 1
+                assert len(registry._reaper_tasks) == 1
+            assert registry.stats() == {}
+            assert registry._async_pools == {}
+            assert registry._reaper_tasks == {}
+        finally:
+            registry.close()
+
+
+class TestAsyncRedisPoolRegistry:
+    """Test RedisPoolRegistry with asyncio clients."""
+
+    @pytest.mark.asyncio
+    async def test_async_clients_share_a_pool_per_loop(self, registry):
+        """Test that async clients on one loop share a pool and track waiters."""
+        config = RedisConfig(max_connections=2)
+        clients = [AsyncRedisClient(config, pool_registry=registry) for _ in range(4)]
+
+        await asyncio.gather(*(client.set(f"key{i}", "v") for i, client in enumerate(clients)))
+
+        pools = {(await client.client).connection_pool for client in clients}
+        assert len(pools) == 1
+        stats = registry.stats()["localhost:6379/0 (async)"]
+        assert stats["in_use"] == 0
+        assert stats["max_connections"] == 2
+        for client in clients:
+            await client.close()
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_dedicated_clients_stay_out_of_shared_pools(self, registry):
+        """Test that a client for blocking commands does not take connections from the shared pool."""
+        shared = registry.async_client(RedisConfig(max_connections=1))
+        reader = registry.dedicated_async_client(RedisConfig(max_connections=1))
+
+        blocked = asyncio.create_task(reader.blpop("queue", timeout=1))
+        await asyncio.sleep(0.05)
+        await shared.rpush("queue", "item")
+
+        assert tuple(await asyncio.wait_for(blocked, 1)) == ("queue", "item")
+        assert reader.connection_pool is not shared.connection_pool
+        assert list(registry.stats()) == ["localhost:6379/0 (async)"]
+        await reader.aclose()
+        await shared.aclose()
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_async_idle_connections_are_reaped(self, registry):
+        """Test that idle asyncio connections are disconnected and stay usable."""
+        client = registry.async_client(RedisConfig())
+        await client.set("key", "value")
+
+        registry.idle_timeout = 0
+        assert await registry.reap_idle_async() == 1
+        assert await client.get("key") == "value"
+        await client.aclose()
+        await registry.aclose()
@@ -0,0 +1,98 @@
+"""Tests for priority lanes of RedisStreamsBackend subscriptions.
+
+This module checks weighted and strict lane reads, starvation protection and
+per-lane lag statistics against a fakeredis server.
+"""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+
+from ailf.messaging.redis_streams import LanePolicy, LaneStats, RedisStreamsBackend, StreamLane
+from tests.fake_redis import FakeRedisPoolRegistry
+
+LANES = [StreamLane("tasks:high", weight=6), StreamLane("tasks:normal", weight=3), StreamLane("tasks:low", weight=1)]
+
+
+@pytest_asyncio.fixture
+async def backend():
+    """Provide a connected backend with consumer groups on the test lanes."""
+    backend = RedisStreamsBackend("redis://localhost:6379/0", pool_registry=FakeRedisPoolRegistry())
+    await backend.connect()
+    for lane in LANES:
+        await backend._create_group(lane.stream, "group")
+    yield backend
+    await backend.disconnect()
+
+
+async def _fill(backend, counts):
+    for stream, count in counts.items():
+        for i in range(count):
+            await backend.publish(stream, f"{stream}-{i}")
+
+
+async def _read_round(backend, policy, max_starvation_ms=None, last_read=None):
+    last_read = last_read or {lane.stream: time.monotonic() for lane in LANES}
+    batches = await backend._read_lane_round(LANES, "group", "consumer", 10, policy, max_starvation_ms, last_read)
+    return {stream: len(entries) for stream, entries in batches.items()}
+
+
+class TestStreamLanes:
+    """Test lane reads of RedisStreamsBackend."""
+
+    @pytest.mark.asyncio
+    async def test_weighted_rounds_split_reads_by_weight(self, backend):
+        """Test that a weighted round reads from every lane in proportion to its weight."""
+        await _fill(backend, {"tasks:high": 20, "tasks:normal": 20, "tasks:low": 20})
+
+        assert await _read_round(backend, LanePolicy.WEIGHTED) == {"tasks:high": 6, "tasks:normal": 3, "tasks:low": 1}
+
+    @pytest.mark.asyncio
+    async def test_strict_rounds_read_the_highest_lane_with_messages(self, backend):
+        """Test that strict rounds drain higher lanes first."""
+        await _fill(backend, {"tasks:normal": 3, "tasks:low": 3})
+
+        assert await _read_round(backend, LanePolicy.STRICT) == {"tasks:normal": 3}
+        assert await _read_round(backend, LanePolicy.STRICT) == {"tasks:low": 3}
+
+    @pytest.mark.asyncio
+    async def test_strict_rounds_protect_starving_lanes(self, backend):
+        """Test that a lane unread for max_starvation_ms is read ahead of higher lanes."""
+        await _fill(backend, {"tasks:high": 3, "tasks:low": 3})
+        now = time.monotonic()
+        last_read = {"tasks:high": now, "tasks:normal": now, "tasks:low": now - 10}
+
+        assert await _read_round(backend, LanePolicy.STRICT, 5000, last_read) == {"tasks:low": 3}
+
+    @pytest.mark.asyncio
+    async def test_subscription_delivers_in_priority_order_with_lag_stats(self, backend):
+        """Test that a lane subscription handles higher lanes first and records lag."""
+        await _fill(backend, {"tasks:low": 2, "tasks:high": 2})
+        received = []
+        done = asyncio.Event()
+
+        async def on_message(stream, payload):
+            received.append(payload.decode())
+            if len(received) == 4:
+                done.set()
+
+        await backend.subscribe("tasks", on_message, lanes=LANES, lane_policy="strict", block_ms=50)
+        await asyncio.wait_for(done.wait(), 5)
+
+        assert received == ["tasks:high-0", "tasks:high-1", "tasks:low-0", "tasks:low-1"]
+        stats = backend.lane_stats("tasks")
+        assert stats["tasks:high"]["delivered"] == 2
+        assert stats["tasks:normal"]["delivered"] == 0
+        assert stats["tasks:low"]["lag_ms_max"] >= 0
+
+
+def test_lane_validation():
+    """Test that lanes need a positive weight and lag is taken from entry IDs."""
+    with pytest.raises(ValueError):
+        StreamLane("s", weight=0)
+
+    stats = LaneStats()
+    stats.record(f"{int(time.time() * 1000) - 250}-0".encode())
+    assert 250 <= stats.lag_ms_avg < 1250
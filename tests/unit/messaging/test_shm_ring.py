@@ -0,0 +1,144 @@
+"""Tests for the shared-memory ring-buffer backend.
+
+This module tests the SPSC ring and the backend within one process and
+across processes.
+"""
+
+import asyncio
+import multiprocessing
+import sys
+import uuid
+
+import pytest
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="POSIX shared memory and FIFOs")
+
+from ailf.messaging.shm_ring import ShmRing, ShmRingBackend  # noqa: E402
+
+
+@pytest.fixture
+def ring():
+    """Provide a small ring that is unlinked afterwards."""
+    ring = ShmRing.create(f"ailf_test_{uuid.uuid4().hex[:8]}", capacity=256)
+    yield ring
+    ring.unlink()
+    ring.close()
+
+
+def _bus_name() -> str:
+    """Build a unique bus name."""
+    return f"test-{uuid.uuid4().hex[:8]}"
+
+
+def _produce(bus: str, count: int) -> None:
+    """Publish numbered messages to a bus from a child process."""
+    async def run():
+        backend = ShmRingBackend(ring_size=4096)
+        await backend.connect()
+        for i in range(count):
+            await backend.publish("numbers", str(i), bus=bus)
+        await backend.disconnect()
+
+    asyncio.run(run())
+
+
+class TestShmRing:
+    """Test the ShmRing class."""
+
+    def test_variable_size_records_wrap_around(self, ring):
+        """Test that records of varying size survive many wrap-arounds."""
+        for i in range(200):
+            payload = bytes([i % 256]) * (i % 50)
+            assert ring.write(b"t", payload)
+            assert ring.read() == (b"t", payload)
+        assert ring.read() is None
+        assert len(ring) == 0
+
+    def test_full_ring_rejects_writes(self, ring):
+        """Test that writes fail when the ring is full and succeed after reading."""
+        written = 0
+        while ring.write(b"topic", b"x" * 40):
+            written += 1
+        assert written > 0
+
+        assert ring.read() == (b"topic", b"x" * 40)
+        assert ring.write(b"topic", b"x" * 40)
+
+    def test_oversized_record(self, ring):
+        """Test that a record that can never fit is rejected."""
+        with pytest.raises(ValueError):
+            ring.write(b"t", b"x" * ring.capacity)
+
+    def test_topic_length_limit(self):
+        """Test that topics too long for the 16-bit length field are rejected."""
+        ring = ShmRing.create(f"ailf_test_{uuid.uuid4().hex[:8]}", capacity=256 * 1024)
+        try:
+            with pytest.raises(ValueError, match="Topic"):
+                ring.write(b"t" * 0x10000, b"")
+            assert ring.write(b"t" * 0xFFFF, b"x")
+            assert ring.read() == (b"t" * 0xFFFF, b"x")
+        finally:
+            ring.unlink()
+            ring.close()
+
+
+class TestShmRingBackend:
+    """Test the ShmRingBackend class."""
+
+    @pytest.mark.asyncio
+    async def test_demultiplexes_topics(self):
+        """Test that records reach only the subscribers of their topic."""
+        bus = _bus_name()
+        received = asyncio.Queue()
+
+        async def on_message(topic, message):
+            await received.put((topic, message))
+
+        backend = ShmRingBackend(inbox=bus)
+        await backend.connect()
+        try:
+            await backend.subscribe("wanted", on_message)
+            await backend.publish("other", b"skip", bus=bus)
+            await backend.publish("wanted", "hello", bus=bus)
+            result = await asyncio.wait_for(received.get(), 1.0)
+        finally:
+            await backend.disconnect()
+
+        assert result == ("wanted", b"hello")
+        assert received.empty()
+
+    @pytest.mark.asyncio
+    async def test_receives_from_other_process(self):
+        """Test that messages from another process arrive in order."""
+        bus = _bus_name()
+        received = []
+        done = asyncio.Event()
+
+        async def on_message(topic, message):
+            received.append(int(message))
+            if len(received) == 500:
+                done.set()
+
+        backend = ShmRingBackend(inbox=bus)
+        await backend.connect()
+        await backend.subscribe("numbers", on_message)
+        process = multiprocessing.get_context("fork").Process(target=_produce, args=(bus, 500))
+        try:
+            process.start()
+            await asyncio.wait_for(done.wait(), 10.0)
+        finally:
+            process.join(5)
+            await backend.disconnect()
+
+        assert received == list(range(500))
+
+    @pytest.mark.asyncio
+    async def test_publish_to_missing_bus(self):
+        """Test that publishing to a bus nobody owns raises ConnectionError."""
+        backend = ShmRingBackend()
+        await backend.connect()
+        try:
+            with pytest.raises(ConnectionError):
+                await backend.publish(_bus_name(), b"lost")
+        finally:
+            await backend.disconnect()
@@ -0,0 +1,117 @@
+"""Tests for Redis Streams consumer telemetry.
+
+This module checks backlog sampling, handler metrics and exporting against a
+fakeredis server.
+"""
+
+import asyncio
+from unittest import mock
+
+import pytest
+import pytest_asyncio
+
+from ailf.core.monitoring import MetricsExporter
+from ailf.messaging.redis_streams import RedisStreamsBackend
+from ailf.messaging.stream_telemetry import HandlerMetrics, StreamTelemetry
+from tests.fake_redis import FakeRedisPoolRegistry
+
+
+@pytest_asyncio.fixture
+async def backend():
+    """Provide a connected backend."""
+    backend = RedisStreamsBackend("redis://localhost:6379/0", pool_registry=FakeRedisPoolRegistry())
+    await backend.connect()
+    yield backend
+    await backend.disconnect()
+
+
+class TestHandlerMetrics:
+    """Test HandlerMetrics."""
+
+    def test_histogram_is_cumulative(self):
+        """Test that latencies land in cumulative buckets and errors are counted."""
+        metrics = HandlerMetrics(buckets=(0.1, 1.0))
+        metrics.record(0.05)
+        metrics.record(0.5, ok=False)
+        metrics.record(5.0)
+
+        assert metrics.histogram() == {"le_0.1": 1, "le_1.0": 2, "le_inf": 3}
+        assert (metrics.handled, metrics.errors) == (3, 1)
+        assert metrics.drain_observations() == [0.05, 0.5, 5.0]
+        assert metrics.drain_observations() == []
+
+
+class TestStreamTelemetry:
+    """Test StreamTelemetry sampling of RedisStreamsBackend subscriptions."""
+
+    @pytest.mark.asyncio
+    async def test_collect_reports_lag_pending_and_rate(self, backend):
+        """Test that a sample reflects undelivered, unacknowledged and handled entries."""
+        handled = asyncio.Event()
+        release = asyncio.Event()
+
+        async def on_message(topic, payload):
+            handled.set()
+            await release.wait()
+
+        for i in range(5):
+            await backend.publish("jobs", f"job-{i}")
+        await backend.subscribe("jobs", on_message, count=2, block_ms=50)
+        await asyncio.wait_for(handled.wait(), 5)
+
+        telemetry = StreamTelemetry(backend)
+        sample = (await telemetry.collect())["jobs"]
+
+        assert sample["lag"] == 3
+        assert sample["pending"] == 2
+        assert sample["oldest_pending_age_seconds"] >= 0
+        assert sample["backlog"] == 5
+        assert sample["estimated_drain_seconds"] is None
+
+        release.set()
+        for _ in range(100):
+            if backend.handler_metrics("jobs").handled == 5:
+                break
+            await asyncio.sleep(0.02)
+        sample = (await telemetry.collect())["jobs"]
+
+        assert sample["handled"] == 5
+        assert sample["pending"] == 0
+        assert sample["processing_rate"] > 0
+        assert sample["handler_latency"]["le_inf"] == 5
+
+    @pytest.mark.asyncio
+    async def test_export_sends_gauges_counters_and_histogram(self, backend):
+        """Test that samples reach exporters and latencies are sent once."""
+        async def on_message(topic, payload):
+            pass
+
+        await backend.subscribe("jobs", on_message, block_ms=50)
+        await backend.publish("jobs", "job")
+        for _ in range(100):
+            if backend.handler_metrics("jobs").handled:
+                break
+            await asyncio.sleep(0.02)
+        exporter = mock.MagicMock(spec=MetricsExporter)
+        telemetry = StreamTelemetry(backend, [exporter])
+
+        await telemetry.sample_and_export()
+        await telemetry.sample_and_export()
+
+        name, gauges = exporter.export_gauges.call_args.args
+        assert name == "redis_streams.jobs"
+        assert gauges["backlog"] == 0
+        first, second = exporter.export_histogram.call_args_list
+        assert len(first.args[2]) == 1
+        assert second.args[2] == []
+
+    def test_default_histogram_export_falls_back_to_timers(self):
+        """Test that exporters without histogram support receive summary timers."""
+        class Exporter(MetricsExporter):
+            export_counters = export_ai_stats = mock.MagicMock()
+            export_timers = mock.MagicMock()
+
+        exporter = Exporter()
+        exporter.export_histogram("c", "latency", [0.1, 0.3])
+
+        exporter.export_timers.assert_called_once_with("c", {"latency_avg": pytest.approx(0.2), "latency_max": 0.3})
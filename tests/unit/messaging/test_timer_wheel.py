@@ -0,0 +1,117 @@
+"""Tests for the hashed timer wheel.
+
+This module tests deadline scheduling, refreshing and expiry.
+"""
+
+import pytest
+
+from ailf.messaging.timer_wheel import TimerWheel
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Provide a fake clock."""
+    return FakeClock()
+
+
+class TestTimerWheel:
+    """Test the TimerWheel class."""
+
+    def test_invalid_configuration(self):
+        """Test that tick and slot counts must be positive."""
+        with pytest.raises(ValueError):
+            TimerWheel(tick=0)
+        with pytest.raises(ValueError):
+            TimerWheel(slots=0)
+
+    def test_expiry(self, clock):
+        """Test that keys expire once their deadline passes."""
+        wheel = TimerWheel(tick=1.0, slots=8, clock=clock)
+        wheel.schedule("a", 5.0)
+        wheel.schedule("b", 10.0)
+
+        clock.now += 4.0
+        assert wheel.advance() == []
+
+        clock.now += 1.0
+        assert wheel.advance() == ["a"]
+        assert "a" not in wheel
+        assert len(wheel) == 1
+
+        clock.now += 5.0
+        assert wheel.advance() == ["b"]
+        assert len(wheel) == 0
+
+    def test_touch_defers_expiry(self, clock):
+        """Test that touching a key pushes its deadline back."""
+        wheel = TimerWheel(tick=1.0, slots=8, clock=clock)
+        wheel.schedule("a", 5.0)
+
+        clock.now += 4.0
+        wheel.touch("a", 5.0)
+        clock.now += 2.0
+        assert wheel.advance() == []
+        assert wheel.deadline("a") == 1009.0
+
+        clock.now += 3.0
+        assert wheel.advance() == ["a"]
+
+    def test_schedule_earlier_deadline(self, clock):
+        """Test that rescheduling a key to an earlier deadline expires it on time."""
+        wheel = TimerWheel(tick=1.0, slots=64, clock=clock)
+        wheel.schedule("a", 30.0)
+        wheel.schedule("a", 2.0)
+
+        clock.now += 2.0
+        assert wheel.advance() == ["a"]
+        assert len(wheel) == 0
+
+    def test_touch_unknown_key_is_ignored(self, clock):
+        """Test that touching an untracked key does not start tracking it."""
+        wheel = TimerWheel(clock=clock)
+        wheel.touch("missing", 5.0)
+        assert "missing" not in wheel
+
+    def test_cancel(self, clock):
+        """Test that cancelled keys never expire."""
+        wheel = TimerWheel(tick=1.0, slots=8, clock=clock)
+        wheel.schedule("a", 2.0)
+
+        assert wheel.cancel("a") is True
+        assert wheel.cancel("a") is False
+
+        clock.now += 10.0
+        assert wheel.advance() == []
+
+    def test_deadline_beyond_one_revolution(self, clock):
+        """Test deadlines longer than the wheel span expire on time."""
+        wheel = TimerWheel(tick=1.0, slots=4, clock=clock)
+        wheel.schedule("a", 10.0)
+
+        for _ in range(9):
+            clock.now += 1.0
+            assert wheel.advance() == []
+
+        clock.now += 1.0
+        assert wheel.advance() == ["a"]
+
+    def test_large_clock_jump(self, clock):
+        """Test that a jump over many revolutions expires everything due."""
+        wheel = TimerWheel(tick=1.0, slots=4, clock=clock)
+        for i in range(20):
+            wheel.schedule(i, float(i + 1))
+        wheel.schedule("late", 500.0)
+
+        clock.now += 100.0
+        assert sorted(wheel.advance()) == list(range(20))
+        assert "late" in wheel
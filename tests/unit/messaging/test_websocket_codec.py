@@ -0,0 +1,152 @@
+"""Tests for the WebSocket wire codec.
+
+This module tests encoding negotiation, binary framing and compression.
+"""
+
+import zlib
+
+import pytest
+
+from ailf.messaging.websocket_codec import (
+    CodecError, MessageCodec, MSGPACK_AVAILABLE, ZSTD_AVAILABLE, available_encodings
+)
+from ailf.schemas.websockets import MessageCompression, MessageEncoding, StandardMessage
+
+requires_msgpack = pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack not installed")
+requires_zstd = pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+
+
+class TestMessageCodec:
+    """Test the MessageCodec class."""
+
+    def test_json_codec_uses_text_frames(self):
+        """Test that the default codec produces plain JSON text frames."""
+        codec = MessageCodec()
+        frame = codec.encode({"type": "standard", "payload": {"key": "value"}})
+
+        assert isinstance(frame, str)
+        assert codec.decode(frame) == {"type": "standard", "payload": {"key": "value"}}
+
+    def test_json_codec_encodes_models(self):
+        """Test that Pydantic models are encoded with their JSON serializer."""
+        codec = MessageCodec()
+        message = StandardMessage(payload={"text": "hello"})
+
+        decoded = codec.decode(codec.encode(message))
+
+        assert decoded["type"] == "standard"
+        assert decoded["payload"] == {"text": "hello"}
+        assert decoded["message_id"] == message.message_id
+
+    @requires_msgpack
+    def test_msgpack_round_trip(self):
+        """Test that msgpack frames are binary and round trip."""
+        codec = MessageCodec(MessageEncoding.MSGPACK)
+        message = StandardMessage(payload={"numbers": [1, 2, 3]})
+
+        frame = codec.encode(message)
+
+        assert isinstance(frame, bytes)
+        assert frame[0] == 0x10
+        decoded = codec.decode(frame)
+        assert decoded["type"] == "standard"
+        assert decoded["payload"] == {"numbers": [1, 2, 3]}
+        assert decoded["timestamp"] == message.timestamp.isoformat()
+
+    @requires_msgpack
+    def test_model_frames_validate_back(self):
+        """Test that decoded msgpack frames validate into the original model."""
+        codec = MessageCodec(MessageEncoding.MSGPACK)
+        message = StandardMessage(payload={"text": "hello"})
+
+        restored = StandardMessage.model_validate(codec.decode(codec.encode(message)))
+
+        assert restored.payload == message.payload
+        assert restored.timestamp == message.timestamp
+
+    def test_compression_threshold(self):
+        """Test that only frames above the threshold are compressed."""
+        codec = MessageCodec(
+            MessageEncoding.JSON, MessageCompression.DEFLATE, compression_threshold=64
+        )
+
+        small = codec.encode({"text": "hi"})
+        large = codec.encode({"text": "x" * 1000})
+
+        assert small[0] == 0x00
+        assert large[0] == 0x01
+        assert len(large) < 1000
+        assert codec.decode(small) == {"text": "hi"}
+        assert codec.decode(large) == {"text": "x" * 1000}
+
+    def test_decode_is_self_describing(self):
+        """Test that any codec decodes frames produced by another codec."""
+        sender = MessageCodec(
+            MessageEncoding.JSON, MessageCompression.DEFLATE, compression_threshold=0
+        )
+        receiver = MessageCodec()
+
+        assert receiver.decode(sender.encode({"key": "value"})) == {"key": "value"}
+
+    def test_decode_invalid_frames(self):
+        """Test that malformed frames raise CodecError."""
+        codec = MessageCodec()
+
+        with pytest.raises(CodecError):
+            codec.decode("not json")
+        with pytest.raises(CodecError):
+            codec.decode(b"")
+        with pytest.raises(CodecError):
+            codec.decode(b"\xff{}")
+        with pytest.raises(CodecError):
+            codec.decode(b"\x01" + zlib.compress(b"[1, 2]"))
+
+    @pytest.mark.parametrize("compression", [
+        MessageCompression.DEFLATE,
+        pytest.param(MessageCompression.ZSTD, marks=requires_zstd),
+    ])
+    def test_decompressed_size_is_bounded(self, compression):
+        """Test that frames inflating past max_message_size are rejected."""
+        sender = MessageCodec(MessageEncoding.JSON, compression, compression_threshold=0)
+        receiver = MessageCodec(max_message_size=1000)
+        fits = sender.encode({"text": "x" * 900})
+        bomb = sender.encode({"text": "x" * 100_000})
+
+        assert receiver.decode(fits) == {"text": "x" * 900}
+        assert len(bomb) < 1000
+        with pytest.raises(CodecError, match="exceeds 1000 bytes"):
+            receiver.decode(bomb)
+
+    @requires_zstd
+    def test_zstd_frames_without_content_size_are_bounded(self):
+        """Test the bound on zstd frames that don't declare their decompressed size."""
+        import zstandard
+
+        compressor = zstandard.ZstdCompressor().compressobj()
+        body = compressor.compress(b'{"text": "' + b"x" * 100_000 + b'"}') + compressor.flush()
+
+        with pytest.raises(CodecError, match="exceeds 1000 bytes"):
+            MessageCodec(max_message_size=1000).decode(b"\x02" + body)
+
+    def test_negotiate_prefers_peer_order(self):
+        """Test negotiation picks the peer's most preferred supported option."""
+        codec = MessageCodec.negotiate(
+            ["unknown", *available_encodings()],
+            ["deflate", "none"]
+        )
+
+        assert codec.encoding == available_encodings()[0]
+        assert codec.compression == MessageCompression.DEFLATE
+
+    def test_negotiate_respects_local_restrictions(self):
+        """Test negotiation falls back to JSON when the server restricts encodings."""
+        codec = MessageCodec.negotiate(
+            ["msgpack", "json"],
+            ["deflate"],
+            allowed_encodings=[MessageEncoding.JSON],
+            allowed_compressions=[MessageCompression.NONE]
+        )
+
+        assert codec.encoding == MessageEncoding.JSON
+        assert codec.compression == MessageCompression.NONE
+        assert not codec.is_binary
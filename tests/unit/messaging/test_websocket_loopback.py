@@ -0,0 +1,205 @@
+"""Loopback tests for the WebSocket client and server.
+
+This module runs a real server on localhost and checks the connect
+handshake, codec negotiation and message round trips end to end.
+"""
+
+import asyncio
+import json
+import socket
+
+import pytest
+import pytest_asyncio
+import websockets
+
+from ailf.messaging.websocket_client import WebSocketClient
+from ailf.messaging.websocket_codec import MSGPACK_AVAILABLE, available_compressions
+from ailf.messaging.websocket_server import Client, WebSocketServer
+from ailf.schemas.websockets import (
+    ConnectMessage, MessageCompression, MessageEncoding, MessageType, StandardMessage
+)
+
+
+def _free_port() -> int:
+    """Find a free TCP port on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest_asyncio.fixture
+async def server():
+    """Provide a running server that echoes standard messages back."""
+    server = WebSocketServer(host="127.0.0.1", port=_free_port())
+    server.received = []
+
+    async def echo(websocket, message):
+        server.received.append(message)
+        await server._send_message_to_client(websocket, message)
+
+    server.on_message = echo
+    await server.start()
+    yield server
+    await server.stop()
+
+
+def _client(server, **kwargs) -> WebSocketClient:
+    """Build a client for the test server without reconnects or pings."""
+    return WebSocketClient(
+        f"ws://127.0.0.1:{server.port}",
+        auto_reconnect=False,
+        ping_interval=None,
+        connection_timeout=2.0,
+        **kwargs
+    )
+
+
+class TestWebSocketLoopback:
+    """Test a client talking to a server over a real socket."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(
+        not MSGPACK_AVAILABLE or MessageCompression.ZSTD not in available_compressions(),
+        reason="msgpack and zstandard are required"
+    )
+    async def test_msgpack_zstd_round_trip(self, server):
+        """Test that msgpack with zstd is negotiated and a message round-trips."""
+        client = _client(
+            server,
+            encodings=[MessageEncoding.MSGPACK],
+            compressions=[MessageCompression.ZSTD]
+        )
+        await client.connect()
+        try:
+            assert client.codec.encoding == MessageEncoding.MSGPACK
+            assert client.codec.compression == MessageCompression.ZSTD
+            (server_client,) = server.clients.values()
+            assert server_client.codec.encoding == MessageEncoding.MSGPACK
+
+            payload = {"text": "hello " * 200, "values": list(range(50))}
+            message = StandardMessage(payload=payload)
+            await client.send(message)
+            echoed = await client.receive(timeout=2.0)
+        finally:
+            await client.disconnect()
+
+        assert isinstance(echoed, StandardMessage)
+        assert echoed.message_id == message.message_id
+        assert echoed.payload == payload
+        assert server.received[0].payload == payload
+
+    @pytest.mark.asyncio
+    async def test_unknown_offers_fall_back_to_json(self, server):
+        """Test that schemes the server does not know are skipped, not rejected."""
+        async with websockets.connect(f"ws://127.0.0.1:{server.port}") as websocket:
+            offer = ConnectMessage(
+                client_id="raw",
+                encodings=["cbor", MessageEncoding.JSON.value],
+                compressions=["brotli", MessageCompression.NONE.value]
+            )
+            await websocket.send(offer.model_dump_json())
+            ack = json.loads(await asyncio.wait_for(websocket.recv(), 2.0))
+
+        assert ack["type"] == MessageType.CONNECT_ACK
+        assert ack["encoding"] == MessageEncoding.JSON
+        assert ack["compression"] == MessageCompression.NONE
+
+
+class TestWebSocketClient:
+    """Test WebSocketClient without a server."""
+
+    @pytest.mark.asyncio
+    async def test_receive_queue_drops_oldest(self):
+        """Test that a client reading only through handlers keeps a bounded receive queue."""
+        client = WebSocketClient("ws://127.0.0.1:1", max_incoming_messages=2)
+        handled = []
+        client.add_message_handler(handled.append)
+        messages = [StandardMessage(payload={"n": i}) for i in range(5)]
+
+        for message in messages:
+            await client._process_incoming_message(client.codec.encode(message))
+
+        assert client._handler_queue.qsize() == 5
+        queued = [client._incoming_queue.get_nowait() for _ in range(client._incoming_queue.qsize())]
+        assert [message.payload["n"] for message in queued] == [3, 4]
+
+
+class TestWebSocketLiveness:
+    """Test idle-client expiry on a running server."""
+
+    @pytest_asyncio.fixture
+    async def server(self):
+        """Provide a server with a short idle timeout and no keepalive pings."""
+        server = WebSocketServer(
+            host="127.0.0.1",
+            port=_free_port(),
+            ping_interval=None,
+            ping_timeout=0.3,
+            idle_timeout=0.3,
+            liveness_tick=0.05
+        )
+        await server.start()
+        yield server
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_quiet_client_that_answers_pings_stays(self, server):
+        """Test that a client sending no messages is kept while it answers pings."""
+        client = _client(server)
+        await client.connect()
+        try:
+            await asyncio.sleep(1.0)
+
+            assert len(server.clients) == 1
+            assert client.connected
+        finally:
+            await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_unresponsive_client_is_dropped(self, server):
+        """Test that a client that stops answering pings is disconnected."""
+        websocket = await websockets.connect(f"ws://127.0.0.1:{server.port}")
+        try:
+            await websocket.send(ConnectMessage(client_id="stalled").model_dump_json())
+            await asyncio.wait_for(websocket.recv(), 2.0)
+            assert "stalled" in server.clients
+
+            # Stop reading so pings go unanswered
+            websocket.transport.pause_reading()
+            await asyncio.sleep(1.5)
+
+            assert "stalled" not in server.clients
+        finally:
+            websocket.transport.abort()
+
+    @pytest.mark.asyncio
+    async def test_slow_probe_does_not_delay_other_clients(self, server):
+        """Test that a client waiting for its pong does not hold up the next expiries."""
+
+        class FakeSocket:
+            def __init__(self, answers):
+                self.answers = answers
+                self.pings = 0
+
+            async def ping(self):
+                self.pings += 1
+                pong_waiter = asyncio.get_running_loop().create_future()
+                if self.answers:
+                    pong_waiter.set_result(None)
+                return pong_waiter
+
+        server.ping_timeout = 5.0
+        stalled, alive = FakeSocket(answers=False), FakeSocket(answers=True)
+        server.clients["stalled"] = Client(stalled, "stalled", "session-1")
+        server.clients["alive"] = Client(alive, "alive", "session-2")
+        server._liveness.schedule("stalled", 0.0)
+        server._liveness.schedule("alive", 0.2)
+        try:
+            await asyncio.sleep(0.6)
+
+            assert stalled.pings == 1
+            assert alive.pings >= 1
+            assert "alive" in server._liveness  # Re-armed after answering
+        finally:
+            server.clients.pop("stalled")
+            server.clients.pop("alive")
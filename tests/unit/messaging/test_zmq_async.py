@@ -0,0 +1,215 @@
+"""Tests for asyncio ZMQ messaging.
+
+This module tests the asyncio ZMQ classes over inproc sockets.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+import zmq
+import zmq.asyncio
+
+from ailf.messaging.zmq_async import (
+    AsyncZMQBackend, AsyncZMQClient, AsyncZMQPublisher, AsyncZMQServer, AsyncZMQSubscriber
+)
+
+
+@pytest.fixture
+def context():
+    """Provide a private asyncio ZMQ context."""
+    ctx = zmq.asyncio.Context()
+    yield ctx
+    ctx.term()
+
+
+def _address() -> str:
+    """Build a unique inproc address."""
+    return f"inproc://test-{uuid.uuid4().hex[:8]}"
+
+
+class TestAsyncZMQServerClient:
+    """Test the ROUTER/DEALER server and client."""
+
+    @pytest.mark.asyncio
+    async def test_pipelined_requests_resolve_to_own_replies(self, context):
+        """Test that concurrent requests each receive their own reply."""
+        address = _address()
+
+        async def handler(request: bytes) -> bytes:
+            # Finish later requests first to force out-of-order replies
+            await asyncio.sleep(0.05 / int(request))
+            return b"echo:" + request
+
+        server = AsyncZMQServer(context=context)
+        server.bind(address)
+        await server.start(handler)
+
+        client = AsyncZMQClient(context=context)
+        client.connect(address)
+        try:
+            replies = await asyncio.gather(
+                *(client.send_request(str(i), timeout=2.0) for i in range(1, 11))
+            )
+        finally:
+            client.close()
+            await server.stop()
+            server.close()
+
+        assert replies == [f"echo:{i}".encode() for i in range(1, 11)]
+
+    @pytest.mark.asyncio
+    async def test_requests_run_concurrently(self, context):
+        """Test that the server does not handle requests one at a time."""
+        address = _address()
+
+        async def handler(request: bytes) -> bytes:
+            await asyncio.sleep(0.2)
+            return request
+
+        server = AsyncZMQServer(context=context)
+        server.bind(address)
+        await server.start(handler)
+
+        client = AsyncZMQClient(context=context)
+        client.connect(address)
+        try:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await asyncio.gather(*(client.send_request(b"x", timeout=2.0) for _ in range(10)))
+            elapsed = loop.time() - start
+        finally:
+            client.close()
+            await server.stop()
+            server.close()
+
+        assert elapsed < 1.0
+
+    @pytest.mark.asyncio
+    async def test_handler_error_is_returned(self, context):
+        """Test that handler exceptions produce an error reply."""
+        address = _address()
+
+        async def handler(request: bytes) -> bytes:
+            raise ValueError("boom")
+
+        server = AsyncZMQServer(context=context)
+        server.bind(address)
+        await server.start(handler)
+
+        client = AsyncZMQClient(context=context)
+        client.connect(address)
+        try:
+            reply = await client.send_request_json({"op": "fail"}, timeout=2.0)
+        finally:
+            client.close()
+            await server.stop()
+            server.close()
+
+        assert reply == {"error": "boom"}
+
+    @pytest.mark.asyncio
+    async def test_request_timeout(self, context):
+        """Test that a request without a reply times out and is forgotten."""
+        client = AsyncZMQClient(context=context)
+        client.connect(_address())
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await client.send_request(b"ping", timeout=0.05)
+            assert client.in_flight == 0
+        finally:
+            client.close()
+
+
+class TestAsyncZMQPubSub:
+    """Test the asyncio publisher, subscriber and backend."""
+
+    @pytest.mark.asyncio
+    async def test_subscriber_receive(self, context):
+        """Test publishing and receiving a message."""
+        address = _address()
+        publisher = AsyncZMQPublisher(context=context)
+        publisher.bind(address)
+        subscriber = AsyncZMQSubscriber(context=context)
+        subscriber.connect(address)
+        subscriber.subscribe("topic")
+        await asyncio.sleep(0.05)
+
+        try:
+            await publisher.publish("topic", {"key": "value"})
+            topic, message = await subscriber.receive(timeout=1.0)
+        finally:
+            subscriber.close()
+            publisher.close()
+
+        assert topic == "topic"
+        assert message == b'{"key": "value"}'
+
+    @pytest.mark.asyncio
+    async def test_backend_dispatches_to_callbacks(self, context):
+        """Test that the backend invokes the callback for its topic only."""
+        address = _address()
+        received = asyncio.Queue()
+
+        async def on_message(topic, message):
+            await received.put((topic, message))
+
+        # An external publisher binds the address the backend subscribes to
+        publisher = AsyncZMQPublisher(context=context)
+        publisher.bind(address)
+
+        backend = AsyncZMQBackend(_address(), address, context)
+        try:
+            await backend.connect()
+            await backend.subscribe("wanted", on_message)
+            await asyncio.sleep(0.05)
+
+            await publisher.publish("other", b"skip")
+            await publisher.publish("wanted", b"hello")
+            topic, message = await asyncio.wait_for(received.get(), 1.0)
+        finally:
+            await backend.disconnect()
+            publisher.close()
+
+        assert (topic, message) == ("wanted", b"hello")
+        assert received.empty()
+
+    @pytest.mark.asyncio
+    async def test_callbacks_match_topic_prefixes(self, context):
+        """Test that every callback whose topic is a prefix of the message topic runs."""
+        address = _address()
+        received = []
+
+        def handler(name):
+            async def on_message(topic, message):
+                received.append((name, topic))
+            return on_message
+
+        publisher = AsyncZMQPublisher(context=context)
+        publisher.bind(address)
+        subscriber = AsyncZMQSubscriber(context=context)
+        subscriber.connect(address)
+        subscriber.subscribe("", handler("all"))
+        subscriber.subscribe("agent.", handler("agents"))
+        subscriber.subscribe("agent.b", handler("b"))
+        subscriber.start()
+        await asyncio.sleep(0.05)
+
+        try:
+            await publisher.publish("agent.a", b"1")
+            await publisher.publish("agent.b.status", b"2")
+            await publisher.publish("system", b"3")
+            for _ in range(50):
+                if len(received) == 6:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await subscriber.stop()
+            subscriber.close()
+            publisher.close()
+
+        assert sorted(received) == sorted([
+            ("all", "agent.a"), ("agents", "agent.a"),
+            ("all", "agent.b.status"), ("agents", "agent.b.status"), ("b", "agent.b.status"),
+            ("all", "system"),
+        ])
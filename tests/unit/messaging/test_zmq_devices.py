@@ -0,0 +1,169 @@
+"""Tests for the ZMQ devices.
+
+This module runs ProxyDevice and ThreadDevice over inproc sockets on a
+private context.
+"""
+
+import time
+import uuid
+
+import pytest
+import zmq
+
+from ailf.messaging.zmq_devices import DeviceError, ProxyDevice, ThreadDevice
+from ailf.schemas.zmq_devices import DeviceConfig, DeviceType
+
+
+@pytest.fixture
+def context():
+    """Provide a private ZMQ context, terminated after the test."""
+    context = zmq.Context()
+    yield context
+    context.term()
+
+
+def _config(**kwargs):
+    name = uuid.uuid4().hex
+    return DeviceConfig(
+        device_type=DeviceType.STREAMER,
+        frontend_addr=f"inproc://frontend-{name}",
+        backend_addr=f"inproc://backend-{name}",
+        **kwargs
+    )
+
+
+def _socket(context, socket_type, address, subscribe=False):
+    socket = context.socket(socket_type)
+    socket.setsockopt(zmq.LINGER, 0)
+    socket.setsockopt(zmq.RCVTIMEO, 2000)
+    if subscribe:
+        socket.setsockopt(zmq.SUBSCRIBE, b"")
+    socket.connect(address)
+    return socket
+
+
+class Pipeline:
+    """PUSH and PULL sockets connected to a STREAMER device."""
+
+    def __init__(self, context, device):
+        self.producer = _socket(context, zmq.PUSH, device.config.frontend_addr)
+        self.consumer = _socket(context, zmq.PULL, device.config.backend_addr)
+
+    def roundtrip(self, messages):
+        for message in messages:
+            self.producer.send(message)
+        return [self.consumer.recv() for _ in messages]
+
+    def close(self):
+        self.producer.close()
+        self.consumer.close()
+
+
+class TestProxyDevice:
+    """Test the ProxyDevice class."""
+
+    def test_start_and_stop(self, context):
+        """Test that the proxy forwards while running and leaves the caller's context open."""
+        device = ProxyDevice(_config(), context=context, capture_metrics=False)
+        device.start()
+        pipeline = Pipeline(context, device)
+        try:
+            assert device.is_alive()
+            assert pipeline.roundtrip([b"a", b"b"]) == [b"a", b"b"]
+        finally:
+            pipeline.close()
+            device.stop()
+
+        assert not device.is_alive()
+        assert not context.closed
+        with pytest.raises(DeviceError):
+            device.pause()
+
+    def test_capture_metrics(self, context):
+        """Test that forwarded messages are counted from the capture socket."""
+        device = ProxyDevice(_config(), context=context, metrics_flush_interval=0.01)
+        device.start()
+        pipeline = Pipeline(context, device)
+        try:
+            pipeline.roundtrip([b"x" * 10] * 5)
+            deadline = time.monotonic() + 2.0
+            while device.collector.messages < 5 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            pipeline.close()
+            device.stop()
+
+        assert device.collector.messages == 5
+        assert device.collector.bytes == 50
+
+    def test_pause_and_resume(self, context):
+        """Test that messages wait in the sockets while paused and flow again on resume."""
+        device = ProxyDevice(_config(), context=context, capture_metrics=False)
+        with pytest.raises(DeviceError):
+            device.pause()
+
+        device.start()
+        pipeline = Pipeline(context, device)
+        try:
+            device.pause()
+            assert device.is_alive()
+            pipeline.producer.send(b"held")
+            assert not pipeline.consumer.poll(100)
+
+            device.resume()
+            assert pipeline.consumer.recv() == b"held"
+            device.resume()
+            assert pipeline.roundtrip([b"after"]) == [b"after"]
+        finally:
+            pipeline.close()
+            device.stop()
+
+    def test_stop_while_paused(self, context):
+        """Test that a paused proxy can be stopped."""
+        device = ProxyDevice(_config(), context=context)
+        device.start()
+        device.pause()
+        device.stop()
+
+        assert not device.is_alive()
+        with pytest.raises(DeviceError):
+            device.resume()
+
+    @pytest.mark.parametrize("capture_metrics", [True, False])
+    def test_monitor_receives_forwarded_messages(self, context, capture_metrics):
+        """Test that config.monitor_addr gets a copy of every forwarded message."""
+        config = _config(monitor_addr=f"inproc://monitor-{uuid.uuid4().hex}")
+        device = ProxyDevice(config, context=context, capture_metrics=capture_metrics)
+        device.start()
+        monitor = _socket(context, zmq.SUB, config.monitor_addr, subscribe=True)
+        pipeline = Pipeline(context, device)
+        try:
+            time.sleep(0.05)  # Let the subscription reach the monitor socket
+            assert pipeline.roundtrip([b"watched"]) == [b"watched"]
+            assert monitor.recv() == b"watched"
+        finally:
+            monitor.close()
+            pipeline.close()
+            device.stop()
+
+
+class TestThreadDevice:
+    """Test the ThreadDevice class."""
+
+    def test_monitor_and_context(self, context):
+        """Test that the forwarding loop feeds the monitor and leaves the caller's context open."""
+        config = _config(monitor_addr=f"inproc://monitor-{uuid.uuid4().hex}")
+        device = ThreadDevice(config, context=context)
+        device.start()
+        monitor = _socket(context, zmq.SUB, config.monitor_addr, subscribe=True)
+        pipeline = Pipeline(context, device)
+        try:
+            time.sleep(0.05)  # Let the subscription reach the monitor socket
+            assert pipeline.roundtrip([b"watched"]) == [b"watched"]
+            assert monitor.recv() == b"watched"
+        finally:
+            monitor.close()
+            pipeline.close()
+            device.stop()
+
+        assert not context.closed
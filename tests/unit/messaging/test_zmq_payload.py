@@ -0,0 +1,139 @@
+"""Tests for zero-copy ZMQ payload transport.
+
+This module tests the payload framing helpers and the payload methods of the
+ZMQ request-reply classes.
+"""
+
+import socket
+import uuid
+import threading
+
+import pytest
+import zmq
+
+from ailf.messaging.zmq import ZMQClient, ZMQServer
+from ailf.messaging.zmq_payload import (
+    PayloadError, build_header, parse_payload, send_payload
+)
+
+
+def _free_port() -> int:
+    """Find a free TCP port on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def pair():
+    """Provide a connected PAIR socket pair over inproc."""
+    context = zmq.Context.instance()
+    sender = context.socket(zmq.PAIR)
+    receiver = context.socket(zmq.PAIR)
+    address = f"inproc://test-zmq-payload-{uuid.uuid4().hex[:8]}"
+    sender.bind(address)
+    receiver.connect(address)
+    yield sender, receiver
+    sender.close(0)
+    receiver.close(0)
+
+
+class TestPayloadFraming:
+    """Test sending and parsing payload messages."""
+
+    def test_roundtrip_without_copy(self, pair):
+        """Test that large buffers arrive as views over the received frames."""
+        sender, receiver = pair
+        blob = bytearray(b"a" * (1024 * 1024))
+
+        handle = send_payload(sender, {"doc": "x"}, [blob, b"tail"])
+        payload = parse_payload(receiver.recv_multipart(copy=False))
+        handle.wait(timeout=1.0)
+
+        assert payload.header == {"doc": "x"}
+        assert isinstance(payload.buffers[0], memoryview)
+        assert payload.buffers[0].nbytes == len(blob)
+        assert bytes(payload.buffers[1]) == b"tail"
+        assert payload.nbytes == len(blob) + 4
+        assert handle.done
+
+    def test_small_payload_is_copied(self, pair):
+        """Test that payloads under the threshold are copied and released at once."""
+        sender, receiver = pair
+        blob = bytearray(b"small")
+
+        handle = send_payload(sender, {}, [blob])
+        assert handle.tracker is None and handle.done
+        blob[:] = b"reuse"
+
+        payload = parse_payload(receiver.recv_multipart(copy=False))
+        assert bytes(payload.buffers[0]) == b"small"
+
+    def test_untracked_send_does_not_report_done(self, pair):
+        """Test that a zero-copy send without tracking refuses to say the buffers are free."""
+        sender, receiver = pair
+        blob = bytearray(b"a" * (1024 * 1024))
+
+        handle = send_payload(sender, {}, [blob], track=False)
+        parse_payload(receiver.recv_multipart(copy=False))
+
+        with pytest.raises(PayloadError):
+            handle.done
+        with pytest.raises(PayloadError):
+            handle.wait(timeout=1.0)
+
+    def test_numpy_arrays_keep_dtype_and_shape(self, pair):
+        """Test that arrays are rebuilt as views with their dtype and shape."""
+        np = pytest.importorskip("numpy")
+        sender, receiver = pair
+        vectors = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+        send_payload(sender, None, [vectors[:, ::2]], track=False)
+        payload = parse_payload(receiver.recv_multipart(copy=False))
+
+        received = payload.buffers[0]
+        assert received.dtype == np.float32
+        assert received.shape == (3, 2)
+        np.testing.assert_array_equal(received, vectors[:, ::2])
+
+    def test_buffer_count_mismatch(self):
+        """Test that a header describing missing buffers is rejected."""
+        frames = [zmq.Frame(build_header({}, [b"one", b"two"])), zmq.Frame(b"one")]
+        with pytest.raises(PayloadError):
+            parse_payload(frames)
+
+    def test_invalid_header(self):
+        """Test that a non-payload message is rejected."""
+        with pytest.raises(PayloadError):
+            parse_payload([zmq.Frame(b"not json")])
+
+
+class TestZMQRequestReplyPayload:
+    """Test payload methods of ZMQClient and ZMQServer."""
+
+    def test_request_response_payload(self):
+        """Test sending a payload request and receiving a payload response."""
+        port = _free_port()
+        server = ZMQServer()
+        server.connect(f"tcp://*:{port}")
+        client = ZMQClient()
+        client.connect(f"tcp://127.0.0.1:{port}")
+
+        def serve():
+            request = server.receive_payload(timeout=2000)
+            size = sum(buffer.nbytes for buffer in request.buffers)
+            server.send_response_payload({"size": size}, [request.buffers[0]]).wait(1.0)
+
+        thread = threading.Thread(target=serve)
+        thread.start()
+        try:
+            response = client.send_request_payload(
+                {"op": "echo"}, [b"x" * 100000, b"y"], timeout=2000
+            )
+        finally:
+            thread.join()
+            client.close()
+            server.close()
+
+        assert response.header == {"size": 100001}
+        assert bytes(response.buffers[0]) == b"x" * 100000